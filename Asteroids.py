@@ -7,6 +7,7 @@ import game.debug.visuals
 
 from game.classes.player import Player
 from game.classes.asteroid import Asteroid
+from game.tick_events import EVENT_DEATH, EVENT_HIT, EVENT_KILL, EVENT_SHOT, EVENT_SPAWN, EVENT_SPLIT, TickEvents
 from interfaces.EnvironmentTracker import EnvironmentTracker
 from interfaces.MetricsTracker import MetricsTracker
 from interfaces.RewardCalculator import ComposableRewardCalculator
@@ -55,6 +56,9 @@ class AsteroidsGame(arcade.Window):
         # Distance threshold so extremely small movement doesn't count
         self.movement_threshold = 25
 
+        # Per-tick event records (cleared at the start of every on_update)
+        self.events = TickEvents()
+
         # Trackers
         self.tracker = EnvironmentTracker(self)
         self.metrics_tracker = MetricsTracker(self)
@@ -157,6 +161,7 @@ class AsteroidsGame(arcade.Window):
             rng=self.rng
         )
         self.asteroid_list.append(asteroid)
+        self.events.add(EVENT_SPAWN, asteroid.uid, asteroid.center_x, asteroid.center_y, asteroid.this_scale)
 
     def on_draw(self):
         self.clear()
@@ -177,6 +182,9 @@ class AsteroidsGame(arcade.Window):
         if self.external_control:
             return
 
+        events = self.events
+        events.clear()
+
         self.player_list.update()
         self.asteroid_list.update()
         self.bullet_list.update()
@@ -212,18 +220,21 @@ class AsteroidsGame(arcade.Window):
                 if distance < collision_threshold:
                     hit_asteroid = True
                     self.metrics_tracker.total_hits += 1
-                    
+                    events.add(EVENT_HIT, asteroid.uid, asteroid.center_x, asteroid.center_y, asteroid.this_scale)
+
                     # Damage asteroid
                     asteroid.hp -= 1
                     
                     if asteroid.hp <= 0:
                         asteroids_to_remove.append(asteroid)
                         self.metrics_tracker.total_kills += 1
-                        
+                        events.add(EVENT_KILL, asteroid.uid, asteroid.center_x, asteroid.center_y, asteroid.this_scale)
+
                         # Break asteroid
                         new_asteroids = asteroid.break_asteroid()
                         for child in new_asteroids:
                             self.asteroid_list.append(child)
+                            events.add(EVENT_SPLIT, child.uid, child.center_x, child.center_y, child.this_scale)
                     
                     # Bullet hits only one asteroid
                     break
@@ -250,6 +261,7 @@ class AsteroidsGame(arcade.Window):
                 
                 if distance < collision_threshold:
                     player_hit = True
+                    events.add(EVENT_DEATH, asteroid.uid, self.player.center_x, self.player.center_y)
                     break
             
             if player_hit:
@@ -271,6 +283,7 @@ class AsteroidsGame(arcade.Window):
                     if bullet:
                         self.bullet_list.append(bullet)
                         self.metrics_tracker.total_shots_fired += 1
+                        events.add(EVENT_SHOT, -1, bullet.center_x, bullet.center_y)
             else:
                 # Boolean control path (GA/ES/NEAT and manual play) - unchanged
                 if self.left_pressed:
@@ -284,6 +297,7 @@ class AsteroidsGame(arcade.Window):
                     if bullet:
                         self.bullet_list.append(bullet)
                         self.metrics_tracker.total_shots_fired += 1
+                        events.add(EVENT_SHOT, -1, bullet.center_x, bullet.center_y)
 
         # Manual asteroid spawning (matches headless game timing exactly)
         if self.manual_spawning:
@@ -0,0 +1,99 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+class CompatibilityIndex:
+    """
+    Flattened connection genes of a population for batched compatibility distances.
+
+    Every genome's sorted (innovation, weight) arrays are concatenated once, so
+    the distance from all genomes to one representative is a handful of array
+    operations over the population's genes instead of a Python merge per pair.
+    Results match ``Genome.compatibility_distance`` exactly: weight differences
+    are accumulated per genome in the same (innovation) order.
+
+    Args:
+        genomes: Genomes to index (anything exposing ``gene_arrays()``)
+        c1: Excess gene coefficient
+        c2: Disjoint gene coefficient
+        c3: Mean weight difference coefficient
+    """
+
+    def __init__(self, genomes: Sequence, c1: float, c2: float, c3: float):
+        self.c1 = c1
+        self.c2 = c2
+        self.c3 = c3
+        arrays = [genome.gene_arrays() for genome in genomes]
+        self.num_genomes = len(arrays)
+        self.lengths = np.array([len(innovations) for innovations, _ in arrays], dtype=np.int64)
+        self.max_innovation = np.array(
+            [innovations[-1] if len(innovations) else 0 for innovations, _ in arrays],
+            dtype=np.int64
+        )
+        if arrays:
+            self.innovations = np.concatenate([innovations for innovations, _ in arrays])
+            self.weights = np.concatenate([weights for _, weights in arrays])
+        else:
+            self.innovations = np.zeros(0, dtype=np.int64)
+            self.weights = np.zeros(0, dtype=np.float64)
+        self.owner = np.repeat(np.arange(self.num_genomes), self.lengths)
+        self.offsets = np.concatenate([[0], np.cumsum(self.lengths)])
+
+    def distances_to(self, representative, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compatibility distance to ``representative`` of the indexed genomes
+        ``rows`` (sorted indices; all genomes when None).
+        """
+        rep_innovations, rep_weights = representative.gene_arrays()
+        rep_len = len(rep_innovations)
+        rep_max = rep_innovations[-1] if rep_len else 0
+
+        if rows is None:
+            innovations, weights, owner = self.innovations, self.weights, self.owner
+            lengths, max_innovation = self.lengths, self.max_innovation
+        else:
+            lengths, max_innovation = self.lengths[rows], self.max_innovation[rows]
+            # Flat positions of the selected genomes' genes, in genome order
+            owner = np.repeat(np.arange(len(rows)), lengths)
+            starts = np.repeat(self.offsets[rows] - (np.cumsum(lengths) - lengths), lengths)
+            genes = starts + np.arange(len(owner))
+            innovations, weights = self.innovations[genes], self.weights[genes]
+        size = len(lengths)
+
+        if rep_len:
+            pos = np.minimum(np.searchsorted(rep_innovations, innovations), rep_len - 1)
+            matched = rep_innovations[pos] == innovations
+        else:
+            pos = np.zeros(len(innovations), dtype=np.int64)
+            matched = np.zeros(len(innovations), dtype=bool)
+
+        matches = np.bincount(owner[matched], minlength=size)
+        weight_diff_sum = np.bincount(
+            owner[matched],
+            weights=np.abs(weights[matched] - rep_weights[pos[matched]]),
+            minlength=size
+        )
+
+        # Genome genes beyond the representative's newest innovation, and vice versa
+        excess = np.bincount(owner[innovations > rep_max], minlength=size)
+        excess += rep_len - np.searchsorted(rep_innovations, max_innovation, side="right")
+        disjoint = lengths + rep_len - 2 * matches - excess
+
+        n = np.maximum(lengths, rep_len)
+        n = np.where(n < 20, 1, n)
+        mean_weight_diff = np.divide(
+            weight_diff_sum, matches,
+            out=np.zeros(size, dtype=np.float64),
+            where=matches > 0
+        )
+        return (self.c1 * excess + self.c2 * disjoint) / n + self.c3 * mean_weight_diff
+
+
+def compatibility_matrix(genomes: Sequence, representatives: List, c1: float, c2: float, c3: float) -> np.ndarray:
+    """[len(genomes), len(representatives)] matrix of compatibility distances."""
+    index = CompatibilityIndex(genomes, c1, c2, c3)
+    matrix = np.zeros((len(genomes), len(representatives)), dtype=np.float64)
+    for j, representative in enumerate(representatives):
+        matrix[:, j] = index.distances_to(representative)
+    return matrix
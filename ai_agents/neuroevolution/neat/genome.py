@@ -1,8 +1,12 @@
 import random
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
+from ai_agents.neuroevolution.neat.compatibility import CompatibilityIndex
 from ai_agents.neuroevolution.neat.genes import ConnectionGene, NodeGene
 from ai_agents.neuroevolution.neat.network import NEATNetwork
+from ai_agents.neuroevolution.neat.topology import TopologicalOrder
 
 
 class Genome:
@@ -19,6 +23,36 @@ class Genome:
         self.input_ids = list(input_ids)
         self.output_ids = list(output_ids)
         self.bias_id = bias_id
+        # Sorted (innovations, weights) arrays; rebuilt lazily after mutations
+        self._gene_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        # Topological order of the enabled connections; built on first use,
+        # then kept current by the structural mutations
+        self._topology: Optional[TopologicalOrder] = None
+
+    def gene_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Connection innovations (sorted int64) and their weights (float64)."""
+        if self._gene_arrays is None:
+            innovations = np.fromiter(self.connections.keys(), dtype=np.int64, count=len(self.connections))
+            weights = np.fromiter(
+                (gene.weight for gene in self.connections.values()),
+                dtype=np.float64,
+                count=len(self.connections)
+            )
+            order = np.argsort(innovations, kind="stable")
+            innovations, weights = innovations[order], weights[order]
+            innovations.flags.writeable = False
+            weights.flags.writeable = False
+            self._gene_arrays = (innovations, weights)
+        return self._gene_arrays
+
+    def topology(self) -> TopologicalOrder:
+        """Cached topological order of the enabled connections (cycle queries, network build)."""
+        if self._topology is None:
+            self._topology = TopologicalOrder(
+                self.nodes.keys(),
+                ((gene.in_node, gene.out_node) for gene in self.connections.values() if gene.enabled)
+            )
+        return self._topology
 
     @staticmethod
     def create_minimal(
@@ -63,10 +97,21 @@ class Genome:
             )
             for innov, gene in self.connections.items()
         }
-        return Genome(nodes, connections, self.input_ids, self.output_ids, self.bias_id)
+        clone = Genome(nodes, connections, self.input_ids, self.output_ids, self.bias_id)
+        clone._gene_arrays = self._gene_arrays  # read-only until either genome mutates
+        if self._topology is not None:
+            clone._topology = self._topology.copy()
+        return clone
 
     def build_network(self) -> NEATNetwork:
-        return NEATNetwork(self.nodes, self.connections, self.input_ids, self.output_ids, self.bias_id)
+        return NEATNetwork(
+            self.nodes,
+            self.connections,
+            self.input_ids,
+            self.output_ids,
+            self.bias_id,
+            order=list(self.topology().order)
+        )
 
     def to_dict(self) -> Dict:
         return {
@@ -122,6 +167,8 @@ class Genome:
             if random.random() < mutation_prob:
                 gene.weight += random.gauss(0.0, sigma)
                 mutated += 1
+        if mutated:
+            self._gene_arrays = None
         return mutated
 
     def mutate_add_connection(
@@ -160,6 +207,8 @@ class Genome:
                 weight=weight,
                 enabled=True
             )
+            self._gene_arrays = None
+            self.topology().add_edge(in_node, out_node)
             return innovation
 
         return None
@@ -189,54 +238,18 @@ class Genome:
             weight=connection.weight,
             enabled=True
         )
+        self._gene_arrays = None
+        if self._topology is not None:
+            # in -> new -> out keeps the order valid with new placed just before out
+            self._topology.remove_edge(connection.in_node, connection.out_node)
+            self._topology.insert_node(new_node_id, before=connection.out_node)
+            self._topology.add_edge(connection.in_node, new_node_id)
+            self._topology.add_edge(new_node_id, connection.out_node)
         return new_node_id, innov1, innov2
 
     def _creates_cycle(self, in_node: int, out_node: int) -> bool:
         """Check if adding a connection from in_node to out_node would create a cycle."""
-        return Genome._would_create_cycle(self.connections, in_node, out_node)
-
-    @staticmethod
-    def _would_create_cycle(
-        connections: Dict[int, "ConnectionGene"],
-        in_node: int,
-        out_node: int
-    ) -> bool:
-        """
-        Check if adding a connection from in_node to out_node would create a cycle.
-
-        This is a static method so it can be used during crossover before the
-        genome is fully constructed.
-
-        Args:
-            connections: Existing connections dict
-            in_node: Source node of the proposed connection
-            out_node: Target node of the proposed connection
-
-        Returns:
-            True if adding this connection would create a cycle
-        """
-        # Build adjacency list from existing enabled connections
-        adjacency: Dict[int, List[int]] = {}
-        for gene in connections.values():
-            if not gene.enabled:
-                continue
-            adjacency.setdefault(gene.in_node, []).append(gene.out_node)
-
-        # Check if there's a path from out_node back to in_node
-        # If so, adding in_node -> out_node would create a cycle
-        stack = [out_node]
-        visited = set()
-        while stack:
-            node = stack.pop()
-            if node == in_node:
-                return True
-            if node in visited:
-                continue
-            visited.add(node)
-            for nxt in adjacency.get(node, []):
-                if nxt not in visited:
-                    stack.append(nxt)
-        return False
+        return self.topology().would_create_cycle(in_node, out_node)
 
     @staticmethod
     def compatibility_distance(
@@ -246,44 +259,8 @@ class Genome:
         c2: float,
         c3: float
     ) -> float:
-        genes_a = genome_a.connections
-        genes_b = genome_b.connections
-        if not genes_a and not genes_b:
-            return 0.0
-
-        innovations_a = sorted(genes_a.keys())
-        innovations_b = sorted(genes_b.keys())
-        set_b = set(innovations_b)
-
-        max_a = innovations_a[-1] if innovations_a else 0
-        max_b = innovations_b[-1] if innovations_b else 0
-
-        excess = 0
-        disjoint = 0
-        weight_diffs = []
-
-        for innov in innovations_a:
-            if innov in genes_b:
-                weight_diffs.append(abs(genes_a[innov].weight - genes_b[innov].weight))
-            else:
-                if innov > max_b:
-                    excess += 1
-                else:
-                    disjoint += 1
-
-        for innov in innovations_b:
-            if innov not in genes_a:
-                if innov > max_a:
-                    excess += 1
-                else:
-                    disjoint += 1
-
-        n = max(len(genes_a), len(genes_b))
-        if n < 20:
-            n = 1
-
-        w = sum(weight_diffs) / len(weight_diffs) if weight_diffs else 0.0
-        return (c1 * excess + c2 * disjoint) / n + c3 * w
+        """Standard NEAT distance; see ``compatibility.CompatibilityIndex`` for the batched form."""
+        return float(CompatibilityIndex([genome_a], c1, c2, c3).distances_to(genome_b)[0])
 
     @staticmethod
     def crossover(
@@ -308,6 +285,8 @@ class Genome:
                     nodes[node_id] = NodeGene(node_id=gene.node_id, node_type=gene.node_type)
 
         connections: Dict[int, ConnectionGene] = {}
+        # Grown alongside ``connections`` so each cycle check is incremental
+        topology = TopologicalOrder(nodes.keys())
         innovations = set(parent_a.connections.keys()) | set(parent_b.connections.keys())
         for innov in innovations:
             gene_a = parent_a.connections.get(innov)
@@ -352,9 +331,11 @@ class Genome:
                 if not candidate.enabled:
                     # Disabled connections can't create cycles in the active network
                     connections[innov] = candidate
-                elif not Genome._would_create_cycle(connections, candidate.in_node, candidate.out_node):
+                elif not topology.would_create_cycle(candidate.in_node, candidate.out_node):
                     connections[innov] = candidate
+                    topology.add_edge(candidate.in_node, candidate.out_node)
                 # else: skip this connection to prevent cycle
 
         child = Genome(nodes, connections, parent_a.input_ids, parent_a.output_ids, parent_a.bias_id)
+        child._topology = topology
         return child
@@ -1,5 +1,5 @@
 import math
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ai_agents.neuroevolution.neat.genes import ConnectionGene, NodeGene
 
@@ -7,6 +7,10 @@ from ai_agents.neuroevolution.neat.genes import ConnectionGene, NodeGene
 class NEATNetwork:
     """
     Feedforward NEAT network compiled from a genome.
+
+    ``order`` is an already known topological order of the nodes (the
+    genome's cached one); without it the order is computed with Kahn's
+    algorithm.
     """
 
     def __init__(
@@ -15,17 +19,29 @@ class NEATNetwork:
         connections: Dict[int, ConnectionGene],
         input_ids: List[int],
         output_ids: List[int],
-        bias_id: int
+        bias_id: int,
+        order: Optional[List[int]] = None
     ):
         self.nodes = nodes
         self.input_ids = list(input_ids)
         self.output_ids = list(output_ids)
         self.bias_id = bias_id
-        self.incoming, self.order = self._compile(connections)
+        self.incoming, self.order = self._compile(connections, order)
 
-    def _compile(self, connections: Dict[int, ConnectionGene]) -> Tuple[Dict[int, List[Tuple[int, float]]], List[int]]:
+    def _compile(
+        self,
+        connections: Dict[int, ConnectionGene],
+        order: Optional[List[int]] = None
+    ) -> Tuple[Dict[int, List[Tuple[int, float]]], List[int]]:
         enabled = [c for c in connections.values() if c.enabled]
         incoming: Dict[int, List[Tuple[int, float]]] = {node_id: [] for node_id in self.nodes.keys()}
+        if order is not None:
+            for conn in enabled:
+                incoming.setdefault(conn.out_node, []).append((conn.in_node, conn.weight))
+            if len(order) != len(self.nodes):
+                raise ValueError("Topological order does not cover the NEAT network's nodes.")
+            return incoming, order
+
         adjacency: Dict[int, List[int]] = {node_id: [] for node_id in self.nodes.keys()}
         in_degree: Dict[int, int] = {node_id: 0 for node_id in self.nodes.keys()}
 
@@ -0,0 +1,147 @@
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class TopologicalOrder:
+    """
+    Incrementally maintained topological order of a genome's enabled connections.
+
+    Uses the Pearce-Kelly dynamic ordering: every node has a rank, and an
+    edge ``a -> b`` with ``rank[a] < rank[b]`` can never close a cycle, so the
+    usual cycle query is answered by one comparison. Only when the new edge
+    points backwards is a search needed, and it is bounded to the nodes whose
+    ranks lie between the two endpoints. Adding such an edge reorders just
+    that region.
+
+    Args:
+        node_ids: Nodes to order (more can be added later)
+        edges: Enabled (in_node, out_node) pairs; must be acyclic
+    """
+
+    def __init__(self, node_ids: Iterable[int] = (), edges: Iterable[Tuple[int, int]] = ()):
+        self.successors: Dict[int, List[int]] = {}
+        self.predecessors: Dict[int, List[int]] = {}
+        for node_id in node_ids:
+            self._register(node_id)
+        edges = list(edges)
+        for in_node, out_node in edges:
+            self._register(in_node)
+            self._register(out_node)
+            self.successors[in_node].append(out_node)
+            self.predecessors[out_node].append(in_node)
+
+        # Kahn's algorithm once; later updates are incremental
+        in_degree = {node_id: len(preds) for node_id, preds in self.predecessors.items()}
+        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        self.order: List[int] = []
+        head = 0
+        while head < len(queue):
+            node_id = queue[head]
+            head += 1
+            self.order.append(node_id)
+            for neighbor in self.successors[node_id]:
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+        if len(self.order) != len(self.successors):
+            raise ValueError("Cycle detected in feedforward NEAT network.")
+        self.rank: Dict[int, int] = {node_id: i for i, node_id in enumerate(self.order)}
+
+    def copy(self) -> "TopologicalOrder":
+        clone = TopologicalOrder.__new__(TopologicalOrder)
+        clone.successors = {node_id: list(succ) for node_id, succ in self.successors.items()}
+        clone.predecessors = {node_id: list(preds) for node_id, preds in self.predecessors.items()}
+        clone.order = list(self.order)
+        clone.rank = dict(self.rank)
+        return clone
+
+    def _register(self, node_id: int) -> None:
+        if node_id not in self.successors:
+            self.successors[node_id] = []
+            self.predecessors[node_id] = []
+
+    def add_node(self, node_id: int) -> None:
+        """Add an unconnected node at the end of the order."""
+        if node_id in self.successors:
+            return
+        self._register(node_id)
+        self.rank[node_id] = len(self.order)
+        self.order.append(node_id)
+
+    def insert_node(self, node_id: int, before: int) -> None:
+        """Add an unconnected node just before ``before`` (used when splitting a connection)."""
+        if node_id in self.successors:
+            return
+        self._register(node_id)
+        position = self.rank[before]
+        self.order.insert(position, node_id)
+        for i in range(position, len(self.order)):
+            self.rank[self.order[i]] = i
+
+    def would_create_cycle(self, in_node: int, out_node: int) -> bool:
+        """True if adding the enabled edge in_node -> out_node would close a cycle."""
+        if in_node == out_node:
+            return True
+        if in_node not in self.rank or out_node not in self.rank:
+            return False
+        upper = self.rank[in_node]
+        if self.rank[out_node] > upper:
+            return False
+        return in_node in self._forward(out_node, upper)
+
+    def add_edge(self, in_node: int, out_node: int) -> None:
+        """
+        Record the enabled edge in_node -> out_node and restore a valid order.
+
+        Raises:
+            ValueError: If the edge would create a cycle
+        """
+        self.add_node(in_node)
+        self.add_node(out_node)
+        lower, upper = self.rank[out_node], self.rank[in_node]
+        if lower < upper:
+            forward = self._forward(out_node, upper)
+            if in_node in forward:
+                raise ValueError(f"Connection {in_node} -> {out_node} would create a cycle.")
+            backward = self._backward(in_node, lower)
+            self._reorder(backward, forward)
+        elif lower == upper:
+            raise ValueError(f"Connection {in_node} -> {out_node} would create a cycle.")
+        self.successors[in_node].append(out_node)
+        self.predecessors[out_node].append(in_node)
+
+    def remove_edge(self, in_node: int, out_node: int) -> None:
+        """Forget one enabled in_node -> out_node edge (the order stays valid)."""
+        self.successors[in_node].remove(out_node)
+        self.predecessors[out_node].remove(in_node)
+
+    def _forward(self, start: int, upper: int) -> Set[int]:
+        """Nodes reachable from ``start`` with rank <= upper."""
+        visited = {start}
+        stack = [start]
+        while stack:
+            node_id = stack.pop()
+            for neighbor in self.successors[node_id]:
+                if neighbor not in visited and self.rank[neighbor] <= upper:
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+        return visited
+
+    def _backward(self, start: int, lower: int) -> Set[int]:
+        """Nodes that reach ``start`` with rank >= lower."""
+        visited = {start}
+        stack = [start]
+        while stack:
+            node_id = stack.pop()
+            for neighbor in self.predecessors[node_id]:
+                if neighbor not in visited and self.rank[neighbor] >= lower:
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+        return visited
+
+    def _reorder(self, backward: Set[int], forward: Set[int]) -> None:
+        """Reuse the affected ranks: ancestors of the edge source first, then descendants of its target."""
+        moved = sorted(backward, key=self.rank.__getitem__) + sorted(forward, key=self.rank.__getitem__)
+        slots = sorted(self.rank[node_id] for node_id in moved)
+        for node_id, slot in zip(moved, slots):
+            self.rank[node_id] = slot
+            self.order[slot] = node_id
@@ -6,10 +6,18 @@ matching the interface of the NumPy version for compatibility with existing
 training infrastructure.
 """
 
-import tensorflow as tf
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 import numpy as np
 
+if TYPE_CHECKING:
+    import tensorflow as tf
+
+
+def _tensorflow():
+    """Import TensorFlow on first use; importing this module stays cheap."""
+    import tensorflow
+    return tensorflow
+
 
 class FeedforwardPolicyTF:
     """
@@ -46,8 +54,9 @@ class FeedforwardPolicyTF:
         if weights is not None:
             self.set_weights(weights)
 
-    def _build_model(self) -> tf.keras.Model:
+    def _build_model(self) -> "tf.keras.Model":
         """Build the Keras sequential model."""
+        tf = _tensorflow()
         model = tf.keras.Sequential([
             tf.keras.layers.InputLayer(input_shape=(self.input_size,)),
             tf.keras.layers.Dense(
@@ -136,6 +145,7 @@ class FeedforwardPolicyTF:
         Returns:
             Output action vector (values in [0, 1] due to sigmoid).
         """
+        tf = _tensorflow()
         # Convert to tensor and add batch dimension
         state_tensor = tf.constant([state], dtype=tf.float32)
 
@@ -155,6 +165,7 @@ class FeedforwardPolicyTF:
         Returns:
             List of output action vectors.
         """
+        tf = _tensorflow()
         states_tensor = tf.constant(states, dtype=tf.float32)
         outputs = self.model(states_tensor, training=False)
         return outputs.numpy().tolist()
@@ -1,3 +1,10 @@
-from ai_agents.reinforcement_learning.sac_agent import SACAgent
-
+# SACAgent needs torch; it is imported on first access so that importing the
+# package (or a torch-free sibling module) stays cheap in evaluation workers.
 __all__ = ["SACAgent"]
+
+
+def __getattr__(name):
+    if name == "SACAgent":
+        from ai_agents.reinforcement_learning.sac_agent import SACAgent
+        return SACAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,11 @@
+"""
+Benchmark suite for the simulation and training stack.
+
+- ``workloads``: fixed-seed game states, scripted inputs and populations
+- ``cases``: timed cases (env steps, encoders, policy forwards, rewards,
+  SAC replay/updates, generation wall time, worker import time)
+- ``imports``: fresh-interpreter import timing and heavy-dependency check
+- ``parity``: trajectory fingerprints proving optimizations keep outcomes
+- ``compare``: tolerance-based comparison against ``baseline.json``
+- ``run``: command-line entry point (``python -m benchmarks.run``)
+"""
@@ -0,0 +1,375 @@
+"""
+Timed benchmark cases.
+
+Each case builds its state from fixed seeds (untimed), times only the code
+under test, and reports a rate (or a duration for whole generations). The
+value recorded is the best of ``repeats`` runs of at least ``min_seconds``
+each, which filters out scheduler noise better than a mean.
+
+Cases that need an optional dependency (torch for SAC) raise
+``BenchmarkSkipped`` when it is missing. The ``import.*`` cases time worker
+entry points in a fresh interpreter (milliseconds, lower is better).
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import numpy as np
+
+from benchmarks.imports import measure_import
+from benchmarks.workloads import (
+    EARLY_GAME, FRAME_DELAY, LATE_GAME, ScriptedPolicy, boolean_actions,
+    ga_encoder, make_game, random_population
+)
+from ai_agents.neuroevolution.nn_agent import NNAgent
+from interfaces.BatchedRewardCalculator import BatchedRewardCalculator, TickGeometry
+from interfaces.encoders.GraphEncoder import GraphEncoder
+from interfaces.encoders.VectorEncoder import VectorEncoder
+from training.config.genetic_algorithm import GAConfig
+from training.config.rewards import create_reward_calculator
+
+# Ticks run from each seeded state before the next one is built
+EPISODE_TICKS = 300
+BATCH_GAMES = 64
+GENERATION_SIZES = (50, 100, 500)
+GENERATION_STEPS = 200  # Episode cap for generation wall-time cases
+QUICK_GENERATION_SIZES = (50,)
+# Worker entry points timed by the import.* cases (fresh interpreter each)
+IMPORT_TARGETS = {
+    "import.headless_game": "game.headless_game",
+    "import.population_evaluator": "training.core.population_evaluator",
+}
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a case that cannot run here (e.g. optional dependency missing)."""
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    func: Callable[["RunSettings"], Dict[str, Any]]
+    unit: str
+    higher_is_better: bool = True
+    full_only: bool = False  # Skipped by --quick
+
+
+@dataclass
+class RunSettings:
+    min_seconds: float = 1.0
+    repeats: int = 3
+    quick: bool = False
+
+
+CASES: Dict[str, BenchmarkCase] = {}
+
+
+def benchmark(name: str, unit: str, higher_is_better: bool = True, full_only: bool = False):
+    """Register a case under ``name`` (dotted: group.case)."""
+    def register(func):
+        CASES[name] = BenchmarkCase(name, func, unit, higher_is_better, full_only)
+        return func
+    return register
+
+
+Timed = Union[int, Tuple[int, float]]
+
+
+def best_rate(build: Callable[[int], Any], run: Callable[[Any], Timed], settings: RunSettings) -> float:
+    """
+    Best items/second over ``settings.repeats`` runs.
+
+    Each run builds states ``build(0), build(1), ...`` (untimed) and calls
+    ``run(state)`` until ``settings.min_seconds`` of timed work has
+    accumulated. ``run`` returns the items it processed, or
+    ``(items, seconds)`` when it times itself (to exclude its own setup).
+    """
+    best = 0.0
+    for _ in range(max(1, settings.repeats)):
+        items = 0
+        elapsed = 0.0
+        k = 0
+        while elapsed < settings.min_seconds:
+            state = build(k)
+            k += 1
+            start = time.perf_counter()
+            result = run(state)
+            if isinstance(result, tuple):
+                count, seconds = result
+            else:
+                count, seconds = result, time.perf_counter() - start
+            items += count
+            elapsed += seconds
+        best = max(best, items / elapsed if elapsed > 0 else 0.0)
+    return best
+
+
+def _seeded_game(phase: str):
+    return lambda k: (make_game(k, phase), ScriptedPolicy(k))
+
+
+def _step_until_dead(state) -> int:
+    game, policy = state
+    ticks = 0
+    while ticks < EPISODE_TICKS and game.player in game.player_list:
+        policy.apply(game)
+        game.on_update(FRAME_DELAY)
+        ticks += 1
+    return ticks
+
+
+@benchmark("env.step.early", "steps/s")
+def env_step_early(settings: RunSettings) -> Dict[str, Any]:
+    return {"value": best_rate(_seeded_game(EARLY_GAME), _step_until_dead, settings)}
+
+
+@benchmark("env.step.late", "steps/s")
+def env_step_late(settings: RunSettings) -> Dict[str, Any]:
+    return {"value": best_rate(_seeded_game(LATE_GAME), _step_until_dead, settings)}
+
+
+def _encode_rate(encoder_factory, settings: RunSettings) -> float:
+    def build(k):
+        return make_game(k, LATE_GAME), ScriptedPolicy(k), encoder_factory()
+
+    def run(state):
+        game, policy, encoder = state
+        calls, seconds = 0, 0.0
+        for _ in range(EPISODE_TICKS // 3):
+            if game.player not in game.player_list:
+                break
+            start = time.perf_counter()
+            encoder.encode(game.tracker)
+            seconds += time.perf_counter() - start
+            calls += 1
+            policy.apply(game)
+            game.on_update(FRAME_DELAY)
+        return calls, seconds
+
+    return best_rate(build, run, settings)
+
+
+@benchmark("encoder.vector", "calls/s")
+def encoder_vector(settings: RunSettings) -> Dict[str, Any]:
+    return {"value": _encode_rate(VectorEncoder, settings)}
+
+
+@benchmark("encoder.hybrid", "calls/s")
+def encoder_hybrid(settings: RunSettings) -> Dict[str, Any]:
+    return {"value": _encode_rate(ga_encoder, settings)}
+
+
+@benchmark("encoder.graph", "calls/s")
+def encoder_graph(settings: RunSettings) -> Dict[str, Any]:
+    return {"value": _encode_rate(GraphEncoder, settings)}
+
+
+@benchmark("encoder.hybrid.batch64", "rows/s")
+def encoder_hybrid_batch(settings: RunSettings) -> Dict[str, Any]:
+    encoder = ga_encoder()
+
+    def build(k):
+        return [make_game(k * BATCH_GAMES + i, LATE_GAME).tracker for i in range(BATCH_GAMES)]
+
+    def run(trackers) -> int:
+        encoder.encode_batch(trackers)
+        return len(trackers)
+
+    return {"value": best_rate(build, run, settings)}
+
+
+@benchmark("policy.forward", "forwards/s")
+def policy_forward(settings: RunSettings) -> Dict[str, Any]:
+    encoder = ga_encoder()
+    actions = boolean_actions()
+    params = random_population(1, seed=0, encoder=encoder)[0]
+    agent = NNAgent(params, encoder, actions, hidden_size=GAConfig.HIDDEN_LAYER_SIZE)
+
+    def build(k):
+        return [encoder.encode(make_game(k * 16 + i, LATE_GAME).tracker) for i in range(16)]
+
+    def run(states) -> int:
+        for _ in range(20):
+            for state in states:
+                agent.get_action(state)
+        return 20 * len(states)
+
+    return {"value": best_rate(build, run, settings)}
+
+
+@benchmark("reward.step", "steps/s")
+def reward_step(settings: RunSettings) -> Dict[str, Any]:
+    def build(k):
+        calculator = create_reward_calculator(max_steps=GAConfig.MAX_STEPS, frame_delay=FRAME_DELAY)
+        calculator.reset()
+        return make_game(k, LATE_GAME), ScriptedPolicy(k), calculator
+
+    def run(state):
+        game, policy, calculator = state
+        calls, seconds = 0, 0.0
+        while calls < EPISODE_TICKS and game.player in game.player_list:
+            policy.apply(game)
+            game.on_update(FRAME_DELAY)
+            game.metrics_tracker.update(game)
+            start = time.perf_counter()
+            calculator.calculate_step_reward(game.tracker, game.metrics_tracker)
+            seconds += time.perf_counter() - start
+            calls += 1
+        return calls, seconds
+
+    return {"value": best_rate(build, run, settings)}
+
+
+@benchmark("reward.batch64", "game-steps/s")
+def reward_batch(settings: RunSettings) -> Dict[str, Any]:
+    template = create_reward_calculator(max_steps=GAConfig.MAX_STEPS, frame_delay=FRAME_DELAY)
+
+    def build(k):
+        games = [make_game(k * BATCH_GAMES + i, LATE_GAME) for i in range(BATCH_GAMES)]
+        policies = [ScriptedPolicy(k * BATCH_GAMES + i) for i in range(BATCH_GAMES)]
+        return games, policies, BatchedRewardCalculator(template, BATCH_GAMES)
+
+    def run(state):
+        games, policies, calculator = state
+        active = np.ones(len(games), dtype=bool)
+        rows, seconds = 0, 0.0
+        for _ in range(EPISODE_TICKS // 10):
+            for i, game in enumerate(games):
+                if active[i]:
+                    policies[i].apply(game)
+                    game.on_update(FRAME_DELAY)
+                    game.metrics_tracker.update(game)
+            start = time.perf_counter()
+            calculator.calculate_step_rewards(TickGeometry(games), active)
+            seconds += time.perf_counter() - start
+            rows += int(active.sum())
+            active &= np.array([game.player in game.player_list for game in games])
+            if not active.any():
+                break
+        return rows, seconds
+
+    return {"value": best_rate(build, run, settings)}
+
+
+def _sac_modules():
+    try:
+        import torch
+        from training.config.sac import SACConfig
+        from training.methods.sac.learner import SACLearner
+        from training.methods.sac.replay_buffer import ReplayBuffer, Transition
+    except ImportError as exc:
+        raise BenchmarkSkipped(f"torch unavailable ({exc})")
+    return torch, SACConfig, SACLearner, ReplayBuffer, Transition
+
+
+def _filled_replay(ReplayBuffer, Transition, size: int = 2048):
+    """Replay buffer of graph transitions from seeded scripted play."""
+    replay = ReplayBuffer(capacity=size, seed=0)
+    encoder = GraphEncoder()
+    seed = 0
+    while len(replay) < size:
+        game, policy = make_game(seed, LATE_GAME), ScriptedPolicy(seed)
+        seed += 1
+        obs = encoder.encode(game.tracker)
+        while len(replay) < size and game.player in game.player_list:
+            policy.apply_continuous(game)
+            reward, _, done = game.step_repeated(FRAME_DELAY, 4)
+            next_obs = encoder.encode(game.tracker)
+            action = [game.turn_magnitude, game.thrust_magnitude, float(game.shoot_requested)]
+            replay.push(Transition(obs=obs, action=action, reward=reward, next_obs=next_obs, done=done))
+            obs = next_obs
+    return replay
+
+
+@benchmark("sac.replay_sample.b256", "batches/s")
+def sac_replay_sample(settings: RunSettings) -> Dict[str, Any]:
+    torch, SACConfig, _, ReplayBuffer, Transition = _sac_modules()
+    replay = _filled_replay(ReplayBuffer, Transition)
+    device = torch.device("cpu")
+
+    def run(_) -> int:
+        replay.sample_batch(SACConfig.BATCH_SIZE, device)
+        return 1
+
+    return {"value": best_rate(lambda k: None, run, settings), "batch_size": SACConfig.BATCH_SIZE}
+
+
+@benchmark("sac.update.b256", "updates/s")
+def sac_update(settings: RunSettings) -> Dict[str, Any]:
+    torch, SACConfig, SACLearner, ReplayBuffer, Transition = _sac_modules()
+    torch.manual_seed(SACConfig.SEED)
+    device = torch.device("cpu")
+    replay = _filled_replay(ReplayBuffer, Transition)
+    learner = SACLearner(device=device, config=SACConfig)
+
+    def run(batch) -> int:
+        learner.update(batch)
+        return 1
+
+    return {
+        "value": best_rate(lambda k: replay.sample_batch(SACConfig.BATCH_SIZE, device), run, settings),
+        "batch_size": SACConfig.BATCH_SIZE,
+    }
+
+
+def _generation_case(size: int):
+    def run_generation(settings: RunSettings) -> Dict[str, Any]:
+        from training.core.population_evaluator import evaluate_population_parallel
+
+        encoder = ga_encoder()
+        actions = boolean_actions()
+        population = random_population(size, seed=size, encoder=encoder)
+        best = float("inf")
+        steps = 0
+        for _ in range(max(1, settings.repeats)):
+            start = time.perf_counter()
+            _, _, aggregated, _ = evaluate_population_parallel(
+                population, encoder, actions,
+                max_steps=GENERATION_STEPS,
+                generation_seed=size,
+                seeds_per_agent=1,
+                use_common_seeds=True
+            )
+            best = min(best, time.perf_counter() - start)
+            steps = aggregated.get('avg_steps_survived', 0.0) * size
+        return {"value": best, "agent_steps_per_s": steps / best if best > 0 else 0.0}
+
+    return run_generation
+
+
+for _size in GENERATION_SIZES:
+    benchmark(
+        f"generation.{_size}", "s/generation", higher_is_better=False,
+        full_only=_size not in QUICK_GENERATION_SIZES
+    )(_generation_case(_size))
+
+
+def _import_case(module: str):
+    def run_import(settings: RunSettings) -> Dict[str, Any]:
+        runs = [measure_import(module) for _ in range(max(1, settings.repeats))]
+        best = min(runs, key=lambda run: run["ms"])
+        return {"value": best["ms"], "modules": best["modules"], "heavy_modules": best["heavy"]}
+
+    return run_import
+
+
+for _name, _module in IMPORT_TARGETS.items():
+    benchmark(_name, "ms", higher_is_better=False)(_import_case(_module))
+
+
+def run_cases(names: List[str], settings: RunSettings) -> Dict[str, Dict[str, Any]]:
+    """Run the named cases; returns {name: result} with unit/direction attached."""
+    results = {}
+    for name in names:
+        case = CASES[name]
+        entry: Dict[str, Any] = {"unit": case.unit, "higher_is_better": case.higher_is_better}
+        if settings.quick and case.full_only:
+            entry["skipped"] = "full run only"
+        else:
+            try:
+                entry.update(case.func(settings))
+            except BenchmarkSkipped as exc:
+                entry["skipped"] = str(exc)
+        results[name] = entry
+    return results
@@ -0,0 +1,53 @@
+"""
+Baseline comparison for benchmark results.
+
+Timings are compared with a relative tolerance in the direction that matters
+(a rate may not drop, a duration may not grow, by more than the tolerance).
+Parity digests must match exactly.
+"""
+
+from typing import Any, Dict, List, Optional
+
+DEFAULT_TOLERANCE = 0.25
+
+
+def compare_results(results: Dict[str, Any], baseline: Dict[str, Any],
+                    tolerance: float = DEFAULT_TOLERANCE,
+                    tolerances: Optional[Dict[str, float]] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compare a results document against a baseline document.
+
+    Args:
+        results: Output of ``benchmarks.run`` ({"benchmarks": ..., "parity": ...})
+        baseline: A stored results document
+        tolerance: Allowed relative slowdown for every timed case
+        tolerances: Per-case overrides of ``tolerance`` (e.g. from the baseline file)
+
+    Returns:
+        {"regressions": [...], "improvements": [...], "parity_failures": [...]};
+        each entry names the case and both values
+    """
+    tolerances = {**baseline.get("tolerances", {}), **(tolerances or {})}
+    report: Dict[str, List[Dict[str, Any]]] = {"regressions": [], "improvements": [], "parity_failures": []}
+
+    base_cases = baseline.get("benchmarks", {})
+    for name, entry in results.get("benchmarks", {}).items():
+        base = base_cases.get(name)
+        if base is None or "value" not in entry or "value" not in base or base["value"] <= 0:
+            continue
+        allowed = tolerances.get(name, tolerance)
+        ratio = entry["value"] / base["value"]
+        # Speedup > 1 is better for both rates and durations
+        speedup = ratio if entry.get("higher_is_better", True) else 1.0 / ratio if ratio > 0 else 0.0
+        row = {"name": name, "value": entry["value"], "baseline": base["value"], "speedup": speedup}
+        if speedup < 1.0 - allowed:
+            report["regressions"].append(row)
+        elif speedup > 1.0 + allowed:
+            report["improvements"].append(row)
+
+    base_parity = baseline.get("parity", {})
+    for name, digest in results.get("parity", {}).items():
+        expected = base_parity.get(name)
+        if expected is not None and expected != digest:
+            report["parity_failures"].append({"name": name, "value": digest, "baseline": expected})
+    return report
@@ -0,0 +1,53 @@
+"""
+Import-time measurement for worker entry points.
+
+Evaluation workers import the headless game and the evaluator in a fresh
+interpreter, so their start-up cost is the import cost. Each measurement runs
+in a new subprocess (nothing cached in ``sys.modules``) and also reports which
+rendering/deep-learning packages the import pulled in; the headless path
+should load none of them.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict
+
+# Packages a headless evaluation worker must not need
+HEAVY_MODULES = ("arcade", "pyglet", "tensorflow", "torch")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "ms": elapsed * 1000.0,
+    "modules": len(sys.modules),
+    "heavy": sorted(name for name in {heavy!r} if name in sys.modules),
+}}))
+"""
+
+
+def measure_import(module: str) -> Dict[str, Any]:
+    """
+    Import ``module`` in a fresh interpreter.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        {"ms": import time, "modules": sys.modules size afterwards,
+         "heavy": HEAVY_MODULES that ended up loaded}
+    """
+    code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env,
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
@@ -0,0 +1,193 @@
+"""
+Trajectory-parity checks.
+
+Each check replays fixed-seed workloads and hashes everything an optimization
+must not change: sprite state every tick, event and metric counters, step
+rewards, encoder outputs and whole-episode evaluation results. A digest that
+differs from the stored baseline means game outcomes changed.
+
+Floats are hashed through ``repr`` (shortest round-trip form), so digests are
+exact. They are stable on one platform; record a new baseline on a new
+machine from a commit known to be correct.
+"""
+
+import hashlib
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from benchmarks.workloads import (
+    EARLY_GAME, FRAME_DELAY, LATE_GAME, ScriptedPolicy, boolean_actions,
+    ga_encoder, make_game, random_population
+)
+from interfaces.BatchedRewardCalculator import BatchedRewardCalculator, TickGeometry
+from interfaces.encoders.VectorEncoder import VectorEncoder
+from training.config.genetic_algorithm import GAConfig
+from training.config.rewards import create_reward_calculator
+
+PARITY_SEEDS = (0, 1, 2, 3)
+PARITY_TICKS = 600
+
+CHECKS: Dict[str, Callable[[], str]] = {}
+
+
+def parity_check(name: str):
+    def register(func):
+        CHECKS[name] = func
+        return func
+    return register
+
+
+class Fingerprint:
+    """Incremental SHA-256 over repr() of the values fed to it."""
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+
+    def add(self, value) -> None:
+        if isinstance(value, np.ndarray):
+            self._hash.update(str(value.dtype).encode())
+            self._hash.update(np.ascontiguousarray(value).tobytes())
+        else:
+            self._hash.update(repr(value).encode())
+        self._hash.update(b"|")
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def game_snapshot(game) -> tuple:
+    """
+    Everything on_update mutates, in a hashable, order-preserving form.
+
+    Continuous quantities go through float() so an equal int (e.g. a sprite
+    wrapped to exactly 0) hashes the same on every code path.
+    """
+    player = game.player
+    metrics = game.metrics_tracker
+    return (
+        tuple(map(float, (player.center_x, player.center_y, player.change_x, player.change_y,
+                          player.angle, player.shoot_timer))) + (player in game.player_list,),
+        tuple(tuple(map(float, (a.center_x, a.center_y, a.change_x, a.change_y, a.angle, a.this_scale))) + (a.hp,)
+              for a in game.asteroid_list),
+        tuple((float(b.center_x), float(b.center_y), b.lifetime) for b in game.bullet_list),
+        (metrics.total_shots_fired, metrics.total_hits, metrics.total_kills, float(metrics.time_alive)),
+        float(game.time_since_last_spawn),
+    )
+
+
+def _play(phase: str, continuous: bool = False, repeat: int = 1, with_reward: bool = False) -> str:
+    """
+    Scripted play of every parity seed, hashed after each decision.
+
+    The game steps through ``step_repeated``; with ``with_reward`` the
+    per-step and episode rewards are hashed too.
+    """
+    fingerprint = Fingerprint()
+    for seed in PARITY_SEEDS:
+        game = make_game(seed, phase)
+        policy = ScriptedPolicy(seed)
+        calculator = None
+        if with_reward:
+            calculator = create_reward_calculator(max_steps=PARITY_TICKS, frame_delay=FRAME_DELAY)
+            calculator.reset()
+        ticks = 0
+        while ticks < PARITY_TICKS and game.player in game.player_list:
+            if continuous:
+                policy.apply_continuous(game)
+            else:
+                policy.apply(game)
+            reward, frames, _ = game.step_repeated(FRAME_DELAY, repeat, calculator)
+            if calculator is not None:
+                fingerprint.add(reward)
+            ticks += frames
+            fingerprint.add(game_snapshot(game))
+        if calculator is not None:
+            fingerprint.add(calculator.calculate_episode_reward(game.metrics_tracker))
+            fingerprint.add(sorted(calculator.get_reward_breakdown().items()))
+            fingerprint.add(calculator.get_quarterly_scores())
+    return fingerprint.hexdigest()
+
+
+@parity_check("game.early")
+def game_early() -> str:
+    return _play(EARLY_GAME)
+
+
+@parity_check("game.late")
+def game_late() -> str:
+    return _play(LATE_GAME)
+
+
+@parity_check("game.continuous_rewards")
+def game_continuous_rewards() -> str:
+    return _play(EARLY_GAME, continuous=True, repeat=4, with_reward=True)
+
+
+@parity_check("game.late_repeat10")
+def game_late_repeat10() -> str:
+    return _play(LATE_GAME, repeat=10)
+
+
+@parity_check("encoder.batch")
+def encoder_batch() -> str:
+    """Batched Vector/Hybrid encodings of stepped late-game states."""
+    fingerprint = Fingerprint()
+    games = [make_game(seed, LATE_GAME) for seed in PARITY_SEEDS]
+    policies = [ScriptedPolicy(seed) for seed in PARITY_SEEDS]
+    encoders = [VectorEncoder(), ga_encoder()]
+    for _ in range(120):
+        trackers = [game.tracker for game in games]
+        for encoder in encoders:
+            fingerprint.add(encoder.encode_batch(trackers))
+        for game, policy in zip(games, policies):
+            if game.player in game.player_list:
+                policy.apply(game)
+                game.on_update(FRAME_DELAY)
+    return fingerprint.hexdigest()
+
+
+@parity_check("reward.batch")
+def reward_batch() -> str:
+    fingerprint = Fingerprint()
+    games = [make_game(seed, LATE_GAME) for seed in PARITY_SEEDS]
+    policies = [ScriptedPolicy(seed) for seed in PARITY_SEEDS]
+    template = create_reward_calculator(max_steps=PARITY_TICKS, frame_delay=FRAME_DELAY)
+    calculator = BatchedRewardCalculator(template, len(games))
+    active = np.ones(len(games), dtype=bool)
+    for _ in range(PARITY_TICKS):
+        for i, game in enumerate(games):
+            if active[i]:
+                policies[i].apply(game)
+                game.on_update(FRAME_DELAY)
+                game.metrics_tracker.update(game)
+        fingerprint.add(calculator.calculate_step_rewards(TickGeometry(games), active))
+        active &= np.array([game.player in game.player_list for game in games])
+        if not active.any():
+            break
+    return fingerprint.hexdigest()
+
+
+@parity_check("rollout.evaluate_single_agent")
+def rollout_evaluate_single_agent() -> str:
+    """Full GA episodes of fixed random agents (fitness, counters, breakdowns)."""
+    from training.core.population_evaluator import evaluate_single_agent
+
+    fingerprint = Fingerprint()
+    encoder = ga_encoder()
+    actions = boolean_actions()
+    for seed, params in zip(PARITY_SEEDS, random_population(len(PARITY_SEEDS), seed=7, encoder=encoder)):
+        result = evaluate_single_agent(
+            params, encoder, actions, max_steps=PARITY_TICKS, random_seed=seed,
+            hidden_size=GAConfig.HIDDEN_LAYER_SIZE, profile=False
+        )
+        for key in ('fitness', 'steps_survived', 'kills', 'shots_fired', 'hits', 'time_alive',
+                    'thrust_frames', 'turn_frames', 'shoot_frames', 'quarterly_scores'):
+            fingerprint.add(result[key])
+        fingerprint.add(sorted(result['reward_breakdown'].items()))
+    return fingerprint.hexdigest()
+
+
+def run_checks(names: List[str]) -> Dict[str, str]:
+    """Run the named checks; returns {name: digest}."""
+    return {name: CHECKS[name]() for name in names}
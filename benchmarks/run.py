@@ -0,0 +1,154 @@
+"""
+Benchmark Suite Runner
+
+Runs the timed cases and trajectory-parity checks, writes the results as
+JSON and compares them with the stored baseline. Exits non-zero on a parity
+mismatch or a slowdown beyond the tolerance.
+
+    python -m benchmarks.run
+    python -m benchmarks.run --quick --only env encoder
+    python -m benchmarks.run --parity-only
+    python -m benchmarks.run --update-baseline      # after an intended change
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from typing import Any, Dict, List
+
+import numpy as np
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from benchmarks.cases import CASES, RunSettings, run_cases
+from benchmarks.compare import DEFAULT_TOLERANCE, compare_results
+from benchmarks.parity import CHECKS, run_checks
+
+SCHEMA_VERSION = 1
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def _select(names: List[str], prefixes: List[str]) -> List[str]:
+    if not prefixes:
+        return list(names)
+    return [name for name in names if any(name == p or name.startswith(p + ".") for p in prefixes)]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def environment_info() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def run_suite(prefixes: List[str], settings: RunSettings, parity: bool = True, timings: bool = True) -> Dict[str, Any]:
+    """Run the selected cases/checks and return the results document."""
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "environment": environment_info(),
+        "settings": {"min_seconds": settings.min_seconds, "repeats": settings.repeats, "quick": settings.quick},
+        "benchmarks": run_cases(_select(CASES, prefixes), settings) if timings else {},
+        "parity": run_checks(_select(CHECKS, prefixes)) if parity else {},
+    }
+
+
+def _print_results(results: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    base_cases = baseline.get("benchmarks", {})
+    if results["benchmarks"]:
+        print(f"{'case':<28} {'value':>14} {'unit':<14} {'baseline':>14} {'change':>8}")
+        for name, entry in results["benchmarks"].items():
+            if "skipped" in entry:
+                print(f"{name:<28} {'skipped':>14} ({entry['skipped']})")
+                continue
+            base = base_cases.get(name, {}).get("value")
+            change = f"{(entry['value'] / base - 1) * 100:+7.1f}%" if base else f"{'-':>8}"
+            base_text = f"{base:14.4g}" if base else f"{'-':>14}"
+            print(f"{name:<28} {entry['value']:14.4g} {entry['unit']:<14} {base_text} {change}")
+    base_parity = baseline.get("parity", {})
+    for name, digest in results["parity"].items():
+        expected = base_parity.get(name)
+        status = "new" if expected is None else "ok" if expected == digest else "CHANGED"
+        print(f"parity {name:<32} {digest[:16]}  {status}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the simulation/training benchmark suite")
+    parser.add_argument("--only", nargs="+", default=[], help="Case/check name prefixes (e.g. env encoder.hybrid)")
+    parser.add_argument("--quick", action="store_true", help="Shorter timings; skip the largest generations")
+    parser.add_argument("--min-seconds", type=float, default=None, help="Timed work per repeat")
+    parser.add_argument("--repeats", type=int, default=None, help="Repeats per case (best is kept)")
+    parser.add_argument("--parity-only", action="store_true", help="Run the parity checks only")
+    parser.add_argument("--no-parity", action="store_true", help="Skip the parity checks")
+    parser.add_argument("--out", default="benchmark_results.json", help="Results JSON path ('' to skip)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative slowdown before a case counts as a regression")
+    parser.add_argument("--update-baseline", action="store_true", help="Write these results as the new baseline")
+    args = parser.parse_args()
+
+    settings = RunSettings(quick=args.quick)
+    if args.quick:
+        settings.min_seconds, settings.repeats = 0.3, 2
+    if args.min_seconds is not None:
+        settings.min_seconds = args.min_seconds
+    if args.repeats is not None:
+        settings.repeats = args.repeats
+
+    results = run_suite(args.only, settings, parity=not args.no_parity, timings=not args.parity_only)
+
+    baseline: Dict[str, Any] = {}
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    _print_results(results, baseline)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Results: {args.out}")
+
+    if args.update_baseline:
+        # Keep entries of cases that were not run this time, and any tolerances
+        merged = {**baseline, **{k: v for k, v in results.items() if k not in ("benchmarks", "parity")}}
+        merged["benchmarks"] = {**baseline.get("benchmarks", {}),
+                                **{k: v for k, v in results["benchmarks"].items() if "skipped" not in v}}
+        merged["parity"] = {**baseline.get("parity", {}), **results["parity"]}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(merged, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    report = compare_results(results, baseline, args.tolerance)
+    for row in report["improvements"]:
+        print(f"[FASTER] {row['name']}: {row['speedup']:.2f}x baseline")
+    for row in report["regressions"]:
+        print(f"[SLOWER] {row['name']}: {row['speedup']:.2f}x baseline (tolerance {args.tolerance:.0%})")
+    for row in report["parity_failures"]:
+        print(f"[PARITY] {row['name']}: outcomes differ from baseline")
+    if report["regressions"] or report["parity_failures"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
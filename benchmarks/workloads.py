@@ -0,0 +1,82 @@
+"""
+Canonical fixed-seed workloads shared by the benchmark cases and parity checks.
+
+Every workload is a pure function of its seed, so two runs (or two commits)
+time and fingerprint exactly the same game states.
+"""
+
+import random
+from typing import List
+
+import numpy as np
+
+from game import globals
+from game.headless_game import HeadlessAsteroidsGame
+from interfaces.ActionInterface import ActionInterface
+from interfaces.encoders.HybridEncoder import HybridEncoder
+from ai_agents.neuroevolution.nn_agent import NNAgent
+from training.config.genetic_algorithm import GAConfig
+
+FRAME_DELAY = 1.0 / 60.0
+
+EARLY_GAME = "early"   # Fresh reset: 8 asteroids
+LATE_GAME = "late"     # Crowded field, like a long episode's late game
+LATE_GAME_ASTEROIDS = 40
+
+
+def make_game(seed: int, phase: str = EARLY_GAME) -> HeadlessAsteroidsGame:
+    """Headless game reset with ``seed``; ``LATE_GAME`` tops the field up to
+    ``LATE_GAME_ASTEROIDS`` asteroids from the game's own RNG."""
+    game = HeadlessAsteroidsGame(random_seed=seed)
+    game.reset_game()
+    if phase == LATE_GAME:
+        while len(game.asteroid_list) < LATE_GAME_ASTEROIDS:
+            game.spawn_asteroid()
+    game.tracker.update(game)
+    game.metrics_tracker.update(game)
+    return game
+
+
+class ScriptedPolicy:
+    """Seeded random button presses (a stand-in for an agent with no model cost)."""
+
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+
+    def apply(self, game: HeadlessAsteroidsGame) -> None:
+        rng = self.rng
+        game.left_pressed = rng.random() < 0.3
+        game.right_pressed = rng.random() < 0.3
+        game.up_pressed = rng.random() < 0.3
+        game.space_pressed = rng.random() < 0.8
+
+    def apply_continuous(self, game: HeadlessAsteroidsGame) -> None:
+        rng = self.rng
+        game.continuous_control_mode = True
+        game.turn_magnitude = rng.uniform(-1.0, 1.0)
+        game.thrust_magnitude = rng.random()
+        game.shoot_requested = rng.random() < 0.7
+
+
+def ga_encoder() -> HybridEncoder:
+    """The encoder GA training uses (training/scripts/train_ga.py)."""
+    return HybridEncoder(
+        screen_width=globals.SCREEN_WIDTH,
+        screen_height=globals.SCREEN_HEIGHT,
+        num_rays=16,
+        num_fovea_asteroids=3
+    )
+
+
+def boolean_actions() -> ActionInterface:
+    return ActionInterface(action_space_type="boolean")
+
+
+def random_population(size: int, seed: int, encoder=None, hidden_size: int = GAConfig.HIDDEN_LAYER_SIZE) -> List[List[float]]:
+    """``size`` NNAgent parameter vectors drawn from N(0, 0.5) with ``seed``."""
+    encoder = encoder or ga_encoder()
+    param_count = NNAgent.get_parameter_count(
+        encoder.get_state_size(), hidden_size, boolean_actions().get_action_space_size()
+    )
+    rng = np.random.default_rng(seed)
+    return [rng.normal(0.0, 0.5, param_count).tolist() for _ in range(size)]
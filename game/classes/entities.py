@@ -0,0 +1,294 @@
+"""
+Game entity logic without the rendering stack.
+
+``PlayerEntity``, ``AsteroidEntity`` and ``BulletEntity`` hold the physics and
+gameplay rules of the three sprite types. They are mixins: the windowed game
+combines them with ``arcade.Sprite`` (game/classes/player.py, asteroid.py,
+bullet.py) and the headless game with ``HeadlessSprite``, a plain-attribute
+stand-in, so headless rollouts never import arcade/pyglet.
+
+Each entity calls ``self._init_sprite(texture, scale)`` where the original
+code called ``arcade.Sprite.__init__``; subclasses route it to their base.
+"""
+
+import itertools
+import math
+import random
+
+from game import globals
+
+ASTEROID_TEXTURES = [
+    "game/sprites/Asteroid_Large_1.png",
+    "game/sprites/Asteroid_Large_2.png",
+    "game/sprites/Asteroid_Large_3.png",
+    "game/sprites/Asteroid_Large_4.png"
+]
+
+# Process-wide asteroid ids (reported in per-tick game events)
+_asteroid_ids = itertools.count()
+
+
+class HeadlessSprite:
+    """
+    The part of arcade.Sprite the game logic uses, as plain attributes.
+
+    Textures are kept as paths and never loaded; collisions in the headless
+    game use explicit radii, not sprite sizes.
+    """
+
+    def _init_sprite(self, texture=None, scale=1.0):
+        self.texture = texture
+        self.scale = scale
+        self.center_x = 0.0
+        self.center_y = 0.0
+        self.change_x = 0.0
+        self.change_y = 0.0
+        self.angle = 0.0
+
+    def remove_from_sprite_lists(self):
+        """Headless games keep plain lists and filter expired sprites themselves."""
+
+
+class BulletEntity:
+    def __init__(self, x, y, angle, texture="game/sprites/Bullet.png", scale=globals.BULLET_SCALE):
+        self._init_sprite(texture, scale)
+        self.center_x = x
+        self.center_y = y
+        self.angle = angle
+        self.bullet_speed = globals.BULLET_SPEED
+
+        # Convert angle to radians for velocity calculations
+        angle_rad = math.radians(angle)
+        self.change_x = math.sin(angle_rad) * self.bullet_speed
+        self.change_y = math.cos(angle_rad) * self.bullet_speed
+
+        # Disappear after lifetime runs out
+        self.lifetime = globals.BULLET_LIFETIME
+
+    def update(self, delta_time: float = 1/60):
+        """Move the bullet and remove it if lifetime runs out."""
+        self.center_x += self.change_x
+        self.center_y += self.change_y
+        self.lifetime -= 1
+
+        if self.lifetime <= 0:
+            self.remove_from_sprite_lists()
+
+
+class PlayerEntity:
+    # Bullet type fired by shoot() (set by the concrete sprite class)
+    bullet_class = None
+
+    def __init__(self, texture="game/sprites/Player.png", scale=globals.PLAYER_SCALE):
+        self._init_sprite(texture, scale)
+        # Start in the middle of the screen (hard coded leave me alone)
+        self.center_x = 400
+        self.center_y = 300
+
+        # Movement
+        self.change_x = 0
+        self.change_y = 0
+        self.acceleration = globals.PLAYER_ACCELERATION
+        self.rotation_speed = globals.PLAYER_ROTATION_SPEED
+        self.slowdown = globals.PLAYER_FRICTION
+
+        # Shooting
+        self.shoot_cooldown = globals.BULLET_COOLDOWN
+        self.shoot_timer = 0        # timer that goes down each frame
+
+    def update(self, delta_time: float = 1/60) -> None:
+        """Update the player's movement, apply friction, and manage the shoot timer."""
+        # Update position
+        self.center_x += self.change_x
+        self.center_y += self.change_y
+
+        # Reduce the time until we can shoot again
+        if self.shoot_timer >= 0:
+            self.shoot_timer -= delta_time
+
+        # Apply friction (slight movement decay)
+        self.change_x *= self.slowdown
+        self.change_y *= self.slowdown
+
+    def rotate_left(self):
+        """
+        Rotate the ship instantly to the left by a fixed step.
+        """
+        self.angle -= self.rotation_speed
+
+    def rotate_right(self):
+        """Rotate the ship instantly to the right by a fixed step."""
+        self.angle += self.rotation_speed
+
+    def thrust_forward(self):
+        """Accelerate in the direction the ship is currently facing."""
+        angle_rad = math.radians(self.angle)
+        self.change_x += math.sin(angle_rad) * self.acceleration
+        self.change_y += math.cos(angle_rad) * self.acceleration
+
+    def apply_continuous_controls(self, turn_magnitude: float, thrust_magnitude: float):
+        """
+        Apply analog/continuous controls for RL agents.
+
+        Args:
+            turn_magnitude: Signed turn value in [-1, 1]. Negative = left, positive = right.
+            thrust_magnitude: Thrust value in [0, 1]. Proportional acceleration.
+        """
+        # Proportional rotation: scale rotation_speed by turn magnitude
+        self.angle += turn_magnitude * self.rotation_speed
+
+        # Proportional thrust: scale acceleration by thrust magnitude
+        if thrust_magnitude > 0:
+            angle_rad = math.radians(self.angle)
+            self.change_x += math.sin(angle_rad) * self.acceleration * thrust_magnitude
+            self.change_y += math.cos(angle_rad) * self.acceleration * thrust_magnitude
+
+    def shoot(self):
+        """Fire a bullet if the cooldown is up."""
+        if self.shoot_timer <= 0:
+            self.shoot_timer = self.shoot_cooldown
+            return self.bullet_class(self.center_x, self.center_y, self.angle)
+        return None
+
+    def get_max_distance(self, screen_width: int, screen_height: int) -> float:
+        """Get the maximum distance the player can travel in the screen."""
+        return math.sqrt(screen_width**2 + screen_height**2)
+
+    def get_distance(self, x: float, y: float) -> float:
+        """Get the distance between the player and a point."""
+        return math.sqrt((self.center_x - x)**2 + (self.center_y - y)**2)
+
+
+class AsteroidEntity:
+    def __init__(
+            self,
+            screen_width,
+            screen_height,
+            texture=None,
+            scale=globals.ASTEROID_SCALE_LARGE,
+            rng=None,  # Optional isolated Random instance for reproducibility
+            spawn=None  # Optional pre-rolled (center_x, center_y, change_x, change_y, rotation_speed)
+    ):
+        # Use provided RNG or fall back to global random module
+        self._rng = rng if rng is not None else random
+
+        if texture is None:
+            texture = self._rng.choice(ASTEROID_TEXTURES)
+
+        self._init_sprite(texture, scale)
+
+        self.this_scale = scale
+        self.uid = next(_asteroid_ids)
+
+        # Determine HP based on scale
+        if self.this_scale >= globals.ASTEROID_SCALE_LARGE:
+            self.hp = globals.ASTEROID_HP_LARGE
+        elif self.this_scale >= globals.ASTEROID_SCALE_MEDIUM:
+            self.hp = globals.ASTEROID_HP_MEDIUM
+        else:
+            self.hp = globals.ASTEROID_HP_SMALL
+
+        if spawn is None:
+            # Randomly choose an edge for initial position
+            # (or random positions around any edge)
+            self.center_x = self._rng.choice([0, screen_width])
+            self.center_y = self._rng.choice([0, screen_height])
+
+        # Speed based on size
+        if self.this_scale >= globals.ASTEROID_SCALE_LARGE:
+            self.max_speed = globals.ASTEROID_SPEED_LARGE
+        elif self.this_scale >= globals.ASTEROID_SCALE_MEDIUM:
+            self.max_speed = globals.ASTEROID_SPEED_MEDIUM
+        else:
+            self.max_speed = globals.ASTEROID_SPEED_SMALL
+
+        if spawn is None:
+            # Random direction
+            self.change_x = self._rng.uniform(-self.max_speed, self.max_speed)
+            self.change_y = self._rng.uniform(-self.max_speed, self.max_speed)
+
+            # Random rotation spin
+            self.rotation_speed = self._rng.uniform(-self.max_speed * 3, self.max_speed * 3)
+        else:
+            # Values drawn ahead of time by a SpawnSchedule (same RNG order)
+            self.center_x, self.center_y, self.change_x, self.change_y, self.rotation_speed = spawn
+
+        # Lifetime if you want them to disappear eventually, scales with size
+        self.lifetime = 1200 * self.this_scale
+
+        # Keep track of screen bounds to pass to child asteroids if needed
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+
+    def update(self, delta_time: float = 1 / 60):
+        """Move the asteroid each frame."""
+        self.center_x += self.change_x
+        self.center_y += self.change_y
+        self.angle += self.rotation_speed
+
+        # Decrement lifetime if you're using timed destruction
+        self.lifetime -= 1
+        if self.lifetime <= 0:
+            self.remove_from_sprite_lists()
+
+    def break_asteroid(self) -> list:
+        """
+        Returns a list of new child asteroids when this asteroid is destroyed.
+        - Large spawns 2 medium.
+        - Medium spawns 3 small.
+        - Small spawns nothing.
+        """
+        new_asteroids = []
+
+        # Large => spawn children at scale=MEDIUM
+        if self.this_scale >= globals.ASTEROID_SCALE_LARGE:
+            for _ in range(2):
+                child = self._spawn_child(new_scale=globals.ASTEROID_SCALE_MEDIUM)
+                new_asteroids.append(child)
+
+        # Medium => spawn children at scale=SMALL
+        elif self.this_scale >= globals.ASTEROID_SCALE_MEDIUM:
+            for _ in range(3):
+                child = self._spawn_child(new_scale=globals.ASTEROID_SCALE_SMALL)
+                new_asteroids.append(child)
+
+        # Small => no children
+        return new_asteroids
+
+    def _spawn_child(self, new_scale: float) -> "AsteroidEntity":
+        """
+        Internal helper to spawn a new asteroid at this asteroid's position,
+        but with new random velocity & rotation.
+        """
+        child = type(self)(
+            screen_width=self.screen_width,
+            screen_height=self.screen_height,
+            texture=self.texture,
+            scale=new_scale,
+            rng=self._rng  # Pass our RNG for reproducibility
+        )
+        # Place child at the same position
+        child.center_x = self.center_x
+        child.center_y = self.center_y
+
+        # Randomize children's speed and rotation using our RNG
+        child.change_x = self._rng.uniform(-child.max_speed, child.max_speed)
+        child.change_y = self._rng.uniform(-child.max_speed, child.max_speed)
+        child.rotation_speed = self._rng.uniform(-child.max_speed * 3, child.max_speed * 3)
+
+        # (Optional) shorter lifetime for smaller ones, if you like
+        child.lifetime = self.lifetime  # or maybe self.lifetime / 2, etc.
+
+        return child
+
+
+class HeadlessBullet(BulletEntity, HeadlessSprite):
+    pass
+
+
+class HeadlessPlayer(PlayerEntity, HeadlessSprite):
+    bullet_class = HeadlessBullet
+
+
+class HeadlessAsteroid(AsteroidEntity, HeadlessSprite):
+    pass
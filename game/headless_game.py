@@ -8,8 +8,9 @@ Used for fast parallel evaluation of multiple agents.
 import math
 import random
 from game import globals
-from game.classes.player import Player
-from game.classes.asteroid import Asteroid
+from game.classes.entities import ASTEROID_TEXTURES, HeadlessAsteroid as Asteroid, HeadlessPlayer as Player
+from game.profiler import NULL_PROFILER
+from game.tick_events import EVENT_DEATH, EVENT_HIT, EVENT_KILL, EVENT_SHOT, EVENT_SPAWN, EVENT_SPLIT, TickEvents
 from interfaces.EnvironmentTracker import EnvironmentTracker
 from interfaces.MetricsTracker import MetricsTracker
 from interfaces.RewardCalculator import ComposableRewardCalculator
@@ -28,13 +29,15 @@ class HeadlessAsteroidsGame:
     No rendering, no arcade.Window - just game logic.
     """
 
-    def __init__(self, width=800, height=600, random_seed=None):
+    def __init__(self, width=800, height=600, random_seed=None, spawn_schedule=None):
         """Initialize headless game.
 
         Args:
             width: Screen width
             height: Screen height
             random_seed: If provided, use isolated Random instance for reproducibility
+            spawn_schedule: Optional pre-rolled SpawnSchedule for ``random_seed``.
+                Ignored if it was built for a different seed or screen size.
         """
         self.width = width
         self.height = height
@@ -46,6 +49,14 @@ class HeadlessAsteroidsGame:
         else:
             self.rng = random.Random()
 
+        # Pre-rolled spawn stream (shared read-only) and our position in it.
+        # The cursor is dropped at the first split, after which self.rng is live.
+        self.spawn_schedule = None
+        self._schedule_cursor = 0
+        if spawn_schedule is not None and random_seed is not None \
+                and spawn_schedule.matches(random_seed, width, height):
+            self.spawn_schedule = spawn_schedule
+
         # Set game variables
         self.player_list = []
         self.asteroid_list = []
@@ -69,6 +80,12 @@ class HeadlessAsteroidsGame:
         self.last_player_y = 0
         self.movement_threshold = 25
 
+        # Per-tick event records (cleared at the start of every on_update)
+        self.events = TickEvents()
+
+        # Span profiler for on_update phases (game/profiler.py; no-op by default)
+        self.profiler = NULL_PROFILER
+
         # Trackers
         self.tracker = EnvironmentTracker(self)
         self.metrics_tracker = MetricsTracker(self)
@@ -115,6 +132,25 @@ class HeadlessAsteroidsGame:
     
     def spawn_asteroid(self):
         """Spawn a new asteroid using isolated RNG."""
+        schedule = self.spawn_schedule
+        if schedule is not None:
+            i = self._schedule_cursor
+            if i < len(schedule):
+                self._schedule_cursor = i + 1
+                asteroid = Asteroid(
+                    screen_width=self.width,
+                    screen_height=self.height,
+                    texture=ASTEROID_TEXTURES[schedule.textures[i]],
+                    scale=schedule.scales[i],
+                    rng=self.rng,
+                    spawn=(schedule.xs[i], schedule.ys[i], schedule.vxs[i],
+                           schedule.vys[i], schedule.spins[i])
+                )
+                self.asteroid_list.append(asteroid)
+                self.events.add(EVENT_SPAWN, asteroid.uid, asteroid.center_x, asteroid.center_y, asteroid.this_scale)
+                return
+            self._release_spawn_schedule()
+
         roll = self.rng.random()
 
         if roll < 0.4:
@@ -132,9 +168,22 @@ class HeadlessAsteroidsGame:
             rng=self.rng  # Pass our isolated RNG
         )
         self.asteroid_list.append(asteroid)
+        self.events.add(EVENT_SPAWN, asteroid.uid, asteroid.center_x, asteroid.center_y, asteroid.this_scale)
+
+    def _release_spawn_schedule(self):
+        """Stop reading the schedule and bring self.rng to the matching live state."""
+        if self.spawn_schedule is None:
+            return
+        self.spawn_schedule.fast_forward(self.rng, self._schedule_cursor)
+        self.spawn_schedule = None
     
     def on_update(self, delta_time):
         """Update game state (no rendering)."""
+        events = self.events
+        events.clear()
+        profiler = self.profiler
+        mark = profiler.now()
+
         # Update sprites
         for sprite in self.player_list:
             sprite.update()
@@ -153,6 +202,7 @@ class HeadlessAsteroidsGame:
             self.wrap_sprite(bullet)
         for asteroid in self.asteroid_list[:]:
             self.wrap_sprite(asteroid)
+        mark = profiler.lap("physics.movement", mark)
         
         # Bullet-asteroid collisions
         # NOTE: We use explicit collision radii because sprite.width may be 0 in headless mode
@@ -180,20 +230,26 @@ class HeadlessAsteroidsGame:
                         self.bullet_list.remove(bullet)
                     
                     self.metrics_tracker.total_hits += 1
-                    
+                    events.add(EVENT_HIT, asteroid.uid, asteroid.center_x, asteroid.center_y, asteroid.this_scale)
+
                     # Damage asteroid
                     asteroid.hp -= 1
                     
                     if asteroid.hp <= 0:
+                        # Split draws interleave with spawns per agent; go live
+                        if asteroid.this_scale >= globals.ASTEROID_SCALE_MEDIUM:
+                            self._release_spawn_schedule()
                         new_asteroids = asteroid.break_asteroid()
                         if asteroid in self.asteroid_list:
                             self.asteroid_list.remove(asteroid)
                         
                         self.metrics_tracker.total_kills += 1
-                        
+                        events.add(EVENT_KILL, asteroid.uid, asteroid.center_x, asteroid.center_y, asteroid.this_scale)
+
                         # Add child asteroids
                         for child in new_asteroids:
                             self.asteroid_list.append(child)
+                            events.add(EVENT_SPLIT, child.uid, child.center_x, child.center_y, child.this_scale)
                     
                     break
         
@@ -214,6 +270,7 @@ class HeadlessAsteroidsGame:
                 collision_threshold = PLAYER_COLLISION_RADIUS + asteroid_radius
 
                 if distance < collision_threshold:
+                    events.add(EVENT_DEATH, asteroid.uid, self.player.center_x, self.player.center_y)
                     if self.auto_reset_on_collision:
                         self.reset_game()
                     else:
@@ -221,6 +278,7 @@ class HeadlessAsteroidsGame:
                         if self.player in self.player_list:
                             self.player_list.remove(self.player)
                     break
+        mark = profiler.lap("physics.collisions", mark)
         
         # Handle player input
         if self.player in self.player_list:
@@ -232,6 +290,7 @@ class HeadlessAsteroidsGame:
                     if bullet:
                         self.bullet_list.append(bullet)
                         self.metrics_tracker.total_shots_fired += 1
+                        events.add(EVENT_SHOT, -1, bullet.center_x, bullet.center_y)
             else:
                 # Boolean control path (GA/ES/NEAT) - unchanged
                 if self.left_pressed:
@@ -245,6 +304,8 @@ class HeadlessAsteroidsGame:
                     if bullet:
                         self.bullet_list.append(bullet)
                         self.metrics_tracker.total_shots_fired += 1
+                        events.add(EVENT_SHOT, -1, bullet.center_x, bullet.center_y)
+        mark = profiler.lap("physics.input", mark)
         
         # Update trackers
         self.metrics_tracker.time_alive += delta_time
@@ -259,7 +320,41 @@ class HeadlessAsteroidsGame:
         # Calculate rewards if enabled
         if self.update_internal_rewards:
             self.reward_calculator.calculate_step_reward(self.tracker, self.metrics_tracker)
+        profiler.lap("physics.trackers", mark)
     
+    def step_repeated(self, delta_time, repeat=1, reward_calculator=None, max_frames=None):
+        """Advance ``repeat`` physics frames with the current inputs held (action repeat).
+
+        Rewards are accumulated per frame and the loop stops on the first
+        frame the player dies, so a K-frame step scores exactly like K
+        single-frame steps with the same inputs.
+
+        Args:
+            delta_time: Time delta per physics frame
+            repeat: Number of frames to run
+            reward_calculator: Optional calculator queried after every frame
+            max_frames: Optional cap on frames run (e.g. remaining episode budget)
+
+        Returns:
+            Tuple of (summed step reward, frames run, player died)
+        """
+        total_reward = 0.0
+        frames = 0
+        limit = max(1, int(repeat))
+        if max_frames is not None:
+            limit = min(limit, max_frames)
+
+        while frames < limit:
+            self.on_update(delta_time)
+            self.metrics_tracker.update(self)
+            if reward_calculator is not None:
+                total_reward += reward_calculator.calculate_step_reward(self.tracker, self.metrics_tracker)
+            frames += 1
+            if self.player not in self.player_list:
+                return total_reward, frames, True
+
+        return total_reward, frames, False
+
     def wrap_sprite(self, sprite):
         """Wrap sprite around screen edges."""
         if sprite is None:
@@ -0,0 +1,126 @@
+"""
+Pre-rolled asteroid spawn schedules for common-random-number evaluation.
+
+When every agent in a generation plays the same seed set (CRN), each headless
+game replays exactly the same spawn rolls through its own ``random.Random``.
+A ``SpawnSchedule`` draws that stream once per seed and stores the results in
+flat, read-only tuples so games can build asteroids with an index lookup.
+
+The schedule only covers the spawn stream up to the first asteroid split:
+split draws interleave with spawn draws at agent-dependent times, so the
+first split hands control back to the game's RNG, which is fast-forwarded to
+the exact state it would have had. Trajectories are identical either way.
+"""
+
+import random
+from typing import Dict, Iterable, Tuple
+
+from game import globals
+from game.classes.entities import ASTEROID_TEXTURES
+
+# Asteroids spawned by HeadlessAsteroidsGame.reset_game()
+INITIAL_ASTEROIDS = 8
+
+
+def _draw_spawn(rng: random.Random, width: int, height: int) -> Tuple[float, int, float, float, float, float, float]:
+    """Draw one spawn event in the same call order as spawn_asteroid + Asteroid.__init__.
+
+    Returns:
+        (scale, texture_index, center_x, center_y, change_x, change_y, rotation_speed)
+    """
+    roll = rng.random()
+    if roll < 0.4:
+        scale = globals.ASTEROID_SCALE_SMALL
+    elif roll < 0.7:
+        scale = globals.ASTEROID_SCALE_MEDIUM
+    else:
+        scale = globals.ASTEROID_SCALE_LARGE
+
+    texture_index = rng.randrange(len(ASTEROID_TEXTURES))  # == rng.choice(ASTEROID_TEXTURES)
+    center_x = rng.choice([0, width])
+    center_y = rng.choice([0, height])
+
+    if scale >= globals.ASTEROID_SCALE_LARGE:
+        max_speed = globals.ASTEROID_SPEED_LARGE
+    elif scale >= globals.ASTEROID_SCALE_MEDIUM:
+        max_speed = globals.ASTEROID_SPEED_MEDIUM
+    else:
+        max_speed = globals.ASTEROID_SPEED_SMALL
+
+    change_x = rng.uniform(-max_speed, max_speed)
+    change_y = rng.uniform(-max_speed, max_speed)
+    rotation_speed = rng.uniform(-max_speed * 3, max_speed * 3)
+
+    return scale, texture_index, center_x, center_y, change_x, change_y, rotation_speed
+
+
+def estimate_spawn_events(max_steps: int, frame_delay: float = 1.0 / 60.0) -> int:
+    """Upper bound on spawn events for an episode of ``max_steps`` frames."""
+    timed = int(max_steps * frame_delay / globals.ASTEROID_SPAWN_INTERVAL) + 1
+    return INITIAL_ASTEROIDS + timed
+
+
+class SpawnSchedule:
+    """
+    Immutable pre-rolled spawn stream for one seed.
+
+    Shared read-only across worker threads; each game keeps its own cursor.
+    """
+
+    __slots__ = (
+        "seed", "width", "height",
+        "scales", "textures", "xs", "ys", "vxs", "vys", "spins",
+    )
+
+    def __init__(self, seed: int, num_events: int, width: int = 800, height: int = 600):
+        """
+        Args:
+            seed: Seed the headless game would pass to random.Random
+            num_events: Number of spawn events to pre-roll
+            width: Screen width used by the game
+            height: Screen height used by the game
+        """
+        self.seed = seed
+        self.width = width
+        self.height = height
+
+        rng = random.Random(seed)
+        events = [_draw_spawn(rng, width, height) for _ in range(num_events)]
+        columns = tuple(zip(*events)) if events else ((),) * 7
+        (self.scales, self.textures, self.xs, self.ys,
+         self.vxs, self.vys, self.spins) = columns
+
+    def __len__(self) -> int:
+        return len(self.scales)
+
+    def matches(self, seed: int, width: int, height: int) -> bool:
+        """Check whether this schedule reproduces a game built with these arguments."""
+        return seed == self.seed and width == self.width and height == self.height
+
+    def fast_forward(self, rng: random.Random, consumed: int) -> None:
+        """Reseed ``rng`` in place and replay ``consumed`` spawn events.
+
+        Leaves ``rng`` in the state a live game would have after spawning
+        ``consumed`` asteroids without any splits.
+        """
+        rng.seed(self.seed)
+        for _ in range(consumed):
+            _draw_spawn(rng, self.width, self.height)
+
+
+def build_spawn_schedules(seeds: Iterable[int], max_steps: int, frame_delay: float = 1.0 / 60.0,
+                          width: int = 800, height: int = 600) -> Dict[int, SpawnSchedule]:
+    """Build one schedule per distinct seed, sized for a full episode.
+
+    Args:
+        seeds: Seeds used in the generation
+        max_steps: Maximum steps per episode
+        frame_delay: Time delta per step
+        width: Screen width
+        height: Screen height
+
+    Returns:
+        Dict mapping seed -> SpawnSchedule
+    """
+    num_events = estimate_spawn_events(max_steps, frame_delay)
+    return {seed: SpawnSchedule(seed, num_events, width, height) for seed in set(seeds)}
@@ -0,0 +1,100 @@
+"""
+Per-tick game event buffer.
+
+The game clears the buffer at the start of every ``on_update`` and appends a
+compact record for each thing that happens during the tick (shot fired,
+bullet hit, asteroid destroyed, split child created, asteroid spawned, player
+death). Reward components and evaluators read the records instead of diffing
+cumulative counters or re-scanning the whole world every frame.
+
+Records live in preallocated NumPy columns that grow (doubling) only if a
+tick ever overflows them. Per-kind counts are kept alongside so the common
+"how many kills this tick" question is O(1).
+"""
+
+from typing import Iterator, Tuple
+
+import numpy as np
+
+# Event kinds
+EVENT_SHOT = 0    # Bullet fired (position = bullet spawn point)
+EVENT_HIT = 1     # Bullet hit an asteroid (asteroid id/position/scale)
+EVENT_KILL = 2    # Asteroid destroyed (asteroid id/position/scale before removal)
+EVENT_SPLIT = 3   # Child asteroid created by a kill (child id/position/scale)
+EVENT_SPAWN = 4   # Asteroid spawned by the game (id/position/scale)
+EVENT_DEATH = 5   # Player collided with an asteroid (asteroid id, player position)
+
+NUM_EVENT_KINDS = 6
+
+
+class TickEvents:
+    """
+    Fixed-capacity record of the events of one game tick.
+
+    Args:
+        capacity: Initial number of records (grows if exceeded)
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.kinds = np.zeros(capacity, dtype=np.int8)
+        self.asteroid_ids = np.zeros(capacity, dtype=np.int64)
+        self.xs = np.zeros(capacity, dtype=np.float64)
+        self.ys = np.zeros(capacity, dtype=np.float64)
+        self.scales = np.zeros(capacity, dtype=np.float64)
+        self.count = 0
+        self.counts = [0] * NUM_EVENT_KINDS
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        """Forget the previous tick's records (the buffers are reused)."""
+        if self.count:
+            self.count = 0
+            self.counts = [0] * NUM_EVENT_KINDS
+
+    def add(self, kind: int, asteroid_id: int = -1, x: float = 0.0, y: float = 0.0, scale: float = 0.0) -> None:
+        """Append one record."""
+        i = self.count
+        if i == len(self.kinds):
+            self._grow()
+        self.kinds[i] = kind
+        self.asteroid_ids[i] = asteroid_id
+        self.xs[i] = x
+        self.ys[i] = y
+        self.scales[i] = scale
+        self.count = i + 1
+        self.counts[kind] += 1
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self.kinds)
+        for name in ("kinds", "asteroid_ids", "xs", "ys", "scales"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    # Per-kind counts
+    @property
+    def shots(self) -> int:
+        return self.counts[EVENT_SHOT]
+
+    @property
+    def hits(self) -> int:
+        return self.counts[EVENT_HIT]
+
+    @property
+    def kills(self) -> int:
+        return self.counts[EVENT_KILL]
+
+    @property
+    def died(self) -> bool:
+        return self.counts[EVENT_DEATH] > 0
+
+    def iter_kind(self, kind: int) -> Iterator[Tuple[int, float, float, float]]:
+        """(asteroid_id, x, y, scale) of every record of ``kind``, in order."""
+        if not self.counts[kind]:
+            return
+        n = self.count
+        for i in np.flatnonzero(self.kinds[:n] == kind).tolist():
+            yield int(self.asteroid_ids[i]), float(self.xs[i]), float(self.ys[i]), float(self.scales[i])
@@ -0,0 +1,211 @@
+"""
+Batched reward calculation for N games stepped in lockstep.
+
+``TickGeometry`` gathers what reward components read each tick — player
+pose, padded asteroid arrays with wrapped offsets and distances, and the
+tick's shot/hit/kill counts from the game event buffers — once for all games.
+Components with a vectorized form (``RewardComponent.batched``) score every
+game with a few NumPy operations on that shared geometry; the rest are run
+per game on their own copies, so any reward preset works.
+
+Per-component totals live in an (N, C) array and quarterly scores come from
+per-game running totals, so nothing rescans the episode at the end.
+"""
+
+import copy
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from game.tick_events import EVENT_KILL
+from interfaces.RewardCalculator import ComposableRewardCalculator, quarter_bounds
+
+
+class TickGeometry:
+    """
+    Per-tick state of N games as arrays.
+
+    Attributes:
+        num_games: N
+        has_player, alive: (N,) player exists / player still in play
+        px, py, angle: (N,) player position and heading (degrees, 0 = up)
+        asteroid_mask: (N, M) valid entries of the padded asteroid arrays
+        rel_x, rel_y: (N, M) wrapped asteroid offset from the player
+        dist: (N, M) wrapped distance to the player (inf where masked)
+        shots, hits, kills: (N,) events of this tick
+        kill_game, kill_dist: (K,) game index and player distance of each kill
+        time_alive: (N,) seconds survived
+        trackers, metrics: Per-game trackers for components without a batched form
+    """
+
+    def __init__(self, games: Sequence):
+        n = len(games)
+        self.num_games = n
+        self.trackers = [game.tracker for game in games]
+        self.metrics = [game.metrics_tracker for game in games]
+        width = games[0].width if n else 0
+        height = games[0].height if n else 0
+
+        self.has_player = np.zeros(n, dtype=bool)
+        self.alive = np.zeros(n, dtype=bool)
+        self.px = np.zeros(n)
+        self.py = np.zeros(n)
+        self.angle = np.zeros(n)
+        self.shots = np.zeros(n, dtype=np.int64)
+        self.hits = np.zeros(n, dtype=np.int64)
+        self.kills = np.zeros(n, dtype=np.int64)
+        self.time_alive = np.zeros(n)
+
+        max_asteroids = max((len(game.asteroid_list) for game in games), default=0)
+        ax = np.zeros((n, max_asteroids))
+        ay = np.zeros((n, max_asteroids))
+        self.asteroid_mask = np.zeros((n, max_asteroids), dtype=bool)
+
+        kill_game, kill_x, kill_y = [], [], []
+        for i, game in enumerate(games):
+            player = game.player
+            if player is not None:
+                self.has_player[i] = True
+                self.alive[i] = player in game.player_list
+                self.px[i] = player.center_x
+                self.py[i] = player.center_y
+                self.angle[i] = player.angle
+            asteroids = game.asteroid_list
+            if asteroids:
+                count = len(asteroids)
+                ax[i, :count] = [a.center_x for a in asteroids]
+                ay[i, :count] = [a.center_y for a in asteroids]
+                self.asteroid_mask[i, :count] = True
+            events = game.events
+            self.shots[i] = events.shots
+            self.hits[i] = events.hits
+            self.kills[i] = events.kills
+            for _, x, y, _ in events.iter_kind(EVENT_KILL):
+                kill_game.append(i)
+                kill_x.append(x)
+                kill_y.append(y)
+            self.time_alive[i] = game.metrics_tracker.time_alive
+
+        self.rel_x = self._wrap(ax - self.px[:, None], width)
+        self.rel_y = self._wrap(ay - self.py[:, None], height)
+        dist = np.sqrt(self.rel_x * self.rel_x + self.rel_y * self.rel_y)
+        self.dist = np.where(self.asteroid_mask & self.has_player[:, None], dist, np.inf)
+
+        self.kill_game = np.asarray(kill_game, dtype=np.int64)
+        if kill_game:
+            kx = self._wrap(np.asarray(kill_x) - self.px[self.kill_game], width)
+            ky = self._wrap(np.asarray(kill_y) - self.py[self.kill_game], height)
+            self.kill_dist = np.sqrt(kx * kx + ky * ky)
+        else:
+            self.kill_dist = np.zeros(0)
+
+    @staticmethod
+    def _wrap(delta: np.ndarray, size: float) -> np.ndarray:
+        """Shortest signed offset on a wrapping axis of length ``size``."""
+        return np.where(np.abs(delta) > size / 2, delta - np.sign(delta) * size, delta)
+
+
+class BatchedRewardCalculator:
+    """
+    Reward calculator scoring N games per call.
+
+    Args:
+        template: Calculator whose enabled components (and their settings) are used
+        num_games: Number of games scored per step
+    """
+
+    def __init__(self, template: ComposableRewardCalculator, num_games: int):
+        self.num_games = num_games
+        self.names = list(template.enabled_components)
+        self.components = [copy.deepcopy(c) for c in template.enabled_components.values()]
+        # Scalar fallbacks keep their own per-game state
+        self.per_game = [
+            None if component.batched else [copy.deepcopy(component) for _ in range(num_games)]
+            for component in self.components
+        ]
+        self.reset()
+
+    def reset(self) -> None:
+        n = self.num_games
+        for component, copies in zip(self.components, self.per_game):
+            if copies is None:
+                component.reset_batch(n)
+            else:
+                for game_component in copies:
+                    game_component.reset()
+        self.scores = np.zeros(n)
+        self.component_scores = np.zeros((n, len(self.components)))
+        self.steps = np.zeros(n, dtype=np.int64)
+        self._cumulative = np.zeros((n, 64))
+
+    def calculate_step_rewards(self, batch: TickGeometry, active: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Score one tick of every game.
+
+        Args:
+            batch: Geometry of the tick
+            active: (N,) games still running; finished games score 0 and are not logged
+
+        Returns:
+            (N,) summed step reward per game
+        """
+        n = self.num_games
+        active = np.ones(n, dtype=bool) if active is None else np.asarray(active, dtype=bool)
+        step = np.zeros((n, len(self.components)))
+        for c, (component, copies) in enumerate(zip(self.components, self.per_game)):
+            if copies is None:
+                step[:, c] = component.calculate_step_reward_batch(batch)
+            else:
+                for i in np.flatnonzero(active):
+                    step[i, c] = copies[i].calculate_step_reward(batch.trackers[i], batch.metrics[i])
+        step[~active] = 0.0
+        rewards = step.sum(axis=1)
+        self.component_scores += step
+        self._log(rewards, active)
+        return rewards
+
+    def calculate_episode_rewards(self, metrics: List, active: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        End-of-episode rewards, logged as a final step like the scalar calculator.
+
+        Batched components must derive their episode reward from ``metrics`` alone.
+        """
+        n = self.num_games
+        active = np.ones(n, dtype=bool) if active is None else np.asarray(active, dtype=bool)
+        step = np.zeros((n, len(self.components)))
+        for c, (component, copies) in enumerate(zip(self.components, self.per_game)):
+            for i in np.flatnonzero(active):
+                owner = component if copies is None else copies[i]
+                value = owner.calculate_episode_reward(metrics[i])
+                if value is not None:
+                    step[i, c] = value
+        rewards = step.sum(axis=1)
+        self.component_scores += step
+        self._log(rewards, active)
+        return rewards
+
+    def _log(self, rewards: np.ndarray, active: np.ndarray) -> None:
+        rows = np.flatnonzero(active)
+        if not len(rows):
+            return
+        self.scores[rows] += rewards[rows]
+        steps = self.steps[rows]
+        if steps.max() + 1 >= self._cumulative.shape[1]:
+            grown = np.zeros((self.num_games, 2 * self._cumulative.shape[1]))
+            grown[:, :self._cumulative.shape[1]] = self._cumulative
+            self._cumulative = grown
+        self._cumulative[rows, steps + 1] = self._cumulative[rows, steps] + rewards[rows]
+        self.steps[rows] = steps + 1
+
+    def get_reward_breakdown(self, game: int) -> dict:
+        """Rewards contributed by each component in one game."""
+        return {name: float(self.component_scores[game, c]) for c, name in enumerate(self.names)}
+
+    def get_quarterly_scores(self, game: int) -> list:
+        """Score accumulated in each quarter of one game's episode."""
+        total_steps = int(self.steps[game])
+        if total_steps == 0:
+            return [0.0, 0.0, 0.0, 0.0]
+        cumulative = self._cumulative[game]
+        bounds = quarter_bounds(total_steps)
+        return [float(cumulative[bounds[q + 1]] - cumulative[bounds[q]]) for q in range(4)]
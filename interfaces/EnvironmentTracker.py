@@ -4,26 +4,28 @@ from typing import TYPE_CHECKING, List, Optional, Tuple
 if TYPE_CHECKING:
     from Asteroids import AsteroidsGame
 
-from game.classes.bullet import Bullet
-from game.classes.asteroid import Asteroid
-from game.classes.player import Player
+from game.classes.entities import AsteroidEntity, BulletEntity, PlayerEntity
+from game.tick_events import TickEvents
 
 
 class EnvironmentTracker:
     def __init__(self, game: 'AsteroidsGame'):
         self.game = game
+        # Event buffer of the current tick (None if the game does not emit events)
+        self.events: Optional[TickEvents] = getattr(game, "events", None)
 
     def update(self, game: 'AsteroidsGame') -> None:
         self.game = game
+        self.events = getattr(game, "events", None)
 
     # Current state access
-    def get_all_bullets(self) -> List[Bullet]:
+    def get_all_bullets(self) -> List[BulletEntity]:
         return self.game.bullet_list
 
-    def get_all_asteroids(self) -> List[Asteroid]:
+    def get_all_asteroids(self) -> List[AsteroidEntity]:
         return self.game.asteroid_list
     
-    def get_player(self) -> Optional[Player]:
+    def get_player(self) -> Optional[PlayerEntity]:
         return self.game.player
 
     def is_player_alive(self) -> bool:
@@ -34,16 +36,17 @@ class EnvironmentTracker:
         return self.game.time
     
     # Per-tick events (reset each frame)
-    # TODO: Implement this later
-    #   def get_shots_fired_this_tick(self) -> int:
-    #    return self.game.shots_fired_this_tick
+    def get_tick_events(self) -> Optional[TickEvents]:
+        return self.events
 
-    # TODO: Implement this later
-    #   def get_asteroids_destroyed_this_tick(self) -> int:
-    #    return self.game.asteroids_destroyed_this_tick
+    def get_shots_fired_this_tick(self) -> int:
+        return self.events.shots if self.events is not None else 0
+
+    def get_asteroids_destroyed_this_tick(self) -> int:
+        return self.events.kills if self.events is not None else 0
     
     # Derived state
-    def get_nearest_asteroid(self) -> Optional[Asteroid]:
+    def get_nearest_asteroid(self) -> Optional[AsteroidEntity]:
         """
         Get the nearest asteroid to the player.
         
@@ -79,7 +82,7 @@ class EnvironmentTracker:
         asteroid_distances.sort(key=lambda x: x[1])
         return asteroid_distances[0][1]  # Return the distance (second element of first tuple)
     
-    def get_asteroids_in_range(self, distance: float) -> List[Asteroid]:
+    def get_asteroids_in_range(self, distance: float) -> List[AsteroidEntity]:
         """
         Get all asteroids within a given distance of the player.
         
@@ -96,7 +99,7 @@ class EnvironmentTracker:
         # Filter by distance and return asteroids
         return [asteroid for asteroid, dist in asteroid_distances if dist < distance]
     
-    def get_nearest_asteroids(self, num_asteroids: int) -> List[Asteroid]:
+    def get_nearest_asteroids(self, num_asteroids: int) -> List[AsteroidEntity]:
         """
         Get the N nearest asteroids to the player.
         
@@ -149,7 +152,7 @@ class EnvironmentTracker:
             return []
         return [self.get_distance(asteroid.center_x, asteroid.center_y, self.game.player.center_x, self.game.player.center_y) for asteroid in self.game.asteroid_list]
     
-    def _get_asteroid_distances(self) -> List[Tuple[Asteroid, float]]:
+    def _get_asteroid_distances(self) -> List[Tuple[AsteroidEntity, float]]:
         """
         Get list of (asteroid, distance) tuples for all asteroids.
         
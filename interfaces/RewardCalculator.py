@@ -1,61 +1,112 @@
+from array import array
+from typing import TYPE_CHECKING, List, Optional
+
+from game.profiler import NULL_PROFILER
 from interfaces.EnvironmentTracker import EnvironmentTracker
 from interfaces.MetricsTracker import MetricsTracker
 
+if TYPE_CHECKING:
+  import numpy as np
+  from interfaces.BatchedRewardCalculator import TickGeometry
+
 class RewardComponent:
+  # Components that implement calculate_step_reward_batch set this to True;
+  # the batched calculator runs the others once per game.
+  batched = False
+
   def __init__(self, name: str):
     self.name = name
 
   def calculate_step_reward(self, env_tracker: EnvironmentTracker, metrics_tracker: MetricsTracker) -> float:
     pass
 
+  def calculate_step_reward_batch(self, batch: 'TickGeometry') -> 'np.ndarray':
+    """Step rewards for every game in ``batch`` as an array of shape (N,)."""
+    raise NotImplementedError
+
+  def reset_batch(self, num_games: int) -> None:
+    """Reset per-game state kept for calculate_step_reward_batch."""
+    pass
+
   def calculate_episode_reward(self, metrics_tracker: MetricsTracker) -> float:
     pass
 
   def reset(self) -> None:
     pass
 
+def quarter_bounds(total_steps: int) -> List[int]:
+  """
+  Step indices splitting an episode of ``total_steps`` into quarters.
+
+  Step i belongs to quarter min(int(i / (total_steps / 4)), 3); the returned
+  list holds the first step of each quarter plus ``total_steps``.
+  """
+  quarter_len = total_steps / 4
+  bounds = [0]
+  for q in range(1, 4):
+    start = min(int(q * quarter_len), total_steps)
+    while start > 0 and int((start - 1) / quarter_len) >= q:
+      start -= 1
+    while start < total_steps and int(start / quarter_len) < q:
+      start += 1
+    bounds.append(start)
+  bounds.append(total_steps)
+  return bounds
+
 class ComposableRewardCalculator:
   def __init__(self):
     self.score = 0.0
     self.components = {}
-    self.enabled_components = set()
+    self.enabled_components = {}  # name -> component, in insertion order
     self.component_scores = {}  # Tracks score per component
-    self.score_history = []     # Tracks reward per step
-  
+    # Running total after each step; quarterly scores are differences of it
+    self.cumulative_scores = array("d", [0.0])
+    # Per-component step timing ("reward.<name>" spans; no-op by default)
+    self.profiler = NULL_PROFILER
+
   def add_component(self, component: RewardComponent):
     self.components[component.name] = component
-    self.enabled_components.add(component.name)
+    self.enabled_components[component.name] = component
     self.component_scores[component.name] = 0.0
 
   def enable_component(self, name: str):
-    self.enabled_components.add(name)
+    self.enabled_components[name] = self.components[name]
+    # Keep the evaluation order of add_component
+    self.enabled_components = {
+      n: c for n, c in self.components.items() if n in self.enabled_components
+    }
 
   def disable_component(self, name: str):
-    self.enabled_components.discard(name)
+    self.enabled_components.pop(name, None)
 
   def is_enabled(self, name: str) -> bool:
     return name in self.enabled_components
 
   def calculate_step_reward(self, env_tracker: EnvironmentTracker, metrics_tracker: MetricsTracker, debug: bool = False) -> float:
     reward = 0.0
-
-    for name in self.enabled_components:
-      component_reward = self.components[name].calculate_step_reward(env_tracker, metrics_tracker)
+    component_scores = self.component_scores
+    profiler = self.profiler
+    mark = profiler.now()
+
+    for name, component in self.enabled_components.items():
+      component_reward = component.calculate_step_reward(env_tracker, metrics_tracker)
+      if profiler.enabled:
+        mark = profiler.lap("reward." + name, mark)
       if debug and abs(component_reward) > 0.1:
         print(f"    {name}: {component_reward:.2f}")
       reward += component_reward
-      self.component_scores[name] += component_reward
+      component_scores[name] += component_reward
 
     self.score += reward
-    self.score_history.append(reward)
+    self.cumulative_scores.append(self.cumulative_scores[-1] + reward)
 
     return reward
 
   def calculate_episode_reward(self, metrics_tracker: MetricsTracker) -> float:
     reward = 0.0
 
-    for name in self.enabled_components:
-      component_reward = self.components[name].calculate_episode_reward(metrics_tracker)
+    for name, component in self.enabled_components.items():
+      component_reward = component.calculate_episode_reward(metrics_tracker)
       # Ensure we always get a number, never None
       if component_reward is not None:
         reward += component_reward
@@ -64,9 +115,15 @@ class ComposableRewardCalculator:
     self.score += reward
     # Episode rewards are technically "end of game" so append to last step or new step?
     # Appending as a final step makes sense for timeline
-    self.score_history.append(reward)
+    self.cumulative_scores.append(self.cumulative_scores[-1] + reward)
 
     return reward
+
+  @property
+  def score_history(self) -> List[float]:
+    """Reward of each step (rebuilt from the running totals)."""
+    cumulative = self.cumulative_scores
+    return [cumulative[i + 1] - cumulative[i] for i in range(len(cumulative) - 1)]
   
   def get_reward_breakdown(self) -> dict:
     """Returns a dictionary of rewards contributed by each component."""
@@ -74,27 +131,22 @@ class ComposableRewardCalculator:
     
   def get_quarterly_scores(self) -> list:
     """Returns the total score accumulated in each quarter of the episode."""
-    total_steps = len(self.score_history)
+    total_steps = len(self.cumulative_scores) - 1
     if total_steps == 0:
         return [0.0, 0.0, 0.0, 0.0]
-        
-    quarter_len = total_steps / 4
-    quarters = [0.0, 0.0, 0.0, 0.0]
-    
-    for i, reward in enumerate(self.score_history):
-        q_idx = min(int(i / quarter_len), 3)
-        quarters[q_idx] += reward
-        
-    return quarters
+
+    cumulative = self.cumulative_scores
+    bounds = quarter_bounds(total_steps)
+    return [cumulative[bounds[q + 1]] - cumulative[bounds[q]] for q in range(4)]
 
   def current_score(self, env_tracker: EnvironmentTracker, metrics_tracker: MetricsTracker) -> float:
     return self.score
 
   def reset(self) -> None:
-    for name in self.enabled_components:
-      self.components[name].reset()
+    for component in self.enabled_components.values():
+      component.reset()
     self.score = 0.0
-    self.score_history = []
+    self.cumulative_scores = array("d", [0.0])
     # Also reset the component scores
     for name in self.component_scores:
-        self.component_scores[name] = 0.0
\ No newline at end of file
+        self.component_scores[name] = 0.0
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Sequence
+
+import numpy as np
+
 from interfaces.EnvironmentTracker import EnvironmentTracker
 
 class StateEncoder(ABC):
@@ -16,6 +19,25 @@ class StateEncoder(ABC):
     """
     pass
 
+  def encode_batch(self, trackers: Sequence[EnvironmentTracker], dtype=np.float32) -> np.ndarray:
+    """
+    Encode many games at once into one [N, state_size] matrix.
+
+    The default stacks per-game encode() calls; vector encoders override it
+    with array code that yields the same values.
+
+    Args:
+      trackers: One environment tracker per game.
+      dtype: Output dtype (float32 feeds batched policy forward passes).
+
+    Returns:
+      Contiguous array of shape (len(trackers), state_size).
+    """
+    out = np.empty((len(trackers), self.get_state_size()), dtype=dtype)
+    for i, tracker in enumerate(trackers):
+      out[i] = self.encode(tracker)
+    return out
+
   @abstractmethod
   def get_state_size(self) -> int:
     """
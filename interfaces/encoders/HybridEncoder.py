@@ -1,9 +1,14 @@
 import math
-from typing import List, Optional, Tuple
-from game.classes import asteroid, player
-from game.classes.player import Player
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from game.classes.entities import PlayerEntity
 from interfaces.EnvironmentTracker import EnvironmentTracker
 from interfaces.StateEncoder import StateEncoder
+from interfaces.encoders.batch_state import (
+    EncoderBatch, encode_nearest_asteroids_batch, encode_player_batch
+)
 from game import globals
 
 class HybridEncoder(StateEncoder):
@@ -61,6 +66,33 @@ class HybridEncoder(StateEncoder):
         
         return result
 
+    def encode_batch(
+        self,
+        trackers: Union[EncoderBatch, Sequence[EnvironmentTracker]],
+        dtype=np.float32
+    ) -> np.ndarray:
+        """
+        Encode many games at once; row i equals encode(trackers[i]).
+
+        Args:
+            trackers: Environment trackers, or an EncoderBatch already gathered from them.
+            dtype: Output dtype.
+
+        Returns:
+            Contiguous array of shape (N, state_size).
+        """
+        batch = EncoderBatch.of(trackers)
+        out = np.concatenate([
+            encode_player_batch(batch, self.max_player_velocity),
+            encode_nearest_asteroids_batch(
+                batch, self.num_fovea_asteroids, self.screen_width, self.screen_height,
+                self.diag_distance, self.max_relative_velocity, self.max_asteroid_size
+            ),
+            self.encode_rays_batch(batch),
+        ], axis=1)
+        out[~batch.has_player] = 0.0
+        return np.ascontiguousarray(out, dtype=dtype)
+
     def get_state_size(self) -> int:
         # Player (3) + Fovea (3*4) + Rays (16*2) = 3 + 12 + 32 = 47 inputs
         return 3 + (self.num_fovea_asteroids * 4) + (self.num_rays * 2)
@@ -83,7 +115,7 @@ class HybridEncoder(StateEncoder):
 
     # --- Helper Methods ---
 
-    def encode_player(self, player: Player) -> List[float]:
+    def encode_player(self, player: PlayerEntity) -> List[float]:
         """Encode player velocity and cooldown."""
         # Get player's facing direction
         angle_rad = math.radians(player.angle)
@@ -106,7 +138,7 @@ class HybridEncoder(StateEncoder):
             cooldown
         ]
 
-    def encode_fovea(self, env_tracker: EnvironmentTracker, player: Player) -> List[float]:
+    def encode_fovea(self, env_tracker: EnvironmentTracker, player: PlayerEntity) -> List[float]:
         """Encode N nearest asteroids with full physics detail."""
         nearest = env_tracker.get_nearest_asteroids(self.num_fovea_asteroids)
         result = []
@@ -151,7 +183,7 @@ class HybridEncoder(StateEncoder):
                 result.extend([1.0, 0.0, 0.0, 0.0])
         return result
 
-    def encode_rays(self, env_tracker: EnvironmentTracker, player: Player) -> List[float]:
+    def encode_rays(self, env_tracker: EnvironmentTracker, player: PlayerEntity) -> List[float]:
         """
         Cast egocentric rays to detect asteroids.
         
@@ -258,5 +290,59 @@ class HybridEncoder(StateEncoder):
             
         return rays
 
+    def encode_rays_batch(self, batch: EncoderBatch) -> np.ndarray:
+        """(N, 2 * num_rays) ray features; same targets and hit rules as encode_rays."""
+        n = batch.num_games
+        out = np.zeros((n, self.num_rays, 2))
+        out[..., 0] = 1.0
+        if batch.ax.shape[1] == 0:
+            return out.reshape(n, 2 * self.num_rays)
+
+        w = self.screen_width
+        h = self.screen_height
+        offsets = np.array([
+            (0, 0), (w, 0), (-w, 0),
+            (0, h), (0, -h),
+            (w, h), (w, -h), (-w, h), (-w, -h)
+        ], dtype=np.float64)
+
+        # Targets (N, M * 9): every asteroid and its wrapped ghosts, asteroid-major
+        tx = ((batch.ax - batch.px[:, None])[:, :, None] + offsets[:, 0]).reshape(n, -1)
+        ty = ((batch.ay - batch.py[:, None])[:, :, None] + offsets[:, 1]).reshape(n, -1)
+        radius = np.repeat(globals.ASTEROID_BASE_RADIUS * batch.scale, len(offsets), axis=1)
+        rvx = np.repeat(batch.avx - batch.pvx[:, None], len(offsets), axis=1)
+        rvy = np.repeat(batch.avy - batch.pvy[:, None], len(offsets), axis=1)
+        reach = self.ray_max_distance + radius
+        target = (
+            np.repeat(batch.asteroid_mask, len(offsets), axis=1)
+            & (np.abs(tx) <= reach) & (np.abs(ty) <= reach)
+            & (tx * tx + ty * ty < reach ** 2)
+        )
+
+        # Rays (N, R)
+        angle_step = 360.0 / self.num_rays
+        ray_rad = np.radians(batch.angle[:, None] - np.arange(self.num_rays) * angle_step)
+        ray_dx = np.sin(ray_rad)[:, :, None]
+        ray_dy = np.cos(ray_rad)[:, :, None]
+
+        # Ray/circle intersections (N, R, T)
+        tx, ty = tx[:, None, :], ty[:, None, :]
+        rad = radius[:, None, :]
+        t = tx * ray_dx + ty * ray_dy
+        dist_sq = (t * ray_dx - tx) ** 2 + (t * ray_dy - ty) ** 2
+        hit = target[:, None, :] & (t >= 0) & (t <= self.ray_max_distance + rad) & (dist_sq < rad * rad)
+        hit_dist = np.maximum(t - np.sqrt(np.where(hit, rad * rad - dist_sq, 0.0)), 0.0)
+        hit_dist = np.where(hit, hit_dist, np.inf)
+
+        # First nearest hit wins, as in the sequential scan
+        nearest = np.argmin(hit_dist, axis=2)[:, :, None]
+        min_dist = np.take_along_axis(hit_dist, nearest, axis=2)[:, :, 0]
+        found = min_dist < self.ray_max_distance
+        closing = -(np.take_along_axis(rvx[:, None, :] * ray_dx + rvy[:, None, :] * ray_dy, nearest, axis=2)[:, :, 0])
+
+        out[..., 0] = np.where(found, min_dist, self.ray_max_distance) / self.ray_max_distance
+        out[..., 1] = np.where(found, np.clip(closing / self.max_relative_velocity, -1.0, 1.0), 0.0)
+        return out.reshape(n, 2 * self.num_rays)
+
     def _clamp(self, value: float, min_val: float, max_val: float) -> float:
         return max(min_val, min(max_val, value))
@@ -1,4 +1,6 @@
-from typing import List
+from typing import List, Optional, Sequence
+
+import numpy as np
 
 from interfaces.StateEncoder import StateEncoder
 from interfaces.EnvironmentTracker import EnvironmentTracker
@@ -20,6 +22,8 @@ class TemporalStackEncoder(StateEncoder):
         self.stack_size = stack_size
         self.include_deltas = include_deltas
         self._history: List[List[float]] = []
+        # (stack_size, N, base_size) frames of the batched path, oldest first
+        self._batch_history: Optional[np.ndarray] = None
 
     def encode(self, environment_tracker: EnvironmentTracker) -> List[float]:
         state = list(self.base_encoder.encode(environment_tracker))
@@ -43,6 +47,27 @@ class TemporalStackEncoder(StateEncoder):
 
         return stacked
 
+    def encode_batch(self, trackers: Sequence[EnvironmentTracker], dtype=np.float32) -> np.ndarray:
+        """
+        Encode many games at once, keeping one history per row.
+
+        Row i of successive calls matches encode() on game i; the first call
+        (or a change in N) starts every history fresh.
+        """
+        state = self.base_encoder.encode_batch(trackers, dtype=np.float64)
+
+        history = self._batch_history
+        if history is None or history.shape[1] != state.shape[0]:
+            history = np.repeat(state[None], self.stack_size, axis=0)
+        else:
+            history = np.concatenate([history[1:], state[None]], axis=0)
+        self._batch_history = history
+
+        parts = list(history)
+        if self.include_deltas:
+            parts.extend(history[1:] - history[:-1])
+        return np.ascontiguousarray(np.concatenate(parts, axis=1), dtype=dtype)
+
     def get_state_size(self) -> int:
         base_size = self.base_encoder.get_state_size()
         stack_count = self.stack_size
@@ -51,6 +76,7 @@ class TemporalStackEncoder(StateEncoder):
 
     def reset(self) -> None:
         self._history = []
+        self._batch_history = None
         self.base_encoder.reset()
 
     def clone(self) -> "TemporalStackEncoder":
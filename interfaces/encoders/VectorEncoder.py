@@ -1,9 +1,13 @@
 import math
-from typing import List, Optional
-from game.classes import asteroid, bullet
-from game.classes import player
-from game.classes.player import Player
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from game.classes.entities import AsteroidEntity, PlayerEntity
 from interfaces.EnvironmentTracker import EnvironmentTracker
+from interfaces.encoders.batch_state import (
+  EncoderBatch, encode_nearest_asteroids_batch, encode_player_batch
+)
 
 from game import globals
 
@@ -95,7 +99,33 @@ class VectorEncoder:
 
     return result
 
-  def encode_player(self, player: Player) -> List[float]:
+  def encode_batch(
+      self,
+      trackers: Union[EncoderBatch, Sequence[EnvironmentTracker]],
+      dtype=np.float32
+  ) -> np.ndarray:
+    """
+    Encode many games at once; row i equals encode(trackers[i]).
+
+    Args:
+      trackers: Environment trackers, or an EncoderBatch already gathered from them.
+      dtype: Output dtype.
+
+    Returns:
+      Contiguous array of shape (N, state_size).
+    """
+    batch = EncoderBatch.of(trackers)
+    out = np.concatenate([
+      encode_player_batch(batch, self.max_player_velocity),
+      encode_nearest_asteroids_batch(
+        batch, self.num_nearest_asteroids, self.screen_width, self.screen_height,
+        self.max_distance, self.max_relative_velocity, self.max_asteroid_size
+      ),
+    ], axis=1)
+    out[~batch.has_player] = 0.0
+    return np.ascontiguousarray(out, dtype=dtype)
+
+  def encode_player(self, player: PlayerEntity) -> List[float]:
     """
     Encode player state in egocentric frame.
 
@@ -128,7 +158,7 @@ class VectorEncoder:
       normalized_cooldown
     ]
 
-  def encode_asteroids(self, env_tracker: EnvironmentTracker, player: Player) -> List[float]:
+  def encode_asteroids(self, env_tracker: EnvironmentTracker, player: PlayerEntity) -> List[float]:
     """
     Encode nearest asteroids in egocentric frame.
 
@@ -148,7 +178,7 @@ class VectorEncoder:
 
     return result
 
-  def encode_asteroid(self, ast: asteroid.Asteroid, player: Player) -> List[float]:
+  def encode_asteroid(self, ast: AsteroidEntity, player: PlayerEntity) -> List[float]:
     """
     Encode a single asteroid in egocentric frame.
 
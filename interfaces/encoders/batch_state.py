@@ -0,0 +1,205 @@
+"""
+Player/asteroid arrays of many games for batched state encoding.
+
+``EncoderBatch`` copies what the vector encoders read from each game (player
+pose and velocity, padded asteroid positions/velocities/scales) into NumPy
+arrays once per frame. The encoders' ``encode_batch`` methods compute their
+features from these arrays with the same floating-point operations, in the
+same order, as the per-game ``encode`` path, so both produce the same values.
+
+The helpers below are shared by VectorEncoder and HybridEncoder, whose player
+and nearest-asteroid features are the same computation.
+"""
+
+import math
+from typing import Dict, Sequence, Tuple, Union
+
+import numpy as np
+
+from interfaces.EnvironmentTracker import EnvironmentTracker
+
+
+class EncoderBatch:
+    """
+    Per-frame state of N games as arrays.
+
+    Args:
+        trackers: One EnvironmentTracker per game
+
+    Attributes:
+        num_games: N
+        has_player: (N,) rows with a player (rows without one encode to zeros)
+        px, py, pvx, pvy, angle: (N,) player position, velocity, heading (degrees)
+        shoot_timer, shoot_cooldown: (N,) player weapon state
+        asteroid_mask: (N, M) valid entries of the padded asteroid arrays
+        ax, ay, avx, avy, scale: (N, M) asteroid position, velocity, scale
+    """
+
+    def __init__(self, trackers: Sequence[EnvironmentTracker]):
+        n = len(trackers)
+        self.num_games = n
+        self.has_player = np.zeros(n, dtype=bool)
+        self.px = np.zeros(n)
+        self.py = np.zeros(n)
+        self.pvx = np.zeros(n)
+        self.pvy = np.zeros(n)
+        self.angle = np.zeros(n)
+        self.shoot_timer = np.zeros(n)
+        self.shoot_cooldown = np.zeros(n)
+        self.game_width = np.ones(n)
+        self.game_height = np.ones(n)
+
+        games = [tracker.game for tracker in trackers]
+        max_asteroids = max((len(game.asteroid_list) for game in games), default=0)
+        shape = (n, max_asteroids)
+        self.asteroid_mask = np.zeros(shape, dtype=bool)
+        self.ax = np.zeros(shape)
+        self.ay = np.zeros(shape)
+        self.avx = np.zeros(shape)
+        self.avy = np.zeros(shape)
+        self.scale = np.zeros(shape)
+
+        for i, game in enumerate(games):
+            self.game_width[i] = game.width
+            self.game_height[i] = game.height
+            player = game.player
+            if player is not None:
+                self.has_player[i] = True
+                self.px[i] = player.center_x
+                self.py[i] = player.center_y
+                self.pvx[i] = player.change_x
+                self.pvy[i] = player.change_y
+                self.angle[i] = player.angle
+                self.shoot_timer[i] = player.shoot_timer
+                self.shoot_cooldown[i] = player.shoot_cooldown
+            asteroids = game.asteroid_list
+            if asteroids:
+                count = len(asteroids)
+                self.asteroid_mask[i, :count] = True
+                self.ax[i, :count] = [a.center_x for a in asteroids]
+                self.ay[i, :count] = [a.center_y for a in asteroids]
+                self.avx[i, :count] = [a.change_x for a in asteroids]
+                self.avy[i, :count] = [a.change_y for a in asteroids]
+                self.scale[i, :count] = [a.this_scale for a in asteroids]
+
+        self._nearest: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    @classmethod
+    def of(cls, trackers: Union["EncoderBatch", Sequence[EnvironmentTracker]]) -> "EncoderBatch":
+        """Use ``trackers`` as is if already gathered, else gather them."""
+        return trackers if isinstance(trackers, cls) else cls(trackers)
+
+    def nearest(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Indices of each game's ``k`` nearest asteroids, ordered like
+        ``EnvironmentTracker.get_nearest_asteroids``.
+
+        Returns:
+            (indices (N, k), valid (N, k))
+        """
+        if k not in self._nearest:
+            n, m = self.ax.shape
+            if m == 0:
+                self._nearest[k] = (np.zeros((n, k), dtype=np.int64), np.zeros((n, k), dtype=bool))
+            else:
+                # Same wrapped distance as EnvironmentTracker.get_distance
+                dx = np.abs(self.ax - self.px[:, None])
+                dy = np.abs(self.ay - self.py[:, None])
+                width = self.game_width[:, None]
+                height = self.game_height[:, None]
+                dx = np.where(dx > width / 2, width - dx, dx)
+                dy = np.where(dy > height / 2, height - dy, dy)
+                dist = np.where(self.asteroid_mask, np.sqrt(dx * dx + dy * dy), np.inf)
+                order = np.argsort(dist, axis=1, kind="stable")[:, :k]
+                valid = np.take_along_axis(self.asteroid_mask, order, axis=1) & self.has_player[:, None]
+                if order.shape[1] < k:
+                    pad = k - order.shape[1]
+                    order = np.pad(order, ((0, 0), (0, pad)))
+                    valid = np.pad(valid, ((0, 0), (0, pad)))
+                self._nearest[k] = (order, valid)
+        return self._nearest[k]
+
+
+def wrap_degrees(angle: np.ndarray) -> np.ndarray:
+    """Bring angles into [-180, 180] exactly like repeated +/-360 steps."""
+    turns = np.ceil((angle - 180.0) / 360.0)
+    angle = angle - 360.0 * np.maximum(turns, 0.0)
+    turns = np.ceil((-180.0 - angle) / 360.0)
+    angle = angle + 360.0 * np.maximum(turns, 0.0)
+    # Correct any off-by-one from rounding in the turn count
+    angle = np.where(angle > 180.0, angle - 360.0, angle)
+    return np.where(angle < -180.0, angle + 360.0, angle)
+
+
+def encode_player_batch(batch: EncoderBatch, max_player_velocity: float) -> np.ndarray:
+    """(N, 3) [forward_velocity, lateral_velocity, shoot_cooldown] per game."""
+    angle_rad = np.radians(batch.angle)
+    facing_x = np.sin(angle_rad)
+    facing_y = np.cos(angle_rad)
+    right_x = facing_y
+    right_y = -facing_x
+
+    forward_velocity = batch.pvx * facing_x + batch.pvy * facing_y
+    lateral_velocity = batch.pvx * right_x + batch.pvy * right_y
+
+    has_cooldown = batch.shoot_cooldown > 0
+    cooldown = np.divide(batch.shoot_timer, batch.shoot_cooldown,
+                         out=np.zeros(batch.num_games), where=has_cooldown)
+    return np.stack([
+        np.clip(forward_velocity / max_player_velocity, -1.0, 1.0),
+        np.clip(lateral_velocity / max_player_velocity, -1.0, 1.0),
+        np.where(has_cooldown, np.clip(cooldown, 0.0, 1.0), 0.0),
+    ], axis=1)
+
+
+def encode_nearest_asteroids_batch(
+    batch: EncoderBatch,
+    k: int,
+    screen_width: float,
+    screen_height: float,
+    max_distance: float,
+    max_relative_velocity: float,
+    max_asteroid_size: float
+) -> np.ndarray:
+    """
+    (N, 4k) [distance, angle_to_target, closing_speed, size] of the ``k``
+    nearest asteroids, padded with the "safe" [1, 0, 0, 0].
+    """
+    index, valid = batch.nearest(k)
+    out = np.zeros((batch.num_games, k, 4))
+    out[..., 0] = 1.0
+    if not valid.any():
+        return out.reshape(batch.num_games, 4 * k)
+
+    rows = np.nonzero(valid)[0]
+    cols = index[valid]
+    px, py = batch.px[rows], batch.py[rows]
+
+    rel_x = batch.ax[rows, cols] - px
+    rel_y = batch.ay[rows, cols] - py
+    abs_x = np.abs(rel_x)
+    abs_y = np.abs(rel_y)
+    rel_x = np.where(abs_x > screen_width / 2, -1 * np.copysign(screen_width - abs_x, rel_x), rel_x)
+    rel_y = np.where(abs_y > screen_height / 2, -1 * np.copysign(screen_height - abs_y, rel_y), rel_y)
+
+    distance = np.sqrt(rel_x * rel_x + rel_y * rel_y)
+    normalized_distance = np.minimum(distance / max_distance, 1.0)
+
+    # math.atan2 per target: NumPy's arctan2 can differ from it in the last bit
+    bearing = np.array([math.atan2(x, y) for x, y in zip(rel_x.tolist(), rel_y.tolist())])
+    angle_to_target = wrap_degrees(np.degrees(bearing) - batch.angle[rows])
+
+    rel_vx = batch.avx[rows, cols] - batch.pvx[rows]
+    rel_vy = batch.avy[rows, cols] - batch.pvy[rows]
+    moving = distance > 0.001
+    closing_speed = np.where(
+        moving, -(rel_x * rel_vx + rel_y * rel_vy) / np.where(moving, distance, 1.0), 0.0
+    )
+
+    out[valid] = np.stack([
+        normalized_distance,
+        angle_to_target / 180.0,
+        np.clip(closing_speed / max_relative_velocity, -1.0, 1.0),
+        np.minimum(batch.scale[rows, cols] / max_asteroid_size, 1.0),
+    ], axis=1)
+    return out.reshape(batch.num_games, 4 * k)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from interfaces.RewardCalculator import RewardComponent
 from interfaces.EnvironmentTracker import EnvironmentTracker
 from interfaces.MetricsTracker import MetricsTracker
@@ -10,6 +12,7 @@ class ConservingAmmoBonus(RewardComponent):
     This provides a clear skill signal: you get rewarded for shots that
     actually connect, not just for aiming in the right direction.
     """
+    batched = True
 
     def __init__(self, hit_bonus: float = 20.0, shot_penalty: float = -5.0, **kwargs):
         """
@@ -25,6 +28,11 @@ class ConservingAmmoBonus(RewardComponent):
         self.prev_hits = 0
 
     def calculate_step_reward(self, env_tracker: EnvironmentTracker, metrics_tracker: MetricsTracker) -> float:
+        # Games that emit per-tick events report this tick's shots and hits directly
+        events = getattr(env_tracker, "events", None)
+        if events is not None:
+            return self.shot_penalty * events.shots + self.hit_bonus * events.hits
+
         current_shots = metrics_tracker.get_total_shots_fired()
         current_hits = metrics_tracker.get_total_hits()
 
@@ -44,6 +52,9 @@ class ConservingAmmoBonus(RewardComponent):
         self.prev_hits = current_hits
         return reward
 
+    def calculate_step_reward_batch(self, batch) -> np.ndarray:
+        return self.shot_penalty * batch.shots + self.hit_bonus * batch.hits
+
     def calculate_episode_reward(self, metrics_tracker: MetricsTracker) -> float:
         return 0.0
 
@@ -1,3 +1,5 @@
+import numpy as np
+
 from interfaces.RewardCalculator import RewardComponent
 from interfaces.EnvironmentTracker import EnvironmentTracker
 from interfaces.MetricsTracker import MetricsTracker
@@ -10,6 +12,7 @@ class DeathPenalty(RewardComponent):
     This provides a clear negative signal that dying is bad, helping the agent
     understand that survival matters, not just accumulating points quickly.
     """
+    batched = True
 
     def __init__(
         self,
@@ -28,6 +31,7 @@ class DeathPenalty(RewardComponent):
         self.max_time_alive = max_time_alive
         self.early_death_scale = early_death_scale
         self.death_applied = False
+        self.batch_death_applied = np.zeros(0, dtype=bool)
 
     def calculate_step_reward(self, env_tracker: EnvironmentTracker, metrics_tracker: MetricsTracker) -> float:
         """
@@ -46,9 +50,21 @@ class DeathPenalty(RewardComponent):
 
         return 0.0
 
+    def calculate_step_reward_batch(self, batch) -> np.ndarray:
+        dying = ~batch.alive & ~self.batch_death_applied
+        self.batch_death_applied |= dying
+        if self.max_time_alive and self.max_time_alive > 0:
+            normalized = np.clip(batch.time_alive / self.max_time_alive, 0.0, 1.0)
+            scale = 1.0 + self.early_death_scale * (1.0 - normalized)
+            return np.where(dying, self.penalty * scale, 0.0)
+        return np.where(dying, self.penalty, 0.0)
+
     def calculate_episode_reward(self, metrics_tracker: MetricsTracker) -> float:
         # Death penalty is handled in step reward when death is detected
         return 0.0
 
     def reset(self) -> None:
         self.death_applied = False
+
+    def reset_batch(self, num_games: int) -> None:
+        self.batch_death_applied = np.zeros(num_games, dtype=bool)
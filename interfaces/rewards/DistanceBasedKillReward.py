@@ -1,5 +1,8 @@
 import math
 from typing import Optional, List
+
+import numpy as np
+
 from interfaces.RewardCalculator import RewardComponent
 from interfaces.EnvironmentTracker import EnvironmentTracker
 from interfaces.MetricsTracker import MetricsTracker
@@ -17,7 +20,12 @@ class DistanceBasedKillReward(RewardComponent):
 
     The scaling range is determined dynamically from the actual asteroid positions,
     not hardcoded distances. This adapts to varying asteroid densities and distributions.
+
+    With a game that emits per-tick events, kills are counted from the event
+    buffer and scored exactly like the counter path, without computing any
+    distances.
     """
+    batched = True
 
     def __init__(
         self,
@@ -36,8 +44,14 @@ class DistanceBasedKillReward(RewardComponent):
         self.prev_kills = 0
         self.prev_closest_distance: Optional[float] = None
         self.prev_all_distances: List[float] = []
+        self.prev_had_targets = False
+        self.batch_had_targets = np.zeros(0, dtype=bool)
 
     def calculate_step_reward(self, env_tracker: EnvironmentTracker, metrics_tracker: MetricsTracker, debug: bool = False) -> float:
+        events = getattr(env_tracker, "events", None)
+        if events is not None:
+            return self._reward_from_events(env_tracker, events, debug)
+
         current_kills = metrics_tracker.get_total_kills()
         delta_kills = current_kills - self.prev_kills
 
@@ -79,9 +93,33 @@ class DistanceBasedKillReward(RewardComponent):
 
         return reward
 
+    def _reward_from_events(self, env_tracker: EnvironmentTracker, events, debug: bool) -> float:
+        # The counter path scores a kill by the previous frame's nearest
+        # asteroid against the previous frame's range, i.e. always at the low
+        # end (multiplier 1.0), provided that frame had a player and asteroids.
+        # Only that condition needs tracking, not the distances.
+        scored = self.prev_had_targets
+        self.prev_had_targets = env_tracker.get_player() is not None and bool(env_tracker.get_all_asteroids())
+        if not events.kills or not scored:
+            return 0.0
+
+        reward = events.kills * self.max_reward_per_kill
+        if debug:
+            print(f"DistanceBasedKillReward: kills={events.kills}, multiplier=1.00, reward={reward:.2f}")
+        return reward
+
+    def calculate_step_reward_batch(self, batch) -> np.ndarray:
+        rewards = np.where(self.batch_had_targets, batch.kills * self.max_reward_per_kill, 0.0)
+        self.batch_had_targets = batch.has_player & batch.asteroid_mask.any(axis=1)
+        return rewards
+
     def calculate_episode_reward(self, metrics_tracker: MetricsTracker) -> float:
         return 0.0
 
     def reset(self) -> None:
         self.prev_kills = 0
         self.prev_closest_distance = None
+        self.prev_had_targets = False
+
+    def reset_batch(self, num_games: int) -> None:
+        self.batch_had_targets = np.zeros(num_games, dtype=bool)
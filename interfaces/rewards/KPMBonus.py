@@ -14,11 +14,17 @@ class KPMBonus(RewardComponent):
 
   def calculate_step_reward(self, env_tracker: EnvironmentTracker, metrics_tracker: MetricsTracker) -> float:
     current_time = metrics_tracker.get_time_alive()
-    current_kills = metrics_tracker.get_total_kills()
-    
-    if current_kills > len(self.kill_timestamps):
-      for _ in range(current_kills - len(self.kill_timestamps)):
-        self.kill_timestamps.append(current_time)
+
+    events = getattr(env_tracker, "events", None)
+    if events is not None:
+      # One timestamp per kill this tick (the counter fallback below re-adds
+      # timestamps once old ones leave the window)
+      self.kill_timestamps.extend([current_time] * events.kills)
+    else:
+      current_kills = metrics_tracker.get_total_kills()
+      if current_kills > len(self.kill_timestamps):
+        for _ in range(current_kills - len(self.kill_timestamps)):
+          self.kill_timestamps.append(current_time)
     
     cutoff_time = current_time - self.window_seconds
     self.kill_timestamps = [t for t in self.kill_timestamps if t > cutoff_time]
@@ -1,14 +1,23 @@
+import numpy as np
+
 from interfaces.RewardCalculator import RewardComponent
 from interfaces.EnvironmentTracker import EnvironmentTracker
 from interfaces.MetricsTracker import MetricsTracker
 
 class KillAsteroid(RewardComponent):
+  batched = True
+
   def __init__(self, reward_per_asteroid: float = 50.0):  # Increased from 25 to emphasize killing
     self.name = "KillAsteroid"
     self.reward_per_asteroid = reward_per_asteroid
     self.prev_kills = 0
 
   def calculate_step_reward(self, env_tracker: EnvironmentTracker, metrics_tracker: MetricsTracker) -> float:
+    # Games that emit per-tick events report this tick's kills directly
+    events = getattr(env_tracker, "events", None)
+    if events is not None:
+      return events.kills * self.reward_per_asteroid
+
     current_kills = metrics_tracker.get_total_kills()
 
     if current_kills == self.prev_kills:
@@ -21,6 +30,9 @@ class KillAsteroid(RewardComponent):
       return max(0.0, delta_kills * self.reward_per_asteroid)
 
 
+  def calculate_step_reward_batch(self, batch) -> np.ndarray:
+    return batch.kills * self.reward_per_asteroid
+
   def calculate_episode_reward(self, metrics_tracker: MetricsTracker) -> float:
     return 0.0
 
@@ -18,13 +18,16 @@ class LeadingTargetBonus(RewardComponent):
         self.prev_shots = 0
     
     def calculate_step_reward(self, env_tracker: EnvironmentTracker, metrics_tracker: MetricsTracker) -> float:
-        current_shots = metrics_tracker.get_total_shots_fired()
-        
         # Check if a shot was fired this step
-        if current_shots <= self.prev_shots:
-            return 0.0
-        
-        self.prev_shots = current_shots
+        events = getattr(env_tracker, "events", None)
+        if events is not None:
+            if not events.shots:
+                return 0.0
+        else:
+            current_shots = metrics_tracker.get_total_shots_fired()
+            if current_shots <= self.prev_shots:
+                return 0.0
+            self.prev_shots = current_shots
         
         player = env_tracker.get_player()
         nearest_asteroid = env_tracker.get_nearest_asteroid()
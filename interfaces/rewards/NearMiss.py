@@ -1,7 +1,6 @@
 from interfaces.RewardCalculator import RewardComponent
 from interfaces.EnvironmentTracker import EnvironmentTracker
 from interfaces.MetricsTracker import MetricsTracker
-from game.classes.asteroid import Asteroid
 from typing import List
 
 class NearMiss(RewardComponent):
@@ -1,3 +1,5 @@
+import numpy as np
+
 from interfaces.RewardCalculator import RewardComponent
 from interfaces.EnvironmentTracker import EnvironmentTracker
 from interfaces.MetricsTracker import MetricsTracker
@@ -7,6 +9,7 @@ class ShootingPenalty(RewardComponent):
     Penalizes the agent for wasting ammo.
     Encourages deliberate, accurate shooting rather than spray-and-pray.
     """
+    batched = True
     
     def __init__(self, penalty_per_shot: float = -0.5):
         self.name = "ShootingPenalty"
@@ -14,6 +17,10 @@ class ShootingPenalty(RewardComponent):
         self.prev_shots = 0
     
     def calculate_step_reward(self, env_tracker: EnvironmentTracker, metrics_tracker: MetricsTracker) -> float:
+        events = getattr(env_tracker, "events", None)
+        if events is not None:
+            return events.shots * self.penalty_per_shot
+
         current_shots = metrics_tracker.get_total_shots_fired()
         
         if current_shots == self.prev_shots:
@@ -26,6 +33,9 @@ class ShootingPenalty(RewardComponent):
         # This is balanced by kill rewards, so accurate shooting is net positive
         return delta_shots * self.penalty_per_shot
     
+    def calculate_step_reward_batch(self, batch) -> np.ndarray:
+        return batch.shots * self.penalty_per_shot
+    
     def calculate_episode_reward(self, metrics_tracker: MetricsTracker) -> float:
         return 0.0
     
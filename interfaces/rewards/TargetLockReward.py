@@ -1,5 +1,8 @@
 from typing import Dict, List, Optional
 import math
+
+import numpy as np
+
 from interfaces.RewardCalculator import RewardComponent
 from interfaces.EnvironmentTracker import EnvironmentTracker
 from interfaces.MetricsTracker import MetricsTracker
@@ -10,6 +13,8 @@ class TargetLockReward(RewardComponent):
     Rewards the agent for keeping the nearest asteroid within a narrow aiming cone.
     Encourages "locking on" to targets rather than spinning blindly.
     """
+    batched = True
+
     def __init__(self, 
                  aim_cone_degrees: float = 15.0, 
                  reward_per_frame: float = 0.5,
@@ -65,6 +70,23 @@ class TargetLockReward(RewardComponent):
 
         return total_reward
 
+    def calculate_step_reward_batch(self, batch) -> np.ndarray:
+        rewards = np.zeros(batch.num_games)
+        if batch.dist.shape[1] == 0:
+            return rewards
+
+        # Nearest targets per game (stable, like the tracker's sort)
+        order = np.argsort(batch.dist, axis=1, kind="stable")[:, :self.num_targets]
+        dist = np.take_along_axis(batch.dist, order, axis=1)
+        rel_x = np.take_along_axis(batch.rel_x, order, axis=1)
+        rel_y = np.take_along_axis(batch.rel_y, order, axis=1)
+
+        target_angle = np.degrees(np.arctan2(rel_x, rel_y))
+        angle_diff = np.abs((target_angle - batch.angle[:, None] + 180.0) % 360.0 - 180.0)
+        locked = (dist <= self.max_distance) & (angle_diff <= self.aim_cone_degrees)
+        alignment_bonus = 1.0 - (angle_diff / self.aim_cone_degrees)
+        return np.where(locked, self.reward_per_frame * alignment_bonus, 0.0).sum(axis=1)
+
     def calculate_episode_reward(self, metrics: MetricsTracker) -> float:
         return 0.0
 
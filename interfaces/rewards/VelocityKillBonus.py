@@ -22,12 +22,16 @@ class VelocityKillBonus(RewardComponent):
 
     def calculate_step_reward(self, env_tracker: EnvironmentTracker, metrics_tracker: MetricsTracker, debug: bool = False) -> float:
         reward = 0.0
-        current_kills = metrics_tracker.get_total_kills()
-        
+        events = getattr(env_tracker, "events", None)
+        if events is not None:
+            num_kills = events.kills
+        else:
+            current_kills = metrics_tracker.get_total_kills()
+            num_kills = max(0, current_kills - self.prev_total_kills)
+            self.prev_total_kills = current_kills
+
         # Check if one or more kills occurred since the last step
-        if current_kills > self.prev_total_kills:
-            num_kills = current_kills - self.prev_total_kills
-            
+        if num_kills > 0:
             player = env_tracker.get_player()
             if player:
                 # Calculate current speed
@@ -43,7 +47,6 @@ class VelocityKillBonus(RewardComponent):
                     print(f"VelocityKillBonus: {num_kills} kill(s) at speed {speed:.2f}. "
                           f"Factor: {speed_factor:.2f}. Reward: {reward:.2f}")
 
-        self.prev_total_kills = current_kills
         return reward
 
     def calculate_episode_reward(self, metrics_tracker: MetricsTracker) -> float:
@@ -0,0 +1,52 @@
+import unittest
+
+from game.headless_game import HeadlessAsteroidsGame
+from training.config.rewards import create_reward_calculator
+
+
+def _make_game(seed):
+    game = HeadlessAsteroidsGame(width=800, height=600, random_seed=seed)
+    game.reset_game()
+    game.up_pressed = True
+    game.space_pressed = True
+    game.left_pressed = True
+    return game
+
+
+class TestActionRepeat(unittest.TestCase):
+    def test_repeated_step_matches_single_frames(self):
+        single = _make_game(4)
+        single_calc = create_reward_calculator(max_steps=600, frame_delay=1.0 / 60.0)
+        single_calc.reset()
+        single_reward = 0.0
+        single_frames = 0
+        while single_frames < 600 and single.player in single.player_list:
+            single.on_update(1.0 / 60.0)
+            single_reward += single_calc.calculate_step_reward(single.tracker, single.metrics_tracker)
+            single_frames += 1
+
+        repeated = _make_game(4)
+        repeated_calc = create_reward_calculator(max_steps=600, frame_delay=1.0 / 60.0)
+        repeated_calc.reset()
+        repeated_reward = 0.0
+        repeated_frames = 0
+        done = False
+        while repeated_frames < 600 and not done:
+            reward, frames, done = repeated.step_repeated(
+                1.0 / 60.0, 4, repeated_calc, max_frames=600 - repeated_frames
+            )
+            repeated_reward += reward
+            repeated_frames += frames
+
+        self.assertEqual(single_frames, repeated_frames)
+        self.assertAlmostEqual(single_reward, repeated_reward, places=9)
+        self.assertEqual(single.metrics_tracker.total_kills, repeated.metrics_tracker.total_kills)
+
+    def test_max_frames_caps_substeps(self):
+        game = _make_game(1)
+        _, frames, _ = game.step_repeated(1.0 / 60.0, 8, max_frames=3)
+        self.assertEqual(frames, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+
+from training.analytics.analytics import TrainingAnalytics
+
+
+def _record(analytics, generations):
+    for generation in generations:
+        fitnesses = [float(generation * 10 + i) for i in range(5)]
+        metrics = [
+            {"kills": i, "steps_survived": 100 + i, "accuracy": 0.1 * i, "shots_fired": 10}
+            for i in range(5)
+        ]
+        analytics.record_generation(generation, fitnesses, behavioral_metrics={"avg_kills": 2.0})
+        analytics.record_distributions(generation, fitnesses, metrics)
+        if generation % 2 == 0:
+            analytics.record_fresh_game(generation, {"kills": 3, "steps_survived": 200}, {"gap": 0.5})
+
+
+class TestAnalyticsStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _roundtrip(self, filename):
+        path = os.path.join(self.tmp.name, filename)
+        analytics = TrainingAnalytics()
+        analytics.attach_store(path)
+        analytics.set_config({"method": "test", "population_size": 5})
+        _record(analytics, range(1, 5))
+        analytics.close_store()
+        return analytics, TrainingAnalytics.from_store(path)
+
+    def _assert_same(self, expected, loaded):
+        self.assertEqual(loaded.config, expected.config)
+        self.assertEqual(loaded.generations_data, expected.generations_data)
+        self.assertEqual(loaded.distributions_data, expected.distributions_data)
+        self.assertEqual(loaded.fresh_game_data, expected.fresh_game_data)
+        # Change-tracking counters only drive report caching and are not replayed
+        untracked = ("revision", "generation_revisions")
+        self.assertEqual(
+            {k: v for k, v in loaded.state_dict().items() if k not in untracked},
+            {k: v for k, v in expected.state_dict().items() if k not in untracked}
+        )
+
+    def test_replay_matches_recorded_data(self):
+        self._assert_same(*self._roundtrip("analytics.jsonl"))
+
+    def test_gzip_store(self):
+        self._assert_same(*self._roundtrip("analytics.jsonl.gz"))
+
+    def test_truncated_last_line_is_ignored(self):
+        expected, _ = self._roundtrip("analytics.jsonl")
+        path = os.path.join(self.tmp.name, "analytics.jsonl")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"type":"generation","data":{"generation":')
+        self._assert_same(expected, TrainingAnalytics.from_store(path))
+
+    def test_resume_restarts_log_from_snapshot(self):
+        path = os.path.join(self.tmp.name, "analytics.jsonl")
+        original = TrainingAnalytics()
+        _record(original, range(1, 3))
+        state = original.state_dict()
+
+        # A resumed run writes generations past the checkpoint only once
+        resumed = TrainingAnalytics()
+        resumed.attach_store(path)
+        _record(resumed, range(1, 4))
+        resumed.load_state_dict(state)
+        _record(resumed, range(3, 5))
+        resumed.close_store()
+
+        self._assert_same(resumed, TrainingAnalytics.from_store(path))
+        self.assertEqual([g["generation"] for g in resumed.generations_data], [1, 2, 3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import random
+import unittest
+
+import numpy as np
+
+from game.headless_game import HeadlessAsteroidsGame
+from interfaces.BatchedRewardCalculator import BatchedRewardCalculator, TickGeometry
+from interfaces.RewardCalculator import ComposableRewardCalculator
+from interfaces.rewards.KillAsteroid import KillAsteroid
+from interfaces.rewards.ShootingPenalty import ShootingPenalty
+from interfaces.rewards.SurvivalBonus import SurvivalBonus
+from interfaces.rewards.TargetLockReward import TargetLockReward
+from training.config.rewards import create_reward_calculator
+
+
+def _calculator():
+    calc = create_reward_calculator(max_steps=600, frame_delay=1.0 / 60.0)
+    calc.add_component(KillAsteroid(reward_per_asteroid=10.0))
+    calc.add_component(ShootingPenalty())
+    calc.add_component(SurvivalBonus())  # No batched form: runs per game
+    return calc
+
+
+class TestBatchedRewards(unittest.TestCase):
+    def test_batch_matches_per_game_calculators(self):
+        num_games, max_steps = 4, 600
+        games = [HeadlessAsteroidsGame(random_seed=seed) for seed in range(num_games)]
+        scalar = [_calculator() for _ in games]
+        for game, calc in zip(games, scalar):
+            game.reset_game()
+            calc.reset()
+        batched = BatchedRewardCalculator(_calculator(), num_games)
+        policies = [random.Random(seed) for seed in range(num_games)]
+
+        active = np.ones(num_games, dtype=bool)
+        for _ in range(max_steps):
+            for i, game in enumerate(games):
+                if not active[i]:
+                    continue
+                game.left_pressed = policies[i].random() < 0.3
+                game.right_pressed = policies[i].random() < 0.3
+                game.up_pressed = policies[i].random() < 0.3
+                game.space_pressed = policies[i].random() < 0.8
+                game.on_update(1.0 / 60.0)
+                game.metrics_tracker.update(game)
+
+            rewards = batched.calculate_step_rewards(TickGeometry(games), active)
+            for i, (game, calc) in enumerate(zip(games, scalar)):
+                if active[i]:
+                    expected = calc.calculate_step_reward(game.tracker, game.metrics_tracker)
+                    self.assertAlmostEqual(rewards[i], expected, places=9)
+                else:
+                    self.assertEqual(rewards[i], 0.0)
+            active &= np.array([game.player in game.player_list for game in games])
+            if not active.any():
+                break
+
+        batched.calculate_episode_rewards([game.metrics_tracker for game in games])
+        for i, calc in enumerate(scalar):
+            calc.calculate_episode_reward(games[i].metrics_tracker)
+            breakdown = batched.get_reward_breakdown(i)
+            for name, value in calc.get_reward_breakdown().items():
+                self.assertAlmostEqual(breakdown[name], value, places=6, msg=name)
+            np.testing.assert_allclose(batched.get_quarterly_scores(i), calc.get_quarterly_scores(), atol=1e-6)
+        self.assertTrue(any(calc.get_reward_breakdown()["DistanceBasedKillReward"] > 0 for calc in scalar))
+
+    def test_quarterly_scores_match_step_history(self):
+        calc = ComposableRewardCalculator()
+        for steps in (1, 3, 7, 10, 101):
+            calc.reset()
+            rewards = [float(i % 5) for i in range(steps)]
+            calc.cumulative_scores.extend(np.cumsum([0.0] + rewards)[1:])
+            quarter_len = steps / 4
+            expected = [0.0] * 4
+            for i, reward in enumerate(rewards):
+                expected[min(int(i / quarter_len), 3)] += reward
+            self.assertEqual(calc.get_quarterly_scores(), expected)
+            self.assertEqual(calc.score_history, rewards)
+
+    def test_target_lock_without_asteroids(self):
+        game = HeadlessAsteroidsGame(random_seed=0)
+        game.reset_game()
+        game.asteroid_list.clear()
+        self.assertEqual(TargetLockReward().calculate_step_reward_batch(TickGeometry([game])).tolist(), [0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import json
+import unittest
+
+from benchmarks.cases import CASES, RunSettings, run_cases
+from benchmarks.compare import compare_results
+from benchmarks.parity import CHECKS, run_checks
+from benchmarks.run import BASELINE_PATH
+
+
+class TestParityBaseline(unittest.TestCase):
+    def test_outcomes_match_stored_baseline(self):
+        with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["parity"]
+        self.assertEqual(set(baseline), set(CHECKS))
+        self.assertEqual(run_checks(sorted(CHECKS)), baseline)
+
+
+class TestCompare(unittest.TestCase):
+    def test_tolerance_and_direction(self):
+        baseline = {
+            "benchmarks": {
+                "rate": {"value": 100.0, "higher_is_better": True},
+                "duration": {"value": 10.0, "higher_is_better": False},
+                "noisy": {"value": 100.0, "higher_is_better": True},
+            },
+            "parity": {"game": "abc"},
+            "tolerances": {"noisy": 0.6},
+        }
+        results = {
+            "benchmarks": {
+                "rate": {"value": 70.0, "higher_is_better": True},
+                "duration": {"value": 5.0, "higher_is_better": False},
+                "noisy": {"value": 50.0, "higher_is_better": True},
+                "new_case": {"value": 1.0, "higher_is_better": True},
+            },
+            "parity": {"game": "abd"},
+        }
+        report = compare_results(results, baseline, tolerance=0.25)
+        self.assertEqual([row["name"] for row in report["regressions"]], ["rate"])
+        self.assertEqual([row["name"] for row in report["improvements"]], ["duration"])
+        self.assertAlmostEqual(report["improvements"][0]["speedup"], 2.0)
+        self.assertEqual([row["name"] for row in report["parity_failures"]], ["game"])
+
+
+class TestCases(unittest.TestCase):
+    def test_cases_report_values(self):
+        settings = RunSettings(min_seconds=0.01, repeats=1, quick=True)
+        results = run_cases(["env.step.early", "reward.batch64", "generation.500"], settings)
+        self.assertGreater(results["env.step.early"]["value"], 0)
+        self.assertEqual(results["reward.batch64"]["unit"], "game-steps/s")
+        self.assertIn("skipped", results["generation.500"])
+        self.assertFalse(CASES["generation.50"].higher_is_better)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+import os
+import pickle
+import random
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+
+from training.config.evolution_strategies import ESConfig
+from training.config.genetic_algorithm import GAConfig
+from training.config.neat import NEATConfig
+from training.core.checkpoints import (
+    CHECKPOINT_NAME,
+    CheckpointWriter,
+    capture_rng_state,
+    load_checkpoint,
+    restore_rng_state,
+    save_checkpoint,
+)
+
+
+def _tiny(config, population_size, generations):
+    return mock.patch.multiple(
+        config,
+        POPULATION_SIZE=population_size,
+        NUM_GENERATIONS=generations,
+        SEEDS_PER_AGENT=1,
+        MAX_STEPS=30,
+        CHECKPOINT_EVERY=2,
+    )
+
+
+class TestCheckpointFormat(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, CHECKPOINT_NAME)
+
+    def test_round_trip_preserves_arrays_and_structure(self):
+        state = {
+            "mean": np.arange(5, dtype=np.float32),
+            "nested": {"paths": [np.ones(3), None], "pair": (1, float("-inf"))},
+            "maps": {(1, 2): 7},
+            "rng": capture_rng_state(),
+        }
+        save_checkpoint(self.path, state)
+        loaded = load_checkpoint(self.path)
+
+        self.assertEqual(loaded["mean"].dtype, np.float32)
+        np.testing.assert_array_equal(loaded["mean"], state["mean"])
+        np.testing.assert_array_equal(loaded["nested"]["paths"][0], np.ones(3))
+        self.assertIsNone(loaded["nested"]["paths"][1])
+        self.assertEqual(loaded["nested"]["pair"], (1, float("-inf")))
+        self.assertEqual(loaded["maps"], {(1, 2): 7})
+
+    def test_scalars_and_datetimes_keep_their_types(self):
+        started = datetime(2024, 5, 1, 12, 30, 15, 250)
+        save_checkpoint(self.path, {"sigma": np.float32(0.1), "count": np.int64(7), "started": started,
+                                    "__checkpoint_tuple__": "plain key"})
+        loaded = load_checkpoint(self.path)
+        self.assertEqual(type(loaded["sigma"]), np.float32)
+        self.assertEqual(loaded["sigma"], np.float32(0.1))
+        self.assertEqual(type(loaded["count"]), np.int64)
+        self.assertEqual(loaded["started"], started)
+        self.assertEqual(loaded["__checkpoint_tuple__"], "plain key")
+
+    def test_pickled_state_is_refused_without_unpickling(self):
+        # Format version 1 pickled the state tree; such files must not be unpickled
+        legacy = pickle.dumps({"format_version": 1, "state": {}})
+        np.savez(self.path, __state__=np.frombuffer(legacy, dtype=np.uint8))
+        with mock.patch.object(pickle, "loads", side_effect=AssertionError("unpickled")) as loads:
+            with self.assertRaises(ValueError):
+                load_checkpoint(self.path)
+        loads.assert_not_called()
+
+    def test_rng_state_replays_draws(self):
+        rng_state = capture_rng_state()
+        expected = (random.random(), np.random.randn(3))
+        save_checkpoint(self.path, {"rng": rng_state})
+
+        random.random()
+        np.random.randn(10)
+        restore_rng_state(load_checkpoint(self.path)["rng"])
+        self.assertEqual(random.random(), expected[0])
+        np.testing.assert_array_equal(np.random.randn(3), expected[1])
+
+    def test_writer_snapshots_before_background_write(self):
+        writer = CheckpointWriter(self.path)
+        values = np.zeros(4)
+        writer.save({"values": values})
+        values[:] = 1.0
+        writer.close()
+
+        np.testing.assert_array_equal(load_checkpoint(self.path)["values"], np.zeros(4))
+        self.assertEqual(os.listdir(self.tmp.name), [CHECKPOINT_NAME])
+        self.assertEqual(writer.checkpoints_written, 1)
+
+
+class TestTrainerResume(unittest.TestCase):
+    """Resuming after generation 2 must reproduce generation 3 of an uninterrupted run."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _artifacts_dir(self, method):
+        path = os.path.join(self.tmp.name, f"{method}_artifacts")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _run_and_resume(self, module, script_cls, config, population_size):
+        with mock.patch.object(module, "artifacts_dir", self._artifacts_dir), \
+                mock.patch.object(script_cls, "_save"):
+            with _tiny(config, population_size, 3):
+                random.seed(1234)
+                np.random.seed(1234)
+                full = script_cls()
+                full.run_headless()
+
+            # A fresh process would start from unrelated RNG state
+            random.seed(99)
+            np.random.seed(99)
+            with _tiny(config, population_size, 3):
+                resumed = script_cls()
+                resumed.resume()
+                self.assertEqual(resumed.current_generation, 2)
+                resumed.run_headless()
+
+        self.assertEqual(resumed.current_generation, 3)
+        self.assertEqual(resumed.current_fitnesses, full.current_fitnesses)
+        self.assertEqual(
+            [g["best_fitness"] for g in resumed.analytics.generations_data],
+            [g["best_fitness"] for g in full.analytics.generations_data],
+        )
+        return full, resumed
+
+    def test_ga_resume_is_bit_exact(self):
+        from training.scripts import train_ga
+        full, resumed = self._run_and_resume(train_ga, train_ga.GATrainingScript, GAConfig, 4)
+        np.testing.assert_array_equal(resumed.driver.population, full.driver.population)
+
+    def test_es_resume_is_bit_exact(self):
+        from training.scripts import train_es
+        full, resumed = self._run_and_resume(train_es, train_es.ESTrainingScript, ESConfig, 4)
+        np.testing.assert_array_equal(resumed.driver.mean, full.driver.mean)
+        np.testing.assert_array_equal(resumed.driver.cov_diag, full.driver.cov_diag)
+        self.assertEqual(resumed.driver.sigma, full.driver.sigma)
+
+    def test_neat_resume_is_bit_exact(self):
+        from training.scripts import train_neat
+        full, resumed = self._run_and_resume(train_neat, train_neat.NEATTrainingScript, NEATConfig, 6)
+        self.assertEqual(
+            [genome.to_dict() for genome in resumed.driver.population],
+            [genome.to_dict() for genome in full.driver.population],
+        )
+        self.assertEqual(
+            [s.species_id for s in resumed.driver.species],
+            [s.species_id for s in full.driver.species],
+        )
+        self.assertEqual(
+            resumed.driver.innovation_tracker.state_dict(),
+            full.driver.innovation_tracker.state_dict(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from training.config.evolution_strategies import ESConfig
+from training.config.pareto import ParetoConfig
+from training.methods.evolution_strategies.cmaes_driver import CMAESDriver
+from training.methods.evolution_strategies.cmaes_variants import (
+    FullCMAESDriver,
+    LMCMAESDriver,
+    create_cmaes_driver,
+)
+
+MODES = ["cmaes", "cmaes_full", "cmaes_lm"]
+
+
+def _ellipsoid(x: np.ndarray, rotation: np.ndarray) -> np.ndarray:
+    """Rotated, ill-conditioned quadratic centred at 0.5 (negated: larger is better)."""
+    scales = np.logspace(0, 2, x.shape[1])
+    return -np.sum(scales * ((x - 0.5) @ rotation) ** 2, axis=1)
+
+
+class TestCMAESVariants(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.multiple(ESConfig, POPULATION_SIZE=16, CMAES_SIGMA=0.3, CMAES_EIGEN_INTERVAL=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pareto = ParetoConfig(ENABLED=False)
+        rng = np.random.RandomState(7)
+        self.rotation, _ = np.linalg.qr(rng.randn(8, 8))
+
+    def _run(self, driver, generations):
+        for _ in range(generations):
+            candidates, _ = driver.sample_population()
+            driver.update(_ellipsoid(np.array(candidates), self.rotation).tolist())
+        return float(_ellipsoid(driver.mean[None, :], self.rotation)[0])
+
+    def test_factory_selects_mode(self):
+        self.assertIs(type(create_cmaes_driver(8, "cmaes", self.pareto)), CMAESDriver)
+        self.assertIs(type(create_cmaes_driver(8, "cmaes_full", self.pareto)), FullCMAESDriver)
+        self.assertIs(type(create_cmaes_driver(8, "cmaes_lm", self.pareto)), LMCMAESDriver)
+        with self.assertRaises(ValueError):
+            create_cmaes_driver(8, "classic", self.pareto)
+
+    def test_every_mode_improves_rotated_ellipsoid(self):
+        for mode in MODES:
+            with self.subTest(mode=mode):
+                np.random.seed(0)
+                driver = create_cmaes_driver(8, mode, self.pareto)
+                start = float(_ellipsoid(driver.mean[None, :], self.rotation)[0])
+                final = self._run(driver, 60)
+                self.assertGreater(final, start * 1e-3)
+                self.assertEqual(driver.last_update_stats["cmaes_mode"], mode)
+
+    def test_full_covariance_refreshes_lazily(self):
+        np.random.seed(1)
+        driver = create_cmaes_driver(8, "cmaes_full", self.pareto)
+        self._run(driver, 5)
+        self.assertEqual(driver.eigen_updates, 2)
+        np.testing.assert_allclose(driver.cov, driver.cov.T)
+        # Samples follow the cached B * D factor, not the latest matrix
+        z = np.random.randn(4, 8)
+        np.testing.assert_allclose(
+            driver._scale_samples(z),
+            z @ (driver.eigen_basis * driver.eigen_scale).T
+        )
+
+    def test_lm_transform_starts_at_identity(self):
+        driver = create_cmaes_driver(8, "cmaes_lm", self.pareto)
+        z = np.random.randn(4, 8).astype(np.float32)
+        np.testing.assert_array_equal(driver._scale_samples(z), z.astype(np.float64))
+        self._run(driver, 3)
+        self.assertEqual(driver.directions_used, 3)
+
+    def test_state_dict_round_trip_continues_identically(self):
+        for mode in MODES:
+            with self.subTest(mode=mode):
+                np.random.seed(2)
+                driver = create_cmaes_driver(8, mode, self.pareto)
+                self._run(driver, 4)
+                state = driver.state_dict()
+                rng_state = np.random.get_state()
+                expected = self._run(driver, 3)
+
+                restored = create_cmaes_driver(8, mode, self.pareto)
+                restored.load_state_dict(state)
+                np.random.set_state(rng_state)
+                self.assertEqual(self._run(restored, 3), expected)
+
+    def test_state_dict_rejects_other_mode(self):
+        state = create_cmaes_driver(8, "cmaes_full", self.pareto).state_dict()
+        with self.assertRaises(ValueError):
+            create_cmaes_driver(8, "cmaes", self.pareto).load_state_dict(state)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import concurrent.futures
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from ai_agents.neuroevolution.nn_agent import NNAgent
+from interfaces.ActionInterface import ActionInterface
+from interfaces.encoders.HybridEncoder import HybridEncoder
+from training.config.genetic_algorithm import GAConfig
+from training.core import population_evaluator
+from training.core.generation_pipeline import GenerationPipeline
+from training.core.population_evaluator import submit_population_evaluation
+from training.methods.genetic_algorithm.driver import GADriver
+
+
+class TestCostScheduling(unittest.TestCase):
+    def setUp(self):
+        self.encoder = HybridEncoder(num_rays=16, num_fovea_asteroids=3)
+        self.actions = ActionInterface(action_space_type="boolean")
+        param_size = NNAgent.get_parameter_count(self.encoder.get_state_size(), GAConfig.HIDDEN_LAYER_SIZE, 3)
+        self.population = np.random.default_rng(0).uniform(-1, 1, (4, param_size)).tolist()
+        self.kwargs = dict(
+            state_encoder=self.encoder, action_interface=self.actions, max_steps=40,
+            generation_seed=11, seeds_per_agent=2, profile=False
+        )
+
+    def _evaluate(self, predicted_costs):
+        started = []
+        real = population_evaluator.evaluate_single_agent
+
+        def record(individual, *args, **kwargs):
+            started.append(kwargs["random_seed"])
+            return real(individual, *args, **kwargs)
+
+        with mock.patch.object(population_evaluator, "evaluate_single_agent", record), \
+                concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            pending = submit_population_evaluation(
+                executor, self.population, max_workers=1, predicted_costs=predicted_costs, **self.kwargs
+            )
+            result = pending.result()
+        return result, started, pending.scheduling_stats()
+
+    def test_longest_predicted_rollouts_start_first(self):
+        baseline, started, _ = self._evaluate(None)
+        self.assertEqual(started, list(range(11, 19)))
+
+        scheduled, started, stats = self._evaluate([5.0, 50.0, 5.0, 20.0])
+        # Agent i owns seeds 11 + 2i and 12 + 2i; ties keep population order
+        self.assertEqual(started, [13, 14, 17, 18, 11, 12, 15, 16])
+        self.assertEqual(scheduled[0], baseline[0])
+        self.assertEqual(scheduled[3], baseline[3])
+        self.assertGreater(stats["worker_utilization"], 0.0)
+        self.assertLessEqual(stats["worker_utilization"], 1.0)
+        self.assertGreaterEqual(stats["evaluation_tail_duration"], 0.0)
+
+    def test_pipeline_predicts_from_parent_steps(self):
+        pipeline = GenerationPipeline(max_workers=2, **self.kwargs)
+        self.addCleanup(pipeline.shutdown)
+        self.assertIsNone(pipeline.predicted_costs([0, 1, 2, 3]))
+
+        _, _, _, per_agent = pipeline.collect(self.population)
+        steps = [metrics["steps_survived"] for metrics in per_agent]
+        self.assertEqual(pipeline.predicted_costs([3, 0, -1, 3]), [steps[3], steps[0], sum(steps) / 4, steps[3]])
+        self.assertIsNone(pipeline.predicted_costs(None))
+        self.assertIn("worker_utilization", pipeline.last_stats)
+        self.assertIn("evaluation_tail_duration", pipeline.last_stats)
+
+    def test_ga_records_parent_indices(self):
+        with mock.patch.multiple(GAConfig, POPULATION_SIZE=10, RNG_SEED=5):
+            driver = GADriver(param_size=6)
+            previous = driver.population.copy()
+            fitnesses = list(range(10))
+            driver.evolve(fitnesses)
+        self.assertEqual(len(driver.parent_indices), 10)
+        # Elites are unchanged copies of the fittest members
+        self.assertEqual(driver.parent_indices[:2], [9, 8])
+        np.testing.assert_array_equal(driver.population[0], previous[9])
+        self.assertTrue(all(0 <= p < 10 for p in driver.parent_indices))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import random
+import unittest
+
+import numpy as np
+
+from game.headless_game import HeadlessAsteroidsGame
+from interfaces.encoders.batch_state import EncoderBatch, wrap_degrees
+from interfaces.encoders.HybridEncoder import HybridEncoder
+from interfaces.encoders.TemporalStackEncoder import TemporalStackEncoder
+from interfaces.encoders.VectorEncoder import VectorEncoder
+
+
+def _games(num_games):
+    games = [HeadlessAsteroidsGame(random_seed=seed) for seed in range(num_games)]
+    for game in games:
+        game.reset_game()
+    return games
+
+
+def _step(games, policies):
+    for game, policy in zip(games, policies):
+        if game.player not in game.player_list:
+            continue
+        game.left_pressed = policy.random() < 0.4
+        game.right_pressed = policy.random() < 0.2
+        game.up_pressed = policy.random() < 0.5
+        game.space_pressed = policy.random() < 0.5
+        game.on_update(1.0 / 60.0)
+
+
+class TestEncodeBatch(unittest.TestCase):
+    def _assert_matches_encode(self, make_encoder, frames=240):
+        games = _games(5)
+        # A game without asteroids encodes to the padding values
+        games[-1].asteroid_list.clear()
+        policies = [random.Random(seed) for seed in range(len(games))]
+        batched = make_encoder()
+        single = [make_encoder() for _ in games]
+        for _ in range(frames):
+            trackers = [game.tracker for game in games]
+            matrix = batched.encode_batch(trackers)
+            self.assertEqual(matrix.dtype, np.float32)
+            self.assertTrue(matrix.flags["C_CONTIGUOUS"])
+            self.assertEqual(matrix.shape, (len(games), batched.get_state_size()))
+            expected = np.array([enc.encode(t) for enc, t in zip(single, trackers)], dtype=np.float32)
+            np.testing.assert_array_equal(matrix, expected)
+            _step(games, policies)
+
+    def test_vector_encoder(self):
+        self._assert_matches_encode(VectorEncoder)
+
+    def test_hybrid_encoder(self):
+        self._assert_matches_encode(HybridEncoder)
+
+    def test_temporal_stack_encoder(self):
+        self._assert_matches_encode(lambda: TemporalStackEncoder(HybridEncoder(), stack_size=3), frames=60)
+
+    def test_shared_gather_and_missing_player(self):
+        games = _games(3)
+        games[1].player = None
+        batch = EncoderBatch([game.tracker for game in games])
+        encoder = VectorEncoder()
+        matrix = encoder.encode_batch(batch)
+        self.assertFalse(matrix[1].any())
+        np.testing.assert_array_equal(matrix[0], np.float32(encoder.encode(games[0].tracker)))
+
+    def test_wrap_degrees_matches_repeated_turns(self):
+        rng = np.random.default_rng(0)
+        angles = np.concatenate([rng.uniform(-5000.0, 5000.0, 1000), [180.0, -180.0, 540.0, -540.0]])
+        expected = []
+        for angle in angles.tolist():
+            while angle > 180:
+                angle -= 360
+            while angle < -180:
+                angle += 360
+            expected.append(angle)
+        np.testing.assert_array_equal(wrap_degrees(angles), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from training.config.genetic_algorithm import GAConfig
+from training.methods.genetic_algorithm.driver import GADriver
+from training.methods.genetic_algorithm.operators import GAGeneticOperators
+from training.methods.genetic_algorithm.selection import tournament_selection_indices
+
+
+class TestVectorizedOperators(unittest.TestCase):
+    def setUp(self):
+        self.ops = GAGeneticOperators(mutation_probability=0.25, mutation_gaussian_sigma=0.1,
+                                      crossover_alpha=0.5, rng=np.random.default_rng(0))
+
+    def test_gaussian_mutation_touches_expected_fraction(self):
+        population = np.zeros((200, 100))
+        mutated = self.ops.mutate_gaussian_batch(population)
+        self.assertTrue(np.all(population == 0.0))
+        self.assertAlmostEqual(np.mean(mutated != 0.0), 0.25, delta=0.02)
+        self.assertAlmostEqual(mutated[mutated != 0.0].std(), 0.1, delta=0.01)
+
+    def test_blend_children_stay_in_extended_range(self):
+        p1 = self.ops.rng.uniform(-1, 1, size=(50, 30))
+        p2 = self.ops.rng.uniform(-1, 1, size=(50, 30))
+        d = np.abs(p1 - p2)
+        for child in self.ops.crossover_blend_batch(p1, p2):
+            self.assertTrue(np.all(child >= np.minimum(p1, p2) - 0.5 * d))
+            self.assertTrue(np.all(child <= np.maximum(p1, p2) + 0.5 * d))
+
+    def test_single_individual_api_returns_deap_tuples(self):
+        (mutated,) = self.ops.mutate_gaussian([0.0] * 8)
+        self.assertIsInstance(mutated, list)
+        self.assertEqual(len(mutated), 8)
+        children = self.ops.crossover_blend([0.0] * 8, [1.0] * 8)
+        self.assertEqual([len(child) for child in children], [8, 8])
+
+    def test_tournament_picks_best_contestant(self):
+        fitnesses = [5.0, 1.0, 3.0, 2.0]
+        winners = tournament_selection_indices(fitnesses, tournament_size=4, num_selected=6,
+                                               rng=np.random.default_rng(1))
+        self.assertTrue(np.all(winners == 0))
+        winners = tournament_selection_indices(fitnesses, tournament_size=2, num_selected=500,
+                                               rng=np.random.default_rng(1))
+        self.assertNotIn(1, winners)  # the worst individual can never win a size-2 tournament
+        # Redrawn rows: contestants stay distinct, so the 4 worst of 10 never win a size-5 tournament
+        winners = tournament_selection_indices(list(range(10)), tournament_size=5, num_selected=2000,
+                                               rng=np.random.default_rng(1))
+        self.assertGreaterEqual(winners.min(), 4)
+        self.assertEqual(set(winners.tolist()), set(range(4, 10)))
+
+
+class TestVectorizedDriver(unittest.TestCase):
+    def _driver(self, seed=3):
+        with mock.patch.multiple(GAConfig, POPULATION_SIZE=20, RNG_SEED=seed):
+            return GADriver(param_size=12)
+
+    def test_population_is_array_and_seeded(self):
+        a, b = self._driver(), self._driver()
+        self.assertEqual(a.population.shape, (20, 12))
+        np.testing.assert_array_equal(a.population, b.population)
+
+        fitnesses = list(range(20))
+        for driver in (a, b):
+            driver.evolve(fitnesses)
+        np.testing.assert_array_equal(a.population, b.population)
+        self.assertEqual(a.population.shape, (20, 12))
+
+    def test_global_random_seeds_generator_by_default(self):
+        random.seed(8)
+        first = self._driver(seed=None).population
+        random.seed(8)
+        np.testing.assert_array_equal(self._driver(seed=None).population, first)
+
+    def test_elites_and_all_time_best_survive(self):
+        driver = self._driver()
+        fitnesses = [float(i) for i in range(20)]
+        top_two = driver.population[[19, 18]].copy()
+        driver.evolve(fitnesses)
+        np.testing.assert_array_equal(driver.population[:2], top_two)
+
+        best = np.full(12, 7.0)
+        driver.evolve(fitnesses, best_individual=best.tolist())
+        np.testing.assert_array_equal(driver.population[1], best)
+        # Already an elite: not duplicated into the last elite slot
+        elite = driver.population[0].tolist()
+        driver.evolve([0.0] + [-1.0] * 19, best_individual=elite)
+        self.assertEqual(sum(row.tolist() == elite for row in driver.population[:2]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import random
+import time
+import unittest
+
+from ai_agents.neuroevolution.nn_agent import NNAgent
+from game import globals
+from interfaces.ActionInterface import ActionInterface
+from interfaces.encoders.HybridEncoder import HybridEncoder
+from training.core.generation_pipeline import GenerationPipeline
+from training.core.population_evaluator import evaluate_population_parallel
+
+
+def _setup(population_size=4):
+    encoder = HybridEncoder(
+        screen_width=globals.SCREEN_WIDTH,
+        screen_height=globals.SCREEN_HEIGHT,
+        num_rays=16,
+        num_fovea_asteroids=3
+    )
+    actions = ActionInterface(action_space_type="boolean")
+    rng = random.Random(0)
+    param_count = NNAgent.get_parameter_count(encoder.get_state_size(), 24, 3)
+    population = [[rng.uniform(-1, 1) for _ in range(param_count)] for _ in range(population_size)]
+    return encoder, actions, population
+
+
+class TestGenerationPipeline(unittest.TestCase):
+    def test_matches_blocking_evaluation(self):
+        encoder, actions, population = _setup()
+        kwargs = dict(max_steps=40, generation_seed=123, seeds_per_agent=2, use_common_seeds=True)
+        expected = evaluate_population_parallel(population, encoder, actions, max_workers=2, **kwargs)
+
+        random.seed(5)
+        for enabled in (True, False):
+            pipeline = GenerationPipeline(max_workers=2, enabled=enabled, state_encoder=encoder,
+                                          action_interface=actions, **kwargs)
+            try:
+                pipeline.submit(population)
+                self.assertTrue(pipeline.has_pending())
+                fitnesses, seed, _, per_agent = pipeline.collect()
+            finally:
+                pipeline.shutdown()
+            self.assertEqual(seed, 123)
+            self.assertEqual(fitnesses, expected[0])
+            self.assertEqual([m["kills"] for m in per_agent], [m["kills"] for m in expected[3]])
+            self.assertFalse(pipeline.has_pending())
+
+    def test_reports_overlap_with_main_thread_work(self):
+        encoder, actions, population = _setup()
+        pipeline = GenerationPipeline(max_workers=2, state_encoder=encoder, action_interface=actions,
+                                      max_steps=60, seeds_per_agent=1)
+        try:
+            pipeline.collect(population)
+            self.assertEqual(pipeline.last_stats["pipeline_overlap_duration"], 0.0)
+
+            pipeline.submit(population)
+            time.sleep(0.05)  # stand-in for playback/reporting
+            pipeline.collect()
+        finally:
+            pipeline.shutdown()
+        stats = pipeline.last_stats
+        self.assertGreater(stats["pipeline_overlap_duration"], 0.0)
+        self.assertLessEqual(stats["pipeline_overlap_duration"], stats["evaluation_duration"] + 1e-9)
+        self.assertGreater(pipeline.overlap_ratio(), 0.0)
+
+    def test_rejects_second_submit(self):
+        encoder, actions, population = _setup(1)
+        pipeline = GenerationPipeline(max_workers=1, enabled=False, state_encoder=encoder,
+                                      action_interface=actions, max_steps=10, seeds_per_agent=1)
+        pipeline.submit(population)
+        with self.assertRaises(RuntimeError):
+            pipeline.submit(population)
+        pipeline.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from training.config.evolution_strategies import ESConfig
+from training.config.genetic_algorithm import GAConfig
+from training.config.neat import NEATConfig
+from training.core.best_artifacts import BEST_GENOME_NAME, BEST_WEIGHTS_NAME, load_best_weights, save_best_weights
+
+
+def _tiny(config, population_size):
+    return mock.patch.multiple(
+        config,
+        POPULATION_SIZE=population_size,
+        NUM_GENERATIONS=2,
+        SEEDS_PER_AGENT=1,
+        MAX_STEPS=30,
+    )
+
+
+class TestHeadlessTrainers(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _artifacts_dir(self, method):
+        path = os.path.join(self.tmp.name, f"{method}_artifacts")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def test_best_weights_round_trip(self):
+        path = os.path.join(self.tmp.name, BEST_WEIGHTS_NAME)
+        save_best_weights(path, [0.5, -1.25, 3.0], 12.5, 4, 24)
+        artifact = load_best_weights(path)
+        self.assertEqual(artifact["weights"], [0.5, -1.25, 3.0])
+        self.assertEqual((artifact["fitness"], artifact["generation"], artifact["hidden_size"]), (12.5, 4, 24))
+        self.assertEqual(os.listdir(self.tmp.name), [BEST_WEIGHTS_NAME])
+
+    def test_ga_runs_without_window(self):
+        from training.scripts import train_ga
+        with _tiny(GAConfig, 4), mock.patch.object(train_ga, "artifacts_dir", self._artifacts_dir), \
+                mock.patch.object(train_ga.GATrainingScript, "_save") as save:
+            trainer = train_ga.GATrainingScript()
+            trainer.run_headless()
+        self.assertIsNone(trainer.display_manager)
+        self.assertEqual(trainer.current_generation, 2)
+        save.assert_called_once()
+        artifact = load_best_weights(os.path.join(self.tmp.name, "ga_artifacts", BEST_WEIGHTS_NAME))
+        self.assertEqual(artifact["fitness"], trainer.best_fitness)
+
+    def test_es_runs_without_window(self):
+        from training.scripts import train_es
+        with _tiny(ESConfig, 4), mock.patch.object(train_es, "artifacts_dir", self._artifacts_dir), \
+                mock.patch.object(train_es.ESTrainingScript, "_save") as save:
+            trainer = train_es.ESTrainingScript()
+            trainer.run_headless()
+        self.assertEqual(trainer.current_generation, 2)
+        save.assert_called_once()
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "es_artifacts", BEST_WEIGHTS_NAME)))
+
+    def test_neat_runs_without_window(self):
+        from training.scripts import train_neat
+        with _tiny(NEATConfig, 6), mock.patch.object(train_neat, "artifacts_dir", self._artifacts_dir), \
+                mock.patch.object(train_neat.NEATTrainingScript, "_save") as save:
+            trainer = train_neat.NEATTrainingScript()
+            trainer.run_headless()
+        self.assertEqual(trainer.current_generation, 2)
+        save.assert_called_once()
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "neat_artifacts", BEST_GENOME_NAME)))
+
+
+if __name__ == "__main__":
+    unittest.main()
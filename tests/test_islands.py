@@ -0,0 +1,169 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from training.config.genetic_algorithm import GAConfig
+from training.config.neat import NEATConfig
+from training.core.islands import (
+    FileTransport,
+    IslandMigration,
+    Migrant,
+    MigrationHub,
+    MigrationHubError,
+    SocketTransport,
+    migration_sources,
+    replace_members,
+)
+from training.methods.neat.driver import NEATDriver
+
+VECTOR = {"kind": "vector", "param_size": 3}
+
+
+def _metrics(fitness):
+    return {"fitness": fitness, "time_profile": {"total": 1.0}}
+
+
+class TestMigrationProtocol(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_topology_sources(self):
+        self.assertEqual(migration_sources("ring", 0, 4), [3])
+        self.assertEqual(migration_sources("full", 1, 3), [0, 2])
+        self.assertEqual(migration_sources("none", 1, 3), [])
+        self.assertEqual(migration_sources("ring", 0, 1), [])
+        with self.assertRaises(ValueError):
+            migration_sources("star", 0, 2)
+
+    def _exchange_round_trip(self, transport):
+        island0 = IslandMigration(0, 3, transport, VECTOR, topology="full", interval=2, migrants=2)
+        island1 = IslandMigration(1, 3, transport, VECTOR, topology="full", interval=2, migrants=2)
+        stranger = IslandMigration(2, 3, transport, {"kind": "neat", "inputs": 3, "outputs": 3}, topology="none")
+        self.assertFalse(island0.due(1))
+        self.assertTrue(island0.due(2))
+
+        population = [np.full(3, float(i)) for i in range(4)]
+        fitnesses = [1.0, 4.0, 2.0, 3.0]
+        metrics = [_metrics(f) for f in fitnesses]
+        stranger.exchange(2, population, fitnesses, metrics, encode=lambda row: row.tolist())
+        self.assertEqual(island1.exchange(2, population, fitnesses, metrics, encode=lambda row: row.tolist()), [])
+
+        received = island0.exchange(2, population, fitnesses, metrics, encode=lambda row: row.tolist())
+        self.assertEqual([m.individual for m in received], [[1.0] * 3, [3.0] * 3])
+        self.assertEqual([m.source for m in received], [1, 1])
+        self.assertNotIn("time_profile", received[0].metrics)
+        self.assertEqual(island0.last_stats["migrants_rejected"], 2)
+        self.assertEqual(island0.last_stats["best_immigrant_fitness"], 4.0)
+        # Island 1 has not published again: nothing new
+        self.assertEqual(island0.exchange(4, population, fitnesses, metrics, encode=lambda row: row.tolist()), [])
+
+    def test_file_transport(self):
+        transport = FileTransport(os.path.join(self.tmp.name, "migration"))
+        self._exchange_round_trip(transport)
+        transport.clear(1)
+        self.assertIsNone(transport.fetch(1))
+
+    def test_socket_transport(self):
+        hub = MigrationHub().start()
+        self.addCleanup(hub.close)
+        transport = SocketTransport(hub.address, timeout=10)
+        self.addCleanup(transport.close)
+        self._exchange_round_trip(transport)
+        self.assertEqual(sorted(hub.payloads), [0, 1, 2])
+        # A dropped connection is re-established
+        transport._sock.close()
+        transport._sock = None
+        transport.clear(2)
+        self.assertIsNone(transport.fetch(2))
+        # An error reply is raised once over the same connection, not resent
+        sock = transport._sock
+        with mock.patch.object(hub, "handle_request", wraps=hub.handle_request) as handle:
+            with self.assertRaises(MigrationHubError):
+                transport._request({"op": "bogus"})
+            with self.assertRaises(MigrationHubError):
+                transport._request({"op": "fetch"})  # Malformed: no island
+        self.assertEqual(handle.call_count, 2)
+        self.assertIs(transport._sock, sock)
+        self.assertIsNone(transport.fetch(2))
+
+
+class TestImmigration(unittest.TestCase):
+    def test_replace_members_spares_the_best(self):
+        migrants = [Migrant([9.0], 9.0, {"fitness": 9.0}, 1) for _ in range(5)]
+        slots, fitnesses, metrics = replace_members([5.0, 1.0, 3.0], [{}, {}, {}], migrants)
+        self.assertEqual(slots, [1, 2])
+        self.assertEqual(fitnesses, [5.0, 9.0, 9.0])
+        self.assertEqual(metrics[0], {})
+
+    def test_neat_immigrants_are_renumbered(self):
+        with mock.patch.multiple(NEATConfig, POPULATION_SIZE=4):
+            source = NEATDriver(input_size=3, output_size=2)
+            local = NEATDriver(input_size=3, output_size=2)
+        genome = source.population[0]
+        for _ in range(20):
+            genome.mutate_add_node(source.innovation_tracker)
+        data = genome.to_dict()
+        hidden = [n["node_id"] for n in data["nodes"] if n["node_type"] == "hidden"]
+        self.assertTrue(hidden)
+
+        # Local innovations diverge from the source island's
+        local_genome = local.population[1]
+        for _ in range(3):
+            local_genome.mutate_add_node(local.innovation_tracker)
+        next_node = local.innovation_tracker.next_node_id
+        local.replace_members([2], [data], sources=[0])
+
+        immigrant = local.population[2]
+        self.assertEqual(immigrant.num_connections(), len(data["connections"]))
+        local_hidden = [n.node_id for n in immigrant.nodes.values() if n.node_type == "hidden"]
+        self.assertTrue(all(node_id >= next_node for node_id in local_hidden))
+        for conn in immigrant.connections.values():
+            self.assertEqual(
+                conn.innovation,
+                local.innovation_tracker.get_connection_innovation(conn.in_node, conn.out_node)
+            )
+
+
+class TestIslandTrainers(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _artifacts_dir(self, method):
+        path = os.path.join(self.tmp.name, f"{method}_artifacts")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def test_two_ga_islands_exchange(self):
+        from training.scripts import train_ga
+        transport = FileTransport(os.path.join(self.tmp.name, "migration"))
+        tiny = mock.patch.multiple(
+            GAConfig, POPULATION_SIZE=4, NUM_GENERATIONS=3, SEEDS_PER_AGENT=1, MAX_STEPS=30, CHECKPOINT_EVERY=0
+        )
+        with tiny, mock.patch.object(train_ga, "artifacts_dir", self._artifacts_dir):
+            islands = []
+            for island_id in range(2):
+                trainer = train_ga.GATrainingScript(max_workers=2, artifacts_name=f"island{island_id}_ga")
+                self.addCleanup(trainer.pipeline.shutdown)
+                trainer.migration = IslandMigration(
+                    island_id, 2, transport, trainer.representation, interval=1, migrants=1
+                )
+                islands.append(trainer)
+            for _ in range(2):
+                for trainer in islands:
+                    trainer._step_generation()
+
+        first, second = (trainer.analytics.generations_data for trainer in islands)
+        self.assertEqual(first[0]["migrants_received"], 0)
+        self.assertEqual(second[0]["migrants_received"], 1)
+        self.assertEqual(first[1]["migrants_received"], 1)
+        self.assertTrue(os.path.isdir(os.path.join(self.tmp.name, "island1_ga_artifacts")))
+        self.assertEqual(islands[0].migration.total_sent, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from benchmarks.imports import measure_import
+from training.config.rewards import REWARD_PRESETS, create_reward_calculator, load_reward_component
+
+
+class TestLeanImports(unittest.TestCase):
+    def test_headless_path_loads_no_rendering_or_dl_framework(self):
+        for module in ("game.headless_game", "training.core.population_evaluator",
+                       "training.core.remote_evaluation",
+                       "ai_agents.policies.feedforward_tf", "training.methods.sac"):
+            with self.subTest(module=module):
+                self.assertEqual(measure_import(module)["heavy"], [])
+
+    def test_trainers_import_arcade_only_for_a_window(self):
+        for module in ("training.scripts.train_ga", "training.scripts.train_es",
+                       "training.scripts.train_neat", "training.scripts.train_islands"):
+            with self.subTest(module=module):
+                self.assertEqual(measure_import(module)["heavy"], [])
+
+    def test_headless_game_uses_entity_sprites(self):
+        from game.classes.entities import HeadlessBullet
+        from game.headless_game import HeadlessAsteroidsGame
+
+        game = HeadlessAsteroidsGame(random_seed=3)
+        game.reset_game()
+        game.player.shoot_timer = 0
+        bullet = game.player.shoot()
+        self.assertIsInstance(bullet, HeadlessBullet)
+        self.assertEqual(bullet.texture, "game/sprites/Bullet.png")
+
+
+class TestRewardRegistry(unittest.TestCase):
+    def test_presets_resolve_by_name(self):
+        calc = create_reward_calculator(max_steps=100, frame_delay=0.5)
+        names = [name for name, _ in REWARD_PRESETS["default"]]
+        self.assertEqual([type(c).__name__ for c in calc.components.values()], names)
+        death = calc.components["DeathPenalty"]
+        self.assertEqual(death.max_time_alive, 50.0)
+
+    def test_unknown_component(self):
+        with self.assertRaises(ValueError):
+            load_reward_component("NoSuchReward")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from ai_agents.neuroevolution.neat.compatibility import compatibility_matrix
+from ai_agents.neuroevolution.neat.genome import Genome
+from training.config.neat import NEATConfig
+from training.methods.neat.driver import NEATDriver
+from training.methods.neat.innovation import InnovationTracker
+
+C1, C2, C3 = 1.0, 1.0, 0.4
+
+
+def _reference_distance(genome_a, genome_b):
+    """Dict-based merge the batched implementation must reproduce exactly."""
+    genes_a, genes_b = genome_a.connections, genome_b.connections
+    if not genes_a and not genes_b:
+        return 0.0
+    max_a = max(genes_a) if genes_a else 0
+    max_b = max(genes_b) if genes_b else 0
+    excess = disjoint = 0
+    weight_diffs = []
+    for innov in sorted(genes_a):
+        if innov in genes_b:
+            weight_diffs.append(abs(genes_a[innov].weight - genes_b[innov].weight))
+        elif innov > max_b:
+            excess += 1
+        else:
+            disjoint += 1
+    for innov in genes_b:
+        if innov not in genes_a:
+            if innov > max_a:
+                excess += 1
+            else:
+                disjoint += 1
+    n = max(len(genes_a), len(genes_b))
+    if n < 20:
+        n = 1
+    w = sum(weight_diffs) / len(weight_diffs) if weight_diffs else 0.0
+    return (C1 * excess + C2 * disjoint) / n + C3 * w
+
+
+def _population(size=30, seed=0):
+    random.seed(seed)
+    tracker = InnovationTracker(start_innovation=0, start_node_id=10)
+    base = Genome.create_minimal(list(range(6)), [7, 8, 9], 6, tracker)
+    population = []
+    for _ in range(size):
+        genome = base.copy()
+        for _ in range(random.randint(0, 6)):
+            genome.mutate_add_node(tracker)
+        for _ in range(random.randint(0, 12)):
+            genome.mutate_add_connection(tracker)
+        genome.mutate_weights(0.5, 0.5)
+        population.append(genome)
+    return population
+
+
+class TestCompatibilityDistance(unittest.TestCase):
+    def test_pairwise_matches_reference(self):
+        population = _population()
+        for genome_a in population[:8]:
+            for genome_b in population:
+                self.assertEqual(
+                    Genome.compatibility_distance(genome_a, genome_b, C1, C2, C3),
+                    _reference_distance(genome_a, genome_b)
+                )
+
+    def test_matrix_matches_pairwise(self):
+        population = _population()
+        representatives = population[::7]
+        matrix = compatibility_matrix(population, representatives, C1, C2, C3)
+        self.assertEqual(matrix.shape, (len(population), len(representatives)))
+        for i, genome in enumerate(population):
+            for j, representative in enumerate(representatives):
+                self.assertEqual(matrix[i, j], _reference_distance(genome, representative))
+
+    def test_gene_arrays_follow_mutations(self):
+        genome = _population(size=1)[0]
+        before = genome.gene_arrays()
+        self.assertIs(genome.copy().gene_arrays(), before)
+        genome.mutate_weights(1.0, 0.5)
+        innovations, weights = genome.gene_arrays()
+        self.assertTrue(np.all(np.diff(innovations) > 0))
+        np.testing.assert_array_equal(weights, [genome.connections[int(i)].weight for i in innovations])
+        self.assertFalse(np.array_equal(weights, before[1]))
+
+
+class TestIndexedSpeciation(unittest.TestCase):
+    def test_matches_genome_by_genome_first_fit(self):
+        with mock.patch.multiple(NEATConfig, POPULATION_SIZE=30, C1=C1, C2=C2, C3=C3):
+            random.seed(1)
+            driver = NEATDriver(input_size=6)
+        population = _population(seed=2)
+        driver.compatibility_threshold = 0.6
+
+        # Expected assignment from the straightforward sequential loop
+        representatives = [s.representative for s in driver.species]
+        members = [[] for _ in representatives]
+        for genome in population:
+            for j, representative in enumerate(representatives):
+                if _reference_distance(genome, representative) < driver.compatibility_threshold:
+                    members[j].append(genome)
+                    break
+            else:
+                representatives.append(genome)
+                members.append([genome])
+        expected = [[id(g) for g in group] for group in members if group]
+
+        species_list, distances = driver._speciate(population)
+        self.assertGreater(len(expected), 2)
+        self.assertEqual([[id(g) for g in s.members] for s in species_list], expected)
+        self.assertGreaterEqual(len(distances), len(population) - len(species_list))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import random
+import unittest
+
+from ai_agents.neuroevolution.neat.genome import Genome
+from ai_agents.neuroevolution.neat.network import NEATNetwork
+from ai_agents.neuroevolution.neat.topology import TopologicalOrder
+from training.methods.neat.innovation import InnovationTracker
+
+
+def _reaches(edges, start, goal):
+    stack, seen = [start], set()
+    while stack:
+        node = stack.pop()
+        if node == goal:
+            return True
+        if node not in seen:
+            seen.add(node)
+            stack.extend(b for a, b in edges if a == node)
+    return False
+
+
+def _assert_valid_order(test, topology, edges):
+    test.assertEqual(sorted(topology.order), sorted(topology.rank))
+    for position, node in enumerate(topology.order):
+        test.assertEqual(topology.rank[node], position)
+    for in_node, out_node in edges:
+        test.assertLess(topology.rank[in_node], topology.rank[out_node])
+
+
+class TestTopologicalOrder(unittest.TestCase):
+    def test_cycle_queries_match_search_under_random_edges(self):
+        rng = random.Random(0)
+        topology = TopologicalOrder(range(25))
+        edges = []
+        for _ in range(400):
+            a, b = rng.randrange(25), rng.randrange(25)
+            expected = a == b or _reaches(edges, b, a)
+            self.assertEqual(topology.would_create_cycle(a, b), expected)
+            if expected:
+                with self.assertRaises(ValueError):
+                    topology.add_edge(a, b)
+            elif (a, b) not in edges:
+                topology.add_edge(a, b)
+                edges.append((a, b))
+            if edges and rng.random() < 0.1:
+                removed = edges.pop(rng.randrange(len(edges)))
+                topology.remove_edge(*removed)
+            _assert_valid_order(self, topology, edges)
+
+    def test_rejects_cyclic_initial_edges(self):
+        with self.assertRaises(ValueError):
+            TopologicalOrder([1, 2], [(1, 2), (2, 1)])
+
+
+class TestGenomeTopology(unittest.TestCase):
+    def _genome(self):
+        random.seed(3)
+        tracker = InnovationTracker(start_innovation=0, start_node_id=10)
+        genome = Genome.create_minimal(list(range(6)), [7, 8], 6, tracker)
+        for _ in range(15):
+            genome.mutate_add_node(tracker)
+            genome.mutate_add_connection(tracker)
+        return genome, tracker
+
+    def _enabled_edges(self, genome):
+        return [(g.in_node, g.out_node) for g in genome.connections.values() if g.enabled]
+
+    def test_mutations_keep_cached_order_valid(self):
+        genome, tracker = self._genome()
+        _assert_valid_order(self, genome.topology(), self._enabled_edges(genome))
+        clone = genome.copy()
+        clone.mutate_add_node(tracker)
+        clone.mutate_add_connection(tracker)
+        _assert_valid_order(self, clone.topology(), self._enabled_edges(clone))
+        _assert_valid_order(self, genome.topology(), self._enabled_edges(genome))
+
+    def test_crossover_child_order_is_valid(self):
+        genome, tracker = self._genome()
+        other = genome.copy()
+        for _ in range(5):
+            other.mutate_add_node(tracker)
+            other.mutate_add_connection(tracker)
+        child = Genome.crossover(genome, other, 1.0, 1.0, 0.75)
+        _assert_valid_order(self, child.topology(), self._enabled_edges(child))
+
+    def test_network_uses_cached_order(self):
+        genome, _ = self._genome()
+        network = genome.build_network()
+        self.assertEqual(network.order, genome.topology().order)
+        kahn = NEATNetwork(genome.nodes, genome.connections, genome.input_ids, genome.output_ids, genome.bias_id)
+        inputs = [0.3, -0.2, 0.9, 0.0, 0.5, -1.0]
+        self.assertEqual(network.activate(inputs), kahn.activate(inputs))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import copy
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from ai_agents.neuroevolution.nn_agent import NNAgent
+from game import globals
+from interfaces.ActionInterface import ActionInterface
+from interfaces.encoders.HybridEncoder import HybridEncoder
+from training.config.evolution_strategies import ESConfig
+from training.core.population_evaluator import evaluate_population_parallel
+from training.methods.evolution_strategies.driver import ESDriver
+from training.methods.evolution_strategies.noise_table import (
+    NoiseCandidate,
+    SharedNoiseTable,
+    get_noise_table,
+)
+
+TABLE_SIZE = 10_000
+
+
+def _table_mode(**overrides):
+    settings = dict(
+        USE_NOISE_TABLE=True,
+        NOISE_TABLE_SIZE=TABLE_SIZE,
+        NOISE_TABLE_SEED=3,
+        POPULATION_SIZE=9,
+        ENABLE_NOVELTY=False,
+        ENABLE_DIVERSITY=False,
+    )
+    settings.update(overrides)
+    return mock.patch.multiple(ESConfig, **settings)
+
+
+class TestSharedNoiseTable(unittest.TestCase):
+    def test_table_is_deterministic_and_cached(self):
+        table = get_noise_table(TABLE_SIZE, 3)
+        self.assertIs(get_noise_table(TABLE_SIZE, 3), table)
+        np.testing.assert_array_equal(SharedNoiseTable(TABLE_SIZE, 3).noise, table.noise)
+        self.assertFalse(table.noise.flags.writeable)
+        with self.assertRaises(ValueError):
+            table.sample_offsets(1, TABLE_SIZE + 1)
+
+    def test_weighted_sum_matches_dense_product(self):
+        table = get_noise_table(TABLE_SIZE, 3)
+        offsets = np.random.RandomState(0).randint(0, TABLE_SIZE - 50, size=600)
+        coefficients = np.random.RandomState(1).randn(600)
+        dense = np.stack([table.get(offset, 50) for offset in offsets]).astype(np.float64)
+        np.testing.assert_allclose(table.weighted_sum(offsets, coefficients, 50), coefficients @ dense)
+
+
+class TestNoiseTableDriver(unittest.TestCase):
+    def test_antithetic_candidates_materialize_mirrored(self):
+        with _table_mode():
+            np.random.seed(0)
+            driver = ESDriver(param_size=20)
+            driver.mean = np.random.randn(20)
+            candidates, noise = driver.sample_population()
+
+        self.assertIsNone(noise)
+        plus, minus = candidates[0], candidates[4]
+        self.assertIsInstance(plus, NoiseCandidate)
+        self.assertEqual((plus.offset, plus.sign, minus.sign), (minus.offset, 1.0, -1.0))
+        step = np.array(plus.materialize()) - driver.mean
+        np.testing.assert_allclose(np.array(minus.materialize()) - driver.mean, -step)
+        np.testing.assert_allclose(step, driver.sigma * get_noise_table(TABLE_SIZE, 3).get(plus.offset, 20))
+
+    def test_update_matches_explicit_noise_matrix(self):
+        with _table_mode():
+            np.random.seed(1)
+            driver = ESDriver(param_size=20)
+            driver.best_ever_candidate = np.random.randn(20).astype(np.float32)
+            driver.best_ever_fitness = 100.0
+            candidates, _ = driver.sample_population()
+            self.assertEqual(driver.elite_index, ESConfig.POPULATION_SIZE - 1)
+            self.assertIsInstance(candidates[-1], list)  # elite stays explicit
+            fitnesses = np.random.RandomState(2).randn(ESConfig.POPULATION_SIZE).tolist()
+
+            # Same draw expressed as the dense noise matrix of the classic path
+            explicit = copy.deepcopy(driver)
+            table = driver.noise_table
+            explicit.last_noise_vectors = np.stack([
+                sign * table.get(int(offset), 20)
+                for offset, sign in zip(driver.last_noise_offsets, driver.last_noise_signs)
+            ])
+            explicit.last_noise_offsets = None
+
+            driver.update(fitnesses)
+            explicit.update(fitnesses)
+
+        np.testing.assert_allclose(driver.mean, explicit.mean, rtol=1e-6)
+        self.assertIsNone(driver.last_noise_offsets)
+
+
+class TestNoiseCandidateEvaluation(unittest.TestCase):
+    def test_evaluator_rebuilds_candidates(self):
+        encoder = HybridEncoder(
+            screen_width=globals.SCREEN_WIDTH,
+            screen_height=globals.SCREEN_HEIGHT,
+            num_rays=16,
+            num_fovea_asteroids=3
+        )
+        actions = ActionInterface(action_space_type="boolean")
+        param_count = NNAgent.get_parameter_count(encoder.get_state_size(), ESConfig.HIDDEN_LAYER_SIZE, 3)
+        with _table_mode(POPULATION_SIZE=4, ENABLE_ELITISM=False):
+            np.random.seed(4)
+            driver = ESDriver(param_size=param_count)
+            candidates, _ = driver.sample_population()
+
+        kwargs = dict(max_steps=40, max_workers=2, generation_seed=11, seeds_per_agent=1)
+        random.seed(0)
+        from_table = evaluate_population_parallel(candidates, encoder, actions, **kwargs)[0]
+        random.seed(0)
+        explicit = evaluate_population_parallel(
+            [candidate.materialize() for candidate in candidates], encoder, actions, **kwargs
+        )[0]
+        self.assertEqual(from_table, explicit)
+
+
+if __name__ == "__main__":
+    unittest.main()
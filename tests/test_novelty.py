@@ -0,0 +1,81 @@
+import math
+import random
+import unittest
+
+from training.components.archive import BehaviorArchive, cKDTree
+from training.components.novelty import compute_behavior_novelty, compute_population_novelty
+
+
+def _reference_novelty(behavior, population, archive, k_nearest):
+    """Original list-based implementation, kept as the parity oracle."""
+    all_behaviors = population + archive
+    if not all_behaviors:
+        return 1.0
+    distances = sorted(
+        math.sqrt(sum((a - b) ** 2 for a, b in zip(behavior, other)))
+        for other in all_behaviors
+    )
+    k = min(k_nearest, len(distances))
+    if k == 0:
+        return 1.0
+    return sum(distances[:k]) / k
+
+
+def _reference_population(population, archive, k_nearest):
+    return [
+        _reference_novelty(b, population[:i] + population[i + 1:], archive, k_nearest)
+        for i, b in enumerate(population)
+    ]
+
+
+def _behaviors(rng, count, dim=11, duplicates=0):
+    rows = [[rng.random() for _ in range(dim)] for _ in range(count)]
+    for _ in range(duplicates):
+        rows.append(list(rng.choice(rows)))
+    return rows
+
+
+class TestVectorizedNovelty(unittest.TestCase):
+    def test_population_scores_match_reference(self):
+        rng = random.Random(0)
+        for pop_size, archive_size, k in [(1, 0, 15), (2, 0, 15), (20, 0, 5), (30, 40, 15), (50, 500, 15), (10, 3, 0)]:
+            population = _behaviors(rng, pop_size, duplicates=2 if pop_size > 2 else 0)
+            archive = _behaviors(rng, archive_size)
+            expected = _reference_population(population, archive, k)
+            self.assertEqual(compute_population_novelty(population, archive, k), expected)
+
+    def test_single_behavior_matches_reference(self):
+        rng = random.Random(1)
+        population = _behaviors(rng, 25)
+        archive = _behaviors(rng, 60)
+        behavior = population[3]
+        self.assertEqual(
+            compute_behavior_novelty(behavior, population, archive, 15),
+            _reference_novelty(behavior, population, archive, 15),
+        )
+        self.assertEqual(compute_behavior_novelty(behavior, [], [], 15), 1.0)
+
+    def test_archive_matrix_and_index(self):
+        rng = random.Random(2)
+        archive = BehaviorArchive(max_size=300, novelty_threshold=0.0, index_min_size=50)
+        stored = _behaviors(rng, 200)
+        archive.add_batch(stored, [1.0] * len(stored))
+        self.assertEqual(archive.size(), 200)
+        self.assertEqual(archive.get_behaviors(), stored)
+
+        population = _behaviors(rng, 40)
+        expected = _reference_population(population, stored, 15)
+        self.assertEqual(compute_population_novelty(population, archive.get_matrix(), 15), expected)
+
+        index = archive.get_index()
+        if cKDTree is None:
+            self.assertIsNone(index)
+        else:
+            self.assertEqual(
+                compute_population_novelty(population, archive.get_matrix(), 15, archive_index=index),
+                expected,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
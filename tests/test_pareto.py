@@ -0,0 +1,134 @@
+import math
+import random
+import unittest
+
+from training.components.pareto.ranking import (
+    _dominates,
+    crowding_distance,
+    dominance_matrix,
+    pareto_fronts,
+)
+from training.components.pareto.utility import pareto_order
+
+
+def _reference_fronts(values, directions):
+    """Scalar fast non-dominated sort (previous implementation)."""
+    n = len(values)
+    dominates_list = [[] for _ in range(n)]
+    dominated_count = [0] * n
+    for p in range(n):
+        for q in range(n):
+            if p == q:
+                continue
+            if _dominates(values[p], values[q], directions):
+                dominates_list[p].append(q)
+            elif _dominates(values[q], values[p], directions):
+                dominated_count[p] += 1
+    fronts = [[i for i in range(n) if dominated_count[i] == 0]]
+    i = 0
+    while i < len(fronts) and fronts[i]:
+        next_front = []
+        for p in fronts[i]:
+            for q in dominates_list[p]:
+                dominated_count[q] -= 1
+                if dominated_count[q] == 0:
+                    next_front.append(q)
+        if next_front:
+            fronts.append(next_front)
+        i += 1
+    return fronts
+
+
+def _reference_crowding(front, values):
+    distances = {idx: 0.0 for idx in front}
+    if len(front) <= 2:
+        return {idx: float("inf") for idx in front}
+    for obj_idx in range(len(values[0])):
+        sorted_front = sorted(front, key=lambda i: values[i][obj_idx])
+        distances[sorted_front[0]] = float("inf")
+        distances[sorted_front[-1]] = float("inf")
+        denom = max(1e-12, values[sorted_front[-1]][obj_idx] - values[sorted_front[0]][obj_idx])
+        for i in range(1, len(sorted_front) - 1):
+            prev_val = values[sorted_front[i - 1]][obj_idx]
+            next_val = values[sorted_front[i + 1]][obj_idx]
+            distances[sorted_front[i]] += (next_val - prev_val) / denom
+    return distances
+
+
+def _reference_order(values, directions):
+    n = len(values)
+    front_rank = [0] * n
+    crowding = [0.0] * n
+    for rank, front in enumerate(_reference_fronts(values, directions)):
+        for idx in front:
+            front_rank[idx] = rank
+        for idx, dist in _reference_crowding(front, values).items():
+            crowding[idx] = dist
+    order = sorted(range(n), key=lambda i: (front_rank[i], -crowding[i]))
+    return order, front_rank, crowding
+
+
+def _random_values(rng, n, num_obj, levels):
+    # Coarse integer levels force ties and duplicate points.
+    if levels:
+        return [[float(rng.randrange(levels)) for _ in range(num_obj)] for _ in range(n)]
+    return [[rng.gauss(0.0, 1.0) for _ in range(num_obj)] for _ in range(n)]
+
+
+class TestParetoRanking(unittest.TestCase):
+    def test_matches_reference_on_random_populations(self):
+        rng = random.Random(1234)
+        for trial in range(120):
+            num_obj = rng.choice([1, 2, 3, 4])
+            n = rng.randint(1, 60)
+            directions = [rng.choice(["max", "min"]) for _ in range(num_obj)]
+            values = _random_values(rng, n, num_obj, rng.choice([0, 3, 5, 12]))
+            with self.subTest(trial=trial, num_obj=num_obj, n=n):
+                self.assertEqual(pareto_fronts(values, directions), _reference_fronts(values, directions))
+                self.assertEqual(pareto_order(values, directions), _reference_order(values, directions))
+
+    def test_nan_objectives_follow_scalar_semantics(self):
+        values = [[1.0, float("nan")], [2.0, 1.0], [0.0, 0.0], [2.0, 1.0], [float("nan"), 3.0]]
+        directions = ["max", "min"]
+        self.assertEqual(pareto_fronts(values, directions), _reference_fronts(values, directions))
+
+    def test_nan_objectives_match_reference_order(self):
+        rng = random.Random(4321)
+        nan_as_none = lambda xs: [None if math.isnan(x) else x for x in xs]
+        for trial in range(200):
+            num_obj = rng.choice([1, 2, 3, 4])
+            n = rng.randint(1, 60)
+            directions = [rng.choice(["max", "min"]) for _ in range(num_obj)]
+            values = _random_values(rng, n, num_obj, rng.choice([0, 3, 5, 12]))
+            for row in values:
+                for k in range(num_obj):
+                    if rng.random() < 0.05:
+                        row[k] = float("nan")
+            with self.subTest(trial=trial, num_obj=num_obj, n=n):
+                order, ranks, crowding = pareto_order(values, directions)
+                ref_order, ref_ranks, ref_crowding = _reference_order(values, directions)
+                self.assertEqual((order, ranks), (ref_order, ref_ranks))
+                self.assertEqual(nan_as_none(crowding), nan_as_none(ref_crowding))
+
+    def test_dominance_matrix(self):
+        rng = random.Random(7)
+        values = _random_values(rng, 25, 3, 4)
+        directions = ["max", "min", "max"]
+        matrix = dominance_matrix(values, directions)
+        for p in range(25):
+            for q in range(25):
+                self.assertEqual(bool(matrix[p, q]), _dominates(values[p], values[q], directions))
+
+    def test_crowding_distance_matches_reference(self):
+        rng = random.Random(99)
+        values = _random_values(rng, 30, 3, 6)
+        front = rng.sample(range(30), 20)
+        self.assertEqual(crowding_distance(front, values, ["max"] * 3), _reference_crowding(front, values))
+
+    def test_empty_population(self):
+        self.assertEqual(pareto_fronts([], ["max"]), [])
+        self.assertEqual(pareto_order([], ["max"]), ([], [], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
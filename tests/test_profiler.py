@@ -0,0 +1,87 @@
+import io
+import unittest
+
+from game.headless_game import HeadlessAsteroidsGame
+from game.profiler import NULL_PROFILER, SpanProfiler
+from ai_agents.neuroevolution.nn_agent import NNAgent
+from interfaces.ActionInterface import ActionInterface
+from interfaces.encoders.VectorEncoder import VectorEncoder
+from training.analytics.reporting.sections.performance import write_time_profile
+from training.core.population_evaluator import evaluate_single_agent
+
+
+class TestSpanProfiler(unittest.TestCase):
+    def test_laps_tile_and_merge(self):
+        profiler = SpanProfiler()
+        mark = profiler.now()
+        mark = profiler.lap("a", mark)
+        mark = profiler.lap("b", mark)
+        profiler.lap("a", mark)
+        with profiler.span("c"):
+            pass
+        snapshot = profiler.snapshot()
+        self.assertEqual(snapshot["a"]["calls"], 2)
+        self.assertEqual(set(snapshot), {"a", "b", "c"})
+        self.assertTrue(all(entry["seconds"] >= 0.0 for entry in snapshot.values()))
+
+        merged = SpanProfiler()
+        merged.merge(snapshot)
+        merged.merge(snapshot)
+        self.assertEqual(merged.calls["a"], 4)
+        self.assertAlmostEqual(merged.seconds["b"], 2 * snapshot["b"]["seconds"])
+        merged.reset()
+        self.assertEqual(merged.snapshot(), {})
+
+    def test_null_profiler_records_nothing(self):
+        game = HeadlessAsteroidsGame(random_seed=0)
+        game.reset_game()
+        self.assertIs(game.profiler, NULL_PROFILER)
+        for _ in range(10):
+            game.on_update(1.0 / 60.0)
+        self.assertEqual(NULL_PROFILER.snapshot(), {})
+
+
+class TestEpisodeProfile(unittest.TestCase):
+    def _evaluate(self, profile):
+        encoder = VectorEncoder()
+        actions = ActionInterface(action_space_type="boolean")
+        size = NNAgent.get_parameter_count(encoder.get_state_size(), 8, actions.get_action_space_size())
+        return evaluate_single_agent([0.1] * size, encoder, actions, max_steps=120,
+                                     random_seed=3, hidden_size=8, profile=profile)
+
+    def test_profiled_episode_reports_spans(self):
+        result = self._evaluate(profile=True)
+        spans = result["time_profile"]
+        for name in ("encode", "inference", "physics", "reward", "metrics",
+                     "physics.movement", "physics.collisions"):
+            self.assertIn(name, spans)
+        self.assertEqual(spans["physics"]["calls"], result["steps_survived"])
+        self.assertTrue(any(name.startswith("reward.") for name in spans))
+        # Children are part of their parent span
+        children = sum(v["seconds"] for k, v in spans.items() if k.startswith("physics."))
+        self.assertLessEqual(children, spans["physics"]["seconds"])
+
+        unprofiled = self._evaluate(profile=False)
+        self.assertNotIn("time_profile", unprofiled)
+        self.assertEqual(unprofiled["fitness"], result["fitness"])
+
+    def test_report_section(self):
+        spans = self._evaluate(profile=True)["time_profile"]
+        generations = [
+            {"generation": 1, "time_profile": spans, "evaluation_duration": 1.0, "report_duration": 0.1},
+            {"generation": 2, "time_profile": spans, "evaluation_duration": 2.0},
+        ]
+        f = io.StringIO()
+        write_time_profile(f, generations)
+        text = f.getvalue()
+        self.assertIn("## Where the Time Went", text)
+        self.assertIn("physics.collisions", text)
+        self.assertIn("| Evaluation | 1.500 |", text)
+
+        f = io.StringIO()
+        write_time_profile(f, [{"generation": 1}])
+        self.assertEqual(f.getvalue(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+import os
+import socket
+import subprocess
+import sys
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from ai_agents.neuroevolution.neat.agent import NEATAgent
+from ai_agents.neuroevolution.nn_agent import NNAgent
+from interfaces.ActionInterface import ActionInterface
+from interfaces.encoders.HybridEncoder import HybridEncoder
+from interfaces.encoders.TemporalStackEncoder import TemporalStackEncoder
+from training.config.genetic_algorithm import GAConfig
+from training.config.neat import NEATConfig
+from training.core import remote_evaluation
+from training.core.population_evaluator import evaluate_population_parallel
+from training.core.remote_evaluation import (
+    EvaluationWorker,
+    RemoteEvaluationPool,
+    build_encoder,
+    describe_encoder,
+)
+from training.core.wire_protocol import parse_address, recv_message, send_message
+from training.methods.evolution_strategies.noise_table import NoiseCandidate, NoiseCenter
+from training.methods.neat.driver import NEATDriver
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKER_SCRIPT = os.path.join(PROJECT_ROOT, "training", "scripts", "evaluation_worker.py")
+
+
+class TestRemoteEvaluation(unittest.TestCase):
+    def setUp(self):
+        self.encoder = HybridEncoder(num_rays=16, num_fovea_asteroids=3)
+        self.actions = ActionInterface(action_space_type="boolean")
+        param_size = NNAgent.get_parameter_count(self.encoder.get_state_size(), GAConfig.HIDDEN_LAYER_SIZE, 3)
+        self.population = np.random.default_rng(0).uniform(-1, 1, (4, param_size)).tolist()
+        self.kwargs = dict(
+            state_encoder=self.encoder, action_interface=self.actions, max_steps=40,
+            generation_seed=21, seeds_per_agent=2, profile=False
+        )
+
+    def _worker_process(self):
+        """Start evaluation_worker.py on a free port; returns (process, address)."""
+        process = subprocess.Popen(
+            [sys.executable, WORKER_SCRIPT, "--bind", "127.0.0.1:0", "--threads", "1"],
+            stdout=subprocess.PIPE, text=True, cwd=PROJECT_ROOT
+        )
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+        line = process.stdout.readline()
+        self.assertIn("listening on", line)
+        return process, line.split("listening on ")[1].split()[0]
+
+    def _pool(self, addresses, **kwargs):
+        pool = RemoteEvaluationPool(addresses, connect_timeout=10, request_timeout=120, **kwargs)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_worker_processes_match_local_evaluation(self):
+        addresses = [self._worker_process()[1] for _ in range(2)]
+        pool = self._pool(addresses, batch_size=2)
+        for crn in (False, True):
+            with self.subTest(use_common_seeds=crn):
+                local = evaluate_population_parallel(self.population, max_workers=2, use_common_seeds=crn, **self.kwargs)
+                remote = evaluate_population_parallel(self.population, use_common_seeds=crn, backend=pool, **self.kwargs)
+                self.assertEqual(remote[0], local[0])
+                self.assertEqual(remote[1], local[1])
+                self.assertEqual(remote[2]["avg_kills"], local[2]["avg_kills"])
+                self.assertEqual(
+                    [m["steps_survived"] for m in remote[3]], [m["steps_survived"] for m in local[3]]
+                )
+
+    def test_lost_worker_rollouts_are_requeued(self):
+        doomed, doomed_address = self._worker_process()
+        _, address = self._worker_process()
+        pool = self._pool([doomed_address, address], batch_size=1)
+        self.assertEqual(len(pool.live_connections()), 2)
+
+        doomed.kill()
+        doomed.wait()
+        pending = pool.submit(self.population, **self.kwargs)
+        fitnesses = pending.result()[0]
+        self.assertGreater(pending.rollouts.requeued, 0)
+        self.assertEqual(fitnesses, evaluate_population_parallel(self.population, max_workers=1, **self.kwargs)[0])
+        # The dead worker is retried (and skipped) on the next evaluation
+        self.assertEqual(len(pool.live_connections()), 1)
+
+    def test_rollout_errors_are_raised_not_requeued(self):
+        workers = [EvaluationWorker("127.0.0.1", 0, threads=1).start() for _ in range(2)]
+        for worker in workers:
+            self.addCleanup(worker.close)
+        pool = self._pool([worker.address for worker in workers], batch_size=1)
+        broken = [params[:5] for params in self.population[:3]]  # Wrong parameter count
+
+        with self.assertRaises(Exception) as local:
+            evaluate_population_parallel(broken, max_workers=1, **self.kwargs)
+        pending = pool.submit(broken, **self.kwargs)
+        with self.assertRaises(remote_evaluation.RemoteRolloutError) as remote:
+            pending.result()
+        self.assertIn(type(local.exception).__name__, str(remote.exception))
+        self.assertIn("Traceback", str(remote.exception))
+        self.assertEqual(pending.rollouts.requeued, 0)
+        # Both workers stay connected and keep serving
+        self.assertTrue(all(connection.sock is not None for connection in pool.connections))
+        self.assertEqual(
+            evaluate_population_parallel(self.population, backend=pool, **self.kwargs)[0],
+            evaluate_population_parallel(self.population, max_workers=1, **self.kwargs)[0]
+        )
+
+    def test_neat_genomes_and_fingerprint_check(self):
+        worker = EvaluationWorker("127.0.0.1", 0, threads=2).start()
+        self.addCleanup(worker.close)
+        with mock.patch.multiple(NEATConfig, POPULATION_SIZE=3):
+            genomes = NEATDriver(input_size=self.encoder.get_state_size(), output_size=3).population
+        kwargs = dict(self.kwargs, agent_factory=lambda genome, encoder, actions: NEATAgent(genome))
+        pool = self._pool([worker.address])
+        local = evaluate_population_parallel(genomes, max_workers=1, **kwargs)
+        self.assertEqual(evaluate_population_parallel(genomes, backend=pool, **kwargs)[0], local[0])
+        with self.assertRaises(ValueError):
+            pool.submit(self.population, **kwargs)  # Custom agents only for genomes
+
+        # A worker with a different configuration refuses the batch
+        with socket.create_connection(parse_address(worker.address), timeout=30) as sock:
+            send_message(sock, {
+                "op": "evaluate", "spec": remote_evaluation.evaluation_spec(self.encoder, self.actions, 40, 1, False),
+                "fingerprint": "0" * 16, "individuals": [], "tasks": [],
+            })
+            reply = recv_message(sock)
+        self.assertFalse(reply["ok"])
+        self.assertTrue(reply["rejected"])
+
+        real = remote_evaluation.config_fingerprint
+        coordinator = threading.current_thread()
+        with mock.patch.object(
+            remote_evaluation, "config_fingerprint",
+            side_effect=lambda spec: "coordinator" if threading.current_thread() is coordinator else real(spec)
+        ):
+            pending = pool.submit(self.population, **self.kwargs)
+            with self.assertRaises(ConnectionError):
+                pending.result()
+        self.assertTrue(pool.connections[0].rejected)
+
+    def test_noise_candidates_are_sent_seed_only(self):
+        worker = EvaluationWorker("127.0.0.1", 0, threads=2).start()
+        self.addCleanup(worker.close)
+        param_size = len(self.population[0])
+        center = NoiseCenter(mean=np.asarray(self.population[0]), sigma=0.05, table_size=param_size + 64, table_seed=3)
+        candidates = [NoiseCandidate(center, offset, sign) for offset, sign in ((0, 1.0), (0, -1.0), (17, 1.0))]
+
+        centers = []
+        encoded = [remote_evaluation.encode_individual(candidate, centers) for candidate in candidates]
+        self.assertEqual(encoded, [{"noise": [0, 0, 1.0]}, {"noise": [0, 0, -1.0]}, {"noise": [0, 17, 1.0]}])
+        self.assertEqual(len(centers), 1)
+
+        pool = self._pool([worker.address])
+        local = evaluate_population_parallel(candidates, max_workers=1, **self.kwargs)
+        self.assertEqual(evaluate_population_parallel(candidates, backend=pool, **self.kwargs)[0], local[0])
+
+    def test_encoder_description_round_trip(self):
+        encoder = TemporalStackEncoder(HybridEncoder(num_rays=8, num_fovea_asteroids=2), stack_size=3)
+        description = describe_encoder(encoder)
+        rebuilt = build_encoder(description)
+        self.assertIsInstance(rebuilt.base_encoder, HybridEncoder)
+        self.assertEqual(rebuilt.get_state_size(), encoder.get_state_size())
+        self.assertEqual(describe_encoder(rebuilt), description)
+
+
+if __name__ == "__main__":
+    unittest.main()
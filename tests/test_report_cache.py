@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from training.analytics.analytics import TrainingAnalytics
+from training.config.analytics import AnalyticsConfig
+
+
+def _record(analytics, generations):
+    for generation in generations:
+        fitnesses = [float(generation + i) for i in range(4)]
+        metrics = [{"kills": i, "steps_survived": 100 + i, "accuracy": 0.2} for i in range(4)]
+        analytics.record_generation(generation, fitnesses, behavioral_metrics={"avg_kills": 1.0})
+        analytics.record_distributions(generation, fitnesses, metrics)
+
+
+class TestReportSectionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "report.md")
+        self.analytics = TrainingAnalytics()
+        self.analytics.set_config({"method": "test"})
+        _record(self.analytics, range(1, AnalyticsConfig.RECENT_TABLE_WINDOW + 11))
+
+    def _rendered(self):
+        return {name for name, _, cached in self.analytics.report_timings if not cached}
+
+    def _body(self):
+        with open(self.path, encoding="utf-8") as f:
+            text = f.read()
+        lines = [line for line in text.split("\n## Report Generation")[0].splitlines()
+                 if "Generated:" not in line and "Training Duration" not in line]
+        return "\n".join(lines)
+
+    def test_unchanged_data_reuses_every_section(self):
+        self.analytics.generate_markdown_report(self.path)
+        first = self._body()
+        self.analytics.generate_markdown_report(self.path)
+        # Only the summary carries the wall-clock training duration
+        self.assertEqual(self._rendered(), {"Overall Summary"})
+        self.assertEqual(self._body(), first)
+
+    def test_update_outside_window_keeps_windowed_sections(self):
+        self.analytics.record_fresh_game(1, {"kills": 2, "fitness": 5.0}, {"fitness_ratio": 0.9})
+        self.analytics.generate_markdown_report(self.path)
+        self.analytics.record_fresh_game(2, {"kills": 3, "fitness": 6.0}, {"fitness_ratio": 0.8})
+        self.analytics.generate_markdown_report(self.path)
+        rendered = self._rendered()
+        self.assertNotIn("Recent Generations", rendered)
+        self.assertNotIn("Training Configuration", rendered)
+        self.assertIn("Learning Progress", rendered)
+
+        _record(self.analytics, [AnalyticsConfig.RECENT_TABLE_WINDOW + 11])
+        self.analytics.generate_markdown_report(self.path)
+        self.assertIn("Recent Generations", self._rendered())
+
+    def test_live_report_and_resume(self):
+        live_path = os.path.join(self.tmp.name, "live.md")
+        self.analytics.generate_live_report(live_path)
+        names = [name for name, _, _ in self.analytics.report_timings]
+        self.assertIn("Recent Generations", names)
+        self.assertNotIn("Correlation Analysis", names)
+
+        state = self.analytics.state_dict()
+        _record(self.analytics, [100])
+        self.analytics.load_state_dict(state)
+        self.analytics.generate_live_report(live_path)
+        self.assertEqual(self._rendered(), set(names))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import random
+import unittest
+
+from game.headless_game import HeadlessAsteroidsGame
+from game.spawn_schedule import SpawnSchedule, estimate_spawn_events
+
+
+def _run_episode(seed, schedule=None, steps=900, policy_seed=0):
+    """Play a scripted episode and record every asteroid's state per step."""
+    game = HeadlessAsteroidsGame(width=800, height=600, random_seed=seed, spawn_schedule=schedule)
+    game.reset_game()
+    policy = random.Random(policy_seed)
+    trace = []
+    kills = 0
+    for _ in range(steps):
+        game.left_pressed = policy.random() < 0.3
+        game.right_pressed = policy.random() < 0.3
+        game.up_pressed = policy.random() < 0.2
+        game.space_pressed = True
+        game.on_update(1.0 / 60.0)
+        trace.append(tuple(
+            (a.center_x, a.center_y, a.change_x, a.change_y, a.rotation_speed, a.this_scale)
+            for a in game.asteroid_list
+        ))
+        kills = game.metrics_tracker.total_kills
+        if game.player not in game.player_list:
+            break
+    return trace, kills
+
+
+class TestSpawnSchedule(unittest.TestCase):
+    def test_trajectories_match_live_rng(self):
+        split_seen = False
+        for seed in (3, 11, 42):
+            schedule = SpawnSchedule(seed, estimate_spawn_events(900))
+            for policy_seed in range(3):
+                live = _run_episode(seed, policy_seed=policy_seed)
+                replay = _run_episode(seed, schedule, policy_seed=policy_seed)
+                self.assertEqual(live, replay)
+                split_seen = split_seen or live[1] > 0
+        self.assertTrue(split_seen, "expected at least one kill to exercise the split path")
+
+    def test_short_schedule_falls_back_to_live_rng(self):
+        schedule = SpawnSchedule(7, 10)
+        self.assertEqual(_run_episode(7), _run_episode(7, schedule))
+
+    def test_mismatched_seed_is_ignored(self):
+        game = HeadlessAsteroidsGame(random_seed=5, spawn_schedule=SpawnSchedule(6, 20))
+        self.assertIsNone(game.spawn_schedule)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from ai_agents.neuroevolution.nn_agent import NNAgent
+from interfaces.ActionInterface import ActionInterface
+from interfaces.encoders.HybridEncoder import HybridEncoder
+from training.config.genetic_algorithm import GAConfig
+from training.config.neat import NEATConfig
+from training.core.steady_state import CompletionWindow, SteadyStateEvaluator, default_in_flight
+from training.methods.genetic_algorithm.driver import GADriver
+from training.methods.neat.driver import NEATDriver
+
+
+def _tiny(config, population_size, generations):
+    return mock.patch.multiple(
+        config,
+        POPULATION_SIZE=population_size,
+        NUM_GENERATIONS=generations,
+        SEEDS_PER_AGENT=2,
+        MAX_STEPS=30,
+        CHECKPOINT_EVERY=0,
+    )
+
+
+def _metrics(fitness):
+    return {"fitness": fitness, "behavior_vector": [fitness] * 11, "reward_diversity": 0.0}
+
+
+class TestSteadyStateEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.encoder = HybridEncoder(num_rays=16, num_fovea_asteroids=3)
+        self.actions = ActionInterface(action_space_type="boolean")
+
+    def test_completions_seeds_and_window(self):
+        rng = np.random.default_rng(0)
+        param_size = NNAgent.get_parameter_count(self.encoder.get_state_size(), GAConfig.HIDDEN_LAYER_SIZE, 3)
+        evaluator = SteadyStateEvaluator(
+            max_workers=2, state_encoder=self.encoder, action_interface=self.actions,
+            max_steps=30, seeds_per_agent=2, base_seed=100, profile=False
+        )
+        self.addCleanup(evaluator.shutdown)
+        tickets = [evaluator.submit(rng.uniform(-1, 1, param_size), tag=i) for i in range(3)]
+        self.assertEqual(tickets, [0, 1, 2])
+        self.assertEqual(evaluator.in_flight(), 3)
+        self.assertEqual(evaluator._seeds_for(1)[0], [102, 103])
+
+        window = CompletionWindow(size=3, max_workers=2)
+        while evaluator.in_flight():
+            done = evaluator.next_completed(timeout=60)
+            self.assertEqual(len(done.results), 2)
+            self.assertEqual(done.fitness, done.metrics["fitness"])
+            window.add(done)
+        self.assertTrue(window.full())
+        self.assertEqual(sorted(c.tag for c in window.completions), [0, 1, 2])
+
+        fitnesses, aggregated, per_agent, timing = window.summarize()
+        self.assertEqual(len(fitnesses), 3)
+        self.assertEqual(len(per_agent), 3)
+        self.assertIn("avg_kills", aggregated)
+        self.assertGreater(timing["steady_state_evaluations_per_s"], 0.0)
+        self.assertLessEqual(timing["steady_state_busy_ratio"], 1.0)
+        with self.assertRaises(RuntimeError):
+            evaluator.next_completed()
+
+    def test_common_seeds_are_shared_per_block(self):
+        evaluator = SteadyStateEvaluator(
+            max_workers=1, state_encoder=self.encoder, action_interface=self.actions,
+            max_steps=30, seeds_per_agent=2, use_common_seeds=True, common_seed_period=4, base_seed=0
+        )
+        self.addCleanup(evaluator.shutdown)
+        self.assertEqual(evaluator._seeds_for(0)[0], evaluator._seeds_for(3)[0])
+        self.assertNotEqual(evaluator._seeds_for(3)[0], evaluator._seeds_for(4)[0])
+        self.assertEqual(default_in_flight(8, 2), 8)
+        self.assertEqual(default_in_flight(1, 5), 2)
+
+
+class TestSteadyStateDrivers(unittest.TestCase):
+    def test_ga_insert_never_replaces_best(self):
+        with mock.patch.multiple(GAConfig, POPULATION_SIZE=5, RNG_SEED=3):
+            driver = GADriver(param_size=4)
+            driver.start_steady_state()
+            self.assertEqual(driver.unevaluated_slots(), [0, 1, 2, 3, 4])
+            for slot, fitness in enumerate([1.0, 9.0, 2.0, 3.0, 0.5]):
+                driver.record_evaluation(slot, fitness, _metrics(fitness))
+            best = driver.population[1].copy()
+            for _ in range(20):
+                child = driver.breed_offspring()
+                driver.insert_offspring(child, -1.0, _metrics(-1.0))
+            np.testing.assert_array_equal(driver.population[1], best)
+            driver.finish_window()
+        self.assertEqual(driver.last_evolution_stats["replacements"], 20)
+        self.assertEqual(driver.evaluated_count(), 5)
+
+    def test_neat_keeps_population_size_and_best(self):
+        with mock.patch.multiple(NEATConfig, POPULATION_SIZE=6):
+            driver = NEATDriver(input_size=4, output_size=3)
+            driver.start_steady_state()
+            members = driver.unevaluated()
+            for i, genome in enumerate(members):
+                driver.record_evaluation(genome, float(i), _metrics(float(i)))
+            best = members[-1]
+            for _ in range(10):
+                child = driver.breed_offspring()
+                driver.insert_offspring(child, 0.5, _metrics(0.5))
+            self.assertEqual(len(driver.population), 6)
+            self.assertTrue(any(genome is best for genome in driver.population))
+            self.assertEqual(sum(len(s.members) for s in driver.species), 6)
+            driver.finish_window()
+
+            state = driver.state_dict()
+            restored = NEATDriver(input_size=4, output_size=3)
+            restored.load_state_dict(state)
+        self.assertEqual(driver.last_evolution_stats["replacements"], 10)
+        self.assertEqual(
+            sorted(restored.steady_fitness.values()), sorted(driver.steady_fitness.values())
+        )
+
+
+class TestSteadyStateTrainers(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _artifacts_dir(self, method):
+        path = os.path.join(self.tmp.name, f"{method}_artifacts")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def test_ga_runs_report_windows(self):
+        from training.scripts import train_ga
+        with _tiny(GAConfig, 4, 3), mock.patch.object(train_ga, "artifacts_dir", self._artifacts_dir), \
+                mock.patch.object(train_ga.GATrainingScript, "_save"):
+            trainer = train_ga.GATrainingScript(steady_state=True)
+            trainer.run_steady_state()
+        self.assertEqual(trainer.current_generation, 3)
+        self.assertEqual(len(trainer.analytics.generations_data), 3)
+        self.assertEqual(trainer.analytics.config["evolution_mode"], "steady_state")
+        self.assertIn("steady_state_busy_ratio", trainer.analytics.generations_data[-1])
+
+    def test_neat_runs_report_windows(self):
+        from training.scripts import train_neat
+        with _tiny(NEATConfig, 6, 2), mock.patch.object(train_neat, "artifacts_dir", self._artifacts_dir), \
+                mock.patch.object(train_neat.NEATTrainingScript, "_save"):
+            trainer = train_neat.NEATTrainingScript(steady_state=True)
+            trainer.run_steady_state()
+        self.assertEqual(trainer.current_generation, 2)
+        self.assertEqual(len(trainer.driver.population), 6)
+        self.assertIn("species_count", trainer.analytics.generations_data[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
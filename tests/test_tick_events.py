@@ -0,0 +1,102 @@
+import random
+import unittest
+
+from game.headless_game import HeadlessAsteroidsGame
+from game.tick_events import EVENT_KILL, EVENT_SPAWN, EVENT_SPLIT, TickEvents
+from interfaces.EnvironmentTracker import EnvironmentTracker
+from interfaces.rewards.ConservingAmmoBonus import ConservingAmmoBonus
+from interfaces.rewards.DistanceBasedKillReward import DistanceBasedKillReward
+from interfaces.rewards.KillAsteroid import KillAsteroid
+from interfaces.rewards.LeadingTargetBonus import LeadingTargetBonus
+from interfaces.rewards.ShootingPenalty import ShootingPenalty
+from interfaces.rewards.VelocityKillBonus import VelocityKillBonus
+
+
+def _components():
+    return [
+        KillAsteroid(reward_per_asteroid=10.0),
+        ConservingAmmoBonus(hit_bonus=4.0, shot_penalty=-1.0),
+        ShootingPenalty(),
+        DistanceBasedKillReward(max_reward_per_kill=15.0, min_reward_fraction=0.15),
+        VelocityKillBonus(),
+        LeadingTargetBonus(),
+    ]
+
+
+def _play(seed, on_tick, max_ticks=3000):
+    game = HeadlessAsteroidsGame(random_seed=seed)
+    game.reset_game()
+    policy = random.Random(seed)
+    for _ in range(max_ticks):
+        if game.player not in game.player_list:
+            break
+        game.left_pressed = policy.random() < 0.3
+        game.right_pressed = policy.random() < 0.3
+        game.up_pressed = policy.random() < 0.3
+        game.space_pressed = policy.random() < 0.8
+        before = (game.metrics_tracker.total_shots_fired, game.metrics_tracker.total_hits,
+                  game.metrics_tracker.total_kills, len(game.asteroid_list))
+        game.on_update(1.0 / 60.0)
+        on_tick(game, before)
+    return game
+
+
+class TestTickEvents(unittest.TestCase):
+    def test_events_match_counter_deltas(self):
+        totals = {"kills": 0, "splits": 0}
+
+        def check(game, before):
+            events = game.events
+            shots, hits, kills, asteroids = before
+            metrics = game.metrics_tracker
+            self.assertEqual(events.shots, metrics.total_shots_fired - shots)
+            self.assertEqual(events.hits, metrics.total_hits - hits)
+            self.assertEqual(events.kills, metrics.total_kills - kills)
+            killed = [asteroid_id for asteroid_id, _, _, _ in events.iter_kind(EVENT_KILL)]
+            self.assertEqual(len(set(killed)), len(killed))
+            self.assertFalse(set(killed) & {a.uid for a in game.asteroid_list})
+            splits = list(events.iter_kind(EVENT_SPLIT))
+            alive = {a.uid for a in game.asteroid_list}
+            self.assertTrue(all(child_id in alive for child_id, _, _, _ in splits))
+            totals["kills"] += events.kills
+            totals["splits"] += len(splits)
+
+        game = _play(0, check)
+        self.assertGreater(totals["kills"], 0)
+        self.assertGreater(totals["splits"], 0)
+        if game.player not in game.player_list:
+            self.assertTrue(game.events.died)
+
+    def test_event_rewards_match_counter_polling(self):
+        with_events, polled = _components(), _components()
+        polling_tracker = {}
+
+        def score(game, _):
+            tracker = polling_tracker.setdefault("t", EnvironmentTracker(game))
+            tracker.update(game)
+            tracker.events = None
+            for event_component, polled_component in zip(with_events, polled):
+                self.assertAlmostEqual(
+                    event_component.calculate_step_reward(game.tracker, game.metrics_tracker),
+                    polled_component.calculate_step_reward(tracker, game.metrics_tracker),
+                    msg=event_component.name
+                )
+
+        game = _play(3, score)
+        self.assertGreater(game.metrics_tracker.total_kills, 0)
+
+    def test_buffer_grows_and_clears(self):
+        events = TickEvents(capacity=2)
+        for i in range(5):
+            events.add(EVENT_SPAWN, i, float(i), 0.0, 1.0)
+        events.add(EVENT_KILL, 3, 3.0, 0.0, 1.0)
+        self.assertEqual(len(events), 6)
+        self.assertEqual([e[0] for e in events.iter_kind(EVENT_SPAWN)], [0, 1, 2, 3, 4])
+        self.assertEqual(events.kills, 1)
+        events.clear()
+        self.assertEqual((len(events), events.kills), (0, 0))
+        self.assertEqual(list(events.iter_kind(EVENT_SPAWN)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
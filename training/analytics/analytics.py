@@ -12,9 +12,11 @@ specialized modules for data collection, analysis, and reporting.
 """
 
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
+from game.profiler import SpanProfiler
 from training.analytics.collection.models import AnalyticsData
+from training.analytics.collection.store import AnalyticsStore, load_analytics
 from training.analytics.collection.collectors import (
     record_generation as _record_generation,
     record_fresh_game as _record_fresh_game,
@@ -36,6 +38,44 @@ class TrainingAnalytics:
 
     def __init__(self):
         self._data = AnalyticsData()
+        self._store: Optional[AnalyticsStore] = None
+        self._reporter = MarkdownReporter(self._data)
+        # Report rendering time, charged to the next recorded generation
+        self.profiler = SpanProfiler()
+
+    @classmethod
+    def from_store(cls, path: str) -> "TrainingAnalytics":
+        """Rebuild analytics from an append-only store (see attach_store).
+
+        Args:
+            path: Store file written during training
+
+        Returns:
+            TrainingAnalytics holding the replayed data
+        """
+        analytics = cls()
+        analytics._data = load_analytics(path)
+        analytics._reporter = MarkdownReporter(analytics._data)
+        return analytics
+
+    def attach_store(self, path: str):
+        """Stream every recorded generation to an append-only JSONL store.
+
+        The store starts with a snapshot of the data recorded so far, so it can
+        be attached at any point (and is restarted by load_state_dict).
+
+        Args:
+            path: Store file; a ``.gz`` suffix enables gzip compression
+        """
+        self.close_store()
+        self._store = AnalyticsStore(path)
+        self._store.start(self._data)
+
+    def close_store(self):
+        """Close the attached store, if any."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
 
     @property
     def generations_data(self) -> List[Dict[str, Any]]:
@@ -84,6 +124,8 @@ class TrainingAnalytics:
             config: Training configuration dictionary
         """
         self._data.set_config(config)
+        if self._store is not None:
+            self._store.append({"type": "config", "config": config})
 
     def record_generation(self, generation: int, fitness_scores: List[float],
                           behavioral_metrics: Optional[Dict[str, Any]] = None,
@@ -100,9 +142,15 @@ class TrainingAnalytics:
             timing_stats: Optional timing metrics
             operator_stats: Optional genetic operator statistics
         """
-        _record_generation(self._data, generation, fitness_scores,
-                           behavioral_metrics, best_agent_stats,
-                           timing_stats, operator_stats)
+        report_duration = self.profiler.seconds.get("report", 0.0)
+        self.profiler.reset()
+        if report_duration:
+            timing_stats = {**(timing_stats or {}), "report_duration": report_duration}
+        gen_data = _record_generation(self._data, generation, fitness_scores,
+                                      behavioral_metrics, best_agent_stats,
+                                      timing_stats, operator_stats)
+        if self._store is not None and gen_data is not None:
+            self._store.append({"type": "generation", "data": gen_data})
 
     def record_fresh_game(self, generation: int, fresh_game_data: Dict[str, Any],
                           generalization_metrics: Dict[str, Any]):
@@ -115,6 +163,12 @@ class TrainingAnalytics:
         """
         _record_fresh_game(self._data, generation, fresh_game_data,
                            generalization_metrics)
+        if self._store is not None:
+            self._store.append({
+                "type": "fresh_game",
+                "generation": generation,
+                **self._data.fresh_game_data[generation]
+            })
 
     def record_distributions(self, generation: int, fitness_values: List[float],
                              per_agent_metrics: List[Dict[str, Any]]):
@@ -125,7 +179,29 @@ class TrainingAnalytics:
             fitness_values: List of all fitness scores
             per_agent_metrics: List of per-agent behavioral metrics
         """
-        _record_distributions(self._data, generation, fitness_values, per_agent_metrics)
+        std_fields = _record_distributions(self._data, generation, fitness_values, per_agent_metrics)
+        if self._store is not None:
+            self._store.append({
+                "type": "distributions",
+                "generation": generation,
+                **self._data.distributions_data[generation],
+                "fields": std_fields
+            })
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Return all recorded data and tracking state for checkpointing."""
+        return dict(vars(self._data))
+
+    def load_state_dict(self, state: Dict[str, Any]):
+        """Restore data written by state_dict().
+
+        Args:
+            state: Dictionary returned by state_dict()
+        """
+        vars(self._data).update(state)
+        self._reporter.cache.clear()
+        if self._store is not None:
+            self._store.start(self._data)
 
     def get_summary_stats(self) -> Dict[str, Any]:
         """Get overall training summary statistics.
@@ -217,12 +293,30 @@ class TrainingAnalytics:
         Returns:
             Path to the generated report
         """
-        summary = self.get_summary_stats()
-        reporter = MarkdownReporter(self._data)
-        return reporter.generate_report(output_path, summary)
+        with self.profiler.span("report"):
+            summary = self.get_summary_stats()
+            return self._reporter.generate_report(output_path, summary)
+
+    def generate_live_report(self, output_path: str) -> str:
+        """Write the short live report (sections cheap enough to refresh every generation).
+
+        Args:
+            output_path: Path to write the report
+
+        Returns:
+            Path to the generated report
+        """
+        with self.profiler.span("report"):
+            summary = self.get_summary_stats()
+            return self._reporter.generate_live_report(output_path, summary)
+
+    @property
+    def report_timings(self) -> List[Tuple[str, float, bool]]:
+        """(section, seconds, reused from cache) for the most recent report."""
+        return self._reporter.last_timings
 
     def save_json(self, output_path: str = "training_data.json") -> str:
-        """Save raw training data as JSON.
+        """Save raw training data as JSON (full export; see attach_store for streaming).
 
         Args:
             output_path: Path to write the JSON file
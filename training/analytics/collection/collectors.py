@@ -16,7 +16,7 @@ def record_generation(data: AnalyticsData, generation: int, fitness_scores: List
                       behavioral_metrics: Optional[Dict[str, Any]] = None,
                       best_agent_stats: Optional[Dict[str, Any]] = None,
                       timing_stats: Optional[Dict[str, float]] = None,
-                      operator_stats: Optional[Dict[str, int]] = None):
+                      operator_stats: Optional[Dict[str, int]] = None) -> Optional[Dict[str, Any]]:
     """Record metrics for a generation.
 
     Args:
@@ -27,9 +27,12 @@ def record_generation(data: AnalyticsData, generation: int, fitness_scores: List
         best_agent_stats: Optional stats for the best agent
         timing_stats: Optional timing metrics (duration of phases)
         operator_stats: Optional genetic operator statistics
+
+    Returns:
+        The recorded generation dict, or None if nothing was recorded
     """
     if not fitness_scores:
-        return
+        return None
 
     sorted_scores = sorted(fitness_scores)
     n = len(sorted_scores)
@@ -152,6 +155,8 @@ def record_generation(data: AnalyticsData, generation: int, fitness_scores: List
         
         gen_data['avg_reward_breakdown'] = behavioral_metrics.get('avg_reward_breakdown', {})
         gen_data['avg_quarterly_scores'] = behavioral_metrics.get('avg_quarterly_scores', [])
+        if 'time_profile' in behavioral_metrics:
+            gen_data['time_profile'] = behavioral_metrics['time_profile']
 
         reward_breakdown = gen_data.get('avg_reward_breakdown', {})
         if reward_breakdown:
@@ -185,6 +190,8 @@ def record_generation(data: AnalyticsData, generation: int, fitness_scores: List
         gen_data.update(best_agent_stats)
 
     data.generations_data.append(gen_data)
+    data.mark_updated(generation)
+    return gen_data
 
 
 def record_fresh_game(data: AnalyticsData, generation: int, fresh_game_data: Dict[str, Any],
@@ -208,10 +215,11 @@ def record_fresh_game(data: AnalyticsData, generation: int, fresh_game_data: Dic
             gen_data['fresh_game'] = fresh_game_data
             gen_data['generalization_metrics'] = generalization_metrics
             break
+    data.mark_updated(generation)
 
 
 def record_distributions(data: AnalyticsData, generation: int, fitness_values: List[float],
-                         per_agent_metrics: List[Dict[str, Any]]):
+                         per_agent_metrics: List[Dict[str, Any]]) -> Dict[str, float]:
     """Record per-agent distribution data for a generation.
 
     Args:
@@ -219,6 +227,9 @@ def record_distributions(data: AnalyticsData, generation: int, fitness_values: L
         generation: Generation number
         fitness_values: List of all fitness scores
         per_agent_metrics: List of per-agent behavioral metrics
+
+    Returns:
+        The per-metric standard deviations attached to the generation dict
     """
     sorted_fitness = sorted(fitness_values)
     sorted_kills = sorted([m.get('kills', 0) for m in per_agent_metrics])
@@ -291,30 +302,27 @@ def record_distributions(data: AnalyticsData, generation: int, fitness_values: L
     }
 
     # Calculate additional standard deviations for reporting
-    std_kills = std_dev([m.get('kills', 0) for m in per_agent_metrics])
-    std_steps = std_dev([m.get('steps_survived', 0) for m in per_agent_metrics])
-    std_accuracy = std_dev([m.get('accuracy', 0) for m in per_agent_metrics])
-    std_frontness = std_dev([m.get('frontness_avg', 0.0) for m in per_agent_metrics])
-    std_danger = std_dev([m.get('danger_exposure_rate', 0.0) for m in per_agent_metrics])
-    std_softmin_ttc = std_dev([m.get('softmin_ttc', 0.0) for m in per_agent_metrics])
-    std_turn_deadzone = std_dev([m.get('turn_deadzone_rate', 0.0) for m in per_agent_metrics])
-    std_coverage = std_dev([m.get('coverage_ratio', 0.0) for m in per_agent_metrics])
-    std_fitness_std = std_dev([m.get('fitness_std', 0.0) for m in per_agent_metrics])
+    std_fields = {
+        'std_dev_kills': std_dev([m.get('kills', 0) for m in per_agent_metrics]),
+        'std_dev_steps': std_dev([m.get('steps_survived', 0) for m in per_agent_metrics]),
+        'std_dev_accuracy': std_dev([m.get('accuracy', 0) for m in per_agent_metrics]),
+        'std_dev_frontness': std_dev([m.get('frontness_avg', 0.0) for m in per_agent_metrics]),
+        'std_dev_danger_exposure_rate': std_dev([m.get('danger_exposure_rate', 0.0) for m in per_agent_metrics]),
+        'std_dev_softmin_ttc': std_dev([m.get('softmin_ttc', 0.0) for m in per_agent_metrics]),
+        'std_dev_turn_deadzone_rate': std_dev([m.get('turn_deadzone_rate', 0.0) for m in per_agent_metrics]),
+        'std_dev_coverage_ratio': std_dev([m.get('coverage_ratio', 0.0) for m in per_agent_metrics]),
+        'std_dev_fitness_std': std_dev([m.get('fitness_std', 0.0) for m in per_agent_metrics]),
+    }
 
     # Also attach to generation data if it exists
     for gen_data in data.generations_data:
         if gen_data['generation'] == generation:
             gen_data['distributions'] = distributions
             gen_data['distribution_stats'] = distribution_stats
-            
+
             # Store std devs for distribution charts
-            gen_data['std_dev_kills'] = std_kills
-            gen_data['std_dev_steps'] = std_steps
-            gen_data['std_dev_accuracy'] = std_accuracy
-            gen_data['std_dev_frontness'] = std_frontness
-            gen_data['std_dev_danger_exposure_rate'] = std_danger
-            gen_data['std_dev_softmin_ttc'] = std_softmin_ttc
-            gen_data['std_dev_turn_deadzone_rate'] = std_turn_deadzone
-            gen_data['std_dev_coverage_ratio'] = std_coverage
-            gen_data['std_dev_fitness_std'] = std_fitness_std
+            gen_data.update(std_fields)
             break
+    data.mark_updated(generation)
+
+    return std_fields
@@ -28,10 +28,20 @@ class AnalyticsData:
         self.all_time_best_generation: int = 0
         self.generations_since_improvement: int = 0
 
+        # Change tracking for report caching: every recorded update bumps
+        # ``revision`` and stamps the generation it touched
+        self.revision: int = 0
+        self.generation_revisions: Dict[int, int] = {}
+
     def set_config(self, config: Dict[str, Any]):
         """Store training configuration."""
         self.config = config
 
+    def mark_updated(self, generation: int):
+        """Record that a generation's data was added or changed."""
+        self.revision += 1
+        self.generation_revisions[generation] = self.revision
+
     def update_best_tracking(self, generation: int, best_fitness: float):
         """Update all-time best tracking and stagnation counter.
 
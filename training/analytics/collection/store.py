@@ -0,0 +1,128 @@
+"""
+Append-only analytics store.
+
+Records are written as line-delimited JSON (optionally gzip-compressed) the
+moment they are recorded, so a save costs one line per generation instead of
+re-serializing the whole run. ``load_analytics`` replays the log back into an
+``AnalyticsData`` for ``MarkdownReporter``; ``save_json`` remains available to
+export the classic ``training_data*.json`` file.
+
+Event types (one JSON object per line, ``"type"`` selects the handler):
+    run            schema_version, start_time, config (first line of a log)
+    config         config
+    generation     data (the generation dict as recorded)
+    distributions  generation, distributions, distribution_stats, fields
+    fresh_game     generation, fresh_game, generalization_metrics
+"""
+
+import gzip
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from training.analytics.collection.models import AnalyticsData
+from training.analytics.reporting.json_export import _json_default
+
+
+def _open_text(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class AnalyticsStore:
+    """
+    Line-delimited JSON writer for analytics events.
+
+    Args:
+        path: Log file; a ``.gz`` suffix enables gzip compression
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self.records_written = 0
+
+    def start(self, data: AnalyticsData) -> None:
+        """(Re)start the log with a snapshot of ``data``, e.g. after a resume."""
+        self.close()
+        self._file = _open_text(self.path, "w")
+        self.records_written = 0
+        self.append({
+            "type": "run",
+            "schema_version": data.SCHEMA_VERSION,
+            "start_time": data.start_time.isoformat(),
+            "config": data.config,
+        })
+        for gen_data in data.generations_data:
+            self.append({"type": "generation", "data": gen_data})
+        for generation, entry in data.distributions_data.items():
+            self.append({"type": "distributions", "generation": generation, **entry, "fields": {}})
+        for generation, entry in data.fresh_game_data.items():
+            self.append({"type": "fresh_game", "generation": generation, **entry})
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """Serialize one event and flush it to disk."""
+        if self._file is None:
+            return
+        self._file.write(json.dumps(event, default=_json_default, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.records_written += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def load_analytics(path: str) -> AnalyticsData:
+    """
+    Rebuild ``AnalyticsData`` from a store written by ``AnalyticsStore``.
+
+    A truncated final line (interrupted write) is ignored. Stagnation tracking
+    is recomputed from the generation records.
+    """
+    data = AnalyticsData()
+    by_generation: Dict[int, Dict[str, Any]] = {}
+
+    with _open_text(path, "r") as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            kind = event.get("type")
+            if kind == "run":
+                data.start_time = datetime.fromisoformat(event["start_time"])
+                data.config = event.get("config", {})
+            elif kind == "config":
+                data.config = event["config"]
+            elif kind == "generation":
+                gen_data = event["data"]
+                data.generations_data.append(gen_data)
+                by_generation[gen_data["generation"]] = gen_data
+            elif kind == "distributions":
+                generation = event["generation"]
+                entry = {
+                    "distributions": event["distributions"],
+                    "distribution_stats": event["distribution_stats"],
+                }
+                data.distributions_data[generation] = entry
+                _attach(by_generation.get(generation), {**entry, **event.get("fields", {})})
+            elif kind == "fresh_game":
+                generation = event["generation"]
+                entry = {
+                    "fresh_game": event["fresh_game"],
+                    "generalization_metrics": event["generalization_metrics"],
+                }
+                data.fresh_game_data[generation] = entry
+                _attach(by_generation.get(generation), entry)
+
+    for gen_data in data.generations_data:
+        data.update_best_tracking(gen_data["generation"], gen_data["best_fitness"])
+    return data
+
+
+def _attach(gen_data: Optional[Dict[str, Any]], fields: Dict[str, Any]) -> None:
+    if gen_data is not None:
+        gen_data.update(fields)
@@ -92,6 +92,19 @@ METRIC_GLOSSARY: Dict[str, Tuple[str, str]] = {
     "evaluation_duration": ("Evaluation duration", "Wall time spent evaluating a generation."),
     "evolution_duration": ("Evolution duration", "Wall time spent evolving a generation."),
     "total_gen_duration": ("Total generation duration", "Combined evaluation and evolution wall time."),
+    "time_profile": ("Rollout time profile", "Episode time per hot-path span (encode, inference, physics, reward, metrics), summed over all evaluations."),
+    "pipeline_wait_duration": ("Pipeline wait", "Wall time the trainer blocked waiting for evaluation results."),
+    "worker_utilization": ("Worker utilization", "Rollout time divided by evaluation wall time x workers (1.0 = no idle workers)."),
+    "evaluation_tail_duration": ("Straggler tail", "Wall time from the first worker running out of rollouts to the last rollout finishing."),
+    "report_duration": ("Report duration", "Wall time spent rendering reports since the previous generation was recorded."),
+    "steady_state_busy_ratio": ("Worker busy ratio", "Steady-state mode: rollout time divided by window wall time x workers (1.0 = no idle workers)."),
+    "steady_state_evaluations_per_s": ("Evaluations per second", "Steady-state mode: individuals fully evaluated per second of window wall time."),
+    "steady_state_avg_latency": ("Evaluation latency", "Steady-state mode: average seconds from submitting an individual to its last rollout finishing."),
+    "replacements": ("Replacements", "Steady-state mode: population members replaced by evaluated offspring in the window."),
+    "migrants_sent": ("Migrants sent", "Island runs: best individuals this island published on a migration generation."),
+    "migrants_received": ("Migrants received", "Island runs: new individuals taken in from neighbouring islands (they replace the worst members; CMA-ES pulls its mean toward the best one)."),
+    "migrants_rejected": ("Migrants rejected", "Island runs: neighbour emigrants ignored because their representation (method or network size) differs."),
+    "best_immigrant_fitness": ("Best immigrant fitness", "Island runs: fitness the best received migrant had on its home island."),
     "sigma": ("Sigma", "CMA-ES global step size controlling exploration radius."),
     "cov_diag_mean": ("Cov diag mean", "Mean diagonal covariance value (per-parameter variance)."),
     "cov_diag_std": ("Cov diag std", "Standard deviation of diagonal covariance values."),
@@ -5,7 +5,7 @@ Orchestrates the generation of comprehensive markdown training reports.
 """
 
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional, Tuple
 
 from training.config.analytics import AnalyticsConfig
 from training.analytics.collection.models import AnalyticsData
@@ -35,8 +35,10 @@ from game import globals
 from training.analytics.reporting.sections.warnings import write_reward_warnings
 from training.analytics.reporting.sections.performance import (
     write_computational_performance,
+    write_time_profile,
     write_genetic_operator_stats,
     write_es_optimizer_stats,
+    write_report_timing,
 )
 from training.analytics.reporting.sections.milestones import write_milestone_timeline
 from training.analytics.reporting.sections.toc import write_table_of_contents
@@ -47,10 +49,16 @@ from training.analytics.reporting.sections.risk import write_risk_analysis
 from training.analytics.reporting.sections.control import write_control_diagnostics
 from training.analytics.reporting.sections.takeaways import collect_report_takeaways, write_report_takeaways
 from training.analytics.reporting.sections.sac_diagnosis import write_sac_diagnosis
+from training.analytics.reporting.section_cache import ReportSection, SectionCache
 
 
 class MarkdownReporter:
-    """Generates comprehensive markdown training reports."""
+    """Generates comprehensive markdown training reports.
+
+    Section text is cached between calls (see section_cache.py), so a
+    reporter kept alive across a run only re-renders the sections whose
+    inputs changed since the previous report.
+    """
 
     def __init__(self, data: AnalyticsData):
         """Initialize the reporter.
@@ -59,6 +67,8 @@ class MarkdownReporter:
             data: AnalyticsData instance containing training data
         """
         self.data = data
+        self.cache = SectionCache()
+        self.last_timings: List[Tuple[str, float, bool]] = []
 
     def generate_report(self, output_path: str, summary: Dict[str, Any]) -> str:
         """Generate comprehensive markdown training report.
@@ -70,171 +80,249 @@ class MarkdownReporter:
         Returns:
             Path to the generated report
         """
+        self._write_report(output_path, "Training Summary Report", self._sections(summary), summary)
+        print(f"\n[OK] Training summary saved to: {output_path}")
+        return output_path
+
+    def generate_live_report(self, output_path: str, summary: Dict[str, Any]) -> str:
+        """Write the cheap subset of sections meant to be refreshed every generation.
+
+        Args:
+            output_path: Path to write the report
+            summary: Summary statistics dictionary
+
+        Returns:
+            Path to the generated report
+        """
+        sections = [section for section in self._sections(summary) if section.live]
+        self._write_report(output_path, "Live Training Report", sections, summary)
+        return output_path
+
+    def _flags(self, summary: Dict[str, Any]) -> Tuple[bool, bool, bool]:
         has_behavior = 'final_avg_kills' in summary
         has_fresh_game = 'avg_generalization_ratio' in summary
         has_sac = 'sac' in str(self.data.config.get("method", "")).lower()
         if not has_sac and self.data.generations_data:
             has_sac = any(k.startswith("sac_") for k in self.data.generations_data[-1].keys())
-
+        return has_behavior, has_fresh_game, has_sac
+
+    def _sections(self, summary: Dict[str, Any]) -> List[ReportSection]:
+        """Enabled report sections, in report order."""
+        has_behavior, has_fresh_game, has_sac = self._flags(summary)
+        gens = self.data.generations_data
+        sections = []
+
+        def add(name, write, inputs=("generations",), window=None, live=False, enabled=True):
+            if enabled:
+                sections.append(ReportSection(name, write, inputs, window, live))
+
+        def titled(title, write_fn):
+            def write(f):
+                f.write(title)
+                write_fn(f)
+            return write
+
+        # Table of Contents
+        add("Table of Contents", lambda f: write_table_of_contents(f, has_behavior, has_fresh_game, has_sac),
+            inputs=())
+
+        # Quick Trend Overview (Sparklines)
+        add("Quick Trend Overview", titled("## Quick Trend Overview\n\n", lambda f: write_sparklines(f, gens)),
+            live=True, enabled=AnalyticsConfig.ENABLE_QUICK_TRENDS)
+
+        # Report Takeaways (all sections)
+        add("Report Takeaways",
+            lambda f: write_report_takeaways(f, collect_report_takeaways(gens, summary, has_behavior, has_fresh_game)),
+            inputs=("generations", "summary"))
+
+        # Training Configuration
+        add("Training Configuration", lambda f: write_config(f, self.data.config), inputs=("config",))
+
+        # Overall Summary
+        add("Overall Summary", lambda f: write_overall_summary(f, summary, has_fresh_game),
+            inputs=("summary", "clock"), live=True)
+
+        # Best Agent Deep Profile
+        add("Best Agent Deep Profile", lambda f: write_best_agent_profile(f, gens),
+            enabled=AnalyticsConfig.ENABLE_BEST_AGENT_PROFILE)
+
+        # Heatmaps (New)
+        add("Heatmaps", lambda f: write_heatmaps(f, gens, globals.SCREEN_WIDTH, globals.SCREEN_HEIGHT),
+            window=AnalyticsConfig.HEATMAP_WINDOW, enabled=AnalyticsConfig.ENABLE_HEATMAPS)
+
+        # Generation Highlights
+        add("Generation Highlights",
+            titled("## Generation Highlights\n\n", lambda f: write_generation_highlights(f, gens)),
+            enabled=AnalyticsConfig.ENABLE_GENERATION_HIGHLIGHTS)
+
+        # Milestone Timeline
+        add("Milestone Timeline", lambda f: write_milestone_timeline(f, gens))
+
+        # Training Progress by Phase
+        add("Training Progress by Phase",
+            titled("## Training Progress by Phase\n\n", lambda f: write_decile_breakdown(f, gens)),
+            enabled=AnalyticsConfig.ENABLE_PROGRESS_DECILES)
+
+        # Distribution Charts (New)
+        add("Distribution Analysis", lambda f: write_distribution_charts(f, gens),
+            enabled=AnalyticsConfig.ENABLE_DISTRIBUTIONS)
+
+        # Kill Efficiency Analysis
+        add("Kill Efficiency Analysis",
+            titled("## Kill Efficiency Analysis\n\n", lambda f: write_kill_efficiency(f, gens)),
+            enabled=AnalyticsConfig.ENABLE_KILL_EFFICIENCY)
+
+        # Learning Velocity
+        add("Learning Velocity", titled("## Learning Velocity\n\n", lambda f: write_learning_velocity(f, gens)),
+            enabled=AnalyticsConfig.ENABLE_LEARNING_VELOCITY)
+
+        # Reward Component Evolution
+        add("Reward Component Evolution",
+            titled("## Reward Component Evolution\n\n", lambda f: write_reward_evolution(f, gens)),
+            enabled=AnalyticsConfig.ENABLE_REWARD_EVOLUTION)
+
+        # Reward Balance Warnings
+        add("Reward Balance Analysis",
+            titled("## Reward Balance Analysis\n\n", lambda f: write_reward_warnings(f, gens)))
+
+        # Population Health Dashboard
+        add("Population Health Dashboard",
+            titled("## Population Health Dashboard\n\n", lambda f: write_population_health(f, gens)),
+            enabled=AnalyticsConfig.ENABLE_POPULATION_HEALTH)
+
+        # Stagnation Analysis
+        add("Stagnation Analysis",
+            titled("## Stagnation Analysis\n\n",
+                   lambda f: write_stagnation_analysis(f, gens, self.data.generations_since_improvement)),
+            inputs=("generations", "tracking"), live=True,
+            enabled=AnalyticsConfig.ENABLE_STAGNATION_ANALYSIS)
+
+        # Generalization Analysis (Fresh Game)
+        add("Generalization Analysis",
+            titled("## Generalization Analysis (Fresh Game)\n\n", lambda f: write_generalization_analysis(f, gens)),
+            enabled=has_fresh_game and AnalyticsConfig.ENABLE_FRESH_GAME_ANALYSIS)
+
+        # Correlation Matrix
+        add("Correlation Analysis", titled("## Correlation Analysis\n\n", lambda f: write_correlation_matrix(f, gens)),
+            enabled=AnalyticsConfig.ENABLE_CORRELATIONS)
+
+        # Survival Distribution
+        add("Survival Distribution",
+            titled("## Survival Distribution\n\n",
+                   lambda f: write_survival_distribution(f, gens, self.data.config)),
+            inputs=("generations", "config"), enabled=AnalyticsConfig.ENABLE_SURVIVAL_DISTRIBUTION)
+
+        # Behavioral Summary (if available)
+        add("Behavioral Summary", lambda f: write_behavioral_summary(f, summary), inputs=("summary",),
+            enabled=has_behavior and AnalyticsConfig.ENABLE_BEHAVIORAL_SUMMARY)
+
+        # Learning Progress
+        add("Learning Progress", titled("## Learning Progress\n\n", lambda f: write_learning_progress(f, gens)))
+
+        # Neural Analysis (New)
+        add("Neural Analysis", lambda f: write_neural_analysis(f, gens),
+            enabled=AnalyticsConfig.ENABLE_NEURAL_ANALYSIS)
+
+        # Risk Analysis (New)
+        add("Risk Analysis", lambda f: write_risk_analysis(f, gens), enabled=AnalyticsConfig.ENABLE_RISK_ANALYSIS)
+
+        # Control Diagnostics
+        add("Control Diagnostics", lambda f: write_control_diagnostics(f, gens),
+            enabled=AnalyticsConfig.ENABLE_CONTROL_DIAGNOSTICS)
+
+        # SAC Diagnostics (GNN-SAC only)
+        add("SAC Diagnosis", lambda f: write_sac_diagnosis(f, gens, self.data.config),
+            inputs=("generations", "config"), enabled=has_sac and AnalyticsConfig.ENABLE_SAC_DIAGNOSIS)
+
+        # Convergence Analysis
+        add("Convergence Analysis",
+            titled("## Convergence Analysis\n\n", lambda f: write_convergence_analysis(f, gens)),
+            enabled=AnalyticsConfig.ENABLE_CONVERGENCE_ANALYSIS)
+
+        # Behavioral Trends (if available)
+        def write_behavior(f):
+            f.write("## Behavioral Trends\n\n")
+            write_behavioral_trends(f, gens)
+            write_intra_episode_analysis(f, gens)
+        add("Behavioral Trends", write_behavior,
+            enabled=has_behavior and AnalyticsConfig.ENABLE_BEHAVIORAL_TRENDS)
+
+        # Recent Generations Table
+        add("Recent Generations",
+            titled(f"## Recent Generations (Last {AnalyticsConfig.RECENT_TABLE_WINDOW})\n\n",
+                   lambda f: write_generation_table(f, gens, limit=AnalyticsConfig.RECENT_TABLE_WINDOW,
+                                                    include_behavior=has_behavior)),
+            window=AnalyticsConfig.RECENT_TABLE_WINDOW, live=True,
+            enabled=AnalyticsConfig.ENABLE_RECENT_TABLE)
+
+        # Best Generations
+        add("Top 10 Best Generations",
+            titled("\n## Top 10 Best Generations\n\n",
+                   lambda f: write_best_generations(f, gens, include_behavior=has_behavior)),
+            enabled=AnalyticsConfig.ENABLE_TOP_GENERATIONS)
+
+        # Trend Analysis
+        add("Trend Analysis", titled("\n## Trend Analysis\n\n", lambda f: write_trend_analysis(f, gens)))
+
+        # ASCII Charts
+        add("Fitness Progression",
+            titled("\n## Fitness Progression (ASCII Chart)\n\n", lambda f: write_ascii_chart(f, gens)),
+            live=True, enabled=AnalyticsConfig.ENABLE_ASCII_CHARTS)
+
+        # Performance Appendix
+        def write_appendix(f):
+            f.write("\n---\n\n# Technical Appendix\n\n")
+            write_computational_performance(f, gens)
+            if AnalyticsConfig.ENABLE_TIME_PROFILE:
+                write_time_profile(f, gens)
+            write_genetic_operator_stats(f, gens)
+            write_es_optimizer_stats(f, gens)
+        add("Technical Appendix", write_appendix)
+
+        return sections
+
+    def _section_key(self, section: ReportSection, summary: Dict[str, Any], flags: Tuple[bool, bool, bool]) -> tuple:
+        """Everything the section's text depends on; equal keys mean identical text."""
+        key = [flags]
+        for source in section.inputs:
+            if source == "generations":
+                key.append(self._window_key(section.window))
+            elif source == "config":
+                key.append(dict(self.data.config))
+            elif source == "summary":
+                key.append({k: v for k, v in summary.items() if k != 'training_duration'})
+            elif source == "clock":
+                key.append(summary.get('training_duration'))
+            elif source == "tracking":
+                key.append(self.data.generations_since_improvement)
+        return tuple(key)
+
+    def _window_key(self, window: Optional[int]) -> tuple:
+        """Identify the trailing ``window`` generations (all when None) and their latest update."""
+        gens = self.data.generations_data
+        if not gens:
+            return ()
+        recent = gens if window is None else gens[-window:]
+        revisions = self.data.generation_revisions
+        if window is None:
+            revision = self.data.revision
+        else:
+            revision = max(revisions.get(g['generation'], 0) for g in recent)
+        return len(recent), recent[0]['generation'], recent[-1]['generation'], revision
+
+    def _write_report(self, output_path: str, title: str, sections: List[ReportSection],
+                      summary: Dict[str, Any]):
+        flags = self._flags(summary)
+        self.last_timings = []
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("# Training Summary Report\n\n")
+            f.write(f"# {title}\n\n")
             f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"**Schema Version:** {self.data.SCHEMA_VERSION}\n\n")
-            
-            # Table of Contents
-            write_table_of_contents(f, has_behavior, has_fresh_game, has_sac)
-
-            # Quick Trend Overview (Sparklines)
-            if AnalyticsConfig.ENABLE_QUICK_TRENDS:
-                f.write("## Quick Trend Overview\n\n")
-                write_sparklines(f, self.data.generations_data)
-
-            # Report Takeaways (all sections)
-            takeaways = collect_report_takeaways(
-                self.data.generations_data,
-                summary,
-                has_behavior,
-                has_fresh_game
-            )
-            write_report_takeaways(f, takeaways)
-
-            # Training Configuration
-            write_config(f, self.data.config)
-
-            # Overall Summary
-            write_overall_summary(f, summary, has_fresh_game)
-            
-            # Best Agent Deep Profile
-            if AnalyticsConfig.ENABLE_BEST_AGENT_PROFILE:
-                write_best_agent_profile(f, self.data.generations_data)
-            
-            # Heatmaps (New)
-            if AnalyticsConfig.ENABLE_HEATMAPS:
-                write_heatmaps(f, self.data.generations_data, globals.SCREEN_WIDTH, globals.SCREEN_HEIGHT)
-
-            # Generation Highlights
-            if AnalyticsConfig.ENABLE_GENERATION_HIGHLIGHTS:
-                f.write("## Generation Highlights\n\n")
-                write_generation_highlights(f, self.data.generations_data)
-            
-            # Milestone Timeline
-            write_milestone_timeline(f, self.data.generations_data)
-
-            # Training Progress by Phase
-            if AnalyticsConfig.ENABLE_PROGRESS_DECILES:
-                f.write("## Training Progress by Phase\n\n")
-                write_decile_breakdown(f, self.data.generations_data)
-
-            # Distribution Charts (New)
-            if AnalyticsConfig.ENABLE_DISTRIBUTIONS:
-                write_distribution_charts(f, self.data.generations_data)
-
-            # Kill Efficiency Analysis
-            if AnalyticsConfig.ENABLE_KILL_EFFICIENCY:
-                f.write("## Kill Efficiency Analysis\n\n")
-                write_kill_efficiency(f, self.data.generations_data)
-
-            # Learning Velocity
-            if AnalyticsConfig.ENABLE_LEARNING_VELOCITY:
-                f.write("## Learning Velocity\n\n")
-                write_learning_velocity(f, self.data.generations_data)
-
-            # Reward Component Evolution
-            if AnalyticsConfig.ENABLE_REWARD_EVOLUTION:
-                f.write("## Reward Component Evolution\n\n")
-                write_reward_evolution(f, self.data.generations_data)
-
-            # Reward Balance Warnings
-            f.write("## Reward Balance Analysis\n\n")
-            write_reward_warnings(f, self.data.generations_data)
-
-            # Population Health Dashboard
-            if AnalyticsConfig.ENABLE_POPULATION_HEALTH:
-                f.write("## Population Health Dashboard\n\n")
-                write_population_health(f, self.data.generations_data)
-
-            # Stagnation Analysis
-            if AnalyticsConfig.ENABLE_STAGNATION_ANALYSIS:
-                f.write("## Stagnation Analysis\n\n")
-                write_stagnation_analysis(f, self.data.generations_data,
-                                          self.data.generations_since_improvement)
-
-            # Generalization Analysis (Fresh Game)
-            if has_fresh_game and AnalyticsConfig.ENABLE_FRESH_GAME_ANALYSIS:
-                f.write("## Generalization Analysis (Fresh Game)\n\n")
-                write_generalization_analysis(f, self.data.generations_data)
-
-            # Correlation Matrix
-            if AnalyticsConfig.ENABLE_CORRELATIONS:
-                f.write("## Correlation Analysis\n\n")
-                write_correlation_matrix(f, self.data.generations_data)
-
-            # Survival Distribution
-            if AnalyticsConfig.ENABLE_SURVIVAL_DISTRIBUTION:
-                f.write("## Survival Distribution\n\n")
-                write_survival_distribution(f, self.data.generations_data, self.data.config)
-
-            # Behavioral Summary (if available)
-            if has_behavior and AnalyticsConfig.ENABLE_BEHAVIORAL_SUMMARY:
-                write_behavioral_summary(f, summary)
-
-            # Learning Progress
-            f.write("## Learning Progress\n\n")
-            write_learning_progress(f, self.data.generations_data)
-
-            # Neural Analysis (New)
-            if AnalyticsConfig.ENABLE_NEURAL_ANALYSIS:
-                write_neural_analysis(f, self.data.generations_data)
-
-            # Risk Analysis (New)
-            if AnalyticsConfig.ENABLE_RISK_ANALYSIS:
-                write_risk_analysis(f, self.data.generations_data)
-
-            # Control Diagnostics
-            if AnalyticsConfig.ENABLE_CONTROL_DIAGNOSTICS:
-                write_control_diagnostics(f, self.data.generations_data)
-
-            # SAC Diagnostics (GNN-SAC only)
-            if has_sac and AnalyticsConfig.ENABLE_SAC_DIAGNOSIS:
-                write_sac_diagnosis(f, self.data.generations_data, self.data.config)
-
-            # Convergence Analysis
-            if AnalyticsConfig.ENABLE_CONVERGENCE_ANALYSIS:
-                f.write("## Convergence Analysis\n\n")
-                write_convergence_analysis(f, self.data.generations_data)
-
-            # Behavioral Trends (if available)
-            if has_behavior and AnalyticsConfig.ENABLE_BEHAVIORAL_TRENDS:
-                f.write("## Behavioral Trends\n\n")
-                write_behavioral_trends(f, self.data.generations_data)
-                write_intra_episode_analysis(f, self.data.generations_data)
-
-            # Recent Generations Table
-            if AnalyticsConfig.ENABLE_RECENT_TABLE:
-                f.write(f"## Recent Generations (Last {AnalyticsConfig.RECENT_TABLE_WINDOW})\n\n")
-                write_generation_table(f, self.data.generations_data, limit=AnalyticsConfig.RECENT_TABLE_WINDOW,
-                                       include_behavior=has_behavior)
-
-            # Best Generations
-            if AnalyticsConfig.ENABLE_TOP_GENERATIONS:
-                f.write("\n## Top 10 Best Generations\n\n")
-                write_best_generations(f, self.data.generations_data,
-                                       include_behavior=has_behavior)
-
-            # Trend Analysis
-            f.write("\n## Trend Analysis\n\n")
-            write_trend_analysis(f, self.data.generations_data)
-
-            # ASCII Charts
-            if AnalyticsConfig.ENABLE_ASCII_CHARTS:
-                f.write("\n## Fitness Progression (ASCII Chart)\n\n")
-                write_ascii_chart(f, self.data.generations_data)
-            
-            # Performance Appendix
-            f.write("\n---\n\n# Technical Appendix\n\n")
-            write_computational_performance(f, self.data.generations_data)
-            write_genetic_operator_stats(f, self.data.generations_data)
-            write_es_optimizer_stats(f, self.data.generations_data)
 
-        print(f"\n[OK] Training summary saved to: {output_path}")
-        return output_path
+            for section in sections:
+                text, seconds, cached = self.cache.render(section, self._section_key(section, summary, flags))
+                f.write(text)
+                self.last_timings.append((section.name, seconds, cached))
+
+            if AnalyticsConfig.ENABLE_REPORT_TIMING:
+                write_report_timing(f, self.last_timings)
@@ -0,0 +1,61 @@
+"""
+Report section cache.
+
+Each markdown section is rendered to text once and reused until the data it
+reads changes. A section declares its inputs (generation window, config,
+summary, stagnation tracking); the reporter turns them into a key, and a
+section whose key matches the cached one is copied instead of recomputed.
+"""
+
+import io
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class ReportSection:
+    """
+    One markdown report section.
+
+    Args:
+        name: Display name (used for the timing table)
+        write: Callable writing the section to a text stream
+        inputs: Data the section reads: "generations", "config", "summary", "tracking"
+        window: Trailing generations read (None = the whole history)
+        live: Include in the per-generation live report
+    """
+
+    def __init__(self, name: str, write: Callable[[Any], None],
+                 inputs: Tuple[str, ...] = ("generations",),
+                 window: Optional[int] = None, live: bool = False):
+        self.name = name
+        self.write = write
+        self.inputs = inputs
+        self.window = window
+        self.live = live
+
+
+class SectionCache:
+    """Rendered section text keyed by the data each section depends on."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Any, str]] = {}
+
+    def render(self, section: ReportSection, key: Any) -> Tuple[str, float, bool]:
+        """
+        Return the section text, rendering it only if ``key`` changed.
+
+        Returns:
+            (text, seconds spent, whether the cached text was reused)
+        """
+        start = time.perf_counter()
+        entry = self._entries.get(section.name)
+        if entry is not None and entry[0] == key:
+            return entry[1], time.perf_counter() - start, True
+        buffer = io.StringIO()
+        section.write(buffer)
+        text = buffer.getvalue()
+        self._entries[section.name] = (key, text)
+        return text, time.perf_counter() - start, False
+
+    def clear(self) -> None:
+        self._entries.clear()
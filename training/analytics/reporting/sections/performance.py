@@ -1,10 +1,11 @@
 """
 Performance reporting section.
 
-Analyzes computational performance (timing) and genetic operator statistics.
+Analyzes computational performance (timing), where rollout time goes and
+genetic operator statistics.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from training.analytics.analysis.phases import split_generations
 from training.analytics.reporting.sections.common import write_takeaways, write_warnings, write_glossary
@@ -81,6 +82,111 @@ def write_computational_performance(f, generations_data: List[Dict[str, Any]]):
         ])
     )
 
+def write_time_profile(f, generations_data: List[Dict[str, Any]]):
+    """Write where rollout and training-loop time went in recent generations.
+
+    Args:
+        f: File handle to write to
+        generations_data: List of generation data dictionaries
+    """
+    if not generations_data:
+        return
+
+    window = AnalyticsConfig.TIME_PROFILE_WINDOW
+    recent = generations_data[-window:]
+    spans: Dict[str, Dict[str, float]] = {}
+    for g in recent:
+        for name, entry in g.get('time_profile', {}).items():
+            total = spans.setdefault(name, {"seconds": 0.0, "calls": 0})
+            total["seconds"] += entry.get("seconds", 0.0)
+            total["calls"] += entry.get("calls", 0)
+
+    loop_keys = [
+        ("Evaluation", 'evaluation_duration'),
+        ("Pipeline wait", 'pipeline_wait_duration'),
+        ("Straggler tail", 'evaluation_tail_duration'),
+        ("Evolution", 'evolution_duration'),
+        ("Report", 'report_duration'),
+    ]
+    has_loop = any(key in g for g in recent for _, key in loop_keys)
+    steady = [g for g in recent if 'steady_state_busy_ratio' in g]
+    if not spans and not has_loop and not steady:
+        return
+
+    f.write("## Where the Time Went\n\n")
+    takeaways = []
+
+    top_level = sorted((name for name in spans if "." not in name),
+                       key=lambda name: -spans[name]["seconds"])
+    rollout_total = sum(spans[name]["seconds"] for name in top_level)
+    if rollout_total > 0:
+        f.write(f"**Rollout spans (Last {len(recent)} Generations, summed over all episodes):** "
+                f"{rollout_total:.2f}s\n\n")
+        f.write("| Span | Share | Total (s) | Calls | Per Call (us) |\n")
+        f.write("|------|-------|-----------|-------|---------------|\n")
+
+        def row(label, entry, total):
+            share = entry["seconds"] / total * 100 if total > 0 else 0.0
+            per_call = entry["seconds"] / entry["calls"] * 1e6 if entry["calls"] else 0.0
+            f.write(f"| {label} | {share:.1f}% | {entry['seconds']:.3f} | {int(entry['calls'])} | {per_call:.1f} |\n")
+
+        for name in top_level:
+            row(name, spans[name], rollout_total)
+            children = sorted((child for child in spans if child.startswith(name + ".")),
+                              key=lambda child: -spans[child]["seconds"])
+            for child in children:
+                row(f"&nbsp;&nbsp;{child}", spans[child], rollout_total)
+        f.write("\n")
+
+        hottest = top_level[0]
+        takeaways.append(
+            f"`{hottest}` takes {spans[hottest]['seconds'] / rollout_total * 100:.1f}% of rollout time."
+        )
+
+    if has_loop:
+        f.write(f"**Training loop (average per generation, Last {len(recent)}):**\n\n")
+        f.write("| Phase | Avg Time (s) |\n")
+        f.write("|-------|--------------|\n")
+        for label, key in loop_keys:
+            values = [g[key] for g in recent if key in g]
+            if values:
+                f.write(f"| {label} | {sum(values) / len(values):.3f} |\n")
+        f.write("\n")
+
+    utilization = [g['worker_utilization'] for g in recent if 'worker_utilization' in g]
+    if utilization:
+        takeaways.append(
+            f"Evaluation workers were busy {sum(utilization) / len(utilization) * 100:.0f}% of evaluation wall time."
+        )
+
+    if steady:
+        busy = sum(g['steady_state_busy_ratio'] for g in steady) / len(steady)
+        rate = sum(g.get('steady_state_evaluations_per_s', 0.0) for g in steady) / len(steady)
+        latency = sum(g.get('steady_state_avg_latency', 0.0) for g in steady) / len(steady)
+        takeaways.append(
+            f"Steady-state workers were busy {busy * 100:.0f}% of the time "
+            f"({rate:.2f} evaluations/s, {latency:.2f}s average latency)."
+        )
+
+    write_takeaways(f, takeaways)
+    write_glossary(
+        f,
+        glossary_entries([
+            "time_profile",
+            "evaluation_duration",
+            "pipeline_wait_duration",
+            "evaluation_tail_duration",
+            "worker_utilization",
+            "evolution_duration",
+            "report_duration",
+        ] + ([
+            "steady_state_busy_ratio",
+            "steady_state_evaluations_per_s",
+            "steady_state_avg_latency",
+        ] if steady else []))
+    )
+
+
 def write_genetic_operator_stats(f, generations_data: List[Dict[str, Any]]):
     """Write genetic operator statistics.
 
@@ -249,3 +355,24 @@ def write_es_optimizer_stats(f, generations_data: List[Dict[str, Any]]):
         ]),
         title="Optimizer Glossary",
     )
+
+
+def write_report_timing(f, timings: List[Tuple[str, float, bool]]):
+    """Write how long each report section took to render.
+
+    Args:
+        f: File handle to write to
+        timings: (section name, seconds, reused from cache) per section
+    """
+    if not timings:
+        return
+
+    total = sum(seconds for _, seconds, _ in timings)
+    reused = sum(1 for _, _, cached in timings if cached)
+    f.write("\n## Report Generation\n\n")
+    f.write(f"**Sections:** {len(timings)} ({reused} reused from cache) in {total * 1000:.1f} ms\n\n")
+    f.write("| Section | Time (ms) | Cached |\n")
+    f.write("|---------|-----------|--------|\n")
+    for name, seconds, cached in timings:
+        f.write(f"| {name} | {seconds * 1000:.2f} | {'yes' if cached else 'no'} |\n")
+    f.write("\n")
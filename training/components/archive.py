@@ -7,9 +7,17 @@ both the current population and this historical record.
 """
 
 import random
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
 from training.components.novelty import compute_behavior_novelty
 
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # Optional: brute-force distances are used without scipy
+    cKDTree = None
+
 
 class BehaviorArchive:
     """
@@ -17,13 +25,19 @@ class BehaviorArchive:
 
     Behaviors are added when they exceed a novelty threshold.
     Archive size is capped with random replacement when full.
+
+    Behaviors live in a preallocated [max_size, d] NumPy matrix. When scipy is
+    available and the archive holds at least ``index_min_size`` entries, a
+    k-d tree over the matrix is rebuilt lazily after changes and handed to
+    compute_population_novelty via get_index().
     """
 
     def __init__(
         self,
         max_size: int = 500,
         novelty_threshold: float = 0.3,
-        k_nearest: int = 15
+        k_nearest: int = 15,
+        index_min_size: Optional[int] = None
     ):
         """
         Initialize the behavior archive.
@@ -32,11 +46,23 @@ class BehaviorArchive:
             max_size: Maximum number of behaviors to store
             novelty_threshold: Minimum novelty score to be added to archive
             k_nearest: Number of neighbors for novelty calculation
+            index_min_size: Archive size from which a k-d tree index is kept
+                (None = never index)
         """
         self.max_size = max_size
         self.novelty_threshold = novelty_threshold
         self.k_nearest = k_nearest
-        self.behaviors: List[List[float]] = []
+        self.index_min_size = index_min_size
+
+        self._matrix: Optional[np.ndarray] = None  # Allocated on first add (feature count known)
+        self._count = 0
+        self._index = None
+        self._index_dirty = True
+
+    @property
+    def behaviors(self) -> List[List[float]]:
+        """Archived behaviors as a list of vectors."""
+        return self.get_matrix().tolist()
 
     def maybe_add(
         self,
@@ -57,7 +83,7 @@ class BehaviorArchive:
         novelty = compute_behavior_novelty(
             behavior,
             population_behaviors,
-            self.behaviors,
+            self.get_matrix(),
             self.k_nearest
         )
 
@@ -69,12 +95,17 @@ class BehaviorArchive:
 
     def _add(self, behavior: List[float]) -> None:
         """Add a behavior to the archive, evicting if necessary."""
-        if len(self.behaviors) >= self.max_size:
+        if self._matrix is None:
+            self._matrix = np.zeros((self.max_size, len(behavior)), dtype=np.float64)
+
+        if self._count >= self.max_size:
             # Random replacement
-            idx = random.randint(0, len(self.behaviors) - 1)
-            self.behaviors[idx] = behavior
+            idx = random.randint(0, self._count - 1)
+            self._matrix[idx] = behavior
         else:
-            self.behaviors.append(behavior)
+            self._matrix[self._count] = behavior
+            self._count += 1
+        self._index_dirty = True
 
     def add_batch(
         self,
@@ -100,25 +131,63 @@ class BehaviorArchive:
 
     def get_behaviors(self) -> List[List[float]]:
         """Get all behaviors in the archive."""
-        return self.behaviors.copy()
+        return self.behaviors
+
+    def get_matrix(self) -> np.ndarray:
+        """Get the archived behaviors as a read-only [size, d] array view."""
+        if self._matrix is None:
+            return np.zeros((0, 0), dtype=np.float64)
+        view = self._matrix[:self._count]
+        view.flags.writeable = False
+        return view
+
+    def get_index(self):
+        """Get a k-d tree over the archive, or None when indexing is off or unavailable."""
+        if cKDTree is None or self.index_min_size is None or self._count < self.index_min_size:
+            return None
+        if self._index_dirty or self._index is None:
+            self._index = cKDTree(self._matrix[:self._count].copy())
+            self._index_dirty = False
+        return self._index
 
     def size(self) -> int:
         """Get current archive size."""
-        return len(self.behaviors)
+        return self._count
 
     def clear(self) -> None:
         """Clear the archive."""
-        self.behaviors = []
+        self._matrix = None
+        self._count = 0
+        self._index = None
+        self._index_dirty = True
 
     def set_threshold(self, threshold: float) -> None:
         """Update the novelty threshold."""
         self.novelty_threshold = threshold
 
+    def state_dict(self) -> Dict[str, Any]:
+        """Archive contents and threshold for checkpointing."""
+        return {
+            'behaviors': self.get_matrix().copy(),
+            'novelty_threshold': self.novelty_threshold,
+        }
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """Restore contents written by state_dict()."""
+        self.clear()
+        self.novelty_threshold = state.get('novelty_threshold', self.novelty_threshold)
+        behaviors = np.asarray(state['behaviors'], dtype=np.float64)
+        count = min(len(behaviors), self.max_size)
+        if count > 0:
+            self._matrix = np.zeros((self.max_size, behaviors.shape[1]), dtype=np.float64)
+            self._matrix[:count] = behaviors[:count]
+            self._count = count
+
     def get_stats(self) -> dict:
         """Get archive statistics."""
         return {
-            'size': len(self.behaviors),
+            'size': self._count,
             'max_size': self.max_size,
-            'fill_ratio': len(self.behaviors) / self.max_size if self.max_size > 0 else 0,
+            'fill_ratio': self._count / self.max_size if self.max_size > 0 else 0,
             'novelty_threshold': self.novelty_threshold,
         }
@@ -7,7 +7,15 @@ strategies and promotes exploration of the behavior space.
 """
 
 import math
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+BehaviorMatrix = Union[np.ndarray, Sequence[Sequence[float]]]
+
+# Extra neighbour candidates re-checked with exact distances, so near-ties in
+# the BLAS distance matrix can't change which k neighbours are averaged
+_EXACT_CANDIDATE_MARGIN = 8
 
 
 def compute_behavior_vector(metrics: Dict, steps: int) -> List[float]:
@@ -91,10 +99,100 @@ def euclidean_distance(vec1: List[float], vec2: List[float]) -> float:
     return math.sqrt(sum((a - b) ** 2 for a, b in zip(vec1, vec2)))
 
 
+def behaviors_to_matrix(behaviors: BehaviorMatrix, dim: Optional[int] = None) -> np.ndarray:
+    """Convert a list of behavior vectors (or an existing matrix) to a float64 matrix.
+
+    Args:
+        behaviors: List of behavior vectors or a 2D array
+        dim: Feature count to use for an empty input
+
+    Returns:
+        Array of shape [n, dim]
+    """
+    matrix = np.asarray(behaviors, dtype=np.float64)
+    if matrix.size == 0:
+        width = dim if dim is not None else (matrix.shape[1] if matrix.ndim == 2 else 0)
+        return np.zeros((0, width), dtype=np.float64)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2D behavior matrix, got shape {matrix.shape}")
+    return matrix
+
+
+def pairwise_distances(queries: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """Euclidean distance matrix between two behavior matrices.
+
+    Uses |a|^2 + |b|^2 - 2ab so the heavy lifting is one matrix product.
+
+    Args:
+        queries: Array of shape [n, d]
+        reference: Array of shape [m, d]
+
+    Returns:
+        Array of shape [n, m]
+    """
+    if queries.shape[1] != reference.shape[1]:
+        raise ValueError(f"Vector length mismatch: {queries.shape[1]} vs {reference.shape[1]}")
+    sq = np.einsum("ij,ij->i", queries, queries)[:, None] \
+        + np.einsum("ij,ij->i", reference, reference)[None, :] \
+        - 2.0 * (queries @ reference.T)
+    np.maximum(sq, 0.0, out=sq)
+    return np.sqrt(sq, out=sq)
+
+
+def _mean_k_nearest(
+    queries: np.ndarray,
+    pool: np.ndarray,
+    approx: np.ndarray,
+    k: int,
+    pool_index: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Mean distance from each query to its k nearest pool entries.
+
+    ``approx`` ranks candidates (np.inf marks excluded columns). The best
+    k + margin columns per row are re-measured feature by feature in the
+    same order as euclidean_distance and summed in ascending order, so the
+    result matches the scalar implementation exactly.
+
+    Args:
+        queries: Array of shape [Q, d]
+        pool: Array of shape [M, d] holding candidate vectors
+        approx: Array of shape [Q, C] of approximate distances
+        k: Number of neighbours to average
+        pool_index: Optional [Q, C] map from approx columns to pool rows
+            (default: column c is pool row c)
+
+    Returns:
+        Array of shape [Q]
+    """
+    num_queries, num_cols = approx.shape
+    keep = min(num_cols, k + _EXACT_CANDIDATE_MARGIN)
+    if keep < num_cols:
+        cols = np.argpartition(approx, keep - 1, axis=1)[:, :keep]
+    else:
+        cols = np.broadcast_to(np.arange(num_cols), (num_queries, num_cols))
+    rows = np.arange(num_queries)[:, None]
+    excluded = np.isinf(approx[rows, cols])
+    pool_rows = cols if pool_index is None else pool_index[rows, cols]
+    candidates = pool[pool_rows]
+
+    acc = np.zeros(candidates.shape[:2], dtype=np.float64)
+    for j in range(candidates.shape[2]):
+        diff = queries[:, None, j] - candidates[:, :, j]
+        acc += diff * diff
+    exact = np.sqrt(acc)
+    exact[excluded] = np.inf
+    exact.sort(axis=1)
+
+    total = np.zeros(num_queries, dtype=np.float64)
+    for c in range(k):
+        total += exact[:, c]
+    return total / k
+
+
 def compute_behavior_novelty(
     behavior: List[float],
-    population_behaviors: List[List[float]],
-    archive_behaviors: List[List[float]],
+    population_behaviors: BehaviorMatrix,
+    archive_behaviors: BehaviorMatrix,
     k_nearest: int = 15
 ) -> float:
     """
@@ -111,53 +209,80 @@ def compute_behavior_novelty(
     Returns:
         Novelty score (higher = more novel)
     """
-    all_behaviors = population_behaviors + archive_behaviors
+    query = np.asarray(behavior, dtype=np.float64)
+    population = behaviors_to_matrix(population_behaviors, dim=query.shape[0])
+    archive = behaviors_to_matrix(archive_behaviors, dim=query.shape[0])
+    all_behaviors = np.concatenate([population, archive]) if len(archive) else population
 
     if len(all_behaviors) == 0:
         return 1.0  # Everything is maximally novel when alone
 
-    # Calculate distances to all other behaviors
-    distances = [euclidean_distance(behavior, other) for other in all_behaviors]
+    if all_behaviors.shape[1] != query.shape[0]:
+        raise ValueError(f"Vector length mismatch: {query.shape[0]} vs {all_behaviors.shape[1]}")
 
-    # Sort and take k nearest
-    distances.sort()
-    k = min(k_nearest, len(distances))
-
-    if k == 0:
+    k = min(k_nearest, len(all_behaviors))
+    if k <= 0:
         return 1.0
 
-    # Average distance to k nearest neighbors
-    return sum(distances[:k]) / k
+    approx = pairwise_distances(query[None, :], all_behaviors)
+    return float(_mean_k_nearest(query[None, :], all_behaviors, approx, k)[0])
 
 
 def compute_population_novelty(
-    population_behaviors: List[List[float]],
-    archive_behaviors: List[List[float]],
-    k_nearest: int = 15
+    population_behaviors: BehaviorMatrix,
+    archive_behaviors: BehaviorMatrix,
+    k_nearest: int = 15,
+    archive_index=None
 ) -> List[float]:
     """
     Compute novelty scores for an entire population.
 
+    Distances from every agent to the rest of the population and the archive
+    come from a single distance-matrix computation; each agent's score is
+    the mean of its k nearest (self excluded).
+
     Args:
-        population_behaviors: List of behavior vectors for all agents
-        archive_behaviors: Behaviors from the historical archive
+        population_behaviors: List of behavior vectors (or [P, d] matrix) for all agents
+        archive_behaviors: Behaviors from the historical archive (list or [A, d] matrix)
         k_nearest: Number of nearest neighbors to consider
+        archive_index: Optional spatial index over archive_behaviors with a
+            ``query(points, k)`` method (see BehaviorArchive.get_index)
 
     Returns:
         List of novelty scores, one per agent
     """
-    novelty_scores = []
-
-    for i, behavior in enumerate(population_behaviors):
-        # Exclude self from population when computing novelty
-        other_population = population_behaviors[:i] + population_behaviors[i+1:]
-
-        novelty = compute_behavior_novelty(
-            behavior,
-            other_population,
-            archive_behaviors,
-            k_nearest
-        )
-        novelty_scores.append(novelty)
-
-    return novelty_scores
+    population = behaviors_to_matrix(population_behaviors)
+    pop_size = len(population)
+    if pop_size == 0:
+        return []
+
+    archive = behaviors_to_matrix(archive_behaviors, dim=population.shape[1])
+    others = pop_size - 1 + len(archive)
+    k = min(k_nearest, others)
+    if others == 0 or k <= 0:
+        return [1.0] * pop_size
+
+    pop_dist = pairwise_distances(population, population)
+    np.fill_diagonal(pop_dist, np.inf)  # Exclude self
+
+    if len(archive) == 0:
+        scores = _mean_k_nearest(population, population, pop_dist, k)
+    elif archive_index is not None:
+        # Only the k(+margin) nearest archive entries per agent can matter
+        kk = min(len(archive), k + _EXACT_CANDIDATE_MARGIN)
+        arch_dist, arch_idx = archive_index.query(population, kk)
+        arch_dist = np.asarray(arch_dist, dtype=np.float64).reshape(pop_size, kk)
+        arch_idx = np.asarray(arch_idx, dtype=np.int64).reshape(pop_size, kk)
+        pool = np.concatenate([population, archive])
+        pool_index = np.concatenate([
+            np.broadcast_to(np.arange(pop_size), (pop_size, pop_size)),
+            arch_idx + pop_size
+        ], axis=1)
+        approx = np.concatenate([pop_dist, arch_dist], axis=1)
+        scores = _mean_k_nearest(population, pool, approx, k, pool_index)
+    else:
+        pool = np.concatenate([population, archive])
+        approx = np.concatenate([pop_dist, pairwise_distances(population, archive)], axis=1)
+        scores = _mean_k_nearest(population, pool, approx, k)
+
+    return scores.tolist()
@@ -1,8 +1,22 @@
 """
 Pareto ranking utilities (front assignment and crowding distance).
+
+Ranking is vectorized with NumPy. Front membership comes from a sort-based
+sweep (Efficient Non-dominated Sort with binary search over fronts): two
+objectives only need the last member of each front, three or more compare
+against a whole front at once. Inputs containing NaN fall back to peeling a
+full dominance matrix, which reproduces the scalar comparison semantics.
+
+Within-front ordering matches the classic fast non-dominated sort, so
+crowding ties and downstream selection are unchanged.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# Upper bound on booleans materialized per broadcast comparison chunk.
+_CHUNK_ELEMENTS = 4_000_000
 
 
 def _dominates(a: List[float], b: List[float], directions: List[str]) -> bool:
@@ -26,43 +40,176 @@ def _dominates(a: List[float], b: List[float], directions: List[str]) -> bool:
     return better_or_equal and strictly_better
 
 
+def _oriented(values, directions: Sequence[str]) -> np.ndarray:
+    """Return values as a float matrix where larger is better on every objective."""
+    matrix = np.asarray(values, dtype=np.float64)
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(matrix), -1)
+    signs = np.array([1.0 if d == "max" else -1.0 for d in directions], dtype=np.float64)
+    return matrix[:, :len(signs)] * signs
+
+
+def _dominance_block(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Boolean matrix D[i, j] = a[i] dominates b[j] (oriented values)."""
+    out = np.empty((len(a), len(b)), dtype=bool)
+    if len(a) == 0 or len(b) == 0:
+        return out
+    rows = max(1, _CHUNK_ELEMENTS // (len(b) * max(1, a.shape[1])))
+    for start in range(0, len(a), rows):
+        chunk = a[start:start + rows, None, :]
+        # "not worse" is spelled as "never less" so NaN behaves like the scalar check
+        not_worse = ~np.any(chunk < b[None, :, :], axis=2)
+        strictly = np.any(chunk > b[None, :, :], axis=2)
+        out[start:start + rows] = not_worse & strictly
+    return out
+
+
+def dominance_matrix(values: List[List[float]], directions: List[str]) -> np.ndarray:
+    """
+    Compute the full pairwise dominance matrix.
+
+    Returns:
+        Boolean array D of shape (n, n) with D[p, q] True when p dominates q
+    """
+    oriented = _oriented(values, directions)
+    return _dominance_block(oriented, oriented)
+
+
+def _ranks_by_peeling(oriented: np.ndarray) -> np.ndarray:
+    """Front ranks from repeated removal of non-dominated points."""
+    n = len(oriented)
+    dom = _dominance_block(oriented, oriented)
+    counts = dom.sum(axis=0)
+    ranks = np.full(n, -1, dtype=np.int64)
+    front = np.flatnonzero(counts == 0)
+    rank = 0
+    while front.size:
+        ranks[front] = rank
+        counts = counts - dom[front].sum(axis=0)
+        front = np.flatnonzero((counts == 0) & (ranks < 0))
+        rank += 1
+    return ranks
+
+
+def _ranks_by_sweep(oriented: np.ndarray) -> np.ndarray:
+    """Front ranks via lexicographic sweep and binary search over fronts."""
+    n, num_obj = oriented.shape
+    # Lexicographic descending order: every dominator precedes what it dominates.
+    order = np.lexsort(tuple(-oriented[:, k] for k in range(num_obj - 1, -1, -1)))
+    ranks = np.empty(n, dtype=np.int64)
+
+    if num_obj == 2:
+        # In two objectives the last member of a front has the best second
+        # objective, so it dominates a later point iff the front does.
+        last_f0: List[float] = []
+        last_f1: List[float] = []
+        for q in order.tolist():
+            q0 = oriented[q, 0]
+            q1 = oriented[q, 1]
+            lo, hi = 0, len(last_f1)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                l1 = last_f1[mid]
+                if l1 > q1 or (l1 == q1 and last_f0[mid] > q0):
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo == len(last_f1):
+                last_f0.append(q0)
+                last_f1.append(q1)
+            else:
+                last_f0[lo] = q0
+                last_f1[lo] = q1
+            ranks[q] = lo
+        return ranks
+
+    members: List[List[int]] = []
+    for q in order.tolist():
+        point = oriented[q]
+        lo, hi = 0, len(members)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            front_vals = oriented[members[mid]]
+            dominated = np.any(np.all(front_vals >= point, axis=1) & np.any(front_vals > point, axis=1))
+            if dominated:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(members):
+            members.append([q])
+        else:
+            members[lo].append(q)
+        ranks[q] = lo
+    return ranks
+
+
+def _fronts_from_ranks(oriented: np.ndarray, ranks: np.ndarray) -> List[np.ndarray]:
+    """
+    Group indices by rank in fast non-dominated sort discovery order.
+
+    The first front is in index order. A later member joins its front when its
+    last dominator in the previous front is processed, with ties by index.
+    """
+    num_fronts = int(ranks.max()) + 1 if ranks.size else 0
+    fronts = [np.flatnonzero(ranks == 0)]
+    for rank in range(1, num_fronts):
+        members = np.flatnonzero(ranks == rank)
+        prev = fronts[-1]
+        block = _dominance_block(oriented[prev], oriented[members])
+        last_pos = len(prev) - 1 - np.argmax(block[::-1], axis=0)
+        fronts.append(members[np.argsort(last_pos, kind="stable")])
+    return fronts
+
+
+def _front_arrays(values, directions: Sequence[str]) -> Tuple[np.ndarray, List[np.ndarray]]:
+    oriented = _oriented(values, directions)
+    if oriented.shape[1] == 0 or np.isnan(oriented).any():
+        ranks = _ranks_by_peeling(oriented)
+    else:
+        ranks = _ranks_by_sweep(oriented)
+    return oriented, _fronts_from_ranks(oriented, ranks)
+
+
 def pareto_fronts(values: List[List[float]], directions: List[str]) -> List[List[int]]:
     """
-    Compute Pareto fronts using a fast non-dominated sort.
+    Compute Pareto fronts (non-dominated sort).
     """
-    n = len(values)
-    if n == 0:
+    if len(values) == 0:
         return []
+    _, fronts = _front_arrays(values, directions)
+    return [front.tolist() for front in fronts]
 
-    dominates_list = [[] for _ in range(n)]
-    dominated_count = [0 for _ in range(n)]
-    fronts: List[List[int]] = []
-
-    for p in range(n):
-        for q in range(n):
-            if p == q:
-                continue
-            if _dominates(values[p], values[q], directions):
-                dominates_list[p].append(q)
-            elif _dominates(values[q], values[p], directions):
-                dominated_count[p] += 1
-
-    current_front = [i for i in range(n) if dominated_count[i] == 0]
-    fronts.append(current_front)
-
-    i = 0
-    while i < len(fronts) and fronts[i]:
-        next_front = []
-        for p in fronts[i]:
-            for q in dominates_list[p]:
-                dominated_count[q] -= 1
-                if dominated_count[q] == 0:
-                    next_front.append(q)
-        if next_front:
-            fronts.append(next_front)
-        i += 1
 
-    return fronts
+def _crowding_array(front_values: np.ndarray) -> np.ndarray:
+    """
+    Crowding distance for rows of ``front_values`` given in front order.
+
+    Matches the scalar accumulation exactly, including objectives with NaN
+    (sorted like ``sorted`` would, denominator floored by ``max(1e-12, ...)``).
+    """
+    size = len(front_values)
+    distances = np.zeros(size, dtype=np.float64)
+    if size <= 2:
+        distances[:] = np.inf
+        return distances
+
+    for obj_idx in range(front_values.shape[1]):
+        column = front_values[:, obj_idx]
+        if np.isnan(column).any():
+            # NaN keys leave the order to Python's sort; reproduce it exactly
+            column_list = column.tolist()
+            sorted_idx = np.array(sorted(range(size), key=column_list.__getitem__), dtype=np.int64)
+        else:
+            sorted_idx = np.argsort(column, kind="stable")
+        sorted_vals = column[sorted_idx]
+
+        distances[sorted_idx[0]] = np.inf
+        distances[sorted_idx[-1]] = np.inf
+
+        denom = max(1e-12, sorted_vals[-1] - sorted_vals[0])
+        distances[sorted_idx[1:-1]] += (sorted_vals[2:] - sorted_vals[:-2]) / denom
+
+    return distances
 
 
 def crowding_distance(
@@ -73,28 +220,9 @@ def crowding_distance(
     """
     Compute crowding distance for a single Pareto front.
     """
-    distances = {idx: 0.0 for idx in front}
+    front = [int(idx) for idx in front]
     if len(front) <= 2:
-        for idx in front:
-            distances[idx] = float("inf")
-        return distances
-
+        return {idx: float("inf") for idx in front}
     num_obj = len(values[0])
-    for obj_idx in range(num_obj):
-        sorted_front = sorted(front, key=lambda i: values[i][obj_idx])
-
-        distances[sorted_front[0]] = float("inf")
-        distances[sorted_front[-1]] = float("inf")
-
-        min_val = values[sorted_front[0]][obj_idx]
-        max_val = values[sorted_front[-1]][obj_idx]
-        denom = max(1e-12, max_val - min_val)
-
-        for i in range(1, len(sorted_front) - 1):
-            prev_idx = sorted_front[i - 1]
-            next_idx = sorted_front[i + 1]
-            prev_val = values[prev_idx][obj_idx]
-            next_val = values[next_idx][obj_idx]
-            distances[sorted_front[i]] += (next_val - prev_val) / denom
-
-    return distances
+    front_values = np.array([values[idx][:num_obj] for idx in front], dtype=np.float64)
+    return dict(zip(front, _crowding_array(front_values).tolist()))
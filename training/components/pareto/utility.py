@@ -2,8 +2,11 @@
 Pareto ordering and utility helpers.
 """
 
-from typing import Dict, List, Tuple
-from training.components.pareto.ranking import pareto_fronts, crowding_distance
+from typing import List, Tuple
+
+import numpy as np
+
+from training.components.pareto.ranking import _crowding_array, _front_arrays
 
 
 def pareto_order(
@@ -19,16 +22,20 @@ def pareto_order(
     if n == 0:
         return [], [], []
 
-    fronts = pareto_fronts(values, directions)
-    front_rank = [0 for _ in range(n)]
-    crowding = [0.0 for _ in range(n)]
+    raw = np.asarray(values, dtype=np.float64).reshape(n, -1)
+    _, fronts = _front_arrays(raw, directions)
+    front_rank = np.zeros(n, dtype=np.int64)
+    crowding = np.zeros(n, dtype=np.float64)
 
     for rank, front in enumerate(fronts):
-        for idx in front:
-            front_rank[idx] = rank
-        distances = crowding_distance(front, values, directions)
-        for idx, dist in distances.items():
-            crowding[idx] = dist
-
-    order = sorted(range(n), key=lambda i: (front_rank[i], -crowding[i]))
-    return order, front_rank, crowding
+        front_rank[front] = rank
+        crowding[front] = _crowding_array(raw[front])
+
+    front_rank_list = front_rank.tolist()
+    crowding_list = crowding.tolist()
+    if np.isnan(crowding).any():
+        # NaN distances (NaN or infinite objectives) make the order depend on Python's sort
+        order = sorted(range(n), key=lambda i: (front_rank_list[i], -crowding_list[i]))
+        return order, front_rank_list, crowding_list
+    order = np.lexsort((-crowding, front_rank))
+    return order.tolist(), front_rank_list, crowding_list
@@ -9,6 +9,28 @@ class AnalyticsConfig:
     # --- Output Settings ---
     REPORT_FILENAME = "training_summary.md"
     DATA_FILENAME = "training_data.json"
+
+    # Append-only analytics log in training/<method>_artifacts/, one JSON
+    # line per generation, flushed as it is recorded. A ".gz" suffix
+    # compresses it. Rebuild reports with training/scripts/export_analytics.py.
+    STORE_ENABLED = True
+    STORE_FILENAME = "analytics.jsonl"
+
+    # Live report: a short report (trends, summary, stagnation, recent table,
+    # fitness chart) rewritten in training/<method>_artifacts/ every N
+    # generations. 0 disables it.
+    LIVE_REPORT_EVERY = 1
+    LIVE_REPORT_FILENAME = "training_live.md"
+
+    # Append a per-section render time table to every report
+    ENABLE_REPORT_TIMING = True
+
+    # Time the hot path of every evaluation episode (encode, inference,
+    # physics, reward, metrics; see game/profiler.py) and report where the
+    # time went. Costs about 1-2% of rollout time.
+    PROFILE_EPISODES = True
+    ENABLE_TIME_PROFILE = True
+    TIME_PROFILE_WINDOW = 10  # Recent generations summed in the report table
     
     # --- Section Toggles ---
     ENABLE_QUICK_TRENDS = True
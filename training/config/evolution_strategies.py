@@ -50,8 +50,12 @@ class ESConfig:
     # CMA-ES (Diagonal) Parameters
     # ==========================================================================
 
-    # Optimizer type for ES training.
-    # Options: "cmaes" (default), "classic"
+    # CMA-ES covariance model used by train_es.py.
+    # Options:
+    #   "cmaes"      - diagonal covariance (default); O(n) memory and update
+    #   "cmaes_full" - dense covariance, lazy eigendecomposition; O(n^2) memory
+    #   "cmaes_lm"   - limited-memory rank-m transform (LM-MA-ES); O(m*n)
+    # The classic OpenAI-style ESDriver is not wired into train_es.py.
     OPTIMIZER = "cmaes"
 
     # Initial CMA-ES sigma (step size). Defaults to SIGMA if left as None.
@@ -68,6 +72,12 @@ class ESConfig:
     # Maximum scaling factor applied to c1/cmu when targeting CMAES_COV_TARGET_RATE.
     CMAES_COV_MAX_SCALE = 1e4
 
+    # "cmaes_full": generations between eigendecompositions of the covariance.
+    # None = Hansen's lazy-update gap derived from c1 + cmu and the parameter count.
+    CMAES_EIGEN_INTERVAL = 10
+    # "cmaes_lm": number of direction vectors kept. None = 4 + 3 * ln(n).
+    CMAES_LM_MEMORY = None
+
     # ==========================================================================
     # Sigma Schedule
     # ==========================================================================
@@ -97,6 +107,15 @@ class ESConfig:
     # Reduces gradient variance by ~50% when paired candidates see same seeds.
     USE_ANTITHETIC = True
 
+    # Classic ESDriver only: draw perturbations from a shared noise table.
+    # Candidates become (offset, sign) descriptors that evaluators rebuild
+    # locally, and the gradient is summed from table offsets, so no
+    # [population, params] noise matrix or per-candidate weight list is built.
+    # The table is NOISE_TABLE_SIZE float32 values (4 bytes each) per process.
+    USE_NOISE_TABLE = False
+    NOISE_TABLE_SIZE = 25_000_000
+    NOISE_TABLE_SEED = 12345
+
     # Use rank-based fitness shaping (OpenAI ES style).
     # Transforms fitnesses to utilities based on rank, not magnitude.
     # Reduces sensitivity to outliers and keeps gradient scale stable.
@@ -117,6 +136,19 @@ class ESConfig:
     # Fixed time step for evaluation and playback (1/60 = 60 FPS).
     FRAME_DELAY = 1.0 / 60.0
 
+    # Action repeat (frame skip): physics substeps per policy decision.
+    # The last action is held for K frames; rewards, deaths and per-frame
+    # metrics are still accumulated every frame. 1 = decide every frame.
+    ACTION_REPEAT = 1
+
+    # Pipelined generations: submit generation N+1's evaluation as soon as the
+    # population is updated, overlapping it with reporting/playback of N.
+    PIPELINE_GENERATIONS = True
+
+    # Write a resumable checkpoint (training/<method>_artifacts/checkpoint.npz)
+    # every N generations; resume with --resume. 0 disables checkpointing.
+    CHECKPOINT_EVERY = 10
+
     # Use Common Random Numbers (CRN) for evaluation.
     # When True: All candidates in a generation see the same seed set.
     # This ensures fitness differences reflect parameter differences, not luck.
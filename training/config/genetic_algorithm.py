@@ -50,6 +50,11 @@ class GAConfig:
     # alpha=0 = simple averaging, alpha=0.5 = can explore 50% beyond parents.
     CROSSOVER_ALPHA = 0.5
 
+    # Seed for the GA's numpy Generator (initialization, selection, crossover,
+    # mutation). None derives it from Python's global `random`, so seeding
+    # `random` still makes a run reproducible.
+    RNG_SEED = None
+
     # ==========================================================================
     # Evaluation Settings
     # ==========================================================================
@@ -65,12 +70,53 @@ class GAConfig:
     # Fixed time step for evaluation and playback (1/60 = 60 FPS).
     FRAME_DELAY = 1.0 / 60.0
 
+    # Action repeat (frame skip): physics substeps per policy decision.
+    # The last action is held for K frames; rewards, deaths and per-frame
+    # metrics are still accumulated every frame. 1 = decide every frame.
+    ACTION_REPEAT = 1
+
+    # Pipelined generations: submit generation N+1's evaluation as soon as the
+    # population is updated, overlapping it with reporting/playback of N.
+    PIPELINE_GENERATIONS = True
+
+    # Start the rollouts expected to run longest first (each member's parent's
+    # steps survived last generation) so long-lived elites don't finish last,
+    # leaving the other workers idle at the end of the generation.
+    SCHEDULE_BY_COST = True
+
+    # Write a resumable checkpoint (training/<method>_artifacts/checkpoint.npz)
+    # every N generations; resume with --resume. 0 disables checkpointing.
+    CHECKPOINT_EVERY = 10
+
     # Use Common Random Numbers (CRN) for evaluation.
     # When True: All individuals in a generation see the same seed set.
     # GA is more noise-tolerant than ES due to tournament selection + elitism,
     # so this is optional (default False for GA).
     USE_COMMON_SEEDS = False
 
+    # ==========================================================================
+    # Steady-State Evolution
+    # ==========================================================================
+
+    # Asynchronous evolution instead of generations (also: --steady-state).
+    # Each finished evaluation replaces a population member and a new
+    # offspring is bred for the freed workers, so no generation waits on its
+    # slowest episode. Reports, checkpoints and NUM_GENERATIONS then count
+    # windows of STEADY_STATE_REPORT_EVERY completed evaluations.
+    STEADY_STATE = False
+
+    # Completed evaluations per report window (None = POPULATION_SIZE, the
+    # same evaluation budget per "generation" as generational training).
+    STEADY_STATE_REPORT_EVERY = None
+
+    # Individuals evaluating at once (None = enough queued rollouts to keep
+    # every worker busy). More in flight = offspring bred from staler parents.
+    STEADY_STATE_IN_FLIGHT = None
+
+    # Inverse tournament size when choosing the member an offspring replaces
+    # (the current best is never replaced).
+    STEADY_STATE_REPLACE_TOURNAMENT = 3
+
     # ==========================================================================
     # Neural Network Architecture
     # ==========================================================================
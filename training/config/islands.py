@@ -0,0 +1,36 @@
+"""
+Island Model Configuration
+
+Settings for training/scripts/train_islands.py: several independent
+populations (islands) evolving in separate processes, possibly on separate
+machines, that periodically exchange their best individuals.
+"""
+
+class IslandConfig:
+    # --- Islands ---
+    # One entry per island: "method" or "method:KEY=VALUE,KEY=VALUE" where
+    # method is ga, es or neat and the overrides set that method's config
+    # class in the island's process (e.g. "ga:MUTATION_PROBABILITY=0.3").
+    # Only islands with the same representation exchange migrants (GA and ES
+    # vectors of equal size, NEAT genomes of equal input/output size).
+    ISLANDS = ["ga", "ga", "ga", "ga"]
+
+    # --- Migration ---
+    # Who receives whose emigrants: "ring" (island i takes from i-1),
+    # "full" (everyone from everyone) or "none" (independent runs).
+    TOPOLOGY = "ring"
+    MIGRATION_INTERVAL = 5  # Generations between migrations (0 = never)
+    MIGRANTS = 2  # Best individuals each island publishes per migration
+
+    # CMA-ES has no population slots to fill: a migrant fitter than the
+    # island's current generation pulls the mean this fraction of the way
+    # toward it instead.
+    ES_IMMIGRANT_PULL = 0.3
+
+    # --- Transport ---
+    # "file": islands publish JSON files in MIGRATION_DIR (a shared directory
+    # for multi-machine runs). "socket": islands talk to a migration hub at
+    # HUB_ADDRESS, started by the launcher with --serve-hub.
+    TRANSPORT = "file"
+    MIGRATION_DIR = None  # None = training/islands_artifacts/migration
+    HUB_ADDRESS = "127.0.0.1:47310"
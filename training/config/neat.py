@@ -5,8 +5,20 @@ class NEATConfig:
     SEEDS_PER_AGENT = 5  # Increased from 3 for more stable fitness estimates
     MAX_STEPS = 1500
     FRAME_DELAY = 1.0 / 60.0
+    ACTION_REPEAT = 1  # Physics frames per network decision (action held in between)
+    PIPELINE_GENERATIONS = True  # Evaluate generation N+1 while generation N is reported/played back
+    SCHEDULE_BY_COST = True  # Start rollouts of members whose parent survived longest first (fewer stragglers)
+    CHECKPOINT_EVERY = 10  # Generations between resumable checkpoints (0 = off); resume with --resume
     USE_COMMON_SEEDS = True  # CRN: all agents see same seeds, removes seed luck from rankings
 
+    # Steady-state (rtNEAT-style) evolution instead of generations (also: --steady-state).
+    # Each finished evaluation replaces the member with the lowest shared fitness and
+    # an offspring is bred into the freed workers; species are rebuilt once per window
+    # of STEADY_STATE_REPORT_EVERY evaluations, which also counts as one generation.
+    STEADY_STATE = False
+    STEADY_STATE_REPORT_EVERY = None  # None = POPULATION_SIZE
+    STEADY_STATE_IN_FLIGHT = None  # None = enough queued rollouts to keep every worker busy
+
     # NEAT structure
     OUTPUT_SIZE = 3
     INITIAL_WEIGHT_RANGE = (-1.0, 1.0)
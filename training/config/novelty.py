@@ -33,6 +33,10 @@ class NoveltyConfig:
     # Minimum novelty score to be added to archive
     archive_novelty_threshold: float = 0.25
 
+    # Archive size from which novelty queries use a k-d tree (needs scipy).
+    # Brute-force distance matrices are faster for small archives.
+    archive_index_min_size: int = 2000
+
     # === Reward Diversity Settings ===
 
     # Enable/disable reward diversity in selection
@@ -73,6 +77,7 @@ class NoveltyConfig:
             'k_nearest': self.k_nearest,
             'archive_max_size': self.archive_max_size,
             'archive_novelty_threshold': self.archive_novelty_threshold,
+            'archive_index_min_size': self.archive_index_min_size,
             'enable_reward_diversity': self.enable_reward_diversity,
             'diversity_weight': self.diversity_weight,
             'min_positive_components': self.min_positive_components,
@@ -0,0 +1,25 @@
+"""
+Remote Evaluation Configuration
+
+Settings for evaluating populations on other machines. Start
+training/scripts/evaluation_worker.py on every host that should run rollouts
+and list the workers here; the GA, ES and NEAT generation loops then send
+their rollouts to those workers instead of local threads.
+"""
+
+class RemoteEvaluationConfig:
+    # --- Workers ---
+    # "host:port" of every evaluation worker. Empty = evaluate on local
+    # threads (the default).
+    WORKERS = []
+    WORKER_PORT = 47320  # Port evaluation_worker.py listens on by default
+
+    # Rollouts per request to a worker. None = the worker's thread count, so
+    # one round trip keeps every thread of that worker busy.
+    BATCH_SIZE = None
+
+    # --- Failure handling ---
+    # Rollouts of a worker that disconnects or times out go back on the
+    # queue for the others; unreachable workers are retried every generation.
+    CONNECT_TIMEOUT = 5.0  # Seconds to reach a worker before skipping it
+    REQUEST_TIMEOUT = 600.0  # Seconds to wait for one batch before the worker counts as lost
@@ -1,46 +1,52 @@
+import importlib
+
 from interfaces.RewardCalculator import ComposableRewardCalculator
-from interfaces.rewards.SurvivalBonus import SurvivalBonus
-from interfaces.rewards.VelocitySurvivalBonus import VelocitySurvivalBonus
-from interfaces.rewards.KillAsteroid import KillAsteroid
-from interfaces.rewards.ChunkBonus import ChunkBonus
-from interfaces.rewards.NearMiss import NearMiss
-from interfaces.rewards.AccuracyBonus import AccuracyBonus
-from interfaces.rewards.KPMBonus import KPMBonus
-from interfaces.rewards.ShootingPenalty import ShootingPenalty
-from interfaces.rewards.FacingAsteroidBonus import FacingAsteroidBonus
-from interfaces.rewards.ProximityFacingBonus import ProximityFacingBonus
-from interfaces.rewards.DistanceBasedKillReward import DistanceBasedKillReward
-from interfaces.rewards.ConservingAmmoBonus import ConservingAmmoBonus
-from interfaces.rewards.LeadingTargetBonus import LeadingTargetBonus
-from interfaces.rewards.MovingTowardDangerBonus import MovingTowardDangerBonus
-from interfaces.rewards.SpacingFromWallsBonus import SpacingFromWallsBonus
-from interfaces.rewards.MaintainingMomentumBonus import MaintainingMomentumBonus
-from interfaces.rewards.DeathPenalty import DeathPenalty
-from interfaces.rewards.ProximityPenalty import ProximityPenalty
-from interfaces.rewards.VelocityKillBonus import VelocityKillBonus
-from interfaces.rewards.ExplorationBonus import ExplorationBonus
-from interfaces.rewards.TargetLockReward import TargetLockReward
 from game import globals
 
+# Presets name their components; each name is the class in interfaces/rewards/<Name>.py.
+# Only the components a preset uses get imported, which keeps worker start-up lean.
+REWARD_COMPONENT_PACKAGE = "interfaces.rewards"
+
+
+def load_reward_component(name: str) -> type:
+    """
+    Import and return a reward component class by name.
+
+    Args:
+        name: Class name, also the module name under interfaces/rewards
+
+    Returns:
+        The RewardComponent subclass
+    """
+    module_name = f"{REWARD_COMPONENT_PACKAGE}.{name}"
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as exc:
+        if exc.name != module_name:
+            raise
+        raise ValueError(f"Unknown reward component: {name}") from exc
+    return getattr(module, name)
+
+
 REWARD_PRESETS = {
     "default": [
         # Survival - keep meaningful but avoid dominating the total reward.
-        # (VelocitySurvivalBonus, {"reward_multiplier": 1.5, "max_velocity_cap": 15.0}),
+        # ("VelocitySurvivalBonus", {"reward_multiplier": 1.5, "max_velocity_cap": 15.0}),
 
         # Kills - dynamic scaling; keep strong but not a runaway winner.
-        (DistanceBasedKillReward, {"max_reward_per_kill": 15.0, "min_reward_fraction": 0.15}),
+        ("DistanceBasedKillReward", {"max_reward_per_kill": 15.0, "min_reward_fraction": 0.15}),
 
         # Accuracy - reduce hit reward so it is clearly below kill reward.
-        (ConservingAmmoBonus, {"hit_bonus": 4.0, "shot_penalty": -1.0}),
+        ("ConservingAmmoBonus", {"hit_bonus": 4.0, "shot_penalty": -1.0}),
 
         # Aiming - encourage keeping threats in sights.
-        (TargetLockReward, {"aim_cone_degrees": 20.0, "reward_per_frame": 0.5, "max_distance": 500.0, "num_targets": 1}),
+        ("TargetLockReward", {"aim_cone_degrees": 20.0, "reward_per_frame": 0.5, "max_distance": 500.0, "num_targets": 1}),
 
         # Exploration - small, consistent bonus to promote traversal.
-        # (ExplorationBonus, {"screen_width": globals.SCREEN_WIDTH, "screen_height": globals.SCREEN_HEIGHT, "grid_rows": 3, "grid_cols": 4, "bonus_per_cell": 4.0}),
+        # ("ExplorationBonus", {"screen_width": globals.SCREEN_WIDTH, "screen_height": globals.SCREEN_HEIGHT, "grid_rows": 3, "grid_cols": 4, "bonus_per_cell": 4.0}),
 
         # Death penalty - scaled to make early deaths meaningfully worse than late deaths.
-        (DeathPenalty, {"penalty": -50.0, "early_death_scale": 1.0}),
+        ("DeathPenalty", {"penalty": -50.0, "early_death_scale": 1.0}),
     ]
 }
 
@@ -57,9 +63,9 @@ def create_reward_calculator(
     if max_steps is not None and frame_delay is not None:
         max_time_alive = max_steps * frame_delay
 
-    for component_class, kwargs in REWARD_PRESETS[preset]:
+    for component_name, kwargs in REWARD_PRESETS[preset]:
         component_kwargs = dict(kwargs)
-        if component_class is DeathPenalty and max_time_alive is not None:
+        if component_name == "DeathPenalty" and max_time_alive is not None:
             component_kwargs["max_time_alive"] = max_time_alive
-        calc.add_component(component_class(**component_kwargs))
+        calc.add_component(load_reward_component(component_name)(**component_kwargs))
     return calc
@@ -13,6 +13,7 @@ class SACConfig:
     TOTAL_STEPS = 500_000           # Total environment steps
     MAX_EPISODE_STEPS = 1500        # Max steps per episode
     FRAME_DELAY = 1.0 / 60.0        # Fixed time step (60 FPS)
+    ACTION_REPEAT = 1               # Physics frames per transition (rewards summed; episode steps stay in frames)
 
     # === SAC Hyperparameters ===
     GAMMA = 0.99                    # Discount factor
@@ -0,0 +1,100 @@
+"""
+Best-genome artifacts shared by the trainers and the standalone viewer.
+
+Trainers publish their best-so-far genome after every improvement; the viewer
+process polls the file's mtime and reloads it between episodes. Writes go to a
+temporary file first and are swapped in with ``os.replace`` so a viewer never
+reads a half-written artifact.
+"""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BEST_WEIGHTS_NAME = "best_overall.npz"
+BEST_GENOME_NAME = "best_overall.json"
+
+
+def artifacts_dir(method: str) -> str:
+    """Return (and create) ``training/<method>_artifacts``."""
+    path = os.path.join(PROJECT_ROOT, "training", f"{method}_artifacts")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _atomic_write(path: str, write_fn, binary: bool) -> None:
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, "wb" if binary else "w", encoding=None if binary else "utf-8") as f:
+            write_fn(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_text(path: str, text: str) -> None:
+    """Write a text file atomically."""
+    _atomic_write(path, lambda f: f.write(text), binary=False)
+
+
+def atomic_write_npz(path: str, **arrays: np.ndarray) -> None:
+    """Write an uncompressed ``.npz`` archive atomically."""
+    _atomic_write(path, lambda f: np.savez(f, **arrays), binary=True)
+
+
+def save_genome_json(path: str, data: Dict[str, Any]) -> None:
+    """Write a JSON genome (e.g. ``Genome.to_dict()``) atomically."""
+    atomic_write_text(path, json.dumps(data, indent=2))
+
+
+def save_best_weights(
+    path: str,
+    weights: List[float],
+    fitness: float,
+    generation: int,
+    hidden_size: int,
+) -> None:
+    """
+    Publish a fixed-topology parameter vector for the viewer.
+
+    Args:
+        path: Destination ``.npz`` path
+        weights: Flat policy parameter vector
+        fitness: Training fitness the genome achieved
+        generation: 1-based generation that produced it
+        hidden_size: Hidden layer size needed to rebuild the policy
+    """
+    atomic_write_npz(
+        path,
+        weights=np.asarray(weights, dtype=np.float64),
+        fitness=np.float64(fitness),
+        generation=np.int64(generation),
+        hidden_size=np.int64(hidden_size),
+    )
+
+
+def load_best_weights(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load an artifact written by ``save_best_weights``.
+
+    Returns:
+        Dict with ``weights`` (list), ``fitness``, ``generation`` and
+        ``hidden_size``, or None if the file does not exist.
+    """
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as data:
+        return {
+            "weights": data["weights"].tolist(),
+            "fitness": float(data["fitness"]),
+            "generation": int(data["generation"]),
+            "hidden_size": int(data["hidden_size"]),
+        }
@@ -0,0 +1,188 @@
+"""
+Resumable checkpoints for the evolutionary trainers.
+
+A checkpoint is a single uncompressed ``.npz``. Every NumPy array in the state
+tree (populations, CMA-ES paths, archive matrices, the NumPy RNG key) becomes
+its own member; the remaining small structure is stored as JSON in
+``__state__`` with references to those members. Nothing is pickled, so a
+checkpoint from another machine cannot run code when loaded. The global
+``random`` and NumPy RNG states are part of the tree, so a resumed run
+continues bit-exactly.
+
+``CheckpointWriter`` snapshots state on the calling thread (arrays copied,
+structure encoded) and leaves the disk write to one background thread. Files
+are swapped in with ``os.replace`` so a preempted write never corrupts the
+previous checkpoint.
+"""
+
+import concurrent.futures
+import json
+import random
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from training.core.best_artifacts import atomic_write_npz
+
+CHECKPOINT_NAME = "checkpoint.npz"
+CHECKPOINT_FORMAT_VERSION = 2
+
+_STATE_KEY = "__state__"
+# Tags of the JSON state tree (no plain dict key may start with the prefix)
+_TAG_PREFIX = "__checkpoint_"
+_ARRAY_REF = "__checkpoint_array__"
+_SCALAR_TAG = "__checkpoint_scalar__"
+_TUPLE_TAG = "__checkpoint_tuple__"
+_ITEMS_TAG = "__checkpoint_items__"
+_DATETIME_TAG = "__checkpoint_datetime__"
+
+
+def capture_rng_state() -> Dict[str, Any]:
+    """Snapshot the global ``random`` and NumPy RNG states."""
+    return {"python": random.getstate(), "numpy": np.random.get_state()}
+
+
+def restore_rng_state(state: Dict[str, Any]) -> None:
+    """Restore RNG states captured by ``capture_rng_state``."""
+    random.setstate(state["python"])
+    np.random.set_state(state["numpy"])
+
+
+def _encode_tree(obj: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    """
+    Turn a state tree into JSON-compatible data.
+
+    ndarrays become ``.npz`` member references; tuples, dicts with non-string
+    keys and NumPy scalars are tagged so ``_decode_tree`` restores their exact
+    types (``random.setstate`` needs tuples, resumed runs need the same dtypes).
+    """
+    if isinstance(obj, np.ndarray):
+        key = f"array_{len(arrays)}"
+        arrays[key] = obj.copy()
+        return {_ARRAY_REF: key}
+    if isinstance(obj, np.generic):
+        return {_SCALAR_TAG: [obj.dtype.str, obj.item()]}
+    if obj is None or type(obj) in (bool, int, float, str):
+        return obj
+    if type(obj) is datetime:
+        return {_DATETIME_TAG: obj.isoformat()}
+    if type(obj) is list:
+        return [_encode_tree(v, arrays) for v in obj]
+    if type(obj) is tuple:
+        return {_TUPLE_TAG: [_encode_tree(v, arrays) for v in obj]}
+    if type(obj) is dict:
+        if all(type(k) is str and not k.startswith(_TAG_PREFIX) for k in obj):
+            return {k: _encode_tree(v, arrays) for k, v in obj.items()}
+        return {_ITEMS_TAG: [[_encode_tree(k, arrays), _encode_tree(v, arrays)] for k, v in obj.items()]}
+    raise TypeError(f"Checkpoint state cannot contain {type(obj).__name__} values")
+
+
+def _decode_tree(obj: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    """Inverse of ``_encode_tree``."""
+    if type(obj) is list:
+        return [_decode_tree(v, arrays) for v in obj]
+    if type(obj) is not dict:
+        return obj
+    if len(obj) == 1:
+        (tag, value), = obj.items()
+        if tag == _ARRAY_REF:
+            return arrays[value]
+        if tag == _SCALAR_TAG:
+            return np.dtype(value[0]).type(value[1])
+        if tag == _TUPLE_TAG:
+            return tuple(_decode_tree(v, arrays) for v in value)
+        if tag == _ITEMS_TAG:
+            return {_decode_tree(k, arrays): _decode_tree(v, arrays) for k, v in value}
+        if tag == _DATETIME_TAG:
+            return datetime.fromisoformat(value)
+    return {k: _decode_tree(v, arrays) for k, v in obj.items()}
+
+
+def _snapshot(state: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """Turn a state tree into independent ``.npz`` members."""
+    members: Dict[str, np.ndarray] = {}
+    tree = _encode_tree(state, members)
+    payload = json.dumps({"format_version": CHECKPOINT_FORMAT_VERSION, "state": tree}, separators=(",", ":"))
+    members[_STATE_KEY] = np.frombuffer(payload.encode("utf-8"), dtype=np.uint8)
+    return members
+
+
+def save_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    """Write ``state`` to ``path`` synchronously and atomically."""
+    atomic_write_npz(path, **_snapshot(state))
+
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    """
+    Load a checkpoint written by ``save_checkpoint`` or ``CheckpointWriter``.
+
+    Nothing in the file is unpickled, so checkpoints copied from other
+    machines are safe to load.
+
+    Raises:
+        ValueError: If the file was written by an unsupported format version
+    """
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {key: data[key] for key in data.files}
+    try:
+        payload = json.loads(arrays.pop(_STATE_KEY).tobytes().decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        # Format version 1 pickled this member; it is not loaded
+        raise ValueError(f"Unsupported checkpoint format in {path} (written by an older version?)") from e
+    version = payload.get("format_version")
+    if version != CHECKPOINT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported checkpoint format version {version} in {path}")
+    return _decode_tree(payload["state"], arrays)
+
+
+class CheckpointWriter:
+    """
+    Writes checkpoints to a fixed path on a background thread.
+
+    At most one write is in flight; ``save`` waits for the previous one so a
+    slow disk cannot queue up snapshots.
+
+    Args:
+        path: Destination ``.npz`` path
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._pending: Optional[concurrent.futures.Future] = None
+        self.last_write_duration = 0.0
+        self.checkpoints_written = 0
+
+    def save(self, state: Dict[str, Any]) -> None:
+        """Snapshot ``state`` now and write it in the background."""
+        members = _snapshot(state)
+        self.wait()
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="checkpoint"
+            )
+        self._pending = self._executor.submit(self._write, members)
+
+    def _write(self, members: Dict[str, np.ndarray]) -> None:
+        start_time = time.perf_counter()
+        atomic_write_npz(self.path, **members)
+        self.last_write_duration = time.perf_counter() - start_time
+        self.checkpoints_written += 1
+
+    def wait(self) -> None:
+        """Block until the in-flight write (if any) is on disk."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def close(self) -> None:
+        """Flush the last write and stop the writer thread."""
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
@@ -87,29 +87,30 @@ class DisplayManager:
             self._stop_display()
             return "done"
 
-        # Get and Apply Action
-        state = self.episode_runner.state_encoder.encode(self.episode_runner.env_tracker)
-        action = self.display_agent.get_action(state)
+        # Get and Apply Action (held between decisions when frame skipping)
+        if self.best_agent_steps % getattr(self.episode_runner, "action_repeat", 1) == 0:
+            state = self.episode_runner.state_encoder.encode(self.episode_runner.env_tracker)
+            action = self.display_agent.get_action(state)
         
-        self.episode_runner.action_interface.validate(action)
-        action = self.episode_runner.action_interface.normalize(action)
-        if self.episode_runner.action_interface.action_space_type == "continuous":
-            game_input = self.episode_runner.action_interface.to_game_input_continuous(action)
-            self.game.continuous_control_mode = True
-            self.game.turn_magnitude = game_input["turn_magnitude"]
-            self.game.thrust_magnitude = game_input["thrust_magnitude"]
-            self.game.shoot_requested = game_input["shoot"]
-            self.game.left_pressed = False
-            self.game.right_pressed = False
-            self.game.up_pressed = False
-            self.game.space_pressed = False
-        else:
-            game_input = self.episode_runner.action_interface.to_game_input(action)
-            self.game.continuous_control_mode = False
-            self.game.left_pressed = game_input["left_pressed"]
-            self.game.right_pressed = game_input["right_pressed"]
-            self.game.up_pressed = game_input["up_pressed"]
-            self.game.space_pressed = game_input["space_pressed"]
+            self.episode_runner.action_interface.validate(action)
+            action = self.episode_runner.action_interface.normalize(action)
+            if self.episode_runner.action_interface.action_space_type == "continuous":
+                game_input = self.episode_runner.action_interface.to_game_input_continuous(action)
+                self.game.continuous_control_mode = True
+                self.game.turn_magnitude = game_input["turn_magnitude"]
+                self.game.thrust_magnitude = game_input["thrust_magnitude"]
+                self.game.shoot_requested = game_input["shoot"]
+                self.game.left_pressed = False
+                self.game.right_pressed = False
+                self.game.up_pressed = False
+                self.game.space_pressed = False
+            else:
+                game_input = self.episode_runner.action_interface.to_game_input(action)
+                self.game.continuous_control_mode = False
+                self.game.left_pressed = game_input["left_pressed"]
+                self.game.right_pressed = game_input["right_pressed"]
+                self.game.up_pressed = game_input["up_pressed"]
+                self.game.space_pressed = game_input["space_pressed"]
         
         # Step game
         self.game.external_control = False
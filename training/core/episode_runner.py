@@ -19,6 +19,7 @@ class EpisodeRunner:
     reward_calculator: ComposableRewardCalculator instance
     env_tracker: EnvironmentTracker instance (defaults to game.tracker)
     metrics_tracker: MetricsTracker instance (defaults to game.metrics_tracker)
+    action_repeat: Physics frames per agent decision (action held in between)
   """
 
   def __init__(
@@ -28,7 +29,8 @@ class EpisodeRunner:
     action_interface: ActionInterface,
     reward_calculator: ComposableRewardCalculator,
     env_tracker: Optional[EnvironmentTracker] = None,
-    metrics_tracker: Optional[MetricsTracker] = None
+    metrics_tracker: Optional[MetricsTracker] = None,
+    action_repeat: int = 1
   ):
     """
     Initialize EpisodeRunner with game and infrastructure components.
@@ -40,6 +42,7 @@ class EpisodeRunner:
       reward_calculator: ComposableRewardCalculator instance
       env_tracker: EnvironmentTracker instance (defaults to game.tracker)
       metrics_tracker: MetricsTracker instance (defaults to game.metrics_tracker)
+      action_repeat: Physics frames per agent decision (action held in between)
     """
     self.game = game
     self.state_encoder = state_encoder
@@ -50,6 +53,9 @@ class EpisodeRunner:
 
     # Frame rate for manual stepping (default 60 FPS)
     self.frame_delay = 1.0 / 60.0
+
+    # Frame skip: agent is queried every action_repeat frames
+    self.action_repeat = max(1, int(action_repeat))
     
     # Disable game's internal systems during episode running
     self.game.update_internal_rewards = False
@@ -84,36 +90,38 @@ class EpisodeRunner:
     # Episode loop:
     while not done and steps < max_steps:
 
-      # Encode state using state_encoder
-      state = self.state_encoder.encode(self.env_tracker)
-
-      # Get action from agent
-      action = agent.get_action(state)
-
-      # Validate and normalize action
-      self.action_interface.validate(action)
-      action = self.action_interface.normalize(action)
-
-      # Convert to game input
-      if self.action_interface.action_space_type == "continuous":
-        game_input = self.action_interface.to_game_input_continuous(action)
-        self.game.continuous_control_mode = True
-        self.game.turn_magnitude = game_input["turn_magnitude"]
-        self.game.thrust_magnitude = game_input["thrust_magnitude"]
-        self.game.shoot_requested = game_input["shoot"]
-        # Clear boolean inputs to avoid mixed control paths.
-        self.game.left_pressed = False
-        self.game.right_pressed = False
-        self.game.up_pressed = False
-        self.game.space_pressed = False
-      else:
-        game_input = self.action_interface.to_game_input(action)
-        self.game.continuous_control_mode = False
-        # Apply to game (set left_pressed, etc.)
-        self.game.left_pressed = game_input["left_pressed"]
-        self.game.right_pressed = game_input["right_pressed"]
-        self.game.up_pressed = game_input["up_pressed"]
-        self.game.space_pressed = game_input["space_pressed"]
+      # Query the agent only on decision frames; inputs are held otherwise
+      if steps % self.action_repeat == 0:
+        # Encode state using state_encoder
+        state = self.state_encoder.encode(self.env_tracker)
+
+        # Get action from agent
+        action = agent.get_action(state)
+
+        # Validate and normalize action
+        self.action_interface.validate(action)
+        action = self.action_interface.normalize(action)
+
+        # Convert to game input
+        if self.action_interface.action_space_type == "continuous":
+          game_input = self.action_interface.to_game_input_continuous(action)
+          self.game.continuous_control_mode = True
+          self.game.turn_magnitude = game_input["turn_magnitude"]
+          self.game.thrust_magnitude = game_input["thrust_magnitude"]
+          self.game.shoot_requested = game_input["shoot"]
+          # Clear boolean inputs to avoid mixed control paths.
+          self.game.left_pressed = False
+          self.game.right_pressed = False
+          self.game.up_pressed = False
+          self.game.space_pressed = False
+        else:
+          game_input = self.action_interface.to_game_input(action)
+          self.game.continuous_control_mode = False
+          # Apply to game (set left_pressed, etc.)
+          self.game.left_pressed = game_input["left_pressed"]
+          self.game.right_pressed = game_input["right_pressed"]
+          self.game.up_pressed = game_input["up_pressed"]
+          self.game.space_pressed = game_input["space_pressed"]
 
       # Step game (call game.on_update())
       self.game.on_update(self.frame_delay)
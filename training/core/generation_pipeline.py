@@ -0,0 +1,179 @@
+"""
+Pipelined generation evaluation for the evolutionary trainers.
+
+The trainers' loop is evaluate -> evolve -> (report + playback). Evaluating
+generation N+1 only needs the population that ``evolve()``/``update()``
+returns, so the pipeline submits it to a long-lived worker pool right away
+and the trainer reports and plays back generation N while it runs. Every
+collect records how much of the evaluation was hidden behind that work.
+
+Rollouts are scheduled by predicted cost: when the trainer passes each
+member's parent (its index in the previous generation), the parent's steps
+survived predict the member's episode length and the longest rollouts start
+first, so long-lived elites no longer become end-of-generation stragglers.
+
+With a ``backend`` (training/core/remote_evaluation.py:RemoteEvaluationPool)
+rollouts run on evaluation workers on other machines instead of the local
+thread pool; everything else is unchanged.
+"""
+
+import concurrent.futures
+import os
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from training.core.population_evaluator import PendingPopulationEvaluation, submit_population_evaluation
+
+
+class GenerationPipeline:
+    """
+    Owns the evaluation worker pool and at most one in-flight generation.
+
+    Args:
+        max_workers: Worker threads for rollouts (None = os.cpu_count())
+        enabled: When False, ``submit`` defers work until ``collect`` so the
+                 trainer runs strictly sequentially through the same code path
+        schedule_by_cost: Order rollouts by the parents' previous episode
+                          lengths (needs ``parents`` on submit/collect)
+        backend: Remote evaluation backend used instead of the local pool;
+                 the pipeline closes it on ``shutdown``
+        **eval_kwargs: Fixed keyword arguments for ``submit_population_evaluation``
+                       (state_encoder, action_interface, max_steps, ...)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, enabled: bool = True,
+                 schedule_by_cost: bool = True, backend=None, **eval_kwargs):
+        self.enabled = enabled
+        self.backend = backend
+        self.schedule_by_cost = schedule_by_cost
+        self.eval_kwargs = eval_kwargs
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        self.pending: Optional[PendingPopulationEvaluation] = None
+        self._deferred_population: Optional[List[Any]] = None
+        self._deferred_parents: Optional[Sequence[int]] = None
+        # Steps survived per member of the last collected generation (cost model)
+        self._last_steps: Optional[List[float]] = None
+
+        self.last_stats: Dict[str, float] = {}
+        self.total_evaluation_duration = 0.0
+        self.total_overlap_duration = 0.0
+        self.total_wait_duration = 0.0
+
+    def submit(self, population: List[Any], parents: Optional[Sequence[int]] = None) -> None:
+        """
+        Start evaluating ``population`` (deferred when pipelining is disabled).
+
+        Args:
+            population: Individuals to evaluate
+            parents: Per member, the index of its parent in the previously
+                     collected population (-1 = unknown), for cost ordering
+        """
+        if self.pending is not None or self._deferred_population is not None:
+            raise RuntimeError("GenerationPipeline already has a generation in flight")
+        if self.enabled:
+            self.pending = self._submit(population, parents)
+        else:
+            self._deferred_population = population
+            self._deferred_parents = parents
+
+    def _submit(self, population: List[Any], parents: Optional[Sequence[int]]) -> PendingPopulationEvaluation:
+        if self.backend is not None:
+            return self.backend.submit(population, predicted_costs=self.predicted_costs(parents), **self.eval_kwargs)
+        return submit_population_evaluation(
+            self.executor,
+            population,
+            max_workers=self.max_workers,
+            predicted_costs=self.predicted_costs(parents),
+            **self.eval_kwargs
+        )
+
+    def predicted_costs(self, parents: Optional[Sequence[int]]) -> Optional[List[float]]:
+        """
+        Expected episode length per member: the parent's steps survived last
+        generation, or that generation's mean for members without a known
+        parent. None (population order) before the first collect.
+        """
+        if not self.schedule_by_cost or parents is None or not self._last_steps:
+            return None
+        steps = self._last_steps
+        mean_steps = sum(steps) / len(steps)
+        return [steps[p] if 0 <= p < len(steps) else mean_steps for p in parents]
+
+    def has_pending(self) -> bool:
+        return self.pending is not None or self._deferred_population is not None
+
+    def collect(self, population: Optional[List[Any]] = None,
+                parents: Optional[Sequence[int]] = None) -> Tuple[List[float], int, Dict, List[Dict]]:
+        """
+        Wait for the in-flight generation and return its evaluation.
+
+        Args:
+            population: Population to evaluate if nothing is in flight yet
+                        (first generation, or pipelining disabled)
+            parents: Parent indices for ``population`` (see ``submit``)
+
+        Returns:
+            Same tuple as ``evaluate_population_parallel``
+        """
+        if self._deferred_population is not None:
+            population, parents = self._deferred_population, self._deferred_parents
+            self._deferred_population = None
+            self._deferred_parents = None
+        submitted_here = self.pending is None
+        if submitted_here:
+            if population is None:
+                raise RuntimeError("GenerationPipeline.collect() called with nothing to evaluate")
+            self.pending = self._submit(population, parents)
+
+        pending = self.pending
+        # Nothing ran alongside an evaluation submitted by collect() itself
+        wait_start = pending.submitted_at if submitted_here else time.perf_counter()
+        result = pending.result()
+        self.pending = None
+        self._last_steps = [metrics['steps_survived'] for metrics in result[3]]
+
+        # Rollouts finish on worker threads; completed_at is set by the last one
+        completed_at = pending.completed_at if pending.completed_at is not None else time.perf_counter()
+        evaluation_duration = max(0.0, completed_at - pending.submitted_at)
+        overlap_duration = max(0.0, min(wait_start, completed_at) - pending.submitted_at)
+        wait_duration = max(0.0, completed_at - wait_start)
+
+        self.total_evaluation_duration += evaluation_duration
+        self.total_overlap_duration += overlap_duration
+        self.total_wait_duration += wait_duration
+        self.last_stats = {
+            "evaluation_duration": evaluation_duration,
+            "pipeline_overlap_duration": overlap_duration,
+            "pipeline_wait_duration": wait_duration,
+            "pipeline_overlap_ratio": overlap_duration / evaluation_duration if evaluation_duration > 0 else 0.0,
+            **pending.scheduling_stats(),
+        }
+        return result
+
+    def overlap_ratio(self) -> float:
+        """Fraction of all evaluation wall time hidden behind trainer work."""
+        if self.total_evaluation_duration <= 0:
+            return 0.0
+        return self.total_overlap_duration / self.total_evaluation_duration
+
+    def summary_line(self) -> str:
+        stats = self.last_stats
+        return (
+            f"  Pipeline: overlapped {stats.get('pipeline_overlap_duration', 0.0):.1f}s of "
+            f"{stats.get('evaluation_duration', 0.0):.1f}s eval "
+            f"({stats.get('pipeline_overlap_ratio', 0.0) * 100:.0f}%, run total {self.overlap_ratio() * 100:.0f}%) | "
+            f"workers busy {stats.get('worker_utilization', 0.0) * 100:.0f}%, "
+            f"tail {stats.get('evaluation_tail_duration', 0.0):.1f}s"
+        )
+
+    def shutdown(self) -> None:
+        """Cancel anything still queued and release the worker pool."""
+        if self.pending is not None:
+            self.pending.cancel()
+            self.pending = None
+        self._deferred_population = None
+        self._deferred_parents = None
+        self.executor.shutdown(wait=True)
+        if self.backend is not None:
+            self.backend.close()
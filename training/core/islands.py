@@ -0,0 +1,344 @@
+"""
+Island-model migration between independently evolving populations.
+
+Each island is an ordinary trainer (GA, ES or NEAT) in its own process. Every
+``interval`` generations it publishes its best individuals and takes in the
+latest emigrants of the islands its topology connects it to. Migration is
+asynchronous: an island never waits for a neighbour, it uses whatever that
+neighbour published last (or nothing), so per-island generation time does not
+depend on how many islands run.
+
+Transports only move JSON payloads:
+
+- ``FileTransport``: one file per island in a directory (local, or a shared
+  filesystem across machines), replaced atomically on every publish.
+- ``SocketTransport``: a ``MigrationHub`` TCP server keeps the latest payload
+  per island (see training/core/wire_protocol.py).
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from training.core.best_artifacts import atomic_write_text
+from training.core.wire_protocol import ProtocolError, dumps, parse_address, recv_message, send_message
+
+TOPOLOGIES = ("ring", "full", "none")
+
+# Per-agent metrics that are large or meaningless on another island
+_LOCAL_METRICS = ("time_profile",)
+
+
+def migration_sources(topology: str, island_id: int, num_islands: int) -> List[int]:
+    """Islands whose emigrants ``island_id`` receives."""
+    if topology == "none" or num_islands < 2:
+        return []
+    if topology == "ring":
+        return [(island_id - 1) % num_islands]
+    if topology == "full":
+        return [i for i in range(num_islands) if i != island_id]
+    raise ValueError(f"Unknown topology {topology!r}; expected one of {TOPOLOGIES}")
+
+
+class FileTransport:
+    """Latest payload per island as ``island_<id>.json`` in ``directory``."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, island_id: int) -> str:
+        return os.path.join(self.directory, f"island_{island_id}.json")
+
+    def publish(self, island_id: int, payload: Dict[str, Any]) -> None:
+        atomic_write_text(self._path(island_id), dumps(payload))
+
+    def clear(self, island_id: int) -> None:
+        """Forget ``island_id``'s payload (e.g. left over from a previous run)."""
+        try:
+            os.remove(self._path(island_id))
+        except FileNotFoundError:
+            pass
+
+    def fetch(self, island_id: int) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(island_id), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def close(self) -> None:
+        pass
+
+
+class MigrationHubError(RuntimeError):
+    """The migration hub answered a request with an error."""
+
+
+class _HubHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        hub = self.server.hub
+        while True:
+            try:
+                request = recv_message(self.request)
+            except (ProtocolError, OSError):
+                return
+            if request is None:
+                return
+            try:
+                reply = hub.handle_request(request)
+            except (KeyError, TypeError, ValueError) as e:
+                reply = {"ok": False, "error": f"malformed request: {type(e).__name__}: {e}"}
+            send_message(self.request, reply)
+
+
+class _HubServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class MigrationHub:
+    """
+    TCP server holding the latest published payload of every island.
+
+    Args:
+        host: Interface to bind ("0.0.0.0" to accept other machines)
+        port: Port to bind (0 = any free port; see ``address``)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.payloads: Dict[int, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+        self._server = _HubServer((host, port), _HubHandler)
+        self._server.hub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        if op == "publish":
+            with self.lock:
+                self.payloads[int(request["island"])] = request["payload"]
+            return {"ok": True}
+        if op == "fetch":
+            with self.lock:
+                return {"ok": True, "payload": self.payloads.get(int(request["island"]))}
+        if op == "clear":
+            with self.lock:
+                self.payloads.pop(int(request["island"]), None)
+            return {"ok": True}
+        return {"ok": False, "error": f"unknown op {op!r}"}
+
+    def start(self) -> "MigrationHub":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="migration-hub", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class SocketTransport:
+    """
+    Client of a ``MigrationHub``; reconnects once if the connection dropped.
+
+    Args:
+        address: Hub ``"host:port"``
+        timeout: Socket timeout in seconds
+    """
+
+    def __init__(self, address: str, timeout: float = 30.0):
+        self.address = parse_address(address)
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+
+    def _request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        for attempt in range(2):
+            try:
+                if self._sock is None:
+                    self._sock = socket.create_connection(self.address, timeout=self.timeout)
+                send_message(self._sock, message)
+                reply = recv_message(self._sock)
+                if reply is None:
+                    raise ProtocolError("Migration hub closed the connection")
+                break
+            except OSError:
+                self.close()
+                if attempt:
+                    raise
+        # An error reply came over a working connection: report it, don't resend
+        if not reply.get("ok"):
+            raise MigrationHubError(reply.get("error", "migration hub error"))
+        return reply
+
+    def publish(self, island_id: int, payload: Dict[str, Any]) -> None:
+        self._request({"op": "publish", "island": island_id, "payload": payload})
+
+    def clear(self, island_id: int) -> None:
+        self._request({"op": "clear", "island": island_id})
+
+    def fetch(self, island_id: int) -> Optional[Dict[str, Any]]:
+        return self._request({"op": "fetch", "island": island_id}).get("payload")
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+@dataclass
+class Migrant:
+    """An individual received from another island."""
+    individual: Any  # Decoded: parameter list or NEAT genome dict
+    fitness: float
+    metrics: Dict[str, Any]
+    source: int
+
+
+class IslandMigration:
+    """
+    One island's side of the migration protocol.
+
+    Args:
+        island_id: This island's index
+        num_islands: Islands in the run
+        transport: ``FileTransport`` or ``SocketTransport``
+        representation: Description of the individuals (kind and sizes);
+                        payloads with a different one are ignored
+        topology: "ring", "full" or "none"
+        interval: Generations between migrations (0 = never)
+        migrants: Best individuals published per migration
+    """
+
+    def __init__(
+        self,
+        island_id: int,
+        num_islands: int,
+        transport,
+        representation: Dict[str, Any],
+        topology: str = "ring",
+        interval: int = 5,
+        migrants: int = 2
+    ):
+        self.island_id = island_id
+        self.num_islands = num_islands
+        self.transport = transport
+        self.representation = dict(representation)
+        self.sources = migration_sources(topology, island_id, num_islands)
+        self.interval = interval
+        self.migrants = migrants
+        # Generation of the last payload taken from each source (no repeats)
+        self._received: Dict[int, int] = {}
+        self.total_sent = 0
+        self.total_received = 0
+        self.last_stats: Dict[str, Any] = {}
+
+    def due(self, generation: int) -> bool:
+        """True on generations that migrate."""
+        return bool(self.interval) and generation % self.interval == 0
+
+    def exchange(
+        self,
+        generation: int,
+        population: Sequence[Any],
+        fitnesses: Sequence[float],
+        per_agent_metrics: Sequence[Dict],
+        encode: Callable[[Any], Any]
+    ) -> List[Migrant]:
+        """
+        Publish this generation's best and collect neighbours' new emigrants.
+
+        Args:
+            generation: Generation just evaluated (1-based)
+            population: Evaluated individuals
+            fitnesses: Fitness used for selection on this island
+            per_agent_metrics: Per-individual metrics (sent along for
+                               novelty/Pareto bookkeeping on the receiver)
+            encode: Individual -> JSON-compatible form
+
+        Returns:
+            Migrants not seen before, best first
+        """
+        order = sorted(range(len(fitnesses)), key=lambda i: fitnesses[i], reverse=True)[:self.migrants]
+        self.transport.publish(self.island_id, {
+            "island": self.island_id,
+            "generation": generation,
+            "representation": self.representation,
+            "migrants": [
+                {
+                    "individual": encode(population[i]),
+                    "fitness": float(fitnesses[i]),
+                    "metrics": {k: v for k, v in per_agent_metrics[i].items() if k not in _LOCAL_METRICS},
+                }
+                for i in order
+            ],
+        })
+
+        received, rejected = [], 0
+        for source in self.sources:
+            payload = self.transport.fetch(source)
+            if payload is None or payload["generation"] <= self._received.get(source, 0):
+                continue
+            self._received[source] = payload["generation"]
+            if payload["representation"] != self.representation:
+                rejected += len(payload["migrants"])
+                continue
+            for entry in payload["migrants"]:
+                received.append(Migrant(entry["individual"], entry["fitness"], entry["metrics"], source))
+        received.sort(key=lambda migrant: migrant.fitness, reverse=True)
+
+        self.total_sent += len(order)
+        self.total_received += len(received)
+        self.last_stats = {
+            "migrants_sent": len(order),
+            "migrants_received": len(received),
+            "migrants_rejected": rejected,
+            "best_immigrant_fitness": received[0].fitness if received else None,
+        }
+        return received
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+def worst_indices(fitnesses: Sequence[float], count: int, keep_best: bool = True) -> List[int]:
+    """
+    Indices of the ``count`` lowest fitnesses (worst first); never the single
+    best when ``keep_best`` so migration cannot evict an island's elite.
+    """
+    order = sorted(range(len(fitnesses)), key=lambda i: fitnesses[i])
+    if keep_best:
+        order = order[:-1]
+    return order[:count]
+
+
+def replace_members(
+    fitnesses: Sequence[float],
+    per_agent_metrics: Sequence[Dict],
+    migrants: Sequence[Migrant]
+) -> Tuple[List[int], List[float], List[Dict]]:
+    """
+    Choose the slots migrants replace and the updated fitness/metrics lists.
+
+    Returns:
+        (slots, fitnesses, per_agent_metrics); ``slots[k]`` receives
+        ``migrants[k]``
+    """
+    slots = worst_indices(fitnesses, len(migrants))
+    fitnesses = list(fitnesses)
+    per_agent_metrics = list(per_agent_metrics)
+    for slot, migrant in zip(slots, migrants):
+        fitnesses[slot] = migrant.fitness
+        per_agent_metrics[slot] = migrant.metrics
+    return slots, fitnesses, per_agent_metrics
@@ -5,17 +5,24 @@ Evaluates multiple agents simultaneously using threading for massive speedup.
 """
 
 import concurrent.futures
+import os
 import random
 import math
-from collections import defaultdict
-from typing import List, Tuple, Dict, Optional, Callable, Any
+import threading
+import time
+from collections import defaultdict, deque
+from typing import List, Tuple, Dict, Optional, Callable, Any, Sequence
 from game.headless_game import HeadlessAsteroidsGame
+from game.spawn_schedule import SpawnSchedule, build_spawn_schedules
 from game import globals
+from game.profiler import NULL_PROFILER, SpanProfiler
+from game.tick_events import EVENT_KILL
 from ai_agents.neuroevolution.nn_agent import NNAgent
 from interfaces.StateEncoder import StateEncoder
 from interfaces.encoders.VectorEncoder import VectorEncoder
 from interfaces.ActionInterface import ActionInterface
 from training.config.rewards import create_reward_calculator
+from training.config.analytics import AnalyticsConfig
 from training.config.genetic_algorithm import GAConfig
 from training.config.pareto import ParetoConfig
 from training.components.novelty import compute_behavior_vector
@@ -30,13 +37,17 @@ def evaluate_single_agent(
     frame_delay: float = 1.0 / 60.0,
     random_seed: int = None,
     hidden_size: int = GAConfig.HIDDEN_LAYER_SIZE,
-    agent_factory: Optional[Callable[[Any, VectorEncoder, ActionInterface], Any]] = None
+    agent_factory: Optional[Callable[[Any, VectorEncoder, ActionInterface], Any]] = None,
+    spawn_schedule: Optional[SpawnSchedule] = None,
+    action_repeat: int = 1,
+    profile: bool = False
 ) -> float:
     """
     Evaluate a single agent in a headless game instance.
 
     Args:
-        individual: Parameter vector or genome-like object for the agent
+        individual: Parameter vector, genome-like object, or seed-only candidate
+            exposing ``materialize()``
         state_encoder: State encoder instance
         action_interface: Action interface instance
         max_steps: Maximum steps per episode
@@ -44,13 +55,18 @@ def evaluate_single_agent(
         random_seed: Random seed for reproducible asteroid spawning
         hidden_size: Number of hidden neurons in neural network
         agent_factory: Optional callable to construct a custom agent for the individual
+        spawn_schedule: Optional pre-rolled spawn stream for ``random_seed`` (CRN runs)
+        action_repeat: Physics frames per agent decision (1 = decide every frame)
+        profile: Time the episode's hot path (encode, inference, physics,
+            metrics, reward) and return the spans under ``time_profile``
 
     Returns:
         Fitness score (total reward)
     """
     # Create headless game with isolated RNG for reproducible asteroid spawning
     # Each game has its own Random instance, so parallel evaluations don't interfere
-    game = HeadlessAsteroidsGame(width=800, height=600, random_seed=random_seed)
+    game = HeadlessAsteroidsGame(width=800, height=600, random_seed=random_seed,
+                                 spawn_schedule=spawn_schedule)
     game.reset_game()
     
     # Create reward calculator from config
@@ -60,6 +76,15 @@ def evaluate_single_agent(
     )
     reward_calculator.reset()
 
+    # Span profiler shared by the loop below, the game and the reward calculator
+    profiler = SpanProfiler() if profile else NULL_PROFILER
+    game.profiler = profiler
+    reward_calculator.profiler = profiler
+
+    # Seed-only ES candidates (noise_table.NoiseCandidate) are rebuilt here, on the worker
+    if hasattr(individual, "materialize"):
+        individual = individual.materialize()
+
     # Create agent (default: fixed-topology NNAgent)
     if agent_factory is not None:
         agent = agent_factory(individual, state_encoder, action_interface)
@@ -88,7 +113,6 @@ def evaluate_single_agent(
     # Spatial tracking
     position_history = []
     kill_data = []
-    prev_kills = 0
     total_asteroid_distance = 0.0
     distance_samples = 0
     min_asteroid_dist = float('inf') # Risk profiling
@@ -160,9 +184,6 @@ def evaluate_single_agent(
     last_x = game.player.center_x
     last_y = game.player.center_y
 
-    prev_shots = game.metrics_tracker.total_shots_fired
-    prev_hits = game.metrics_tracker.total_hits
-
     def _compute_frontness() -> Tuple[Optional[float], Optional[float]]:
         """Return (frontness, distance) to nearest asteroid, or (None, None)."""
         player = game.player
@@ -191,23 +212,34 @@ def evaluate_single_agent(
         return frontness, dist
     
     # Episode loop
+    # With action_repeat > 1 the agent decides every K frames and the last
+    # action is held in between; everything below the decision block still
+    # runs per frame so rewards, deaths and frame counters keep their meaning.
+    action_repeat = max(1, int(action_repeat))
+    mark = profiler.now()
     while steps < max_steps and game.player in game.player_list:
-        # Encode state
-        state = state_encoder_copy.encode(game.tracker)
-        
-        # Get action from agent
-        action_vector = agent.get_action(state)
-        
-        # Check output saturation (values >0.9 or <0.1)
-        # NNAgent returns raw sigmoid outputs (0-1)
-        for val in action_vector:
-            total_outputs += 1
-            if val > 0.9 or val < 0.1:
-                saturated_outputs += 1
-        
-        # Validate and normalize
-        action_interface.validate(action_vector)
-        action_norm = action_interface.normalize(action_vector)
+        if steps % action_repeat == 0:
+            # Encode state
+            state = state_encoder_copy.encode(game.tracker)
+            mark = profiler.lap("encode", mark)
+
+            # Get action from agent
+            action_vector = agent.get_action(state)
+
+            # Check output saturation (values >0.9 or <0.1)
+            # NNAgent returns raw sigmoid outputs (0-1)
+            for val in action_vector:
+                total_outputs += 1
+                if val > 0.9 or val < 0.1:
+                    saturated_outputs += 1
+
+            # Validate and normalize
+            action_interface.validate(action_vector)
+            action_norm = action_interface.normalize(action_vector)
+
+            # Convert to game input
+            game_input = action_interface.to_game_input(action_norm)
+            mark = profiler.lap("inference", mark)
 
         # Track signed turn behavior before thresholding to inputs
         if len(action_norm) == 3:
@@ -251,9 +283,6 @@ def evaluate_single_agent(
                 current_turn_streak = 0
                 last_turn_sign = 0
         
-        # Convert to game input
-        game_input = action_interface.to_game_input(action_norm)
-
         # Apply to game
         game.left_pressed = game_input["left_pressed"]
         game.right_pressed = game_input["right_pressed"]
@@ -297,9 +326,11 @@ def evaluate_single_agent(
                 right_only_frames += 1
         if game.space_pressed:
             shoot_frames += 1
+        mark = profiler.lap("metrics", mark)
         
         # Step game
         game.on_update(frame_delay)
+        mark = profiler.lap("physics", mark)
 
         # Track screen wraps
         # If position jumped by more than half screen, it wrapped
@@ -336,12 +367,10 @@ def evaluate_single_agent(
         if steps % 60 == 0:
             position_history.append((int(game.player.center_x), int(game.player.center_y)))
             
-        # Track kills
-        if game.metrics_tracker.total_kills > prev_kills:
-            # Record kill event (approximate location is player's location since we lack target ID)
-            # ideally we'd want target location but this is a good proxy for "where the action is"
-            kill_data.append((int(game.player.center_x), int(game.player.center_y)))
-            prev_kills = game.metrics_tracker.total_kills
+        # Track kills at the destroyed asteroids' positions (this tick's events)
+        events = game.events
+        for _, kill_x, kill_y, _ in events.iter_kind(EVENT_KILL):
+            kill_data.append((int(kill_x), int(kill_y)))
             
         # Track distance to nearest threat (for Safe Space analysis)
         dist = game.tracker.get_distance_to_nearest_asteroid()
@@ -431,32 +460,29 @@ def evaluate_single_agent(
             else:
                 softmin_ttc_sum += ParetoConfig.RISK_TTC_MAX
                 softmin_ttc_samples += 1
+        mark = profiler.lap("metrics", mark)
         
         # Calculate step reward
         step_reward = reward_calculator.calculate_step_reward(
             game.tracker,
             game.metrics_tracker
         )
+        mark = profiler.lap("reward", mark)
         total_reward += step_reward
         steps += 1
 
-        shots_now = game.metrics_tracker.total_shots_fired
-        if shots_now > prev_shots:
-            shot_count = shots_now - prev_shots
-            if step_frontness is not None:
-                frontness_at_shot_sum += step_frontness * shot_count
-                shot_distance_sum += step_nearest_dist * shot_count
-                shot_alignment_samples += shot_count
-            prev_shots = shots_now
-
-        hits_now = game.metrics_tracker.total_hits
-        if hits_now > prev_hits:
-            hit_count = hits_now - prev_hits
-            if step_frontness is not None:
-                frontness_at_hit_sum += step_frontness * hit_count
-                hit_distance_sum += step_nearest_dist * hit_count
-                hit_alignment_samples += hit_count
-            prev_hits = hits_now
+        shot_count = events.shots
+        if shot_count and step_frontness is not None:
+            frontness_at_shot_sum += step_frontness * shot_count
+            shot_distance_sum += step_nearest_dist * shot_count
+            shot_alignment_samples += shot_count
+
+        hit_count = events.hits
+        if hit_count and step_frontness is not None:
+            frontness_at_hit_sum += step_frontness * hit_count
+            hit_distance_sum += step_nearest_dist * hit_count
+            hit_alignment_samples += hit_count
+        mark = profiler.lap("metrics", mark)
     
     # Calculate action durations
     def _avg_duration(history, indices):
@@ -593,9 +619,236 @@ def evaluate_single_agent(
         'output_saturation': saturation_rate,
         'action_entropy': action_entropy
     }
+    if profile:
+        metrics['time_profile'] = profiler.snapshot()
     return metrics
 
 
+class _RolloutQueue:
+    """
+    Rollout tasks shared by the runners of one population evaluation.
+
+    Tasks are popped longest-predicted first; every runner pulls the next task
+    as soon as its previous one finishes, so no worker idles while work is
+    left and the longest episodes start first instead of last.
+    """
+
+    def __init__(self, tasks: List[Tuple[int, Any, int]], results: List[Optional[Dict]]):
+        self._tasks = deque(tasks)
+        self._lock = threading.Lock()
+        self.results = results
+        self.busy_seconds = 0.0
+        self.first_idle_at: Optional[float] = None
+
+    def pop(self) -> Optional[Tuple[int, Any, int]]:
+        with self._lock:
+            if self._tasks:
+                return self._tasks.popleft()
+            if self.first_idle_at is None:
+                self.first_idle_at = time.perf_counter()
+            return None
+
+    def add_busy(self, seconds: float) -> None:
+        with self._lock:
+            self.busy_seconds += seconds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tasks.clear()
+
+
+def _run_rollouts(rollouts: _RolloutQueue, evaluate: Callable[[Any, int], Dict]) -> None:
+    """Worker loop: evaluate queued (slot, individual, seed) tasks until none are left."""
+    while True:
+        task = rollouts.pop()
+        if task is None:
+            return
+        slot, individual, seed = task
+        start = time.perf_counter()
+        rollouts.results[slot] = evaluate(individual, seed)
+        rollouts.add_busy(time.perf_counter() - start)
+
+
+class PendingPopulationEvaluation:
+    """
+    Handle for a population evaluation submitted to an executor.
+
+    Returned by ``submit_population_evaluation``; ``result()`` blocks until
+    every rollout finishes and returns the same tuple as
+    ``evaluate_population_parallel``. ``futures`` are the runner jobs (one per
+    worker), not individual rollouts.
+    """
+
+    def __init__(self, futures: List[concurrent.futures.Future], rollouts: _RolloutQueue,
+                 population_size: int, seeds_per_agent: int, generation_seed: int, workers: int):
+        self.futures = futures
+        self.rollouts = rollouts
+        self.population_size = population_size
+        self.seeds_per_agent = seeds_per_agent
+        self.generation_seed = generation_seed
+        self.workers = workers
+        self.submitted_at = time.perf_counter()
+        self.completed_at: Optional[float] = None
+        self._remaining = len(futures)
+        self._lock = threading.Lock()
+        self._result = None
+        if not futures:
+            self.completed_at = self.submitted_at
+        for future in futures:
+            future.add_done_callback(self._on_done)
+
+    def _on_done(self, _future: concurrent.futures.Future) -> None:
+        with self._lock:
+            self._remaining -= 1
+            if self._remaining == 0:
+                self.completed_at = time.perf_counter()
+
+    def done(self) -> bool:
+        """True once every rollout has finished."""
+        return all(future.done() for future in self.futures)
+
+    def cancel(self) -> None:
+        """Drop rollouts that have not started; running ones finish normally."""
+        self.rollouts.clear()
+        for future in self.futures:
+            future.cancel()
+
+    def result(self) -> Tuple[List[float], int, Dict, List[Dict]]:
+        """Wait for all rollouts and aggregate them (cached after the first call)."""
+        if self._result is None:
+            for future in self.futures:
+                future.result()
+            fitnesses, aggregated_metrics, averaged_results = aggregate_population_results(
+                self.rollouts.results, self.population_size, self.seeds_per_agent
+            )
+            self._result = (fitnesses, self.generation_seed, aggregated_metrics, averaged_results)
+        return self._result
+
+    def scheduling_stats(self) -> Dict[str, float]:
+        """
+        Worker utilization and straggler tail of the finished evaluation.
+
+        ``worker_utilization`` is rollout time over (wall time x workers);
+        ``evaluation_tail_duration`` is the time from the first worker running
+        out of tasks to the last rollout finishing.
+        """
+        completed_at = self.completed_at if self.completed_at is not None else time.perf_counter()
+        wall = completed_at - self.submitted_at
+        first_idle_at = self.rollouts.first_idle_at if self.rollouts.first_idle_at is not None else completed_at
+        return {
+            'worker_utilization': min(1.0, self.rollouts.busy_seconds / (wall * self.workers)) if wall > 0 else 0.0,
+            'evaluation_tail_duration': max(0.0, completed_at - first_idle_at),
+        }
+
+
+def _rollout_tasks(
+    population: Sequence[Any],
+    generation_seed: int,
+    seeds_per_agent: int,
+    use_common_seeds: bool,
+    predicted_costs: Optional[Sequence[float]] = None
+) -> List[Tuple[int, Any, int]]:
+    """
+    Every (result slot, individual, seed) rollout of a population evaluation,
+    longest predicted first when ``predicted_costs`` is given.
+    """
+    tasks = []
+    for agent_idx, individual in enumerate(population):
+        for seed_offset in range(seeds_per_agent):
+            if use_common_seeds:
+                # CRN mode: All agents use the same seed set within a generation
+                # This ensures fitness differences reflect parameter differences, not seed luck
+                # Seed set changes across generations to maintain generalization pressure
+                seed = generation_seed + seed_offset
+            else:
+                # Default mode: Each agent gets unique seeds
+                # Agent i gets seeds: [base + i*seeds_per_agent + 0, base + i*seeds_per_agent + 1, ...]
+                seed = generation_seed + agent_idx * seeds_per_agent + seed_offset
+            tasks.append((len(tasks), individual, seed))
+
+    # Longest predicted episodes first (a stable sort keeps population order for ties)
+    if predicted_costs is not None:
+        tasks.sort(key=lambda task: -predicted_costs[task[0] // seeds_per_agent])
+    return tasks
+
+
+def submit_population_evaluation(
+    executor: concurrent.futures.Executor,
+    population: List[List[float]],
+    state_encoder: StateEncoder,
+    action_interface: ActionInterface,
+    max_steps: int = 2000,
+    generation_seed: int = None,
+    seeds_per_agent: int = 3,
+    use_common_seeds: bool = False,
+    agent_factory: Optional[Callable[[Any, StateEncoder, ActionInterface], Any]] = None,
+    action_repeat: int = 1,
+    profile: Optional[bool] = None,
+    max_workers: Optional[int] = None,
+    predicted_costs: Optional[Sequence[float]] = None
+) -> PendingPopulationEvaluation:
+    """
+    Submit every rollout of a population evaluation without waiting for it.
+
+    Takes the same arguments as ``evaluate_population_parallel`` plus the
+    executor to run on, so callers can keep working (playback, reporting)
+    while the generation evaluates.
+
+    Rollouts are not submitted one future each: ``max_workers`` runner jobs
+    share a queue ordered by ``predicted_costs`` (longest first, ties in
+    population order), so expensive episodes start early and idle workers
+    take whatever is left. Results are identical to population order.
+
+    Args:
+        max_workers: Worker threads of ``executor`` (None = os.cpu_count())
+        predicted_costs: Expected episode length per individual (None = population order)
+
+    Returns:
+        PendingPopulationEvaluation whose ``result()`` matches
+        ``evaluate_population_parallel``'s return value
+    """
+    if profile is None:
+        profile = AnalyticsConfig.PROFILE_EPISODES
+
+    # Base seed for this generation - used to derive unique seeds
+    if generation_seed is None:
+        generation_seed = random.randint(0, 2**31 - 1)
+
+    print(f"[DEBUG] Evaluation Generation Seed: {generation_seed} (CRN: {use_common_seeds})")
+
+    all_eval_tasks = _rollout_tasks(population, generation_seed, seeds_per_agent, use_common_seeds, predicted_costs)
+
+    # CRN mode: every agent replays the same few seeds, so pre-roll each seed's
+    # spawn stream once and share it read-only across workers
+    spawn_schedules = {}
+    if use_common_seeds:
+        spawn_schedules = build_spawn_schedules(
+            (generation_seed + offset for offset in range(seeds_per_agent)),
+            max_steps=max_steps
+        )
+
+    def evaluate(individual, seed):
+        return evaluate_single_agent(
+            individual,
+            state_encoder,
+            action_interface,
+            max_steps,
+            random_seed=seed,
+            agent_factory=agent_factory,
+            spawn_schedule=spawn_schedules.get(seed),
+            action_repeat=action_repeat,
+            profile=profile
+        )
+
+    workers = max_workers or os.cpu_count() or 1
+    rollouts = _RolloutQueue(all_eval_tasks, [None] * len(all_eval_tasks))
+    futures = [
+        executor.submit(_run_rollouts, rollouts, evaluate)
+        for _ in range(min(workers, len(all_eval_tasks)))
+    ]
+    return PendingPopulationEvaluation(futures, rollouts, len(population), seeds_per_agent, generation_seed, workers)
+
+
 def evaluate_population_parallel(
     population: List[List[float]],
     state_encoder: StateEncoder,
@@ -605,7 +858,10 @@ def evaluate_population_parallel(
     generation_seed: int = None,
     seeds_per_agent: int = 3,
     use_common_seeds: bool = False,
-    agent_factory: Optional[Callable[[Any, StateEncoder, ActionInterface], Any]] = None
+    agent_factory: Optional[Callable[[Any, StateEncoder, ActionInterface], Any]] = None,
+    action_repeat: int = 1,
+    profile: Optional[bool] = None,
+    backend=None
 ) -> Tuple[List[float], int, Dict, List[Dict]]:
     """
     Evaluate entire population in parallel with multiple seeds per agent.
@@ -624,6 +880,10 @@ def evaluate_population_parallel(
         use_common_seeds: If True, all agents use the same seed set (CRN for ES).
                           If False, each agent gets unique seeds (default, GA-style).
         agent_factory: Optional callable to construct agents for non-vector genomes
+        action_repeat: Physics frames per agent decision (1 = decide every frame)
+        profile: Time each rollout's hot path (default: AnalyticsConfig.PROFILE_EPISODES)
+        backend: Evaluate on remote workers instead of local threads
+                 (training/core/remote_evaluation.py:RemoteEvaluationPool)
 
     Returns:
         Tuple of:
@@ -632,55 +892,222 @@ def evaluate_population_parallel(
             - Aggregated metrics dict (population averages)
             - List of per-agent metrics (for distribution tracking)
     """
-    # Base seed for this generation - used to derive unique seeds
-    if generation_seed is None:
-        generation_seed = random.randint(0, 2**31 - 1)
-
-    print(f"[DEBUG] Evaluation Generation Seed: {generation_seed} (CRN: {use_common_seeds})")
-
-    def _std(values: List[float]) -> float:
-        if not values:
-            return 0.0
-        mean = sum(values) / len(values)
-        var = sum((v - mean) ** 2 for v in values) / len(values)
-        return math.sqrt(var)
-
-    # Generate seeds for all evaluations
-    all_eval_tasks = []
-    for agent_idx, individual in enumerate(population):
-        for seed_offset in range(seeds_per_agent):
-            if use_common_seeds:
-                # CRN mode: All agents use the same seed set within a generation
-                # This ensures fitness differences reflect parameter differences, not seed luck
-                # Seed set changes across generations to maintain generalization pressure
-                seed = generation_seed + seed_offset
-            else:
-                # Default mode: Each agent gets unique seeds
-                # Agent i gets seeds: [base + i*seeds_per_agent + 0, base + i*seeds_per_agent + 1, ...]
-                seed = generation_seed + agent_idx * seeds_per_agent + seed_offset
-            all_eval_tasks.append((agent_idx, individual, seed))
+    if backend is not None:
+        return backend.submit(
+            population,
+            state_encoder,
+            action_interface,
+            max_steps=max_steps,
+            generation_seed=generation_seed,
+            seeds_per_agent=seeds_per_agent,
+            use_common_seeds=use_common_seeds,
+            agent_factory=agent_factory,
+            action_repeat=action_repeat,
+            profile=profile
+        ).result()
 
     # Use ThreadPoolExecutor for parallel evaluation
     # All 300 evaluations (100 agents × 3 seeds) run in parallel
+    max_workers = max_workers or os.cpu_count() or 1
     with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            executor.submit(
-                evaluate_single_agent,
-                individual,
-                state_encoder,
-                action_interface,
-                max_steps,
-                random_seed=seed,
-                agent_factory=agent_factory
-            )
-            for agent_idx, individual, seed in all_eval_tasks
-        ]
+        pending = submit_population_evaluation(
+            executor,
+            population,
+            state_encoder,
+            action_interface,
+            max_steps=max_steps,
+            generation_seed=generation_seed,
+            seeds_per_agent=seeds_per_agent,
+            use_common_seeds=use_common_seeds,
+            agent_factory=agent_factory,
+            action_repeat=action_repeat,
+            profile=profile,
+            max_workers=max_workers
+        )
+        return pending.result()
+
+
+def _std(values: List[float]) -> float:
+    if not values:
+        return 0.0
+    mean = sum(values) / len(values)
+    var = sum((v - mean) ** 2 for v in values) / len(values)
+    return math.sqrt(var)
 
-        # Collect results as they complete
-        all_results = [future.result() for future in futures]
 
+def average_agent_results(results: List[Dict]) -> Dict:
+    """
+    Average one agent's per-seed rollout results.
+
+    Also derives the agent's behavior vector and reward diversity, the inputs
+    to novelty/diversity selection.
+
+    Args:
+        results: ``evaluate_single_agent`` results of one agent (one per seed)
+
+    Returns:
+        Per-agent metrics dict (one entry of the per-agent metrics list)
+    """
+    avg_fitness = sum(r['fitness'] for r in results) / len(results)
+
+    # Also average the behavioral metrics for this agent
+    avg_kills = sum(r['kills'] for r in results) / len(results)
+    avg_steps = sum(r['steps_survived'] for r in results) / len(results)
+    avg_idle_rate = sum(r.get('idle_rate', 0.0) for r in results) / len(results)
+    avg_asteroid_dist = sum(r.get('avg_asteroid_dist', 0.0) for r in results) / len(results)
+    avg_screen_wraps = sum(r.get('screen_wraps', 0) for r in results) / len(results)
+    avg_thrust = sum(r.get('thrust_frames', 0) for r in results) / len(results)
+    avg_turn = sum(r.get('turn_frames', 0) for r in results) / len(results)
+    avg_shoot = sum(r.get('shoot_frames', 0) for r in results) / len(results)
+    avg_accuracy = sum(r['accuracy'] for r in results) / len(results)
+    avg_hits = sum(r.get('hits', 0) for r in results) / len(results)
+    avg_thrust_duration = sum(r.get('avg_thrust_duration', 0.0) for r in results) / len(results)
+    avg_turn_duration = sum(r.get('avg_turn_duration', 0.0) for r in results) / len(results)
+    avg_shoot_duration = sum(r.get('avg_shoot_duration', 0.0) for r in results) / len(results)
+    avg_time_alive = sum(r.get('time_alive', 0.0) for r in results) / len(results)
+    
+    # New metrics averaging
+    avg_min_dist = sum(r.get('min_asteroid_dist', 0.0) for r in results) / len(results)
+    avg_saturation = sum(r.get('output_saturation', 0.0) for r in results) / len(results)
+    avg_entropy = sum(r.get('action_entropy', 0.0) for r in results) / len(results)
+    avg_turn_value_mean = sum(r.get('turn_value_mean', 0.0) for r in results) / len(results)
+    avg_turn_value_std = sum(r.get('turn_value_std', 0.0) for r in results) / len(results)
+    avg_turn_abs_mean = sum(r.get('turn_abs_mean', 0.0) for r in results) / len(results)
+    avg_turn_deadzone_rate = sum(r.get('turn_deadzone_rate', 0.0) for r in results) / len(results)
+    avg_turn_switch_rate = sum(r.get('turn_switch_rate', 0.0) for r in results) / len(results)
+    avg_turn_balance = sum(r.get('turn_balance', 0.0) for r in results) / len(results)
+    avg_turn_left_rate = sum(r.get('turn_left_rate', 0.0) for r in results) / len(results)
+    avg_turn_right_rate = sum(r.get('turn_right_rate', 0.0) for r in results) / len(results)
+    avg_turn_streak = sum(r.get('avg_turn_streak', 0.0) for r in results) / len(results)
+    avg_max_turn_streak = sum(r.get('max_turn_streak', 0.0) for r in results) / len(results)
+    avg_frontness = sum(r.get('frontness_avg', 0.0) for r in results) / len(results)
+    avg_frontness_shot = sum(r.get('frontness_at_shot', 0.0) for r in results) / len(results)
+    avg_frontness_hit = sum(r.get('frontness_at_hit', 0.0) for r in results) / len(results)
+    avg_shot_distance = sum(r.get('shot_distance_avg', 0.0) for r in results) / len(results)
+    avg_hit_distance = sum(r.get('hit_distance_avg', 0.0) for r in results) / len(results)
+    avg_danger_exposure = sum(r.get('danger_exposure_rate', 0.0) for r in results) / len(results)
+    avg_danger_entries = sum(r.get('danger_entries', 0.0) for r in results) / len(results)
+    avg_reaction_time = sum(r.get('avg_reaction_time', 0.0) for r in results) / len(results)
+    avg_danger_wraps = sum(r.get('danger_wraps', 0.0) for r in results) / len(results)
+    avg_softmin_ttc = sum(r.get('softmin_ttc', 0.0) for r in results) / len(results)
+    avg_distance_traveled = sum(r.get('distance_traveled', 0.0) for r in results) / len(results)
+    avg_speed = sum(r.get('avg_speed', 0.0) for r in results) / len(results)
+    avg_speed_std = sum(r.get('std_speed', 0.0) for r in results) / len(results)
+    avg_coverage_ratio = sum(r.get('coverage_ratio', 0.0) for r in results) / len(results)
+    avg_cooldown_ready_rate = sum(r.get('cooldown_ready_rate', 0.0) for r in results) / len(results)
+    avg_cooldown_usage_rate = sum(r.get('cooldown_usage_rate', 0.0) for r in results) / len(results)
+
+    fitness_std = _std([r['fitness'] for r in results])
+    shots_per_kill = (sum(r.get('shots_fired', 0) for r in results) / len(results)) / max(0.1, avg_kills)
+    shots_per_hit = (sum(r.get('shots_fired', 0) for r in results) / len(results)) / max(0.1, avg_hits)
+
+    # Detailed turn metrics averaging
+    avg_left_only = sum(r.get('left_only_frames', 0) for r in results) / len(results)
+    avg_right_only = sum(r.get('right_only_frames', 0) for r in results) / len(results)
+    avg_both_turn = sum(r.get('both_turn_frames', 0) for r in results) / len(results)
+
+    # Average reward breakdown for this agent
+    agent_reward_breakdown = {}
+    for r in results:
+        for comp, val in r['reward_breakdown'].items():
+            if comp not in agent_reward_breakdown:
+                agent_reward_breakdown[comp] = 0.0
+            agent_reward_breakdown[comp] += val / len(results)
+
+    # Compute behavior vector for novelty calculation
+    # Includes turn dynamics to distinguish spinners from agile turners
+    agent_metrics_for_behavior = {
+        'thrust_frames': avg_thrust,
+        'turn_frames': avg_turn,
+        'shoot_frames': avg_shoot,
+        'accuracy': avg_accuracy,
+        'idle_rate': avg_idle_rate,
+        'avg_asteroid_dist': avg_asteroid_dist,
+        'screen_wraps': avg_screen_wraps,
+        # Turn dynamics (new)
+        'turn_switch_rate': avg_turn_switch_rate,
+        'turn_balance': avg_turn_balance,
+        'avg_turn_streak': avg_turn_streak,
+        # Neural health (new)
+        'output_saturation': avg_saturation,
+    }
+    behavior_vector = compute_behavior_vector(agent_metrics_for_behavior, avg_steps)
+
+    # Compute reward diversity score
+    reward_diversity = compute_reward_diversity(agent_reward_breakdown)
+
+    return {
+        'fitness': avg_fitness,
+        'steps_survived': avg_steps,
+        'time_alive': avg_time_alive,
+        'kills': avg_kills,
+        'shots_fired': sum(r['shots_fired'] for r in results) / len(results),
+        'accuracy': avg_accuracy,
+        'hits': avg_hits,
+        'thrust_frames': avg_thrust,
+        'turn_frames': avg_turn,
+        'shoot_frames': avg_shoot,
+        # Detailed turn metrics
+        'left_only_frames': avg_left_only,
+        'right_only_frames': avg_right_only,
+        'both_turn_frames': avg_both_turn,
+        'avg_thrust_duration': avg_thrust_duration,
+        'avg_turn_duration': avg_turn_duration,
+        'avg_shoot_duration': avg_shoot_duration,
+        'idle_rate': avg_idle_rate,
+        'avg_asteroid_dist': avg_asteroid_dist,
+        'min_asteroid_dist': avg_min_dist,
+        'screen_wraps': avg_screen_wraps,
+        'turn_value_mean': avg_turn_value_mean,
+        'turn_value_std': avg_turn_value_std,
+        'turn_abs_mean': avg_turn_abs_mean,
+        'turn_deadzone_rate': avg_turn_deadzone_rate,
+        'turn_switch_rate': avg_turn_switch_rate,
+        'turn_balance': avg_turn_balance,
+        'turn_left_rate': avg_turn_left_rate,
+        'turn_right_rate': avg_turn_right_rate,
+        'avg_turn_streak': avg_turn_streak,
+        'max_turn_streak': avg_max_turn_streak,
+        'frontness_avg': avg_frontness,
+        'frontness_at_shot': avg_frontness_shot,
+        'frontness_at_hit': avg_frontness_hit,
+        'shot_distance_avg': avg_shot_distance,
+        'hit_distance_avg': avg_hit_distance,
+        'danger_exposure_rate': avg_danger_exposure,
+        'danger_entries': avg_danger_entries,
+        'avg_reaction_time': avg_reaction_time,
+        'danger_wraps': avg_danger_wraps,
+        'softmin_ttc': avg_softmin_ttc,
+        'distance_traveled': avg_distance_traveled,
+        'avg_speed': avg_speed,
+        'std_speed': avg_speed_std,
+        'coverage_ratio': avg_coverage_ratio,
+        'cooldown_ready_rate': avg_cooldown_ready_rate,
+        'cooldown_usage_rate': avg_cooldown_usage_rate,
+        'shots_per_kill': shots_per_kill,
+        'shots_per_hit': shots_per_hit,
+        'fitness_std': fitness_std,
+        'reward_breakdown': agent_reward_breakdown,
+        'behavior_vector': behavior_vector,
+        'reward_diversity': reward_diversity,
+        'output_saturation': avg_saturation,
+        'action_entropy': avg_entropy,
+    }
+
+
+def aggregate_population_results(
+    all_results: List[Dict],
+    population_size: int,
+    seeds_per_agent: int
+) -> Tuple[List[float], Dict, List[Dict]]:
+    """
+    Average per-seed rollout results into per-agent and population metrics.
+
+    Returns:
+        (fitnesses, aggregated_metrics, averaged_results)
+    """
     # Group results by agent and average their fitness
-    agent_results = [[] for _ in range(len(population))]
+    agent_results = [[] for _ in range(population_size)]
     for i, result in enumerate(all_results):
         agent_idx = i // seeds_per_agent
         agent_results[agent_idx].append(result)
@@ -689,153 +1116,10 @@ def evaluate_population_parallel(
     fitnesses = []
     averaged_results = []  # Store averaged metrics per agent for aggregation
     pop_reward_breakdown = {}
-    for agent_idx, results in enumerate(agent_results):
-        avg_fitness = sum(r['fitness'] for r in results) / len(results)
-        fitnesses.append(avg_fitness)
-
-        # Also average the behavioral metrics for this agent
-        avg_kills = sum(r['kills'] for r in results) / len(results)
-        avg_steps = sum(r['steps_survived'] for r in results) / len(results)
-        avg_idle_rate = sum(r.get('idle_rate', 0.0) for r in results) / len(results)
-        avg_asteroid_dist = sum(r.get('avg_asteroid_dist', 0.0) for r in results) / len(results)
-        avg_screen_wraps = sum(r.get('screen_wraps', 0) for r in results) / len(results)
-        avg_thrust = sum(r.get('thrust_frames', 0) for r in results) / len(results)
-        avg_turn = sum(r.get('turn_frames', 0) for r in results) / len(results)
-        avg_shoot = sum(r.get('shoot_frames', 0) for r in results) / len(results)
-        avg_accuracy = sum(r['accuracy'] for r in results) / len(results)
-        avg_hits = sum(r.get('hits', 0) for r in results) / len(results)
-        avg_thrust_duration = sum(r.get('avg_thrust_duration', 0.0) for r in results) / len(results)
-        avg_turn_duration = sum(r.get('avg_turn_duration', 0.0) for r in results) / len(results)
-        avg_shoot_duration = sum(r.get('avg_shoot_duration', 0.0) for r in results) / len(results)
-        avg_time_alive = sum(r.get('time_alive', 0.0) for r in results) / len(results)
-        
-        # New metrics averaging
-        avg_min_dist = sum(r.get('min_asteroid_dist', 0.0) for r in results) / len(results)
-        avg_saturation = sum(r.get('output_saturation', 0.0) for r in results) / len(results)
-        avg_entropy = sum(r.get('action_entropy', 0.0) for r in results) / len(results)
-        avg_turn_value_mean = sum(r.get('turn_value_mean', 0.0) for r in results) / len(results)
-        avg_turn_value_std = sum(r.get('turn_value_std', 0.0) for r in results) / len(results)
-        avg_turn_abs_mean = sum(r.get('turn_abs_mean', 0.0) for r in results) / len(results)
-        avg_turn_deadzone_rate = sum(r.get('turn_deadzone_rate', 0.0) for r in results) / len(results)
-        avg_turn_switch_rate = sum(r.get('turn_switch_rate', 0.0) for r in results) / len(results)
-        avg_turn_balance = sum(r.get('turn_balance', 0.0) for r in results) / len(results)
-        avg_turn_left_rate = sum(r.get('turn_left_rate', 0.0) for r in results) / len(results)
-        avg_turn_right_rate = sum(r.get('turn_right_rate', 0.0) for r in results) / len(results)
-        avg_turn_streak = sum(r.get('avg_turn_streak', 0.0) for r in results) / len(results)
-        avg_max_turn_streak = sum(r.get('max_turn_streak', 0.0) for r in results) / len(results)
-        avg_frontness = sum(r.get('frontness_avg', 0.0) for r in results) / len(results)
-        avg_frontness_shot = sum(r.get('frontness_at_shot', 0.0) for r in results) / len(results)
-        avg_frontness_hit = sum(r.get('frontness_at_hit', 0.0) for r in results) / len(results)
-        avg_shot_distance = sum(r.get('shot_distance_avg', 0.0) for r in results) / len(results)
-        avg_hit_distance = sum(r.get('hit_distance_avg', 0.0) for r in results) / len(results)
-        avg_danger_exposure = sum(r.get('danger_exposure_rate', 0.0) for r in results) / len(results)
-        avg_danger_entries = sum(r.get('danger_entries', 0.0) for r in results) / len(results)
-        avg_reaction_time = sum(r.get('avg_reaction_time', 0.0) for r in results) / len(results)
-        avg_danger_wraps = sum(r.get('danger_wraps', 0.0) for r in results) / len(results)
-        avg_softmin_ttc = sum(r.get('softmin_ttc', 0.0) for r in results) / len(results)
-        avg_distance_traveled = sum(r.get('distance_traveled', 0.0) for r in results) / len(results)
-        avg_speed = sum(r.get('avg_speed', 0.0) for r in results) / len(results)
-        avg_speed_std = sum(r.get('std_speed', 0.0) for r in results) / len(results)
-        avg_coverage_ratio = sum(r.get('coverage_ratio', 0.0) for r in results) / len(results)
-        avg_cooldown_ready_rate = sum(r.get('cooldown_ready_rate', 0.0) for r in results) / len(results)
-        avg_cooldown_usage_rate = sum(r.get('cooldown_usage_rate', 0.0) for r in results) / len(results)
-
-        fitness_std = _std([r['fitness'] for r in results])
-        shots_per_kill = (sum(r.get('shots_fired', 0) for r in results) / len(results)) / max(0.1, avg_kills)
-        shots_per_hit = (sum(r.get('shots_fired', 0) for r in results) / len(results)) / max(0.1, avg_hits)
-
-        # Detailed turn metrics averaging
-        avg_left_only = sum(r.get('left_only_frames', 0) for r in results) / len(results)
-        avg_right_only = sum(r.get('right_only_frames', 0) for r in results) / len(results)
-        avg_both_turn = sum(r.get('both_turn_frames', 0) for r in results) / len(results)
-
-        # Average reward breakdown for this agent
-        agent_reward_breakdown = {}
-        for r in results:
-            for comp, val in r['reward_breakdown'].items():
-                if comp not in agent_reward_breakdown:
-                    agent_reward_breakdown[comp] = 0.0
-                agent_reward_breakdown[comp] += val / len(results)
-
-        # Compute behavior vector for novelty calculation
-        # Includes turn dynamics to distinguish spinners from agile turners
-        agent_metrics_for_behavior = {
-            'thrust_frames': avg_thrust,
-            'turn_frames': avg_turn,
-            'shoot_frames': avg_shoot,
-            'accuracy': avg_accuracy,
-            'idle_rate': avg_idle_rate,
-            'avg_asteroid_dist': avg_asteroid_dist,
-            'screen_wraps': avg_screen_wraps,
-            # Turn dynamics (new)
-            'turn_switch_rate': avg_turn_switch_rate,
-            'turn_balance': avg_turn_balance,
-            'avg_turn_streak': avg_turn_streak,
-            # Neural health (new)
-            'output_saturation': avg_saturation,
-        }
-        behavior_vector = compute_behavior_vector(agent_metrics_for_behavior, avg_steps)
-
-        # Compute reward diversity score
-        reward_diversity = compute_reward_diversity(agent_reward_breakdown)
-
-        averaged_results.append({
-            'fitness': avg_fitness,
-            'steps_survived': avg_steps,
-            'time_alive': avg_time_alive,
-            'kills': avg_kills,
-            'shots_fired': sum(r['shots_fired'] for r in results) / len(results),
-            'accuracy': avg_accuracy,
-            'hits': avg_hits,
-            'thrust_frames': avg_thrust,
-            'turn_frames': avg_turn,
-            'shoot_frames': avg_shoot,
-            # Detailed turn metrics
-            'left_only_frames': avg_left_only,
-            'right_only_frames': avg_right_only,
-            'both_turn_frames': avg_both_turn,
-            'avg_thrust_duration': avg_thrust_duration,
-            'avg_turn_duration': avg_turn_duration,
-            'avg_shoot_duration': avg_shoot_duration,
-            'idle_rate': avg_idle_rate,
-            'avg_asteroid_dist': avg_asteroid_dist,
-            'min_asteroid_dist': avg_min_dist,
-            'screen_wraps': avg_screen_wraps,
-            'turn_value_mean': avg_turn_value_mean,
-            'turn_value_std': avg_turn_value_std,
-            'turn_abs_mean': avg_turn_abs_mean,
-            'turn_deadzone_rate': avg_turn_deadzone_rate,
-            'turn_switch_rate': avg_turn_switch_rate,
-            'turn_balance': avg_turn_balance,
-            'turn_left_rate': avg_turn_left_rate,
-            'turn_right_rate': avg_turn_right_rate,
-            'avg_turn_streak': avg_turn_streak,
-            'max_turn_streak': avg_max_turn_streak,
-            'frontness_avg': avg_frontness,
-            'frontness_at_shot': avg_frontness_shot,
-            'frontness_at_hit': avg_frontness_hit,
-            'shot_distance_avg': avg_shot_distance,
-            'hit_distance_avg': avg_hit_distance,
-            'danger_exposure_rate': avg_danger_exposure,
-            'danger_entries': avg_danger_entries,
-            'avg_reaction_time': avg_reaction_time,
-            'danger_wraps': avg_danger_wraps,
-            'softmin_ttc': avg_softmin_ttc,
-            'distance_traveled': avg_distance_traveled,
-            'avg_speed': avg_speed,
-            'std_speed': avg_speed_std,
-            'coverage_ratio': avg_coverage_ratio,
-            'cooldown_ready_rate': avg_cooldown_ready_rate,
-            'cooldown_usage_rate': avg_cooldown_usage_rate,
-            'shots_per_kill': shots_per_kill,
-            'shots_per_hit': shots_per_hit,
-            'fitness_std': fitness_std,
-            'reward_breakdown': agent_reward_breakdown,
-            'behavior_vector': behavior_vector,
-            'reward_diversity': reward_diversity,
-            'output_saturation': avg_saturation,
-            'action_entropy': avg_entropy,
-        })
+    for results in agent_results:
+        averaged = average_agent_results(results)
+        fitnesses.append(averaged['fitness'])
+        averaged_results.append(averaged)
 
         # Aggregate reward breakdown
         for r in results:
@@ -858,6 +1142,11 @@ def evaluate_population_parallel(
             
     avg_quarterly = [s / num_evals for s in avg_quarterly]
 
+    # Rollout time per span, summed over every evaluation of the generation
+    time_profile = SpanProfiler()
+    for r in all_results:
+        time_profile.merge(r.get('time_profile', {}))
+
 
     # Find best agent (by averaged fitness)
     best_idx = fitnesses.index(max(fitnesses))
@@ -953,6 +1242,8 @@ def evaluate_population_parallel(
         'avg_reward_breakdown': avg_reward_breakdown,
         'avg_quarterly_scores': avg_quarterly,
     }
+    if time_profile.seconds:
+        aggregated_metrics['time_profile'] = time_profile.snapshot()
 
     # Return per-agent metrics list for distribution tracking
-    return fitnesses, generation_seed, aggregated_metrics, averaged_results
+    return fitnesses, aggregated_metrics, averaged_results
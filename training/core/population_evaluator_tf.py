@@ -11,6 +11,7 @@ from collections import defaultdict
 from typing import List, Tuple, Dict, Optional
 from game.headless_game import HeadlessAsteroidsGame
 from game import globals
+from game.tick_events import EVENT_KILL
 from ai_agents.neuroevolution.nn_agent_tf import NNAgentTF
 from interfaces.StateEncoder import StateEncoder
 from interfaces.ActionInterface import ActionInterface
@@ -80,7 +81,6 @@ def evaluate_single_agent_tf(
     # Spatial tracking
     position_history = []
     kill_data = []
-    prev_kills = 0
     total_asteroid_distance = 0.0
     distance_samples = 0
     min_asteroid_dist = float('inf')
@@ -147,9 +147,6 @@ def evaluate_single_agent_tf(
     last_x = game.player.center_x
     last_y = game.player.center_y
 
-    prev_shots = game.metrics_tracker.total_shots_fired
-    prev_hits = game.metrics_tracker.total_hits
-
     def _compute_frontness() -> Tuple[Optional[float], Optional[float]]:
         """Return (frontness, distance) to nearest asteroid, or (None, None)."""
         player = game.player
@@ -320,10 +317,10 @@ def evaluate_single_agent_tf(
         if steps % 60 == 0:
             position_history.append((int(game.player.center_x), int(game.player.center_y)))
 
-        # Track kills
-        if game.metrics_tracker.total_kills > prev_kills:
-            kill_data.append((int(game.player.center_x), int(game.player.center_y)))
-            prev_kills = game.metrics_tracker.total_kills
+        # Track kills at the destroyed asteroids' positions (this tick's events)
+        events = game.events
+        for _, kill_x, kill_y, _ in events.iter_kind(EVENT_KILL):
+            kill_data.append((int(kill_x), int(kill_y)))
 
         # Track distance to nearest threat
         dist = game.tracker.get_distance_to_nearest_asteroid()
@@ -371,23 +368,17 @@ def evaluate_single_agent_tf(
         total_reward += step_reward
         steps += 1
 
-        shots_now = game.metrics_tracker.total_shots_fired
-        if shots_now > prev_shots:
-            shot_count = shots_now - prev_shots
-            if step_frontness is not None:
-                frontness_at_shot_sum += step_frontness * shot_count
-                shot_distance_sum += step_nearest_dist * shot_count
-                shot_alignment_samples += shot_count
-            prev_shots = shots_now
-
-        hits_now = game.metrics_tracker.total_hits
-        if hits_now > prev_hits:
-            hit_count = hits_now - prev_hits
-            if step_frontness is not None:
-                frontness_at_hit_sum += step_frontness * hit_count
-                hit_distance_sum += step_nearest_dist * hit_count
-                hit_alignment_samples += hit_count
-            prev_hits = hits_now
+        shot_count = events.shots
+        if shot_count and step_frontness is not None:
+            frontness_at_shot_sum += step_frontness * shot_count
+            shot_distance_sum += step_nearest_dist * shot_count
+            shot_alignment_samples += shot_count
+
+        hit_count = events.hits
+        if hit_count and step_frontness is not None:
+            frontness_at_hit_sum += step_frontness * hit_count
+            hit_distance_sum += step_nearest_dist * hit_count
+            hit_alignment_samples += hit_count
 
     # Calculate action durations
     def _avg_duration(history, indices):
@@ -0,0 +1,590 @@
+"""
+Population evaluation on other machines.
+
+``EvaluationWorker`` (run by training/scripts/evaluation_worker.py) evaluates
+rollouts for any trainer that connects to it. ``RemoteEvaluationPool`` is the
+coordinator side: a drop-in for the local thread pool behind
+``submit_population_evaluation`` that sends batches of (individual, seed)
+rollouts to every worker over training/core/wire_protocol.py.
+
+Every batch carries the evaluation spec (encoder, action space, episode
+settings) and a fingerprint of that spec plus the reward preset and game
+constants. A worker whose configuration differs computes another fingerprint
+and refuses the batch rather than returning fitnesses that are not
+comparable. When a worker disconnects or times out, its batch goes back on
+the queue for the remaining workers; the evaluation only fails when none is
+left. A rollout that raises on a worker is not retried: the evaluation
+fails with ``RemoteRolloutError`` carrying the worker's traceback. Seed-only
+ES candidates travel as (offset, sign) plus their generation's mean and
+sigma once per batch, and are materialized on the worker. Results match a local evaluation with the same generation seed
+(tuples in the metrics arrive as lists).
+"""
+
+import concurrent.futures
+import hashlib
+import inspect
+import json
+import os
+import random
+import socket
+import socketserver
+import threading
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ai_agents.neuroevolution.neat.agent import NEATAgent
+from ai_agents.neuroevolution.neat.genome import Genome
+from game import globals
+from game.spawn_schedule import build_spawn_schedules
+from interfaces.ActionInterface import ActionInterface
+from interfaces.StateEncoder import StateEncoder
+from interfaces.encoders.HybridEncoder import HybridEncoder
+from interfaces.encoders.TemporalStackEncoder import TemporalStackEncoder
+from interfaces.encoders.VectorEncoder import VectorEncoder
+from training.config.analytics import AnalyticsConfig
+from training.config.genetic_algorithm import GAConfig
+from training.config.remote import RemoteEvaluationConfig
+from training.config.rewards import REWARD_PRESETS
+from training.core.population_evaluator import (
+    PendingPopulationEvaluation,
+    _RolloutQueue,
+    _rollout_tasks,
+    evaluate_single_agent,
+)
+from training.core.wire_protocol import ProtocolError, parse_address, recv_message, send_message
+from training.methods.evolution_strategies.noise_table import NoiseCandidate, NoiseCenter
+
+PROTOCOL_VERSION = 1
+
+# Encoders a spec may name; a peer cannot make the worker build anything else
+_ENCODERS = {cls.__name__: cls for cls in (HybridEncoder, VectorEncoder, TemporalStackEncoder)}
+
+
+class WorkerRejected(RuntimeError):
+    """A worker refused a batch (configuration fingerprint or protocol mismatch)."""
+
+
+class RemoteRolloutError(RuntimeError):
+    """A rollout raised on the worker; the message carries the worker's traceback."""
+
+
+def describe_encoder(encoder: StateEncoder) -> Dict[str, Any]:
+    """Encoder class and constructor arguments as JSON (see ``build_encoder``)."""
+    name = type(encoder).__name__
+    if _ENCODERS.get(name) is not type(encoder):
+        raise ValueError(f"{name} cannot be evaluated remotely; supported encoders: {sorted(_ENCODERS)}")
+    args = {}
+    for param in list(inspect.signature(type(encoder).__init__).parameters)[1:]:
+        value = getattr(encoder, param)
+        args[param] = describe_encoder(value) if isinstance(value, StateEncoder) else value
+    return {"type": name, "args": args}
+
+
+def build_encoder(description: Dict[str, Any]) -> StateEncoder:
+    """Rebuild an encoder from ``describe_encoder`` output."""
+    cls = _ENCODERS.get(description["type"])
+    if cls is None:
+        raise ValueError(f"Unsupported encoder {description['type']!r}")
+    args = {
+        key: build_encoder(value) if isinstance(value, dict) and "type" in value else value
+        for key, value in description["args"].items()
+    }
+    return cls(**args)
+
+
+def evaluation_spec(
+    state_encoder: StateEncoder,
+    action_interface: ActionInterface,
+    max_steps: int,
+    action_repeat: int,
+    profile: bool
+) -> Dict[str, Any]:
+    """Everything besides the individual and seed a worker needs for a rollout."""
+    return {
+        "encoder": describe_encoder(state_encoder),
+        "action_space_type": action_interface.action_space_type,
+        "turn_deadzone": action_interface.turn_deadzone,
+        "max_steps": max_steps,
+        "action_repeat": action_repeat,
+        "profile": bool(profile),
+    }
+
+
+def config_fingerprint(spec: Dict[str, Any]) -> str:
+    """
+    Hash of ``spec`` and the configuration a rollout depends on implicitly
+    (reward preset, game constants, default network size).
+    """
+    constants = {
+        name: value for name, value in vars(globals).items()
+        if name.isupper() and isinstance(value, (bool, int, float, str, tuple, list))
+    }
+    payload = {
+        "protocol": PROTOCOL_VERSION,
+        "spec": spec,
+        "rewards": REWARD_PRESETS,
+        "globals": constants,
+        "hidden_size": GAConfig.HIDDEN_LAYER_SIZE,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def encode_center(center: NoiseCenter) -> Dict[str, Any]:
+    """Mean, sigma and noise table of a generation's seed-only ES candidates -> JSON."""
+    return {
+        "mean": center.mean.tolist(),
+        "sigma": float(center.sigma),
+        "table_size": int(center.table_size),
+        "table_seed": int(center.table_seed),
+    }
+
+
+def decode_center(data: Dict[str, Any]) -> NoiseCenter:
+    """Inverse of ``encode_center``."""
+    return NoiseCenter(
+        mean=np.asarray(data["mean"], dtype=np.float64),
+        sigma=data["sigma"],
+        table_size=data["table_size"],
+        table_seed=data["table_seed"],
+    )
+
+
+def encode_individual(individual: Any, centers: List[NoiseCenter]) -> Dict[str, Any]:
+    """
+    NEAT genome, parameter vector or seed-only ES candidate -> JSON.
+
+    A ``NoiseCandidate`` travels as (center index, offset, sign) and is
+    materialized on the worker; its ``NoiseCenter`` is appended to ``centers``
+    the first time, so a request carries each mean once.
+    """
+    if hasattr(individual, "to_dict"):
+        return {"genome": individual.to_dict()}
+    if isinstance(individual, NoiseCandidate):
+        index = next((i for i, center in enumerate(centers) if center is individual.center), None)
+        if index is None:
+            index = len(centers)
+            centers.append(individual.center)
+        return {"noise": [index, individual.offset, individual.sign]}
+    if hasattr(individual, "materialize"):
+        individual = individual.materialize()
+    return {"params": [float(value) for value in individual]}
+
+
+def _neat_agent(genome, state_encoder, action_interface):
+    return NEATAgent(genome)
+
+
+def decode_individual(data: Dict[str, Any], centers: Sequence[NoiseCenter] = ()) -> Tuple[Any, Optional[Callable]]:
+    """Inverse of ``encode_individual``: (individual, agent_factory)."""
+    if "genome" in data:
+        return Genome.from_dict(data["genome"]), _neat_agent
+    if "noise" in data:
+        center, offset, sign = data["noise"]
+        return NoiseCandidate(centers[center], int(offset), float(sign)), None
+    return data["params"], None
+
+
+class _WorkerHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        worker = self.server.worker
+        while True:
+            try:
+                request = recv_message(self.request)
+            except (ProtocolError, OSError):
+                return
+            if request is None:
+                return
+            try:
+                reply = worker.handle_request(request)
+            except Exception as e:
+                # The batch itself failed (e.g. a rollout raised); the connection is fine
+                reply = {
+                    "ok": False,
+                    "failed": True,
+                    "error": f"{type(e).__name__}: {e}",
+                    "traceback": traceback.format_exc(),
+                }
+            try:
+                send_message(self.request, reply)
+            except OSError:
+                return
+
+
+class _WorkerServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class EvaluationWorker:
+    """
+    Rollout server for remote trainers.
+
+    Args:
+        host: Interface to bind ("0.0.0.0" to accept other machines)
+        port: Port to bind (0 = any free port; see ``address``)
+        threads: Rollouts evaluated at once (None = os.cpu_count())
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = RemoteEvaluationConfig.WORKER_PORT,
+                 threads: Optional[int] = None):
+        self.threads = threads or os.cpu_count() or 1
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.threads)
+        self.rollouts_done = 0
+        self._lock = threading.Lock()
+        self._contexts: Dict[str, Tuple[StateEncoder, ActionInterface]] = {}
+        self._schedules: Tuple[Any, Dict] = (None, {})
+        self._server = _WorkerServer((host, port), _WorkerHandler)
+        self._server.worker = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        if op == "hello":
+            return {"ok": True, "protocol": PROTOCOL_VERSION, "threads": self.threads}
+        if op == "evaluate":
+            return self._evaluate(request)
+        return {"ok": False, "error": f"unknown op {op!r}"}
+
+    def _context(self, spec: Dict[str, Any], fingerprint: str) -> Tuple[StateEncoder, ActionInterface]:
+        with self._lock:
+            if fingerprint not in self._contexts:
+                self._contexts[fingerprint] = (
+                    build_encoder(spec["encoder"]),
+                    ActionInterface(spec["action_space_type"], turn_deadzone=spec["turn_deadzone"]),
+                )
+            return self._contexts[fingerprint]
+
+    def _spawn_schedules(self, seeds: Optional[List[int]], max_steps: int) -> Dict:
+        """CRN spawn streams for ``seeds``, kept for the batches of one generation."""
+        if not seeds:
+            return {}
+        key = (tuple(seeds), max_steps)
+        with self._lock:
+            if self._schedules[0] != key:
+                self._schedules = (key, build_spawn_schedules(seeds, max_steps=max_steps))
+            return self._schedules[1]
+
+    def _evaluate(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        spec = request["spec"]
+        fingerprint = config_fingerprint(spec)
+        if fingerprint != request["fingerprint"]:
+            return {
+                "ok": False,
+                "rejected": True,
+                "error": f"config fingerprint {fingerprint} != coordinator's {request['fingerprint']} "
+                         "(different code, reward preset or game constants)",
+            }
+        state_encoder, action_interface = self._context(spec, fingerprint)
+        schedules = self._spawn_schedules(request.get("spawn_seeds"), spec["max_steps"])
+        centers = [decode_center(data) for data in request.get("centers", [])]
+        individuals = [decode_individual(data, centers) for data in request["individuals"]]
+
+        def run(task):
+            slot, individual_idx, seed = task
+            individual, agent_factory = individuals[individual_idx]
+            start = time.perf_counter()
+            metrics = evaluate_single_agent(
+                individual,
+                state_encoder,
+                action_interface,
+                spec["max_steps"],
+                random_seed=seed,
+                agent_factory=agent_factory,
+                spawn_schedule=schedules.get(seed),
+                action_repeat=spec["action_repeat"],
+                profile=spec["profile"]
+            )
+            return [slot, metrics], time.perf_counter() - start
+
+        done = list(self.executor.map(run, request["tasks"]))
+        with self._lock:
+            self.rollouts_done += len(done)
+        return {
+            "ok": True,
+            "results": [result for result, _ in done],
+            "busy_seconds": sum(seconds for _, seconds in done),
+        }
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> "EvaluationWorker":
+        """Serve on a background thread (tests, or a trainer hosting a worker)."""
+        self._thread = threading.Thread(target=self.serve_forever, name="evaluation-worker", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+        self._server.server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _WorkerConnection:
+    """Coordinator's connection to one worker (one request in flight at a time)."""
+
+    def __init__(self, address: str):
+        self.name = address
+        self.address = parse_address(address)
+        self.sock: Optional[socket.socket] = None
+        self.threads = 0
+        self.rejected = False
+        self._lock = threading.Lock()
+
+    def connect(self, connect_timeout: float, request_timeout: float) -> None:
+        sock = socket.create_connection(self.address, timeout=connect_timeout)
+        try:
+            send_message(sock, {"op": "hello", "protocol": PROTOCOL_VERSION})
+            reply = recv_message(sock)
+            if reply is None:
+                raise ProtocolError("Worker closed the connection during the handshake")
+            if reply.get("protocol") != PROTOCOL_VERSION:
+                self.rejected = True
+                raise WorkerRejected(f"Worker speaks protocol {reply.get('protocol')}, expected {PROTOCOL_VERSION}")
+        except BaseException:
+            sock.close()
+            raise
+        sock.settimeout(request_timeout)
+        self.sock = sock
+        self.threads = int(reply["threads"])
+
+    def evaluate(self, request: Dict[str, Any], batch: Sequence[Tuple[int, Any, int]]) -> Dict[str, Any]:
+        """Send one batch of (slot, individual, seed) rollouts and wait for its results."""
+        individuals, index, tasks, centers = [], {}, [], []
+        for slot, individual, seed in batch:
+            # Seeds of one individual share a single copy of its parameters
+            if id(individual) not in index:
+                index[id(individual)] = len(individuals)
+                individuals.append(encode_individual(individual, centers))
+            tasks.append([slot, index[id(individual)], seed])
+        message = {
+            **request,
+            "centers": [encode_center(center) for center in centers],
+            "individuals": individuals,
+            "tasks": tasks,
+        }
+        with self._lock:
+            if self.sock is None:
+                raise ProtocolError("Not connected")
+            send_message(self.sock, message)
+            reply = recv_message(self.sock)
+        if reply is None:
+            raise ProtocolError("Worker closed the connection")
+        if not reply.get("ok"):
+            if reply.get("rejected"):
+                self.rejected = True
+                raise WorkerRejected(reply.get("error", "batch rejected"))
+            if reply.get("failed"):
+                raise RemoteRolloutError(
+                    f"{reply.get('error', 'rollout failed')} on evaluation worker {self.name}\n"
+                    f"{reply.get('traceback', '')}"
+                )
+            raise ProtocolError(reply.get("error", "worker error"))
+        return reply
+
+    def close(self) -> None:
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+
+class _RemoteRolloutQueue(_RolloutQueue):
+    """
+    Rollout queue shared by the per-worker runners of a remote evaluation.
+
+    A runner that finds the queue empty waits while other runners still have
+    batches out, since a lost worker's batch comes back to the queue.
+    """
+
+    def __init__(self, tasks: List[Tuple[int, Any, int]], results: List[Optional[Dict]], runners: int):
+        super().__init__(tasks, results)
+        self._changed = threading.Condition(self._lock)
+        self._outstanding = len(tasks)
+        self._runners = runners
+        self.requeued = 0
+
+    def take(self, count: int) -> List[Tuple[int, Any, int]]:
+        """Up to ``count`` tasks; empty once every rollout has completed."""
+        with self._changed:
+            while not self._tasks and self._outstanding > 0:
+                if self.first_idle_at is None:
+                    self.first_idle_at = time.perf_counter()
+                self._changed.wait()
+            return [self._tasks.popleft() for _ in range(min(count, len(self._tasks)))]
+
+    def complete(self, count: int, busy_seconds: float) -> None:
+        with self._changed:
+            self._outstanding -= count
+            self.busy_seconds += busy_seconds
+            if self._outstanding <= 0:
+                self._changed.notify_all()
+
+    def requeue(self, batch: Sequence[Tuple[int, Any, int]]) -> None:
+        """Put a lost batch back at the front (it was the longest work left)."""
+        with self._changed:
+            self._tasks.extendleft(reversed(batch))
+            self.requeued += len(batch)
+            self._changed.notify_all()
+
+    def runner_lost(self) -> bool:
+        """Record a dead runner; True if it was the last one and work remains."""
+        with self._changed:
+            self._runners -= 1
+            return self._runners == 0 and self._outstanding > 0
+
+    def clear(self) -> None:
+        with self._changed:
+            self._tasks.clear()
+            self._outstanding = 0
+            self._changed.notify_all()
+
+
+def _run_remote_rollouts(rollouts: _RemoteRolloutQueue, connection: _WorkerConnection,
+                         request: Dict[str, Any], batch_size: int) -> None:
+    """Runner loop for one worker: send batches until the queue is drained or the worker is lost."""
+    while True:
+        batch = rollouts.take(batch_size)
+        if not batch:
+            return
+        try:
+            reply = connection.evaluate(request, batch)
+        except (OSError, WorkerRejected) as e:
+            connection.close()
+            rollouts.requeue(batch)
+            print(f"[remote] Lost evaluation worker {connection.name} ({e}); re-queued {len(batch)} rollouts")
+            if rollouts.runner_lost():
+                raise ConnectionError("Every evaluation worker was lost before the generation finished") from e
+            return
+        except Exception:
+            rollouts.clear()  # Unblock the other runners; result() re-raises this
+            raise
+        for slot, metrics in reply["results"]:
+            rollouts.results[slot] = metrics
+        rollouts.complete(len(batch), reply["busy_seconds"])
+
+
+class RemoteEvaluationPool:
+    """
+    Coordinator backend: evaluates populations on ``EvaluationWorker``s.
+
+    ``submit`` takes the arguments of ``submit_population_evaluation`` (minus
+    the executor) and returns the same ``PendingPopulationEvaluation``, so
+    ``GenerationPipeline`` and ``evaluate_population_parallel`` accept it as
+    ``backend``. NEAT genomes always run as ``NEATAgent`` on the workers;
+    other custom ``agent_factory`` callables cannot be sent.
+
+    Args:
+        addresses: Workers as ``"host:port"``
+        batch_size: Rollouts per request (None = each worker's thread count)
+        connect_timeout: Seconds to reach a worker before skipping it
+        request_timeout: Seconds to wait for a batch before the worker counts as lost
+    """
+
+    def __init__(
+        self,
+        addresses: Sequence[str],
+        batch_size: Optional[int] = None,
+        connect_timeout: float = 5.0,
+        request_timeout: float = 600.0
+    ):
+        if not addresses:
+            raise ValueError("RemoteEvaluationPool needs at least one worker address")
+        self.connections = [_WorkerConnection(address) for address in addresses]
+        self.batch_size = batch_size
+        self.connect_timeout = connect_timeout
+        self.request_timeout = request_timeout
+        # One runner thread per worker; each only waits on its socket
+        self._runners = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(self.connections), thread_name_prefix="remote-eval"
+        )
+
+    def live_connections(self) -> List[_WorkerConnection]:
+        """Connected workers, (re)connecting any that dropped out earlier."""
+        live = []
+        for connection in self.connections:
+            if connection.rejected:
+                continue
+            if connection.sock is None:
+                try:
+                    connection.connect(self.connect_timeout, self.request_timeout)
+                except (OSError, WorkerRejected) as e:
+                    print(f"[remote] Evaluation worker {connection.name} unavailable: {e}")
+                    continue
+            live.append(connection)
+        return live
+
+    def submit(
+        self,
+        population: List[Any],
+        state_encoder: StateEncoder,
+        action_interface: ActionInterface,
+        max_steps: int = 2000,
+        generation_seed: int = None,
+        seeds_per_agent: int = 3,
+        use_common_seeds: bool = False,
+        agent_factory: Optional[Callable[[Any, StateEncoder, ActionInterface], Any]] = None,
+        action_repeat: int = 1,
+        profile: Optional[bool] = None,
+        max_workers: Optional[int] = None,
+        predicted_costs: Optional[Sequence[float]] = None
+    ) -> PendingPopulationEvaluation:
+        """
+        Queue a population evaluation on the workers without waiting for it.
+
+        ``max_workers`` is ignored: parallelism is the workers' total thread
+        count. Raises ConnectionError if no worker is reachable.
+        """
+        if profile is None:
+            profile = AnalyticsConfig.PROFILE_EPISODES
+        if generation_seed is None:
+            generation_seed = random.randint(0, 2**31 - 1)
+        if agent_factory is not None and not all(hasattr(individual, "to_dict") for individual in population):
+            raise ValueError("Remote evaluation supports custom agents only for NEAT genomes")
+
+        live = self.live_connections()
+        if not live:
+            raise ConnectionError(f"No evaluation worker reachable ({', '.join(c.name for c in self.connections)})")
+
+        spec = evaluation_spec(state_encoder, action_interface, max_steps, action_repeat, profile)
+        request = {
+            "op": "evaluate",
+            "spec": spec,
+            "fingerprint": config_fingerprint(spec),
+            "spawn_seeds": [generation_seed + offset for offset in range(seeds_per_agent)] if use_common_seeds else None,
+        }
+        tasks = _rollout_tasks(population, generation_seed, seeds_per_agent, use_common_seeds, predicted_costs)
+        rollouts = _RemoteRolloutQueue(tasks, [None] * len(tasks), runners=len(live))
+        futures = [
+            self._runners.submit(_run_remote_rollouts, rollouts, connection, request,
+                                 self.batch_size or connection.threads)
+            for connection in live
+        ]
+        workers = sum(connection.threads for connection in live)
+        return PendingPopulationEvaluation(futures, rollouts, len(population), seeds_per_agent, generation_seed, workers)
+
+    def close(self) -> None:
+        for connection in self.connections:
+            connection.close()
+        self._runners.shutdown(wait=False)
+
+
+def create_remote_backend() -> Optional[RemoteEvaluationPool]:
+    """``RemoteEvaluationPool`` for ``RemoteEvaluationConfig.WORKERS``, or None (local threads)."""
+    if not RemoteEvaluationConfig.WORKERS:
+        return None
+    return RemoteEvaluationPool(
+        RemoteEvaluationConfig.WORKERS,
+        batch_size=RemoteEvaluationConfig.BATCH_SIZE,
+        connect_timeout=RemoteEvaluationConfig.CONNECT_TIMEOUT,
+        request_timeout=RemoteEvaluationConfig.REQUEST_TIMEOUT
+    )
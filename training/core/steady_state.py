@@ -0,0 +1,282 @@
+"""
+Steady-state (asynchronous) evaluation for the evolutionary trainers.
+
+Generational training evaluates a whole population and waits for its slowest
+episode before breeding, so a few long survivors leave most workers idle at
+the end of every generation. In steady-state mode each individual is submitted
+on its own; as soon as one finishes, the trainer replaces a population member
+with it and breeds a new offspring into the freed worker capacity.
+
+``SteadyStateEvaluator`` owns the worker pool, the per-individual seed
+assignment and the completion queue. Completions are grouped into report
+windows of N evaluations; each window is summarized in the same shape as a
+generation (``aggregate_population_results``) so analytics and reports work
+unchanged, with one "generation" per window.
+"""
+
+import concurrent.futures
+import math
+import queue
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from game.spawn_schedule import SpawnSchedule, build_spawn_schedules
+from interfaces.ActionInterface import ActionInterface
+from interfaces.StateEncoder import StateEncoder
+from training.config.analytics import AnalyticsConfig
+from training.core.population_evaluator import (
+    aggregate_population_results, average_agent_results, evaluate_single_agent
+)
+
+
+def default_in_flight(max_workers: int, seeds_per_agent: int) -> int:
+    """
+    Individuals to keep in flight so every worker has a queued rollout.
+
+    Two rollouts per worker keeps the pool busy while the trainer breeds;
+    anything beyond that only makes offspring staler.
+    """
+    return max(2, math.ceil(2 * max_workers / max(1, seeds_per_agent)))
+
+
+@dataclass
+class CompletedEvaluation:
+    """One individual whose rollouts (one per seed) have all finished."""
+    ticket: int
+    individual: Any
+    tag: Any
+    results: List[Dict]
+    metrics: Dict
+    rollout_seconds: float
+    submitted_at: float
+    completed_at: float
+
+    @property
+    def fitness(self) -> float:
+        return self.metrics['fitness']
+
+
+@dataclass
+class _Submission:
+    ticket: int
+    individual: Any
+    tag: Any
+    futures: List[concurrent.futures.Future]
+    submitted_at: float
+    remaining: int
+    rollout_seconds: List[float] = field(default_factory=list)
+
+
+def _timed_rollout(*args, **kwargs) -> Tuple[Dict, float]:
+    start = time.perf_counter()
+    result = evaluate_single_agent(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+class SteadyStateEvaluator:
+    """
+    Evaluates individuals one at a time on a shared worker pool.
+
+    Seeds: each submission gets ``seeds_per_agent`` fresh seeds. With
+    ``use_common_seeds`` every submission in the same block of
+    ``common_seed_period`` submissions replays one seed set (CRN per report
+    window), and its spawn streams are pre-rolled once per block.
+
+    Args:
+        max_workers: Worker threads for rollouts
+        state_encoder: State encoder instance
+        action_interface: Action interface instance
+        max_steps: Maximum steps per episode
+        seeds_per_agent: Rollouts per individual
+        use_common_seeds: Share seed sets between individuals (see above)
+        common_seed_period: Submissions per common seed set
+        agent_factory: Optional callable to construct agents for non-vector genomes
+        action_repeat: Physics frames per agent decision
+        base_seed: First seed (None = drawn from ``random``)
+        profile: Time each rollout's hot path (default: AnalyticsConfig.PROFILE_EPISODES)
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        state_encoder: StateEncoder,
+        action_interface: ActionInterface,
+        max_steps: int = 2000,
+        seeds_per_agent: int = 3,
+        use_common_seeds: bool = False,
+        common_seed_period: int = 1,
+        agent_factory: Optional[Callable[[Any, StateEncoder, ActionInterface], Any]] = None,
+        action_repeat: int = 1,
+        base_seed: Optional[int] = None,
+        profile: Optional[bool] = None
+    ):
+        self.max_workers = max_workers
+        self.state_encoder = state_encoder
+        self.action_interface = action_interface
+        self.max_steps = max_steps
+        self.seeds_per_agent = seeds_per_agent
+        self.use_common_seeds = use_common_seeds
+        self.common_seed_period = max(1, common_seed_period)
+        self.agent_factory = agent_factory
+        self.action_repeat = action_repeat
+        self.base_seed = random.randint(0, 2**31 - 1) if base_seed is None else base_seed
+        self.profile = AnalyticsConfig.PROFILE_EPISODES if profile is None else profile
+
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._completed: "queue.Queue[_Submission]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[int, _Submission] = {}
+        self._next_ticket = 0
+        self._schedules: Dict[int, Dict[int, SpawnSchedule]] = {}
+
+    def in_flight(self) -> int:
+        """Individuals submitted but not yet returned by ``next_completed``."""
+        return len(self._in_flight)
+
+    def submit(self, individual: Any, tag: Any = None) -> int:
+        """
+        Queue every rollout of ``individual``.
+
+        Args:
+            individual: Parameter vector or genome
+            tag: Caller data returned with the completion (e.g. a population slot)
+
+        Returns:
+            Ticket number (submission order)
+        """
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        seeds, schedules = self._seeds_for(ticket)
+
+        submission = _Submission(ticket, individual, tag, [], time.perf_counter(), len(seeds))
+        self._in_flight[ticket] = submission
+        for seed in seeds:
+            future = self.executor.submit(
+                _timed_rollout,
+                individual,
+                self.state_encoder,
+                self.action_interface,
+                self.max_steps,
+                random_seed=seed,
+                agent_factory=self.agent_factory,
+                spawn_schedule=schedules.get(seed),
+                action_repeat=self.action_repeat,
+                profile=self.profile
+            )
+            submission.futures.append(future)
+            future.add_done_callback(lambda _f, sub=submission: self._on_rollout_done(sub))
+        return ticket
+
+    def _seeds_for(self, ticket: int) -> Tuple[List[int], Dict[int, SpawnSchedule]]:
+        if not self.use_common_seeds:
+            first = self.base_seed + ticket * self.seeds_per_agent
+            return list(range(first, first + self.seeds_per_agent)), {}
+
+        block = ticket // self.common_seed_period
+        first = self.base_seed + block * self.seeds_per_agent
+        seeds = list(range(first, first + self.seeds_per_agent))
+        if block not in self._schedules:
+            self._schedules[block] = build_spawn_schedules(seeds, max_steps=self.max_steps)
+            # In-flight individuals may still use the previous block's streams
+            for old in [b for b in self._schedules if b < block - 1]:
+                del self._schedules[old]
+        return seeds, self._schedules[block]
+
+    def _on_rollout_done(self, submission: _Submission) -> None:
+        with self._lock:
+            submission.remaining -= 1
+            finished = submission.remaining == 0
+        if finished:
+            self._completed.put(submission)
+
+    def next_completed(self, timeout: Optional[float] = None) -> CompletedEvaluation:
+        """
+        Block until an individual's rollouts have all finished.
+
+        Raises:
+            RuntimeError: If nothing is in flight
+            queue.Empty: If ``timeout`` expires first
+            Exception: Whatever a rollout raised
+        """
+        if not self._in_flight:
+            raise RuntimeError("SteadyStateEvaluator.next_completed() called with nothing in flight")
+        submission = self._completed.get(timeout=timeout)
+        completed_at = time.perf_counter()
+        del self._in_flight[submission.ticket]
+
+        results, rollout_seconds = [], 0.0
+        for future in submission.futures:
+            result, seconds = future.result()
+            results.append(result)
+            rollout_seconds += seconds
+        return CompletedEvaluation(
+            ticket=submission.ticket,
+            individual=submission.individual,
+            tag=submission.tag,
+            results=results,
+            metrics=average_agent_results(results),
+            rollout_seconds=rollout_seconds,
+            submitted_at=submission.submitted_at,
+            completed_at=completed_at
+        )
+
+    def shutdown(self) -> None:
+        """Cancel queued rollouts and release the worker pool."""
+        for submission in self._in_flight.values():
+            for future in submission.futures:
+                future.cancel()
+        self._in_flight.clear()
+        self.executor.shutdown(wait=True)
+
+
+class CompletionWindow:
+    """
+    Groups completed evaluations into report windows of ``size`` evaluations.
+
+    Args:
+        size: Evaluations per window (one analytics "generation")
+        max_workers: Worker count, for the busy ratio
+    """
+
+    def __init__(self, size: int, max_workers: int):
+        self.size = max(1, size)
+        self.max_workers = max(1, max_workers)
+        self.completions: List[CompletedEvaluation] = []
+        self.started_at = time.perf_counter()
+
+    def add(self, completion: CompletedEvaluation) -> None:
+        self.completions.append(completion)
+
+    def full(self) -> bool:
+        return len(self.completions) >= self.size
+
+    def summarize(self) -> Tuple[List[float], Dict, List[Dict], Dict[str, float]]:
+        """
+        Summarize the window like one generation.
+
+        Returns:
+            (fitnesses, aggregated_metrics, per_agent_metrics, timing_stats);
+            the first three match ``evaluate_population_parallel`` output
+        """
+        seeds_per_agent = len(self.completions[0].results)
+        all_results = [result for completion in self.completions for result in completion.results]
+        fitnesses, aggregated, per_agent = aggregate_population_results(
+            all_results, len(self.completions), seeds_per_agent
+        )
+        wall = max(1e-9, time.perf_counter() - self.started_at)
+        rollout_seconds = sum(completion.rollout_seconds for completion in self.completions)
+        latencies = [completion.completed_at - completion.submitted_at for completion in self.completions]
+        timing = {
+            'evaluation_duration': wall,
+            'steady_state_busy_ratio': min(1.0, rollout_seconds / (wall * self.max_workers)),
+            'steady_state_evaluations_per_s': len(self.completions) / wall,
+            'steady_state_avg_latency': sum(latencies) / len(latencies),
+        }
+        return fitnesses, aggregated, per_agent, timing
+
+    def reset(self) -> None:
+        self.completions = []
+        self.started_at = time.perf_counter()
@@ -0,0 +1,100 @@
+"""
+Length-prefixed JSON messages over TCP sockets.
+
+Used by the island migration hub and the remote evaluation workers. Every
+message is a 4-byte big-endian length followed by that many bytes of UTF-8
+JSON. JSON (not pickle) keeps a peer from executing code on the receiver;
+NumPy arrays and scalars are converted to lists/numbers on the way out.
+"""
+
+import json
+import socket
+import struct
+from typing import Any, Optional
+
+import numpy as np
+
+# Upper bound on one message; a larger length prefix means a corrupt stream
+MAX_MESSAGE_BYTES = 256 * 1024 * 1024
+
+_HEADER = struct.Struct(">I")
+
+
+class ProtocolError(ConnectionError):
+    """The peer closed the connection mid-message or sent malformed data."""
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(message: Any) -> str:
+    """JSON text of ``message`` (NumPy values converted)."""
+    return json.dumps(message, default=_to_json, separators=(",", ":"))
+
+
+def encode_message(message: Any) -> bytes:
+    """Serialize ``message`` with its length prefix."""
+    body = dumps(message).encode("utf-8")
+    if len(body) > MAX_MESSAGE_BYTES:
+        raise ValueError(f"Message of {len(body)} bytes exceeds MAX_MESSAGE_BYTES")
+    return _HEADER.pack(len(body)) + body
+
+
+def send_message(sock: socket.socket, message: Any) -> None:
+    """Send one JSON message."""
+    sock.sendall(encode_message(message))
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 1 << 20))
+        if not chunk:
+            if remaining == size:
+                return None
+            raise ProtocolError("Connection closed mid-message")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv_message(sock: socket.socket) -> Any:
+    """
+    Receive one JSON message.
+
+    Returns:
+        The decoded message, or None if the peer closed the connection
+        cleanly between messages
+
+    Raises:
+        ProtocolError: Truncated or malformed message
+    """
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+    (size,) = _HEADER.unpack(header)
+    if size > MAX_MESSAGE_BYTES:
+        raise ProtocolError(f"Message length {size} exceeds MAX_MESSAGE_BYTES")
+    body = _recv_exact(sock, size) if size else b""
+    if body is None:
+        raise ProtocolError("Connection closed mid-message")
+    try:
+        return json.loads(body.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ProtocolError(f"Malformed message: {e}") from e
+
+
+def parse_address(address: str, default_host: str = "127.0.0.1") -> tuple:
+    """Split ``"host:port"`` (or ``":port"``) into ``(host, port)``."""
+    host, _, port = address.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(f"Expected HOST:PORT, got {address!r}")
+    return host or default_host, int(port)
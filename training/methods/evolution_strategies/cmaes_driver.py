@@ -3,9 +3,14 @@ Lightweight CMA-ES driver (diagonal covariance).
 
 Implements CMA-ES-style updates using a diagonal covariance vector to keep
 compute overhead low while still learning correlated step sizes.
+
+Ranking, mean, evolution-path and step-size updates live here; the covariance
+model is isolated behind a few hooks (``_scale_samples``, ``_whiten``,
+``_update_covariance``, ...) so the full-covariance and limited-memory modes
+in ``cmaes_variants.py`` only replace those.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import math
 import time
 import numpy as np
@@ -27,6 +32,9 @@ class CMAESDriver:
       - evolution paths for step-size and covariance adaptation
     """
 
+    # ESConfig.OPTIMIZER value selecting this covariance model
+    MODE = "cmaes"
+
     def __init__(
         self,
         param_size: int,
@@ -41,9 +49,6 @@ class CMAESDriver:
         sigma = ESConfig.CMAES_SIGMA if ESConfig.CMAES_SIGMA is not None else ESConfig.SIGMA
         self.sigma = float(sigma)
 
-        # Diagonal covariance (variance per parameter)
-        self.cov_diag = np.ones(self.param_size, dtype=np.float32)
-
         # Evolution paths
         self.p_sigma = np.zeros(self.param_size, dtype=np.float32)
         self.p_c = np.zeros(self.param_size, dtype=np.float32)
@@ -92,6 +97,9 @@ class CMAESDriver:
         self.last_z: Optional[np.ndarray] = None
         self.last_y: Optional[np.ndarray] = None
 
+        # Covariance model (diagonal: variance per parameter)
+        self._reset_covariance()
+
         self.current_generation = 0
         self.last_update_stats: Dict = {}
         self.last_update_duration: float = 0.0
@@ -123,7 +131,7 @@ class CMAESDriver:
         else:
             z = np.random.randn(n, self.param_size).astype(np.float32)
 
-        y = z * np.sqrt(self.cov_diag)
+        y = self._scale_samples(z)
         x = self.mean + self.sigma * y
 
         self.last_z = z
@@ -174,8 +182,9 @@ class CMAESDriver:
         finite_crowding = [c for c in crowding if math.isfinite(c)]
         best_crowding = float(max(finite_crowding)) if finite_crowding else 0.0
         inf_crowding_count = int(sum(1 for c in crowding if not math.isfinite(c)))
-        cov_dev = np.abs(self.cov_diag - 1.0)
-        cov_std = float(np.std(self.cov_diag))
+        cov_before = self._covariance_diagonal()
+        cov_dev = np.abs(cov_before - 1.0)
+        cov_std = float(np.std(cov_before))
         cov_mean_abs_dev = float(np.mean(cov_dev))
         cov_max_abs_dev = float(np.max(cov_dev))
 
@@ -195,7 +204,7 @@ class CMAESDriver:
         # Step-size adaptation
         self.p_sigma = (1.0 - self.c_sigma) * self.p_sigma + math.sqrt(
             self.c_sigma * (2.0 - self.c_sigma) * self.mu_eff
-        ) * z_w
+        ) * self._whiten(z_w)
 
         norm_p_sigma = float(np.linalg.norm(self.p_sigma))
         h_sigma_cond = norm_p_sigma / math.sqrt(
@@ -208,27 +217,21 @@ class CMAESDriver:
             self.c_c * (2.0 - self.c_c) * self.mu_eff
         ) * y_w
 
-        # Covariance (diagonal) update
-        y_sq = np.sum(weights * (y_sel ** 2), axis=0)
-        self.cov_diag = (
-            (1.0 - self.c1 - self.cmu) * self.cov_diag
-            + self.c1 * (self.p_c ** 2)
-            + self.cmu * y_sq
-        )
-
-        self.cov_diag = np.maximum(self.cov_diag, ESConfig.CMAES_COV_MIN)
+        self._update_covariance(weights, y_sel, z_w)
 
         # Sigma update
         self.sigma = self.sigma * math.exp((self.c_sigma / self.d_sigma) * (norm_p_sigma / self.chi_n - 1.0))
         self.sigma = max(self.sigma, ESConfig.SIGMA_MIN)
 
         # Stats
+        cov_after = self._covariance_diagonal()
         self.last_update_stats = {
+            "cmaes_mode": self.MODE,
             "sigma": float(self.sigma),
             "mean_param_norm": float(np.linalg.norm(self.mean)),
-            "cov_diag_mean": float(np.mean(self.cov_diag)),
-            "cov_diag_min": float(np.min(self.cov_diag)),
-            "cov_diag_max": float(np.max(self.cov_diag)),
+            "cov_diag_mean": float(np.mean(cov_after)),
+            "cov_diag_min": float(np.min(cov_after)),
+            "cov_diag_max": float(np.max(cov_after)),
             "cov_diag_std": cov_std,
             "cov_diag_mean_abs_dev": cov_mean_abs_dev,
             "cov_diag_max_abs_dev": cov_max_abs_dev,
@@ -239,25 +242,69 @@ class CMAESDriver:
             "pareto_front0_size": int(sum(1 for r in front_rank if r == 0)),
             "pareto_best_crowding": best_crowding,
             "pareto_infinite_crowding_count": inf_crowding_count,
+            **self._covariance_stats(),
         }
         self.last_update_duration = time.time() - start_time
 
+    # ------------------------------------------------------------------
+    # Covariance model hooks (diagonal)
+    # ------------------------------------------------------------------
+
+    def _reset_covariance(self) -> None:
+        """Reset the covariance model to the identity."""
+        self.cov_diag = np.ones(self.param_size, dtype=np.float32)
+
+    def _scale_samples(self, z: np.ndarray) -> np.ndarray:
+        """Map standard normal rows z to steps y ~ N(0, C)."""
+        return z * np.sqrt(self.cov_diag)
+
+    def _whiten(self, z_w: np.ndarray) -> np.ndarray:
+        """C^(-1/2) applied to the weighted step, from its z-space representation."""
+        return z_w
+
+    def _update_covariance(self, weights: np.ndarray, y_sel: np.ndarray, z_w: np.ndarray) -> None:
+        """Rank-one (p_c) plus rank-mu update of the covariance model."""
+        y_sq = np.sum(weights * (y_sel ** 2), axis=0)
+        self.cov_diag = (
+            (1.0 - self.c1 - self.cmu) * self.cov_diag
+            + self.c1 * (self.p_c ** 2)
+            + self.cmu * y_sq
+        )
+
+        self.cov_diag = np.maximum(self.cov_diag, ESConfig.CMAES_COV_MIN)
+
+    def _covariance_diagonal(self) -> np.ndarray:
+        """Per-parameter variance, used for the cov_diag_* statistics."""
+        return self.cov_diag
+
+    def _covariance_stats(self) -> Dict[str, Any]:
+        """Mode-specific entries for last_update_stats."""
+        return {}
+
+    def _covariance_state(self) -> Dict[str, Any]:
+        return {"cov_diag": self.cov_diag}
+
+    def _load_covariance_state(self, state: Dict[str, Any]) -> None:
+        self.cov_diag = state["cov_diag"].copy()
+
     def restart(self, mean: Optional[np.ndarray] = None, sigma: Optional[float] = None, reason: str = "stagnation") -> None:
         """Restart CMA-ES state to escape stagnation."""
-        self.mean = mean.copy() if mean is not None else self._initialize_mean()
+        self.mean = np.array(mean) if mean is not None else self._initialize_mean()
         base_sigma = ESConfig.CMAES_SIGMA if ESConfig.CMAES_SIGMA is not None else ESConfig.SIGMA
         self.sigma = float(sigma if sigma is not None else base_sigma)
-        self.cov_diag = np.ones(self.param_size, dtype=np.float32)
+        self._reset_covariance()
         self.p_sigma = np.zeros(self.param_size, dtype=np.float32)
         self.p_c = np.zeros(self.param_size, dtype=np.float32)
         self.current_generation = 0
+        cov = self._covariance_diagonal()
         self.last_update_stats = {
+            "cmaes_mode": self.MODE,
             "sigma": float(self.sigma),
             "mean_param_norm": float(np.linalg.norm(self.mean)),
-            "cov_diag_mean": float(np.mean(self.cov_diag)),
-            "cov_diag_min": float(np.min(self.cov_diag)),
-            "cov_diag_max": float(np.max(self.cov_diag)),
-            "cov_diag_std": float(np.std(self.cov_diag)),
+            "cov_diag_mean": float(np.mean(cov)),
+            "cov_diag_min": float(np.min(cov)),
+            "cov_diag_max": float(np.max(cov)),
+            "cov_diag_std": float(np.std(cov)),
             "cov_diag_mean_abs_dev": 0.0,
             "cov_diag_max_abs_dev": 0.0,
             "cov_lr_scale": float(self.cov_lr_scale),
@@ -266,5 +313,49 @@ class CMAESDriver:
             "restart_reason": reason,
         }
 
+    def pull_mean(self, target: Sequence[float], strength: float) -> float:
+        """
+        Move the mean ``strength`` of the way toward ``target`` (an island
+        immigrant); sigma and covariance are left to adapt.
+
+        Returns:
+            Distance from the old mean to ``target``
+        """
+        direction = np.asarray(target, dtype=self.mean.dtype) - self.mean
+        self.mean = self.mean + strength * direction
+        return float(np.linalg.norm(direction))
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Distribution state for checkpointing (strategy constants are rebuilt from config)."""
+        return {
+            "mode": self.MODE,
+            "mean": self.mean,
+            "sigma": self.sigma,
+            "p_sigma": self.p_sigma,
+            "p_c": self.p_c,
+            "current_generation": self.current_generation,
+            "last_update_stats": dict(self.last_update_stats),
+            "last_update_duration": self.last_update_duration,
+            **self._covariance_state(),
+        }
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """Restore state written by state_dict()."""
+        mode = state.get("mode", "cmaes")
+        if mode != self.MODE:
+            raise ValueError(f"Checkpoint was written by CMA-ES mode '{mode}', driver is '{self.MODE}'")
+        if state["mean"].shape != (self.param_size,):
+            raise ValueError(f"Checkpoint mean shape {state['mean'].shape} does not match ({self.param_size},)")
+        self.mean = state["mean"].copy()
+        self.sigma = float(state["sigma"])
+        self._load_covariance_state(state)
+        self.p_sigma = state["p_sigma"].copy()
+        self.p_c = state["p_c"].copy()
+        self.current_generation = int(state["current_generation"])
+        self.last_update_stats = dict(state.get("last_update_stats", {}))
+        self.last_update_duration = state.get("last_update_duration", 0.0)
+        self.last_z = None
+        self.last_y = None
+
     def get_mean_as_list(self) -> List[float]:
         return self.mean.tolist()
@@ -0,0 +1,197 @@
+"""
+Full-covariance and limited-memory CMA-ES modes.
+
+Both reuse ``CMAESDriver``'s ranking, mean, evolution-path and step-size
+updates and only swap the covariance model:
+
+  - ``FullCMAESDriver`` ("cmaes_full") keeps the dense n x n covariance and
+    refreshes its eigendecomposition lazily, every
+    ``ESConfig.CMAES_EIGEN_INTERVAL`` generations. Samples for the whole
+    population are one matrix product with the cached ``B * D`` factor.
+    Memory is O(n^2) and a refresh is O(n^3).
+  - ``LMCMAESDriver`` ("cmaes_lm") follows LM-MA-ES (Loshchilov et al., 2017).
+    It keeps m direction vectors, each an evolution path with its own
+    learning rate. A step is the standard normal sample pushed through m
+    rank-one transforms. Memory and per-sample cost are O(m n), with
+    m = 4 + 3 ln n by default.
+
+``create_cmaes_driver`` picks the mode from ``ESConfig.OPTIMIZER``.
+"""
+
+import math
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from training.config.evolution_strategies import ESConfig
+from training.config.pareto import ParetoConfig
+from training.methods.evolution_strategies.cmaes_driver import CMAESDriver
+
+
+class FullCMAESDriver(CMAESDriver):
+    """CMA-ES with a dense covariance matrix and lazy eigendecomposition."""
+
+    MODE = "cmaes_full"
+
+    def _eigen_interval(self) -> int:
+        if ESConfig.CMAES_EIGEN_INTERVAL is not None:
+            return max(1, int(ESConfig.CMAES_EIGEN_INTERVAL))
+        # Hansen's lazy-update gap, converted from evaluations to generations
+        rate = max(self.c1 + self.cmu, 1e-12)
+        return max(1, int(1.0 / (10.0 * self.param_size * rate)))
+
+    def _reset_covariance(self) -> None:
+        n = self.param_size
+        self.cov = np.eye(n, dtype=np.float64)
+        self.eigen_basis = np.eye(n, dtype=np.float64)
+        self.eigen_scale = np.ones(n, dtype=np.float64)
+        self._sample_transform = np.eye(n, dtype=np.float64)  # B * D, applied to row samples
+        self.eigen_generation = 0
+        self.eigen_updates = 0
+        self.last_eigen_duration = 0.0
+
+    def _refresh_eigensystem(self) -> None:
+        start_time = time.perf_counter()
+        self.cov = (self.cov + self.cov.T) * 0.5
+        eigenvalues, basis = np.linalg.eigh(self.cov)
+        eigenvalues = np.maximum(eigenvalues, ESConfig.CMAES_COV_MIN)
+        self.eigen_basis = basis
+        self.eigen_scale = np.sqrt(eigenvalues)
+        self._sample_transform = basis * self.eigen_scale
+        self.eigen_generation = self.current_generation
+        self.eigen_updates += 1
+        self.last_eigen_duration = time.perf_counter() - start_time
+
+    def _scale_samples(self, z: np.ndarray) -> np.ndarray:
+        # y = B D z for every row at once
+        return z @ self._sample_transform.T
+
+    def _whiten(self, z_w: np.ndarray) -> np.ndarray:
+        # C^(-1/2) B D z = B z under the eigensystem the samples were drawn with
+        return self.eigen_basis @ z_w
+
+    def _update_covariance(self, weights: np.ndarray, y_sel: np.ndarray, z_w: np.ndarray) -> None:
+        weighted = y_sel * weights
+        self.cov = (
+            (1.0 - self.c1 - self.cmu) * self.cov
+            + self.c1 * np.outer(self.p_c, self.p_c)
+            + self.cmu * (weighted.T @ y_sel)
+        )
+        if self.current_generation - self.eigen_generation >= self._eigen_interval():
+            self._refresh_eigensystem()
+
+    def _covariance_diagonal(self) -> np.ndarray:
+        return np.diag(self.cov)
+
+    def _covariance_stats(self) -> Dict[str, Any]:
+        return {
+            "eigen_updates": self.eigen_updates,
+            "eigen_age": self.current_generation - self.eigen_generation,
+            "eigen_duration": self.last_eigen_duration,
+            "condition_number": float((self.eigen_scale.max() / self.eigen_scale.min()) ** 2),
+        }
+
+    def _covariance_state(self) -> Dict[str, Any]:
+        return {
+            "cov": self.cov,
+            "eigen_basis": self.eigen_basis,
+            "eigen_scale": self.eigen_scale,
+            "eigen_generation": self.eigen_generation,
+            "eigen_updates": self.eigen_updates,
+        }
+
+    def _load_covariance_state(self, state: Dict[str, Any]) -> None:
+        self.cov = state["cov"].copy()
+        self.eigen_basis = state["eigen_basis"].copy()
+        self.eigen_scale = state["eigen_scale"].copy()
+        self._sample_transform = self.eigen_basis * self.eigen_scale
+        self.eigen_generation = int(state["eigen_generation"])
+        self.eigen_updates = int(state["eigen_updates"])
+
+
+class LMCMAESDriver(CMAESDriver):
+    """Limited-memory CMA-ES (LM-MA-ES style rank-m transform)."""
+
+    MODE = "cmaes_lm"
+
+    def _reset_covariance(self) -> None:
+        n = self.param_size
+        memory = ESConfig.CMAES_LM_MEMORY
+        if memory is None:
+            memory = 4 + int(3 * math.log(n))
+        self.memory_size = max(1, min(int(memory), n))
+
+        j = np.arange(self.memory_size, dtype=np.float64)
+        # Older directions adapt and act more slowly (c_d: 1.5^-j, c_c: 4^-j)
+        self.direction_rates = 1.0 / (1.5 ** j * n)
+        self.path_rates = np.minimum(1.0, self.pop_size / (4.0 ** j * n))
+        self.directions = np.zeros((self.memory_size, n), dtype=np.float64)
+        self.directions_used = 0
+
+    def _scale_samples(self, z: np.ndarray) -> np.ndarray:
+        d = z.astype(np.float64)
+        for j in range(self.directions_used):
+            m_j = self.directions[j]
+            c_d = self.direction_rates[j]
+            d = (1.0 - c_d) * d + c_d * np.outer(d @ m_j, m_j)
+        return d
+
+    def _update_covariance(self, weights: np.ndarray, y_sel: np.ndarray, z_w: np.ndarray) -> None:
+        scale = np.sqrt(self.mu_eff * self.path_rates * (2.0 - self.path_rates))
+        self.directions = (1.0 - self.path_rates)[:, None] * self.directions + scale[:, None] * z_w[None, :]
+        self.directions_used = min(self.directions_used + 1, self.memory_size)
+
+    def _covariance_diagonal(self) -> np.ndarray:
+        # The implied covariance is never formed; report the sampled second moment
+        if self.last_y is None:
+            return np.ones(self.param_size, dtype=np.float64)
+        return np.mean(self.last_y ** 2, axis=0)
+
+    def _covariance_stats(self) -> Dict[str, Any]:
+        norms = np.linalg.norm(self.directions[:self.directions_used], axis=1)
+        return {
+            "lm_memory_size": self.memory_size,
+            "lm_directions_used": self.directions_used,
+            "lm_direction_norm_max": float(norms.max()) if norms.size else 0.0,
+        }
+
+    def _covariance_state(self) -> Dict[str, Any]:
+        return {
+            "directions": self.directions,
+            "directions_used": self.directions_used,
+        }
+
+    def _load_covariance_state(self, state: Dict[str, Any]) -> None:
+        if state["directions"].shape != self.directions.shape:
+            raise ValueError(
+                f"Checkpoint LM memory {state['directions'].shape} does not match {self.directions.shape}"
+            )
+        self.directions = state["directions"].copy()
+        self.directions_used = int(state["directions_used"])
+
+
+CMAES_DRIVERS = {
+    CMAESDriver.MODE: CMAESDriver,
+    FullCMAESDriver.MODE: FullCMAESDriver,
+    LMCMAESDriver.MODE: LMCMAESDriver,
+}
+
+
+def create_cmaes_driver(
+    param_size: int,
+    optimizer: Optional[str] = None,
+    pareto_config: Optional[ParetoConfig] = None
+) -> CMAESDriver:
+    """
+    Build the CMA-ES driver selected by ``optimizer`` (default ``ESConfig.OPTIMIZER``).
+
+    Raises:
+        ValueError: If the optimizer is not one of the CMA-ES modes
+    """
+    optimizer = optimizer or ESConfig.OPTIMIZER
+    if optimizer not in CMAES_DRIVERS:
+        raise ValueError(
+            f"Unknown ES optimizer '{optimizer}'; expected one of {sorted(CMAES_DRIVERS)}"
+        )
+    return CMAES_DRIVERS[optimizer](param_size=param_size, pareto_config=pareto_config)
@@ -8,16 +8,18 @@ This module implements the core ES algorithm logic, including:
 - AdamW optimizer for stable updates
 - Elitism to prevent forgetting good solutions
 - Adaptive sigma decay based on stagnation
+- Optional shared noise table (seed-only candidates, see noise_table.py)
 """
 
 import time
 import random
 import math
-from typing import List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Tuple, Optional
 import numpy as np
 
 from training.config.evolution_strategies import ESConfig
 from training.methods.evolution_strategies.fitness_shaping import rank_transformation, compute_centered_ranks
+from training.methods.evolution_strategies.noise_table import NoiseCandidate, NoiseCenter, get_noise_table
 from training.components.archive import BehaviorArchive
 from training.components.novelty import compute_population_novelty
 from training.config.novelty import NoveltyConfig
@@ -75,6 +77,13 @@ class ESDriver:
 
         # Noise vectors from last sampling (needed for gradient computation)
         self.last_noise_vectors: Optional[np.ndarray] = None
+
+        # Shared noise table mode: the last sampling as table offsets and signs
+        self.noise_table = None
+        if ESConfig.USE_NOISE_TABLE:
+            self.noise_table = get_noise_table(ESConfig.NOISE_TABLE_SIZE, ESConfig.NOISE_TABLE_SEED)
+        self.last_noise_offsets: Optional[np.ndarray] = None
+        self.last_noise_signs: Optional[np.ndarray] = None
         self.elite_index: Optional[int] = None  # Index of elite in candidates if injected
 
         # Statistics tracking
@@ -86,7 +95,8 @@ class ESDriver:
             self.behavior_archive = BehaviorArchive(
                 max_size=self.novelty_config.archive_max_size,
                 novelty_threshold=self.novelty_config.archive_novelty_threshold,
-                k_nearest=self.novelty_config.k_nearest
+                k_nearest=self.novelty_config.k_nearest,
+                index_min_size=self.novelty_config.archive_index_min_size
             )
         else:
             self.behavior_archive = None
@@ -115,9 +125,16 @@ class ESDriver:
             Tuple of:
                 - List of candidate parameter vectors (as List[float])
                 - NumPy array of noise vectors used (for gradient computation)
+
+            With ESConfig.USE_NOISE_TABLE the candidates are NoiseCandidate
+            descriptors (the elite stays a List[float]) and the noise array is
+            None; evaluators rebuild parameters with ``materialize()``.
         """
         n = ESConfig.POPULATION_SIZE
         self.elite_index = None
+        self.last_noise_vectors = None
+        self.last_noise_offsets = None
+        self.last_noise_signs = None
 
         # Determine if we should inject elite this generation
         inject_elite = (
@@ -129,6 +146,9 @@ class ESDriver:
         # Adjust n to make room for elite if needed
         n_samples = n - 1 if inject_elite else n
 
+        if self.noise_table is not None:
+            return self._sample_from_table(n_samples, inject_elite)
+
         if ESConfig.USE_ANTITHETIC:
             # Generate half the noise vectors, use both + and -
             half_n = n_samples // 2
@@ -164,10 +184,100 @@ class ESDriver:
 
         return candidates, noise
 
+    def _sample_from_table(self, n_samples: int, inject_elite: bool) -> Tuple[List, None]:
+        """Sample seed-only candidates as (offset, sign) pairs into the noise table."""
+        if ESConfig.USE_ANTITHETIC:
+            half_n = n_samples // 2
+            base = self.noise_table.sample_offsets(half_n, self.param_size)
+            offsets = np.concatenate([base, base])
+            signs = np.concatenate([np.ones(half_n), -np.ones(half_n)])
+            if n_samples % 2 == 1:
+                offsets = np.append(offsets, self.noise_table.sample_offsets(1, self.param_size))
+                signs = np.append(signs, 1.0)
+        else:
+            offsets = self.noise_table.sample_offsets(n_samples, self.param_size)
+            signs = np.ones(n_samples)
+
+        center = NoiseCenter(
+            mean=self.mean.copy(),
+            sigma=self.sigma,
+            table_size=self.noise_table.size,
+            table_seed=self.noise_table.seed
+        )
+        candidates: List = [
+            NoiseCandidate(center, int(offset), float(sign))
+            for offset, sign in zip(offsets.tolist(), signs.tolist())
+        ]
+
+        if inject_elite:
+            # The elite is not a perturbation: sign 0 keeps it out of the gradient
+            self.elite_index = len(candidates)
+            candidates.append(self.best_ever_candidate.tolist())
+            offsets = np.append(offsets, 0)
+            signs = np.append(signs, 0.0)
+
+        self.last_noise_offsets = offsets.astype(np.int64)
+        self.last_noise_signs = signs.astype(np.float64)
+        return candidates, None
+
+    def _noise_vector(self, index: int) -> np.ndarray:
+        """Noise of candidate ``index`` from the last sampling."""
+        if self.last_noise_vectors is not None:
+            return self.last_noise_vectors[index]
+        offset = int(self.last_noise_offsets[index])
+        return self.last_noise_signs[index] * self.noise_table.get(offset, self.param_size)
+
     def get_mean_as_list(self) -> List[float]:
         """Get the current mean parameter vector as a list."""
         return self.mean.tolist()
 
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Distribution, optimizer and elitism state for checkpointing.
+
+        Noise from the last sampling is not included; a resumed run samples
+        the next generation again from the restored RNG state.
+        """
+        return {
+            'mean': self.mean,
+            'sigma': self.sigma,
+            'adam_m': self.adam_m,
+            'adam_v': self.adam_v,
+            'adam_t': self.adam_t,
+            'best_ever_candidate': self.best_ever_candidate,
+            'best_ever_fitness': self.best_ever_fitness,
+            'best_ever_generation': self.best_ever_generation,
+            'generations_since_improvement': self.generations_since_improvement,
+            'current_generation': self.current_generation,
+            'last_update_stats': dict(self.last_update_stats),
+            'last_update_duration': self.last_update_duration,
+            'behavior_archive': self.behavior_archive.state_dict() if self.behavior_archive is not None else None,
+        }
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """Restore state written by state_dict()."""
+        if state['mean'].shape != (self.param_size,):
+            raise ValueError(f"Checkpoint mean shape {state['mean'].shape} does not match ({self.param_size},)")
+        self.mean = state['mean'].copy()
+        self.sigma = state['sigma']
+        self.adam_m = state['adam_m'].copy()
+        self.adam_v = state['adam_v'].copy()
+        self.adam_t = int(state['adam_t'])
+        best = state['best_ever_candidate']
+        self.best_ever_candidate = best.copy() if best is not None else None
+        self.best_ever_fitness = state['best_ever_fitness']
+        self.best_ever_generation = state['best_ever_generation']
+        self.generations_since_improvement = state['generations_since_improvement']
+        self.current_generation = state['current_generation']
+        self.last_update_stats = dict(state.get('last_update_stats', {}))
+        self.last_update_duration = state.get('last_update_duration', 0.0)
+        self.last_noise_vectors = None
+        self.last_noise_offsets = None
+        self.last_noise_signs = None
+        self.elite_index = None
+        if self.behavior_archive is not None and state.get('behavior_archive') is not None:
+            self.behavior_archive.load_state_dict(state['behavior_archive'])
+
     def get_best_ever_as_list(self) -> Optional[List[float]]:
         """Get the best-ever candidate parameter vector as a list."""
         if self.best_ever_candidate is not None:
@@ -191,7 +301,7 @@ class ESDriver:
         start_time = time.time()
         self.current_generation += 1
 
-        if self.last_noise_vectors is None:
+        if self.last_noise_vectors is None and self.last_noise_offsets is None:
             raise RuntimeError("Must call sample_population() before update()")
 
         fitnesses_array = np.array(fitnesses, dtype=np.float32)
@@ -210,7 +320,7 @@ class ESDriver:
             else:
                 # Store the actual candidate that achieved this fitness
                 self.best_ever_candidate = (
-                    self.mean + self.sigma * self.last_noise_vectors[best_idx]
+                    self.mean + self.sigma * self._noise_vector(best_idx)
                 ).copy()
             self.best_ever_generation = self.current_generation
             self.generations_since_improvement = 0
@@ -223,15 +333,13 @@ class ESDriver:
 
         # Exclude elite from gradient computation if it was injected
         # (elite is not a perturbation of the mean, so it shouldn't contribute to gradient)
+        mask = np.ones(n, dtype=bool)
         if self.elite_index is not None:
-            mask = np.ones(n, dtype=bool)
             mask[self.elite_index] = False
             grad_fitnesses = fitnesses_array[mask]
-            grad_noise = self.last_noise_vectors[mask]
             n_grad = n - 1
         else:
             grad_fitnesses = fitnesses_array
-            grad_noise = self.last_noise_vectors
             n_grad = n
 
         # Apply fitness shaping (rank transformation)
@@ -248,7 +356,14 @@ class ESDriver:
 
         # Compute gradient estimate
         # grad = (1 / (n * sigma)) * sum(utility_i * noise_i)
-        gradient = np.dot(utilities, grad_noise) / (n_grad * self.sigma)
+        if self.last_noise_vectors is not None:
+            gradient = np.dot(utilities, self.last_noise_vectors[mask]) / (n_grad * self.sigma)
+        else:
+            # Table mode: gather noise rows by offset instead of holding a noise matrix
+            coefficients = np.asarray(utilities, dtype=np.float64) * self.last_noise_signs[mask]
+            gradient = self.noise_table.weighted_sum(
+                self.last_noise_offsets[mask], coefficients, self.param_size
+            ) / (n_grad * self.sigma)
 
         # Update mean using AdamW or vanilla SGD
         if ESConfig.USE_ADAMW:
@@ -280,6 +395,8 @@ class ESDriver:
 
         # Clear noise vectors
         self.last_noise_vectors = None
+        self.last_noise_offsets = None
+        self.last_noise_signs = None
         self.elite_index = None
 
     def _sgd_update(self, gradient: np.ndarray) -> None:
@@ -380,8 +497,9 @@ class ESDriver:
             behavior_vectors = [m.get('behavior_vector', [0.0] * 11) for m in per_agent_metrics]
             novelty_scores = compute_population_novelty(
                 behavior_vectors,
-                self.behavior_archive.get_behaviors(),
-                self.novelty_config.k_nearest
+                self.behavior_archive.get_matrix(),
+                self.novelty_config.k_nearest,
+                archive_index=self.behavior_archive.get_index()
             )
             self.behavior_archive.add_batch(behavior_vectors, novelty_scores)
 
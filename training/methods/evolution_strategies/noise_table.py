@@ -0,0 +1,102 @@
+"""
+Shared noise table for Evolution Strategies (OpenAI-ES style).
+
+Instead of materializing a [population, params] noise matrix and shipping a
+full parameter list per candidate, every process builds the same large block
+of Gaussian noise from a fixed seed. A candidate is then just
+``(offset, sign)`` plus a reference to the generation's mean/sigma, and
+evaluators rebuild its parameters locally with ``materialize()``. The driver
+computes the gradient from offsets too, so only scalar fitness flows back.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Offsets per gradient chunk: bounds the temporary [chunk, params] copy.
+_GRADIENT_CHUNK = 256
+
+_TABLES: Dict[Tuple[int, int], "SharedNoiseTable"] = {}
+_TABLES_LOCK = threading.Lock()
+
+
+class SharedNoiseTable:
+    """
+    Read-only block of standard normal float32 noise.
+
+    Args:
+        size: Number of float32 values in the table
+        seed: Seed that makes the table identical in every process
+    """
+
+    def __init__(self, size: int, seed: int):
+        self.size = int(size)
+        self.seed = int(seed)
+        self.noise = np.random.RandomState(self.seed).randn(self.size).astype(np.float32)
+        self.noise.flags.writeable = False
+
+    def get(self, offset: int, dim: int) -> np.ndarray:
+        """Return the noise vector starting at ``offset`` (a read-only view)."""
+        return self.noise[offset:offset + dim]
+
+    def sample_offsets(self, count: int, dim: int) -> np.ndarray:
+        """Draw ``count`` valid offsets from NumPy's global RNG."""
+        if dim > self.size:
+            raise ValueError(f"Noise table of size {self.size} is smaller than the parameter count {dim}")
+        return np.random.randint(0, self.size - dim + 1, size=count).astype(np.int64)
+
+    def weighted_sum(self, offsets: np.ndarray, coefficients: np.ndarray, dim: int) -> np.ndarray:
+        """
+        Compute sum_i coefficients[i] * table[offsets[i]:offsets[i] + dim].
+
+        Rows are gathered in chunks so large populations never build the full
+        [population, params] matrix.
+        """
+        windows = np.lib.stride_tricks.sliding_window_view(self.noise, dim)
+        total = np.zeros(dim, dtype=np.float64)
+        for start in range(0, len(offsets), _GRADIENT_CHUNK):
+            block = windows[offsets[start:start + _GRADIENT_CHUNK]]
+            total += np.asarray(coefficients[start:start + _GRADIENT_CHUNK], dtype=np.float64) @ block
+        return total
+
+
+def get_noise_table(size: int, seed: int) -> SharedNoiseTable:
+    """Return this process's table for (size, seed), building it on first use."""
+    key = (int(size), int(seed))
+    table = _TABLES.get(key)
+    if table is None:
+        with _TABLES_LOCK:
+            table = _TABLES.get(key)
+            if table is None:
+                table = SharedNoiseTable(size, seed)
+                _TABLES[key] = table
+    return table
+
+
+@dataclass(frozen=True)
+class NoiseCenter:
+    """Mean snapshot and step size shared by every candidate of a generation."""
+    mean: np.ndarray
+    sigma: float
+    table_size: int
+    table_seed: int
+
+
+@dataclass(frozen=True)
+class NoiseCandidate:
+    """
+    Seed-only ES candidate: ``center.mean + center.sigma * sign * table[offset:offset + n]``.
+
+    Evaluators call ``materialize()`` to rebuild the parameter vector locally.
+    """
+    center: NoiseCenter
+    offset: int
+    sign: float
+
+    def materialize(self) -> List[float]:
+        center = self.center
+        table = get_noise_table(center.table_size, center.table_seed)
+        noise = table.get(self.offset, len(center.mean))
+        return (center.mean + center.sigma * (self.sign * noise)).tolist()
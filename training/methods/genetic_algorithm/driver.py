@@ -1,34 +1,58 @@
 import random
 import time
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Sequence
+import numpy as np
 from training.config.genetic_algorithm import GAConfig
 from training.config.novelty import NoveltyConfig
 from training.methods.genetic_algorithm.operators import GAGeneticOperators
-from training.methods.genetic_algorithm.selection import tournament_selection
+from training.methods.genetic_algorithm.selection import tournament_selection_indices
 from training.components.archive import BehaviorArchive
-from training.components.novelty import compute_population_novelty
+from training.components.novelty import compute_behavior_novelty, compute_population_novelty
 from training.components.selection import compute_selection_score
 
 class GADriver:
     """
     Manages the Genetic Algorithm population and evolution process.
+
+    The population is a single ``[population_size, param_size]`` float64 array;
+    selection, crossover and mutation are array operations driven by one seeded
+    ``numpy.random.Generator``.
+
+    ``evolve`` replaces the whole population per generation. Steady-state
+    training instead calls ``start_steady_state`` once and then breeds and
+    inserts one offspring at a time (``breed_offspring``/``insert_offspring``).
     """
     def __init__(self, param_size: int, novelty_config: Optional[NoveltyConfig] = None):
         self.param_size = param_size
         self.population_size = GAConfig.POPULATION_SIZE
 
+        seed = GAConfig.RNG_SEED
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.rng = np.random.default_rng(seed)
+
         self.operators = GAGeneticOperators(
             mutation_probability=GAConfig.MUTATION_PROBABILITY,
             crossover_probability=GAConfig.CROSSOVER_PROBABILITY,
             mutation_gaussian_sigma=GAConfig.MUTATION_GAUSSIAN_SIGMA,
             mutation_uniform_low=GAConfig.MUTATION_UNIFORM_LOW,
             mutation_uniform_high=GAConfig.MUTATION_UNIFORM_HIGH,
-            crossover_alpha=GAConfig.CROSSOVER_ALPHA
+            crossover_alpha=GAConfig.CROSSOVER_ALPHA,
+            rng=self.rng
         )
 
         self.population = self._initialize_population()
         self.last_evolution_stats = {}
         self.last_evolution_duration = 0.0
+        # Per member, the index of its parent in the previous population
+        # (-1 = none); lets the evaluator schedule rollouts by expected length
+        self.parent_indices: Optional[List[int]] = None
+
+        # Steady-state bookkeeping (None until start_steady_state)
+        self.fitnesses: Optional[np.ndarray] = None
+        self.selection_scores: Optional[np.ndarray] = None
+        self.behaviors: Optional[List[Optional[List[float]]]] = None
+        self._window_stats: Dict[str, float] = {}
 
         # Novelty and diversity configuration
         self.novelty_config = novelty_config or NoveltyConfig()
@@ -37,17 +61,20 @@ class GADriver:
         self.behavior_archive = BehaviorArchive(
             max_size=self.novelty_config.archive_max_size,
             novelty_threshold=self.novelty_config.archive_novelty_threshold,
-            k_nearest=self.novelty_config.k_nearest
+            k_nearest=self.novelty_config.k_nearest,
+            index_min_size=self.novelty_config.archive_index_min_size
         )
 
-    def _initialize_population(self) -> List[List[float]]:
-        return [
-            [random.uniform(
-                GAConfig.MUTATION_UNIFORM_LOW,
-                GAConfig.MUTATION_UNIFORM_HIGH
-            ) for _ in range(self.param_size)]
-            for _ in range(self.population_size)
-        ]
+    def _initialize_population(self) -> np.ndarray:
+        return self.rng.uniform(
+            GAConfig.MUTATION_UNIFORM_LOW,
+            GAConfig.MUTATION_UNIFORM_HIGH,
+            size=(self.population_size, self.param_size)
+        )
+
+    def get_population_as_lists(self) -> List[List[float]]:
+        """Population rows as Python lists (what the evaluators and NNAgent consume)."""
+        return self.population.tolist()
 
     def evolve(
         self,
@@ -76,57 +103,59 @@ class GADriver:
         selection_scores = self._compute_selection_scores(fitnesses, per_agent_metrics)
 
         # Tournament selection using combined selection scores
-        parents = tournament_selection(self.population, selection_scores)
-        
-        # Create offspring through crossover
-        offspring = []
-        while len(offspring) < self.population_size:
-            if len(parents) >= 2:
-                parent1 = random.choice(parents).copy()
-                parent2 = random.choice(parents).copy()
-                
-                if random.random() < self.operators.crossover_probability:
-                    result = self.operators.crossover_blend(parent1, parent2)
-                    crossover_count += 1
-                    if isinstance(result, tuple) and len(result) == 2:
-                        child1 = list(result[0])
-                        child2 = list(result[1])
-                        offspring.extend([child1, child2])
-                    else:
-                        offspring.extend([parent1, parent2])
-                else:
-                    offspring.extend([parent1, parent2])
-            else:
-                offspring.append(random.choice(parents).copy())
-        
+        selected = tournament_selection_indices(selection_scores, rng=self.rng)
+        parents = self.population[selected]
+
+        # Create offspring through crossover: random parent pairs, each pair
+        # crossed with probability crossover_probability, else copied
+        if len(parents) >= 2:
+            num_pairs = (self.population_size + 1) // 2
+            pairs = self.rng.integers(0, len(parents), size=(num_pairs, 2))
+            parent1 = parents[pairs[:, 0]]
+            parent2 = parents[pairs[:, 1]]
+            crossed = self.rng.random(num_pairs) < self.operators.crossover_probability
+            child1, child2 = self.operators.crossover_blend_batch(parent1, parent2)
+            child1 = np.where(crossed[:, None], child1, parent1)
+            child2 = np.where(crossed[:, None], child2, parent2)
+            crossover_count = int(crossed.sum())
+
+            offspring = np.empty((2 * num_pairs, self.param_size), dtype=np.float64)
+            offspring[0::2] = child1
+            offspring[1::2] = child2
+            # Row 2k descends from pair k's first parent, row 2k + 1 from its second
+            offspring_parents = selected[pairs].reshape(-1)
+        else:
+            picks = self.rng.integers(0, len(parents), size=self.population_size)
+            offspring = parents[picks]
+            offspring_parents = selected[picks]
+
         # Trim offspring to correct size
         offspring = offspring[:self.population_size]
-        
+
         # Apply mutation to ALL offspring
-        for i, child in enumerate(offspring):
-            mutated = self.operators.mutate_gaussian(child)
-            mutation_count += 1
-            if isinstance(mutated, tuple) and len(mutated) > 0:
-                offspring[i] = list(mutated[0])
-        
-        # Elitism
-        sorted_pop = sorted(zip(self.population, fitnesses), key=lambda x: x[1], reverse=True)
-        elite_count = max(2, self.population_size // 10)  # 10% elitism
-        elite = [ind.copy() for ind, fit in sorted_pop[:elite_count]]
-
-        # Preserve all-time best if not stagnant too long
+        offspring = self.operators.mutate_gaussian_batch(offspring)
+        mutation_count = len(offspring)
+
+        # Elitism (stable sort: ties keep population order)
+        order = np.argsort(-np.asarray(fitnesses, dtype=np.float64), kind='stable')
+        elite_count = min(max(2, self.population_size // 10), self.population_size)  # 10% elitism
+        elite = self.population[order[:elite_count]].copy()
+        elite_parents = order[:elite_count].copy()
+
+        # Preserve all-time best if not stagnant too long. The best is an exact
+        # copy of an earlier member, so elite rows are compared by their bytes.
         if best_individual is not None and stagnation < 30:
-            best_in_elite = any(
-                all(abs(a - b) < 1e-9 for a, b in zip(best_individual, ind))
-                for ind in elite
-            )
-            if not best_in_elite:
-                elite[-1] = best_individual.copy()
+            best = np.asarray(best_individual, dtype=np.float64)
+            if best.tobytes() not in {row.tobytes() for row in elite}:
+                elite[-1] = best
+                elite_parents[-1] = -1
 
         # New population: elite + best offspring
-        self.population = elite + offspring[:self.population_size - len(elite)]
-        self.population = self.population[:self.population_size]
-        
+        self.population = np.concatenate([elite, offspring[:self.population_size - len(elite)]])
+        self.parent_indices = np.concatenate(
+            [elite_parents, offspring_parents[:self.population_size - len(elite)]]
+        ).tolist()
+
         self.last_evolution_duration = time.time() - start_time
         self.last_evolution_stats = {
             'crossover_events': crossover_count,
@@ -134,6 +163,204 @@ class GADriver:
             'elite_count': len(elite)
         }
     
+    def replace_members(self, slots: Sequence[int], individuals: Sequence[Sequence[float]]) -> None:
+        """Overwrite ``population[slots[k]]`` with ``individuals[k]`` (island immigrants)."""
+        for slot, individual in zip(slots, individuals):
+            row = np.asarray(individual, dtype=np.float64)
+            if row.shape != (self.param_size,):
+                raise ValueError(f"Immigrant has shape {row.shape}, expected ({self.param_size},)")
+            self.population[slot] = row
+
+    def start_steady_state(self) -> None:
+        """
+        Switch to steady-state bookkeeping.
+
+        Every member starts unevaluated; ``record_evaluation`` fills in its
+        fitness once its first evaluation completes.
+        """
+        self.fitnesses = np.full(self.population_size, np.nan)
+        self.selection_scores = np.full(self.population_size, np.nan)
+        self.behaviors = [None] * self.population_size
+        self._reset_window_stats()
+
+    def unevaluated_slots(self) -> List[int]:
+        """Population slots still waiting for their first evaluation."""
+        return np.flatnonzero(np.isnan(self.fitnesses)).tolist()
+
+    def evaluated_count(self) -> int:
+        """Members with a fitness (offspring can be bred once this is > 0)."""
+        return int(np.count_nonzero(~np.isnan(self.fitnesses)))
+
+    def record_evaluation(self, slot: int, fitness: float, metrics: Dict) -> None:
+        """
+        Store the evaluation of the member in ``slot``.
+
+        Args:
+            slot: Population index
+            fitness: Averaged fitness
+            metrics: Per-agent metrics (behavior_vector, reward_diversity)
+        """
+        start_time = time.time()
+        self.selection_scores[slot] = self._steady_state_score(slot, fitness, metrics)
+        self.fitnesses[slot] = fitness
+        self.behaviors[slot] = metrics.get('behavior_vector')
+        self._window_stats['duration'] += time.time() - start_time
+
+    def breed_offspring(self) -> np.ndarray:
+        """
+        Breed one offspring from the evaluated members.
+
+        Two tournaments on the selection scores pick the parents, which are
+        blend-crossed with ``crossover_probability`` (else the first is
+        copied); the child is then mutated, as in ``evolve``.
+
+        Returns:
+            Offspring parameter vector
+        """
+        start_time = time.time()
+        evaluated = np.flatnonzero(~np.isnan(self.fitnesses))
+        if not evaluated.size:
+            raise RuntimeError("breed_offspring() needs at least one evaluated member")
+        winners = evaluated[tournament_selection_indices(
+            self.selection_scores[evaluated], num_selected=2, rng=self.rng
+        )]
+        child = self.population[winners[0]].copy()
+        if evaluated.size >= 2 and self.rng.random() < self.operators.crossover_probability:
+            child1, _ = self.operators.crossover_blend_batch(
+                self.population[winners[:1]], self.population[winners[1:]]
+            )
+            child = child1[0]
+            self._window_stats['crossover_events'] += 1
+        child = self.operators.mutate_gaussian_batch(child[None, :])[0]
+        self._window_stats['mutation_events'] += 1
+        self._window_stats['duration'] += time.time() - start_time
+        return child
+
+    def insert_offspring(self, child: np.ndarray, fitness: float, metrics: Dict) -> int:
+        """
+        Replace a member with an evaluated offspring.
+
+        The member to replace loses an inverse tournament on raw fitness among
+        the evaluated members; the current best is never replaced, so the
+        population always holds the best individual found so far.
+
+        Returns:
+            The replaced population slot
+        """
+        start_time = time.time()
+        evaluated = np.flatnonzero(~np.isnan(self.fitnesses))
+        best = evaluated[np.argmax(self.fitnesses[evaluated])]
+        candidates = evaluated[evaluated != best] if evaluated.size > 1 else evaluated
+        loser = tournament_selection_indices(
+            -self.fitnesses[candidates],
+            tournament_size=GAConfig.STEADY_STATE_REPLACE_TOURNAMENT,
+            num_selected=1,
+            rng=self.rng
+        )[0]
+        slot = int(candidates[loser])
+        self.population[slot] = child
+        self._window_stats['replacements'] += 1
+        self._window_stats['duration'] += time.time() - start_time
+        self.record_evaluation(slot, fitness, metrics)
+        return slot
+
+    def finish_window(self, stagnation: int = 0) -> None:
+        """
+        Close a steady-state report window.
+
+        Publishes the window's operator counts in ``last_evolution_stats`` /
+        ``last_evolution_duration`` (as ``evolve`` does per generation) and
+        adapts the mutation rates for the next window.
+        """
+        stats = self._window_stats
+        evaluations = max(1, stats['evaluations'])
+        self.last_evolution_duration = stats['duration']
+        self.last_evolution_stats = {
+            'crossover_events': int(stats['crossover_events']),
+            'mutation_events': int(stats['mutation_events']),
+            'replacements': int(stats['replacements']),
+            'elite_count': 1,
+        }
+        if self.novelty_config.enable_behavior_novelty or self.novelty_config.enable_reward_diversity:
+            self.last_evolution_stats['avg_novelty'] = stats['novelty'] / evaluations
+            self.last_evolution_stats['avg_diversity'] = stats['diversity'] / evaluations
+            self.last_evolution_stats['archive_size'] = self.behavior_archive.size()
+        self._reset_window_stats()
+        self._adapt_mutation(stagnation)
+
+    def _reset_window_stats(self) -> None:
+        self._window_stats = {
+            'crossover_events': 0, 'mutation_events': 0, 'replacements': 0,
+            'evaluations': 0, 'novelty': 0.0, 'diversity': 0.0, 'duration': 0.0,
+        }
+
+    def _steady_state_score(self, slot: int, fitness: float, metrics: Dict) -> float:
+        """
+        Selection score of one new evaluation.
+
+        Novelty is measured against the other evaluated members and the
+        archive at insertion time; older members keep the score they got then.
+        """
+        self._window_stats['evaluations'] += 1
+        config = self.novelty_config
+        if not config.enable_behavior_novelty and not config.enable_reward_diversity:
+            return fitness
+
+        behavior = metrics.get('behavior_vector', [0.0] * 11)
+        diversity = metrics.get('reward_diversity', 0.0)
+        novelty = 0.0
+        if config.enable_behavior_novelty:
+            others = [b for i, b in enumerate(self.behaviors) if b is not None and i != slot]
+            novelty = compute_behavior_novelty(
+                behavior, others, self.behavior_archive.get_matrix(), config.k_nearest
+            )
+            self.behavior_archive.add_batch([behavior], [novelty])
+        self._window_stats['novelty'] += novelty
+        self._window_stats['diversity'] += diversity
+        return compute_selection_score(fitness, novelty, diversity, config)
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Population, operator rates and novelty archive for checkpointing."""
+        state = {
+            'population': self.population,
+            'rng_state': self.rng.bit_generator.state,
+            'mutation_probability': self.operators.mutation_probability,
+            'mutation_gaussian_sigma': self.operators.mutation_gaussian_sigma,
+            'last_evolution_stats': dict(self.last_evolution_stats),
+            'last_evolution_duration': self.last_evolution_duration,
+            'behavior_archive': self.behavior_archive.state_dict(),
+        }
+        if self.fitnesses is not None:
+            state['steady_state'] = {
+                'fitnesses': self.fitnesses,
+                'selection_scores': self.selection_scores,
+                'behaviors': list(self.behaviors),
+            }
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """Restore state written by state_dict()."""
+        population = state['population']
+        if population.shape != (self.population_size, self.param_size):
+            raise ValueError(
+                f"Checkpoint population shape {population.shape} does not match "
+                f"({self.population_size}, {self.param_size})"
+            )
+        self.population = population.astype(np.float64, copy=True)
+        if 'rng_state' in state:
+            self.rng.bit_generator.state = state['rng_state']
+        self.operators.mutation_probability = state['mutation_probability']
+        self.operators.mutation_gaussian_sigma = state['mutation_gaussian_sigma']
+        self.last_evolution_stats = dict(state.get('last_evolution_stats', {}))
+        self.last_evolution_duration = state.get('last_evolution_duration', 0.0)
+        self.behavior_archive.load_state_dict(state['behavior_archive'])
+        steady = state.get('steady_state')
+        if steady is not None:
+            self.start_steady_state()
+            self.fitnesses = np.array(steady['fitnesses'], dtype=np.float64)
+            self.selection_scores = np.array(steady['selection_scores'], dtype=np.float64)
+            self.behaviors = list(steady['behaviors'])
+
     def _adapt_mutation(self, stagnation: int):
         """Adjust mutation parameters based on stagnation."""
         stagnation_threshold = 10
@@ -180,8 +407,9 @@ class GADriver:
         if self.novelty_config.enable_behavior_novelty:
             novelty_scores = compute_population_novelty(
                 behavior_vectors,
-                self.behavior_archive.get_behaviors(),
-                self.novelty_config.k_nearest
+                self.behavior_archive.get_matrix(),
+                self.novelty_config.k_nearest,
+                archive_index=self.behavior_archive.get_index()
             )
             # Update archive with novel behaviors
             self.behavior_archive.add_batch(behavior_vectors, novelty_scores)
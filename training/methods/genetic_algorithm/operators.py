@@ -1,60 +1,123 @@
-from typing import List, Tuple
-import random
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 class GAGeneticOperators:
-  def __init__(self, mutation_probability: float = 0.1, crossover_probability: float = 0.9, mutation_gaussian_sigma: float = 0.1, mutation_uniform_low: float = -1.0, mutation_uniform_high: float = 1.0, crossover_alpha: float = 0.5):
+  """
+  GA variation operators with DEAP-style semantics, vectorized over genes.
+
+  The ``*_batch`` methods work on ``[n, params]`` arrays and are what GADriver
+  uses; the per-individual methods wrap them and keep the DEAP tuple returns.
+  All randomness comes from ``rng`` (a seeded ``numpy.random.Generator``).
+  """
+  def __init__(self, mutation_probability: float = 0.1, crossover_probability: float = 0.9, mutation_gaussian_sigma: float = 0.1, mutation_uniform_low: float = -1.0, mutation_uniform_high: float = 1.0, crossover_alpha: float = 0.5, rng: Optional[np.random.Generator] = None):
     self.mutation_probability = mutation_probability
     self.crossover_probability = crossover_probability
     self.mutation_gaussian_sigma = mutation_gaussian_sigma
     self.mutation_uniform_low = mutation_uniform_low
     self.mutation_uniform_high = mutation_uniform_high
     self.crossover_alpha = crossover_alpha  # Blend factor for crossover (0.5 = equal mix)
+    self.rng = rng if rng is not None else np.random.default_rng()
+
+  def mutate_gaussian_batch(self, population: np.ndarray) -> np.ndarray:
+    """
+    Gaussian mutation of every row: each gene gets N(0, sigma) noise with
+    probability ``mutation_probability`` (DEAP ``mutGaussian`` with ``indpb``).
+
+    Args:
+      population: [n, params] parameter matrix
+
+    Returns:
+      New mutated matrix (the input is not modified)
+    """
+    mask = self.rng.random(population.shape) < self.mutation_probability
+    mutated = population.copy()
+    # Draw noise only for the selected genes
+    mutated[mask] += self.rng.normal(0.0, self.mutation_gaussian_sigma, size=int(mask.sum()))
+    return mutated
+
+  def mutate_uniform_batch(self, population: np.ndarray) -> np.ndarray:
+    """
+    Uniform mutation of every row: each gene is replaced by a value drawn from
+    [low, high) with probability ``mutation_probability``.
+
+    Args:
+      population: [n, params] parameter matrix
+
+    Returns:
+      New mutated matrix (the input is not modified)
+    """
+    mask = self.rng.random(population.shape) < self.mutation_probability
+    mutated = population.copy()
+    mutated[mask] = self.rng.uniform(self.mutation_uniform_low, self.mutation_uniform_high, size=int(mask.sum()))
+    return mutated
+
+  def crossover_blend_batch(self, parents1: np.ndarray, parents2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    BLX-alpha crossover for row-aligned parent pairs.
+
+    For each gene, samples from [min - alpha*d, max + alpha*d] where d is the
+    distance between parents. This creates genetic diversity even when parents
+    are similar.
+
+    Args:
+      parents1: [n, params] first parents
+      parents2: [n, params] second parents
+
+    Returns:
+      Two [n, params] offspring matrices
+    """
+    d = np.abs(parents1 - parents2)
+    low = np.minimum(parents1, parents2) - self.crossover_alpha * d
+    high = np.maximum(parents1, parents2) + self.crossover_alpha * d
+    child1 = self.rng.uniform(low, high)
+    child2 = self.rng.uniform(low, high)
+    return child1, child2
+
+  def crossover_arithmetic_batch(self, parents1: np.ndarray, parents2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Arithmetic crossover for row-aligned parent pairs, one random alpha in
+    [0.3, 0.7) per pair.
+
+    Args:
+      parents1: [n, params] first parents
+      parents2: [n, params] second parents
+
+    Returns:
+      Two complementary [n, params] offspring matrices
+    """
+    alpha = self.rng.uniform(0.3, 0.7, size=(len(parents1), 1))
+    child1 = parents1 * alpha + parents2 * (1 - alpha)
+    child2 = parents1 * (1 - alpha) + parents2 * alpha
+    return child1, child2
 
   def mutate_gaussian(self, individual: List[float]) -> Tuple[List[float]]:
     """
     Gaussian mutation: add noise to parameters.
-    
+
     Args:
       individual: Parameter vector
-    
+
     Returns:
       Mutated individual (tuple for DEAP)
     """
-    # Mutate each gene probabilistically, but always return ALL genes
-    mutated = [
-      individual[i] + random.gauss(0, self.mutation_gaussian_sigma) 
-      if random.random() < self.mutation_probability 
-      else individual[i]
-      for i in range(len(individual))
-    ]
-    return (mutated,)
+    return (self.mutate_gaussian_batch(np.asarray(individual, dtype=np.float64)[None, :])[0].tolist(),)
 
   def mutate_uniform(self, individual: List[float]) -> Tuple[List[float]]:
     """
     Uniform mutation: replace parameter with random value in range.
-    
+
     Args:
       individual: Parameter vector
-    
+
     Returns:
       Mutated individual (tuple for DEAP)
     """
-    # Mutate each gene probabilistically, but always return ALL genes
-    mutated = [
-      random.uniform(self.mutation_uniform_low, self.mutation_uniform_high)
-      if random.random() < self.mutation_probability 
-      else individual[i]
-      for i in range(len(individual))
-    ]
-    return (mutated,)
+    return (self.mutate_uniform_batch(np.asarray(individual, dtype=np.float64)[None, :])[0].tolist(),)
 
   def crossover_blend(self, individual1: List[float], individual2: List[float]) -> Tuple[List[float], List[float]]:
     """
-    BLX-alpha crossover: create offspring by sampling from extended range.
-
-    For each gene, samples from [min - alpha*d, max + alpha*d] where d is the
-    distance between parents. This creates genetic diversity even when parents
-    are similar.
+    BLX-alpha crossover of two individuals (see ``crossover_blend_batch``).
 
     Args:
       individual1: First parent
@@ -63,24 +126,11 @@ class GAGeneticOperators:
     Returns:
       Two distinct offspring
     """
-    alpha = self.crossover_alpha
-    child1 = []
-    child2 = []
-
-    for i in range(len(individual1)):
-      p1 = individual1[i]
-      p2 = individual2[i]
-
-      # Calculate range for BLX-alpha
-      d = abs(p1 - p2)
-      low = min(p1, p2) - alpha * d
-      high = max(p1, p2) + alpha * d
-
-      # Sample two different children from the range
-      child1.append(random.uniform(low, high))
-      child2.append(random.uniform(low, high))
-
-    return (child1, child2)
+    child1, child2 = self.crossover_blend_batch(
+      np.asarray(individual1, dtype=np.float64)[None, :],
+      np.asarray(individual2, dtype=np.float64)[None, :]
+    )
+    return (child1[0].tolist(), child2[0].tolist())
 
   def crossover_arithmetic(self, individual1: List[float], individual2: List[float]) -> Tuple[List[float], List[float]]:
     """
@@ -95,15 +145,8 @@ class GAGeneticOperators:
     Returns:
       Two complementary offspring
     """
-    # Use random alpha for diversity
-    alpha = random.uniform(0.3, 0.7)
-
-    child1 = [
-      individual1[i] * alpha + individual2[i] * (1 - alpha)
-      for i in range(len(individual1))
-    ]
-    child2 = [
-      individual1[i] * (1 - alpha) + individual2[i] * alpha
-      for i in range(len(individual2))
-    ]
-    return (child1, child2)
+    child1, child2 = self.crossover_arithmetic_batch(
+      np.asarray(individual1, dtype=np.float64)[None, :],
+      np.asarray(individual2, dtype=np.float64)[None, :]
+    )
+    return (child1[0].tolist(), child2[0].tolist())
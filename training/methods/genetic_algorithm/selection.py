@@ -1,15 +1,17 @@
 import random
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 def tournament_selection(population: List[List[float]], fitnesses: List[float], tournament_size: int = 3) -> List[List[float]]:
     """
     Select parents using tournament selection.
-    
+
     Args:
         population: List of parameter vectors
         fitnesses: List of fitness scores corresponding to population
         tournament_size: Number of individuals in each tournament
-        
+
     Returns:
         List of selected parent parameter vectors (same size as population)
     """
@@ -21,3 +23,46 @@ def tournament_selection(population: List[List[float]], fitnesses: List[float],
         winner_idx = tournament_indices[tournament_fitnesses.index(max(tournament_fitnesses))]
         parents.append(population[winner_idx].copy())
     return parents
+
+def tournament_selection_indices(
+    fitnesses: List[float],
+    tournament_size: int = 3,
+    num_selected: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    Vectorized tournament selection returning winner indices.
+
+    Each tournament draws ``tournament_size`` distinct contestants (like
+    ``random.sample``) and the highest fitness wins; ties go to the contestant
+    drawn first.
+
+    Args:
+        fitnesses: Fitness scores of the population
+        tournament_size: Number of individuals in each tournament
+        num_selected: Number of tournaments (defaults to the population size)
+        rng: Generator to draw contestants from
+
+    Returns:
+        Integer array of selected population indices
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    scores = np.asarray(fitnesses, dtype=np.float64)
+    pop_size = len(scores)
+    num_selected = pop_size if num_selected is None else num_selected
+    size = min(tournament_size, pop_size)
+    if 2 * size > pop_size:
+        # Dense tournaments: rejection would rarely draw a duplicate-free row
+        contestants = np.array(
+            [rng.choice(pop_size, size, replace=False) for _ in range(num_selected)], dtype=np.int64
+        ).reshape(num_selected, size)
+    else:
+        # Draw with replacement and redraw only the rows that repeat a contestant
+        contestants = rng.integers(0, pop_size, (num_selected, size))
+        redraw = np.arange(num_selected)
+        while redraw.size:
+            ordered = np.sort(contestants[redraw], axis=1)
+            redraw = redraw[np.any(ordered[:, 1:] == ordered[:, :-1], axis=1)]
+            contestants[redraw] = rng.integers(0, pop_size, (redraw.size, size))
+    winners = np.argmax(scores[contestants], axis=1)
+    return contestants[np.arange(num_selected), winners]
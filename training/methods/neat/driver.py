@@ -2,11 +2,14 @@ import math
 import random
 import statistics
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+from ai_agents.neuroevolution.neat.compatibility import CompatibilityIndex
 from ai_agents.neuroevolution.neat.genome import Genome
 from training.components.archive import BehaviorArchive
-from training.components.novelty import compute_population_novelty
+from training.components.novelty import compute_behavior_novelty, compute_population_novelty
 from training.components.selection import compute_selection_score
 from training.config.neat import NEATConfig
 from training.config.novelty import NoveltyConfig
@@ -17,6 +20,11 @@ from training.methods.neat.species import Species
 class NEATDriver:
     """
     NEAT population manager: speciation, crossover, mutation, and reproduction.
+
+    ``evolve`` replaces the population per generation. Steady-state training
+    (rtNEAT-style) calls ``start_steady_state`` once, then ``breed_offspring``
+    and ``insert_offspring`` per completed evaluation, and ``finish_window``
+    every report window to re-speciate.
     """
     def __init__(self, input_size: int, output_size: int = 3, novelty_config: Optional[NoveltyConfig] = None):
         self.input_ids = list(range(input_size))
@@ -48,12 +56,22 @@ class NEATDriver:
         self.behavior_archive = BehaviorArchive(
             max_size=self.novelty_config.archive_max_size,
             novelty_threshold=self.novelty_config.archive_novelty_threshold,
-            k_nearest=self.novelty_config.k_nearest
+            k_nearest=self.novelty_config.k_nearest,
+            index_min_size=self.novelty_config.archive_index_min_size
         )
 
         self.last_evolution_stats: Dict[str, float] = {}
         self.last_evolution_duration = 0.0
         self.last_generation_new_innovations: Optional[set] = None
+        # Per member, the index of its (first) parent in the previous population
+        # (-1 = none); lets the evaluator schedule rollouts by expected length
+        self.parent_indices: Optional[List[int]] = None
+
+        # Steady-state bookkeeping keyed by id(genome) (None until start_steady_state)
+        self.steady_fitness: Optional[Dict[int, float]] = None
+        self.steady_scores: Dict[int, float] = {}
+        self.steady_behaviors: Dict[int, List[float]] = {}
+        self._window_stats: Dict[str, Any] = {}
 
     def evolve(self, fitnesses: List[float], per_agent_metrics: Optional[List[Dict]] = None) -> None:
         start_time = time.time()
@@ -70,8 +88,9 @@ class NEATDriver:
             if NEATConfig.ENABLE_NOVELTY:
                 novelty_scores = compute_population_novelty(
                     behavior_vectors,
-                    self.behavior_archive.get_behaviors(),
-                    self.novelty_config.k_nearest
+                    self.behavior_archive.get_matrix(),
+                    self.novelty_config.k_nearest,
+                    archive_index=self.behavior_archive.get_index()
                 )
                 self.behavior_archive.add_batch(behavior_vectors, novelty_scores)
 
@@ -111,7 +130,9 @@ class NEATDriver:
         elite_total = 0
         new_innovations = set()
 
+        index_of = {id(genome): i for i, genome in enumerate(self.population)}
         new_population: List[Genome] = []
+        new_parents: List[int] = []
         for species in species_list:
             count = offspring_counts.get(species.species_id, 0)
             if count <= 0:
@@ -123,6 +144,7 @@ class NEATDriver:
             elite_total += elite_count
             for i in range(elite_count):
                 new_population.append(sorted_members[i].copy())
+                new_parents.append(index_of[id(sorted_members[i])])
 
             remaining = count - elite_count
             for _ in range(remaining):
@@ -144,27 +166,56 @@ class NEATDriver:
                 self._mutate_genome(child, mutation_counts, new_innovations)
                 mutated_genomes += 1
                 new_population.append(child)
+                new_parents.append(index_of[id(parent1)])
 
         while len(new_population) < self.population_size:
-            genome = random.choice(self.population).copy()
+            parent = random.choice(self.population)
+            genome = parent.copy()
             self._mutate_genome(genome, mutation_counts, new_innovations)
             mutated_genomes += 1
             new_population.append(genome)
+            new_parents.append(index_of[id(parent)])
 
         new_population = new_population[:self.population_size]
+        self.parent_indices = new_parents[:self.population_size]
 
         best_index = fitnesses.index(max(fitnesses)) if fitnesses else 0
         best_genome = self.population[best_index] if self.population else None
 
-        avg_nodes = sum(genome.num_nodes() for genome in self.population) / len(self.population)
-        avg_connections = sum(genome.num_enabled_connections() for genome in self.population) / len(self.population)
-
         survival_rate = self._compute_innovation_survival_rate()
         self.last_generation_new_innovations = new_innovations
 
-        compat_stats = self._compatibility_stats(compat_distances)
+        self.last_evolution_stats = self._evolution_stats(
+            species_list, species_stats, compat_distances, best_genome, mutation_counts,
+            survival_rate, novelty_scores, diversity_scores, pruned_count, elite_total, mutated_genomes
+        )
+
+        self._adapt_compatibility_threshold(len(species_list))
+
+        self.population = new_population
+        self.species, _ = self._speciate(self.population)
+
+        self.last_evolution_duration = time.time() - start_time
 
-        self.last_evolution_stats = {
+    def _evolution_stats(
+        self,
+        species_list: List[Species],
+        species_stats: Dict[str, float],
+        compat_distances: np.ndarray,
+        best_genome: Optional[Genome],
+        mutation_counts: Dict[str, int],
+        survival_rate: Optional[float],
+        novelty_scores: List[float],
+        diversity_scores: List[float],
+        pruned_count: int,
+        elite_total: int,
+        mutated_genomes: int
+    ) -> Dict[str, float]:
+        """Operator/speciation stats for analytics (``last_evolution_stats``)."""
+        avg_nodes = sum(genome.num_nodes() for genome in self.population) / len(self.population)
+        avg_connections = sum(genome.num_enabled_connections() for genome in self.population) / len(self.population)
+        compat_stats = self._compatibility_stats(compat_distances)
+        return {
             "species_count": len(species_list),
             "species_min_size": species_stats.get("min", 0),
             "species_max_size": species_stats.get("max", 0),
@@ -190,12 +241,301 @@ class NEATDriver:
             "mutation_events": mutated_genomes
         }
 
+    def replace_members(
+        self,
+        slots: Sequence[int],
+        genome_dicts: Sequence[Dict],
+        sources: Optional[Sequence[int]] = None
+    ) -> None:
+        """
+        Overwrite ``population[slots[k]]`` with a genome from another island.
+
+        Genomes are renumbered into this island's innovation space; genomes
+        with the same entry in ``sources`` share one hidden-node mapping.
+        """
+        node_maps: Dict[Any, Dict[int, int]] = {}
+        sources = sources if sources is not None else [None] * len(genome_dicts)
+        for slot, data, source in zip(slots, genome_dicts, sources):
+            local = self.innovation_tracker.localize(data, node_maps.setdefault(source, {}))
+            self.population[slot] = Genome.from_dict(local)
+
+    def start_steady_state(self) -> None:
+        """
+        Switch to steady-state bookkeeping.
+
+        Every member starts unevaluated; ``record_evaluation`` stores its
+        fitness once its first evaluation completes.
+        """
+        self.steady_fitness = {}
+        self.steady_scores = {}
+        self.steady_behaviors = {}
+        self._reset_window_stats()
+
+    def unevaluated(self) -> List[Genome]:
+        """Members still waiting for their first evaluation."""
+        return [genome for genome in self.population if id(genome) not in self.steady_fitness]
+
+    def evaluated_count(self) -> int:
+        """Members with a fitness (offspring can be bred once this is > 0)."""
+        return len(self.steady_fitness)
+
+    def record_evaluation(self, genome: Genome, fitness: float, metrics: Dict) -> None:
+        """
+        Store the evaluation of a population member.
+
+        Args:
+            genome: Member of ``population``
+            fitness: Fitness used for selection (the trainer's adjusted fitness)
+            metrics: Per-agent metrics (behavior_vector, reward_diversity)
+        """
+        start_time = time.time()
+        self.steady_scores[id(genome)] = self._steady_state_score(genome, fitness, metrics)
+        self.steady_fitness[id(genome)] = fitness
+        self.steady_behaviors[id(genome)] = metrics.get('behavior_vector', [0.0] * 11)
+        self._window_stats["duration"] += time.time() - start_time
+
+    def breed_offspring(self) -> Genome:
+        """
+        Breed one offspring (not yet part of the population).
+
+        The parent species is drawn in proportion to its members' mean
+        adjusted fitness (stagnant species only when nothing else is left),
+        then parents are chosen within it as in ``evolve``.
+        """
+        start_time = time.time()
+        adjusted_fitness = self._steady_adjusted_fitness()
+        pool = []
+        for species in self.species:
+            members = [genome for genome in species.members if id(genome) in adjusted_fitness]
+            if members:
+                pool.append((species, members))
+        if not pool:
+            raise RuntimeError("breed_offspring() needs at least one evaluated member")
+        active = [entry for entry in pool if entry[0].stagnation < NEATConfig.SPECIES_STAGNATION] or pool
+
+        weights = [
+            max(0.0, sum(adjusted_fitness[id(genome)] for genome in members) / len(members))
+            for _, members in active
+        ]
+        if sum(weights) > 0.0:
+            _, members = random.choices(active, weights=weights)[0]
+        else:
+            _, members = random.choice(active)
+
+        counters = self._window_stats["mutation_counts"]
+        parent1 = self._select_parent(members, adjusted_fitness)
+        if random.random() < NEATConfig.CROSSOVER_PROB and len(members) > 1:
+            parent2 = self._select_parent(members, adjusted_fitness)
+            child = Genome.crossover(
+                parent1,
+                parent2,
+                self.steady_fitness[id(parent1)],
+                self.steady_fitness[id(parent2)],
+                NEATConfig.INHERIT_DISABLED_PROB
+            )
+            counters["crossover"] += 1
+        else:
+            child = parent1.copy()
+        self._mutate_genome(child, counters, self._window_stats["new_innovations"])
+        self._window_stats["mutated_genomes"] += 1
+        self._window_stats["duration"] += time.time() - start_time
+        return child
+
+    def insert_offspring(self, genome: Genome, fitness: float, metrics: Dict) -> None:
+        """
+        Add an evaluated offspring, removing the worst member if full.
+
+        The removed member has the lowest adjusted fitness (fitness shared
+        within its species) among evaluated members; the member with the best
+        raw fitness is never removed.
+        """
+        start_time = time.time()
+        if len(self.population) >= self.population_size:
+            adjusted_fitness = self._steady_adjusted_fitness()
+            best = max(adjusted_fitness, key=lambda key: self.steady_fitness[key], default=None)
+            candidates = [g for g in self.population if id(g) in adjusted_fitness and id(g) != best]
+            if candidates:
+                self._remove_member(min(candidates, key=lambda g: adjusted_fitness[id(g)]))
+                self._window_stats["replacements"] += 1
+        self.population.append(genome)
+        self._assign_species(genome)
+        self._window_stats["duration"] += time.time() - start_time
+        self.record_evaluation(genome, fitness, metrics)
+
+    def finish_window(self) -> None:
+        """
+        Close a steady-state report window.
+
+        Updates species stagnation, re-speciates the population and adapts
+        the compatibility threshold (what a generation boundary does), and
+        publishes the window's stats in ``last_evolution_stats`` /
+        ``last_evolution_duration``.
+        """
+        start_time = time.time()
+        stats = self._window_stats
+        stale = 0
+        for species in self.species:
+            best = max((self.steady_fitness.get(id(g), float("-inf")) for g in species.members), default=float("-inf"))
+            if best > species.best_fitness:
+                species.best_fitness = best
+                species.stagnation = 0
+            else:
+                species.stagnation += 1
+            stale += species.stagnation >= NEATConfig.SPECIES_STAGNATION
+
+        species_list, compat_distances = self._speciate(self.population)
+        best_key = max(self.steady_fitness, key=self.steady_fitness.get, default=None)
+        best_genome = next((g for g in self.population if id(g) == best_key), None)
+
+        survival_rate = self._compute_innovation_survival_rate()
+        self.last_generation_new_innovations = stats["new_innovations"]
+        evaluations = max(1, stats["evaluations"])
+        self.last_evolution_stats = self._evolution_stats(
+            species_list, self._species_size_stats(species_list), compat_distances, best_genome,
+            stats["mutation_counts"], survival_rate, [], [], stale, 1 if best_genome else 0,
+            stats["mutated_genomes"]
+        )
+        self.last_evolution_stats["avg_novelty"] = stats["novelty"] / evaluations
+        self.last_evolution_stats["avg_diversity"] = stats["diversity"] / evaluations
+        self.last_evolution_stats["replacements"] = stats["replacements"]
+
         self._adapt_compatibility_threshold(len(species_list))
+        self.last_evolution_duration = stats["duration"] + time.time() - start_time
+        self._reset_window_stats()
+
+    def _reset_window_stats(self) -> None:
+        self._window_stats = {
+            "mutation_counts": {"add_node": 0, "add_connection": 0, "weight_mutation": 0, "crossover": 0},
+            "new_innovations": set(),
+            "mutated_genomes": 0,
+            "replacements": 0,
+            "evaluations": 0,
+            "novelty": 0.0,
+            "diversity": 0.0,
+            "duration": 0.0,
+        }
 
-        self.population = new_population
-        self.species, _ = self._speciate(self.population)
+    def _steady_state_score(self, genome: Genome, fitness: float, metrics: Dict) -> float:
+        """
+        Selection score of one new evaluation (novelty against the other
+        evaluated members and the archive at insertion time).
+        """
+        self._window_stats["evaluations"] += 1
+        if not (NEATConfig.ENABLE_NOVELTY or NEATConfig.ENABLE_DIVERSITY):
+            return fitness
+        behavior = metrics.get('behavior_vector', [0.0] * 11)
+        diversity = metrics.get('reward_diversity', 0.0)
+        novelty = 0.0
+        if NEATConfig.ENABLE_NOVELTY:
+            others = [b for key, b in self.steady_behaviors.items() if key != id(genome)]
+            novelty = compute_behavior_novelty(
+                behavior, others, self.behavior_archive.get_matrix(), self.novelty_config.k_nearest
+            )
+            self.behavior_archive.add_batch([behavior], [novelty])
+        self._window_stats["novelty"] += novelty
+        self._window_stats["diversity"] += diversity
+        return compute_selection_score(fitness, novelty, diversity, self.novelty_config)
+
+    def _steady_adjusted_fitness(self) -> Dict[int, float]:
+        """Selection scores shared within species, for evaluated members."""
+        adjusted: Dict[int, float] = {}
+        for species in self.species:
+            size = max(1, len(species.members))
+            for genome in species.members:
+                score = self.steady_scores.get(id(genome))
+                if score is not None:
+                    adjusted[id(genome)] = score / size
+        return adjusted
 
-        self.last_evolution_duration = time.time() - start_time
+    def _remove_member(self, genome: Genome) -> None:
+        self.population = [g for g in self.population if g is not genome]
+        for species in self.species:
+            species.members = [g for g in species.members if g is not genome]
+        self.species = [species for species in self.species if species.members]
+        for table in (self.steady_fitness, self.steady_scores, self.steady_behaviors):
+            table.pop(id(genome), None)
+
+    def _assign_species(self, genome: Genome) -> None:
+        """First-fit placement of one genome (see ``_speciate``)."""
+        index = CompatibilityIndex([genome], NEATConfig.C1, NEATConfig.C2, NEATConfig.C3)
+        for species in self.species:
+            if index.distances_to(species.representative)[0] < self.compatibility_threshold:
+                species.add(genome)
+                return
+        species = Species(self._next_species_id(), genome)
+        species.add(genome)
+        self.species.append(species)
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Population, species, innovation counters and archive for checkpointing.
+
+        Species members and representatives are stored as population indices so
+        genome identity (which speciation relies on) survives a reload.
+        """
+        index_of = {id(genome): idx for idx, genome in enumerate(self.population)}
+        species_state = []
+        for species in self.species:
+            rep_idx = index_of.get(id(species.representative))
+            species_state.append({
+                "species_id": species.species_id,
+                "representative": rep_idx,
+                "representative_genome": species.representative.to_dict() if rep_idx is None else None,
+                "members": [index_of[id(genome)] for genome in species.members],
+                "best_fitness": species.best_fitness,
+                "stagnation": species.stagnation,
+            })
+        new_innovations = self.last_generation_new_innovations
+        state = {
+            "population": [genome.to_dict() for genome in self.population],
+            "species": species_state,
+            "species_id_counter": self._species_id_counter,
+            "compatibility_threshold": self.compatibility_threshold,
+            "innovation_tracker": self.innovation_tracker.state_dict(),
+            "behavior_archive": self.behavior_archive.state_dict(),
+            "last_generation_new_innovations": sorted(new_innovations) if new_innovations is not None else None,
+            "last_evolution_stats": dict(self.last_evolution_stats),
+            "last_evolution_duration": self.last_evolution_duration,
+        }
+        if self.steady_fitness is not None:
+            state["steady_state"] = {
+                "fitness": [self.steady_fitness.get(id(genome)) for genome in self.population],
+                "scores": [self.steady_scores.get(id(genome)) for genome in self.population],
+                "behaviors": [self.steady_behaviors.get(id(genome)) for genome in self.population],
+            }
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """Restore state written by state_dict()."""
+        self.population = [Genome.from_dict(data) for data in state["population"]]
+        self.species = []
+        for data in state["species"]:
+            if data["representative"] is not None:
+                representative = self.population[data["representative"]]
+            else:
+                representative = Genome.from_dict(data["representative_genome"])
+            species = Species(data["species_id"], representative)
+            species.members = [self.population[idx] for idx in data["members"]]
+            species.best_fitness = data["best_fitness"]
+            species.stagnation = data["stagnation"]
+            self.species.append(species)
+        self._species_id_counter = state["species_id_counter"]
+        self.compatibility_threshold = state["compatibility_threshold"]
+        self.innovation_tracker.load_state_dict(state["innovation_tracker"])
+        self.behavior_archive.load_state_dict(state["behavior_archive"])
+        new_innovations = state.get("last_generation_new_innovations")
+        self.last_generation_new_innovations = set(new_innovations) if new_innovations is not None else None
+        self.last_evolution_stats = dict(state.get("last_evolution_stats", {}))
+        self.last_evolution_duration = state.get("last_evolution_duration", 0.0)
+        steady = state.get("steady_state")
+        if steady is not None:
+            self.start_steady_state()
+            for genome, fitness, score, behavior in zip(
+                    self.population, steady["fitness"], steady["scores"], steady["behaviors"]):
+                if fitness is not None:
+                    self.steady_fitness[id(genome)] = fitness
+                    self.steady_scores[id(genome)] = score
+                    self.steady_behaviors[id(genome)] = behavior
 
     def _mutate_genome(self, genome: Genome, counters: Dict[str, int], new_innovations: set) -> None:
         if NEATConfig.MAX_NODES is None or genome.num_nodes() < NEATConfig.MAX_NODES:
@@ -231,39 +571,55 @@ class NEATDriver:
                 return genome
         return members[-1]
 
-    def _speciate(self, population: List[Genome]) -> Tuple[List[Species], List[float]]:
+    def _speciate(self, population: List[Genome]) -> Tuple[List[Species], np.ndarray]:
+        """
+        First-fit speciation: each genome joins the first species (existing
+        ones, then those founded earlier in this pass) whose representative is
+        within the compatibility threshold, else it founds a new species.
+
+        Species are visited column by column: one batched distance computation
+        covers every genome still unassigned, which gives the same assignment
+        and member order as the genome-by-genome loop.
+
+        Returns:
+            (species list, every distance computed during the pass)
+        """
         for species in self.species:
             species.reset(species.representative)
 
         species_list = [s for s in self.species]
-        distances: List[float] = []
+        index = CompatibilityIndex(population, NEATConfig.C1, NEATConfig.C2, NEATConfig.C3)
+        unassigned = np.arange(len(population))
+        computed: List[np.ndarray] = []
+
+        def assign(species: Species) -> None:
+            nonlocal unassigned
+            distances = index.distances_to(species.representative, unassigned)
+            computed.append(distances)
+            hits = distances < self.compatibility_threshold
+            for i in unassigned[hits]:
+                species.add(population[i])
+            unassigned = unassigned[~hits]
 
-        for genome in population:
-            assigned = False
-            for species in species_list:
-                distance = Genome.compatibility_distance(
-                    genome,
-                    species.representative,
-                    NEATConfig.C1,
-                    NEATConfig.C2,
-                    NEATConfig.C3
-                )
-                distances.append(distance)
-                if distance < self.compatibility_threshold:
-                    species.add(genome)
-                    assigned = True
-                    break
-            if not assigned:
-                species_id = self._next_species_id()
-                new_species = Species(species_id, genome)
-                new_species.add(genome)
-                species_list.append(new_species)
+        for species in species_list:
+            if not unassigned.size:
+                break
+            assign(species)
+
+        while unassigned.size:
+            founder = population[unassigned[0]]
+            new_species = Species(self._next_species_id(), founder)
+            new_species.add(founder)
+            species_list.append(new_species)
+            unassigned = unassigned[1:]
+            if unassigned.size:
+                assign(new_species)
 
         species_list = [s for s in species_list if s.members]
         for species in species_list:
             species.representative = random.choice(species.members)
         self.species = species_list
-        return species_list, distances
+        return species_list, np.concatenate(computed) if computed else np.zeros(0)
 
     def _adapt_compatibility_threshold(self, species_count: int) -> None:
         if not NEATConfig.ADAPT_COMPATIBILITY_THRESHOLD:
@@ -350,15 +706,15 @@ class NEATDriver:
             "median": statistics.median(sizes)
         }
 
-    def _compatibility_stats(self, distances: List[float]) -> Dict[str, float]:
-        if not distances:
+    def _compatibility_stats(self, distances: np.ndarray) -> Dict[str, float]:
+        if distances.size == 0:
             return {"mean": 0.0, "p10": 0.0, "p90": 0.0}
-        distances_sorted = sorted(distances)
+        distances_sorted = np.sort(distances)
         n = len(distances_sorted)
-        p10 = distances_sorted[int(0.1 * (n - 1))]
-        p90 = distances_sorted[int(0.9 * (n - 1))]
+        p10 = float(distances_sorted[int(0.1 * (n - 1))])
+        p90 = float(distances_sorted[int(0.9 * (n - 1))])
         return {
-            "mean": sum(distances_sorted) / n,
+            "mean": float(distances_sorted.mean()),
             "p10": p10,
             "p90": p90
         }
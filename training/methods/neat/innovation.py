@@ -1,4 +1,4 @@
-from typing import Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from ai_agents.neuroevolution.neat.genes import ConnectionGene
 
@@ -34,6 +34,54 @@ class InnovationTracker:
         self._split_map[key] = (new_node_id, innov1, innov2)
         return new_node_id, innov1, innov2
 
+    def localize(self, data: Dict[str, Any], node_map: Optional[Dict[int, int]] = None) -> Dict[str, Any]:
+        """
+        Renumber a ``Genome.to_dict()`` produced under another tracker.
+
+        Input, output and bias ids are fixed by the network shape and kept.
+        Hidden nodes get fresh local ids; pass the same ``node_map`` for
+        genomes from one source so nodes they share stay shared. Connection
+        innovations are looked up by their (remapped) endpoints, so genes
+        line up with local genomes wherever the structure matches.
+        """
+        node_map = {} if node_map is None else node_map
+        for node in data["nodes"]:
+            if node["node_type"] == "hidden" and node["node_id"] not in node_map:
+                node_map[node["node_id"]] = self._next_node_id
+                self._next_node_id += 1
+
+        def local(node_id: int) -> int:
+            return node_map.get(node_id, node_id)
+
+        connections = []
+        for conn in data["connections"]:
+            in_node, out_node = local(conn["in_node"]), local(conn["out_node"])
+            connections.append({
+                **conn,
+                "innovation": self.get_connection_innovation(in_node, out_node),
+                "in_node": in_node,
+                "out_node": out_node,
+            })
+        return {
+            **data,
+            "nodes": [{**node, "node_id": local(node["node_id"])} for node in data["nodes"]],
+            "connections": connections,
+        }
+
     @property
     def next_node_id(self) -> int:
         return self._next_node_id
+
+    def state_dict(self) -> Dict[str, Any]:
+        return {
+            "next_innovation": self._next_innovation,
+            "next_node_id": self._next_node_id,
+            "connection_map": dict(self._connection_map),
+            "split_map": dict(self._split_map),
+        }
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        self._next_innovation = state["next_innovation"]
+        self._next_node_id = state["next_node_id"]
+        self._connection_map = dict(state["connection_map"])
+        self._split_map = dict(state["split_map"])
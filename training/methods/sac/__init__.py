@@ -9,15 +9,23 @@ This module implements:
 - SAC learner with automatic entropy tuning
 """
 
-from training.methods.sac.networks import GNNBackbone, Actor, TwinCritics
-from training.methods.sac.replay_buffer import ReplayBuffer, Transition
-from training.methods.sac.learner import SACLearner
+import importlib
 
-__all__ = [
-    'GNNBackbone',
-    'Actor',
-    'TwinCritics',
-    'ReplayBuffer',
-    'Transition',
-    'SACLearner',
-]
+# Submodules need torch, so exports are resolved on first access (PEP 562)
+# rather than at package import.
+_EXPORTS = {
+    'GNNBackbone': 'training.methods.sac.networks',
+    'Actor': 'training.methods.sac.networks',
+    'TwinCritics': 'training.methods.sac.networks',
+    'ReplayBuffer': 'training.methods.sac.replay_buffer',
+    'Transition': 'training.methods.sac.replay_buffer',
+    'SACLearner': 'training.methods.sac.learner',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,76 @@
+"""
+CMA-ES Mode Benchmark
+
+Times sampling and distribution updates of the diagonal, full-covariance and
+limited-memory CMA-ES drivers across parameter counts, on a synthetic
+objective (no rollouts). Use it to pick ``ESConfig.OPTIMIZER`` for a policy
+size.
+
+    python training/scripts/benchmark_cmaes.py
+    python training/scripts/benchmark_cmaes.py --sizes 500 1000 2000 --population 32
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from training.config.evolution_strategies import ESConfig
+from training.config.pareto import ParetoConfig
+from training.methods.evolution_strategies.cmaes_variants import CMAES_DRIVERS, create_cmaes_driver
+
+
+def benchmark_mode(mode: str, param_size: int, generations: int) -> dict:
+    """Average per-generation sample/update time for one mode and size."""
+    np.random.seed(0)
+    driver = create_cmaes_driver(param_size, mode, ParetoConfig(ENABLED=False))
+    target = np.linspace(-1.0, 1.0, param_size)
+
+    sample_time = 0.0
+    update_time = 0.0
+    for _ in range(generations):
+        start = time.perf_counter()
+        candidates, _ = driver.sample_population()
+        sample_time += time.perf_counter() - start
+
+        fitnesses = (-np.sum((np.asarray(candidates) - target) ** 2, axis=1)).tolist()
+        start = time.perf_counter()
+        driver.update(fitnesses)
+        update_time += time.perf_counter() - start
+
+    return {
+        "sample_ms": 1000.0 * sample_time / generations,
+        "update_ms": 1000.0 * update_time / generations,
+        "eigen_ms": 1000.0 * getattr(driver, "last_eigen_duration", 0.0),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark CMA-ES covariance modes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000, 3000],
+                        help="Parameter counts to benchmark")
+    parser.add_argument("--population", type=int, default=ESConfig.POPULATION_SIZE)
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--modes", nargs="+", choices=sorted(CMAES_DRIVERS), default=sorted(CMAES_DRIVERS))
+    args = parser.parse_args()
+
+    ESConfig.POPULATION_SIZE = args.population
+    print(f"Population {args.population}, {args.generations} generations per cell, "
+          f"eigendecomposition every {ESConfig.CMAES_EIGEN_INTERVAL} generations (cmaes_full)")
+    print(f"{'mode':<12} {'params':>7} {'sample ms':>10} {'update ms':>10} {'eigen ms':>9}")
+    for param_size in args.sizes:
+        for mode in args.modes:
+            result = benchmark_mode(mode, param_size, args.generations)
+            eigen = f"{result['eigen_ms']:9.1f}" if mode == "cmaes_full" else f"{'-':>9}"
+            print(f"{mode:<12} {param_size:>7} {result['sample_ms']:10.2f} {result['update_ms']:10.2f} {eigen}")
+
+
+if __name__ == "__main__":
+    main()
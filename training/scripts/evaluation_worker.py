@@ -0,0 +1,51 @@
+"""
+Evaluation Worker Daemon
+
+Runs rollouts for GA / ES / NEAT trainers on other machines. Start one per
+host, then list the workers in RemoteEvaluationConfig.WORKERS
+(training/config/remote.py) on the training machine:
+
+    python training/scripts/evaluation_worker.py                          # 0.0.0.0:47320, one thread per core
+    python training/scripts/evaluation_worker.py --bind 127.0.0.1:0 --threads 2
+
+The worker must run the same code and configuration as the trainer; batches
+with a different configuration fingerprint are refused.
+"""
+
+import argparse
+import os
+import sys
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from training.config.remote import RemoteEvaluationConfig
+from training.core.remote_evaluation import EvaluationWorker
+from training.core.wire_protocol import parse_address
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remote evaluation worker for Asteroids AI training")
+    parser.add_argument("--bind", default=f"0.0.0.0:{RemoteEvaluationConfig.WORKER_PORT}", metavar="HOST:PORT",
+                        help="Address to listen on (port 0 = any free port)")
+    parser.add_argument("--threads", type=int, default=None,
+                        help="Rollouts evaluated at once (default: one per core)")
+    args = parser.parse_args()
+
+    host, port = parse_address(args.bind, default_host="0.0.0.0")
+    worker = EvaluationWorker(host, port, threads=args.threads)
+    # Parsed by launchers and tests that bind port 0
+    print(f"Evaluation worker listening on {worker.address} ({worker.threads} threads)", flush=True)
+    try:
+        worker.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.close()
+        print(f"Evaluation worker stopped after {worker.rollouts_done} rollouts")
+
+
+if __name__ == "__main__":
+    main()
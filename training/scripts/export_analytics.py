@@ -0,0 +1,46 @@
+"""
+Analytics Export
+
+Rebuilds the markdown report and the classic JSON export from the append-only
+analytics store a GA / ES / NEAT run writes to ``training/<method>_artifacts``.
+Works on a live run too: the store is flushed after every record.
+
+    python training/scripts/export_analytics.py --method es
+    python training/scripts/export_analytics.py --store run.jsonl.gz --json ""
+"""
+
+import argparse
+import os
+import sys
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from training.analytics.analytics import TrainingAnalytics
+from training.config.analytics import AnalyticsConfig
+from training.core.best_artifacts import artifacts_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild analytics reports from an append-only store")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--method", choices=["ga", "es", "neat"], help="Read the store from training/<method>_artifacts")
+    source.add_argument("--store", help="Path to a store file (.jsonl or .jsonl.gz)")
+    parser.add_argument("--report", default=AnalyticsConfig.REPORT_FILENAME, help="Markdown output ('' to skip)")
+    parser.add_argument("--json", default=AnalyticsConfig.DATA_FILENAME, help="JSON export output ('' to skip)")
+    args = parser.parse_args()
+
+    store_path = args.store or os.path.join(artifacts_dir(args.method), AnalyticsConfig.STORE_FILENAME)
+    analytics = TrainingAnalytics.from_store(store_path)
+    print(f"Loaded {len(analytics.generations_data)} generations from {store_path}")
+
+    if args.report:
+        print(f"Report: {analytics.generate_markdown_report(args.report)}")
+    if args.json:
+        print(f"JSON:   {analytics.save_json(args.json)}")
+
+
+if __name__ == "__main__":
+    main()
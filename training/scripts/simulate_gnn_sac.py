@@ -343,21 +343,18 @@ class SACSimulationScript:
         game.thrust_magnitude = float(action[1])
         game.shoot_requested = float(action[2]) > 0.5
 
-        game.on_update(SACConfig.FRAME_DELAY)
-        game.tracker.update(game)
-        game.metrics_tracker.update(game)
-
-        step_reward = reward_calculator.calculate_step_reward(
-            game.tracker,
-            game.metrics_tracker
+        # ACTION_REPEAT physics frames per transition (reward summed, early stop on death)
+        step_reward, frames, done = game.step_repeated(
+            SACConfig.FRAME_DELAY,
+            SACConfig.ACTION_REPEAT,
+            reward_calculator,
+            max_frames=SACConfig.MAX_EPISODE_STEPS - collector["episode_steps"]
         )
         step_reward *= SACConfig.REWARD_SCALE
 
         collector["episode_return"] += step_reward
-        collector["episode_steps"] += 1
+        collector["episode_steps"] += frames
         self.total_steps += 1
-
-        done = game.player not in game.player_list
         timeout = collector["episode_steps"] >= SACConfig.MAX_EPISODE_STEPS
 
         if done or timeout:
@@ -488,16 +485,17 @@ class SACSimulationScript:
             self._reset_display_episode()
             return
 
-        # Get state and select action
+        # Get state and select action (held between decisions with ACTION_REPEAT)
         self.game.tracker.update(self.game)
-        state = self.display_encoder.encode(self.game.tracker)
-        action = self._select_display_action(state)
+        if self.display_episode_steps % SACConfig.ACTION_REPEAT == 0:
+            state = self.display_encoder.encode(self.game.tracker)
+            action = self._select_display_action(state)
 
-        # Apply action
-        self.game.continuous_control_mode = True
-        self.game.turn_magnitude = float(action[0])
-        self.game.thrust_magnitude = float(action[1])
-        self.game.shoot_requested = float(action[2]) > 0.5
+            # Apply action
+            self.game.continuous_control_mode = True
+            self.game.turn_magnitude = float(action[0])
+            self.game.thrust_magnitude = float(action[1])
+            self.game.shoot_requested = float(action[2]) > 0.5
 
         # Step the game (temporarily disable external_control so our call works)
         self.game.external_control = False
@@ -564,15 +562,15 @@ class SACSimulationScript:
                 game.thrust_magnitude = float(action[1])
                 game.shoot_requested = float(action[2]) > 0.5
 
-                game.on_update(SACConfig.FRAME_DELAY)
-
-                step_reward = reward_calc.calculate_step_reward(
-                    game.tracker,
-                    game.metrics_tracker
+                step_reward, frames, _ = game.step_repeated(
+                    SACConfig.FRAME_DELAY,
+                    SACConfig.ACTION_REPEAT,
+                    reward_calc,
+                    max_frames=SACConfig.MAX_EPISODE_STEPS - steps
                 )
                 step_reward *= SACConfig.REWARD_SCALE
                 total_reward += step_reward
-                steps += 1
+                steps += frames
 
             total_reward += reward_calc.calculate_episode_reward(game.metrics_tracker) * SACConfig.REWARD_SCALE
             eval_returns.append(total_reward)
@@ -2,13 +2,17 @@
 ES Training Entry Point
 
 Runs parallel Evolution Strategies training for Asteroids AI.
+
+    python training/scripts/train_es.py              # windowed, best-of-gen playback
+    python training/scripts/train_es.py --headless   # no window; pair with view_best.py
+    python training/scripts/train_es.py --headless --resume   # continue from the last checkpoint
 """
 
+import argparse
 import sys
 import os
 import math
 import time
-import arcade
 import statistics
 
 # Add project root to path
@@ -17,7 +21,6 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from game import globals
-from Asteroids import AsteroidsGame
 from interfaces.encoders.HybridEncoder import HybridEncoder
 from interfaces.encoders.TemporalStackEncoder import TemporalStackEncoder
 from interfaces.ActionInterface import ActionInterface
@@ -25,23 +28,34 @@ from ai_agents.neuroevolution.nn_agent import NNAgent
 from training.config.evolution_strategies import ESConfig
 from training.config.pareto import ParetoConfig
 from training.config.rewards import create_reward_calculator
-from training.core.episode_runner import EpisodeRunner
-from training.core.population_evaluator import evaluate_population_parallel, evaluate_single_agent
-from training.core.display_manager import DisplayManager
-from training.methods.evolution_strategies.cmaes_driver import CMAESDriver
+from training.core.population_evaluator import evaluate_single_agent
+from training.core.generation_pipeline import GenerationPipeline
+from training.core.remote_evaluation import create_remote_backend
+from training.core.best_artifacts import BEST_WEIGHTS_NAME, artifacts_dir, save_best_weights
+from training.core.checkpoints import CHECKPOINT_NAME, CheckpointWriter, capture_rng_state, load_checkpoint, restore_rng_state
+from training.methods.evolution_strategies.cmaes_variants import create_cmaes_driver
 from training.components.pareto.objectives import compute_objective_matrix
 from training.components.pareto.utility import pareto_order
 from training.analytics.analytics import TrainingAnalytics
+from training.config.analytics import AnalyticsConfig
+from training.config.islands import IslandConfig
 
 
 class ESTrainingScript:
     """
     Main script for Evolution Strategies training. Orchestrates components.
+
+    Pass ``game=None`` to train headless: no episode runner or display is
+    created and ``run_headless()`` drives the generation loop directly.
+
+    ``max_workers`` and ``artifacts_name`` let several trainers share a
+    machine (see train_islands.py); set ``migration`` to an
+    ``IslandMigration`` to exchange candidates with other islands.
     """
 
-    def __init__(self, game):
+    def __init__(self, game=None, max_workers=None, artifacts_name="es"):
         self.game = game
-        self.max_workers = os.cpu_count()
+        self.max_workers = max_workers or os.cpu_count()
 
         # 1. Setup Infrastructure
         base_encoder = HybridEncoder(
@@ -64,12 +78,19 @@ class ESTrainingScript:
             frame_delay=ESConfig.FRAME_DELAY
         )
 
-        self.episode_runner = EpisodeRunner(
-            game=game,
-            state_encoder=self.state_encoder,
-            action_interface=self.action_interface,
-            reward_calculator=self.reward_calculator
-        )
+        self.episode_runner = None
+        if game is not None:
+            # Windowed only, so headless and island processes never import arcade
+            from training.core.display_manager import DisplayManager
+            from training.core.episode_runner import EpisodeRunner
+
+            self.episode_runner = EpisodeRunner(
+                game=game,
+                state_encoder=self.state_encoder,
+                action_interface=self.action_interface,
+                reward_calculator=self.reward_calculator,
+                action_repeat=ESConfig.ACTION_REPEAT
+            )
 
         # 2. Setup Driver (ES Logic)
         input_size = self.state_encoder.get_state_size()
@@ -85,7 +106,21 @@ class ESTrainingScript:
             ACCURACY_MIN_SHOTS=5,
             FRAME_DELAY=ESConfig.FRAME_DELAY
         )
-        self.driver = CMAESDriver(param_size=param_size, pareto_config=self.pareto_config)
+        self.driver = create_cmaes_driver(param_size, pareto_config=self.pareto_config)
+        self.representation = {
+            "kind": "vector", "input_size": input_size, "hidden_size": hidden_size, "param_size": param_size
+        }
+        self.pipeline = GenerationPipeline(
+            max_workers=self.max_workers,
+            enabled=ESConfig.PIPELINE_GENERATIONS,
+            backend=create_remote_backend(),
+            state_encoder=self.state_encoder,
+            action_interface=self.action_interface,
+            max_steps=ESConfig.MAX_STEPS,
+            seeds_per_agent=ESConfig.SEEDS_PER_AGENT,
+            use_common_seeds=ESConfig.USE_COMMON_SEEDS,
+            action_repeat=ESConfig.ACTION_REPEAT
+        )
 
         # 3. Setup Analytics
         self.analytics = TrainingAnalytics()
@@ -114,14 +149,25 @@ class ESTrainingScript:
             'restart_sigma_multiplier': ESConfig.RESTART_SIGMA_MULTIPLIER,
             'restart_use_best_candidate': ESConfig.RESTART_USE_BEST_CANDIDATE,
             'max_workers': self.max_workers,
+            'pipeline_generations': ESConfig.PIPELINE_GENERATIONS,
             'temporal_stack_enabled': ESConfig.USE_TEMPORAL_STACK,
             'temporal_stack_size': ESConfig.TEMPORAL_STACK_SIZE,
             'temporal_stack_include_deltas': ESConfig.TEMPORAL_INCLUDE_DELTAS,
             **self.pareto_config.to_dict(),
         })
 
-        # 4. Setup Display
-        self.display_manager = DisplayManager(game, self.episode_runner, self.analytics)
+        # 4. Setup Display (windowed mode only)
+        self.display_manager = None
+        if game is not None:
+            self.display_manager = DisplayManager(game, self.episode_runner, self.analytics)
+
+        # Artifacts (tailed by training/scripts/view_best.py)
+        self.artifacts_dir = artifacts_dir(artifacts_name)
+        self.best_weights_path = os.path.join(self.artifacts_dir, BEST_WEIGHTS_NAME)
+        self.checkpoint_writer = CheckpointWriter(os.path.join(self.artifacts_dir, CHECKPOINT_NAME))
+        if AnalyticsConfig.STORE_ENABLED:
+            self.analytics.attach_store(os.path.join(self.artifacts_dir, AnalyticsConfig.STORE_FILENAME))
+        self.live_report_path = os.path.join(self.artifacts_dir, AnalyticsConfig.LIVE_REPORT_FILENAME)
 
         # State
         self.current_generation = 0
@@ -135,19 +181,21 @@ class ESTrainingScript:
         self.restart_cooldown = 0
         self.phase = "sampling"
         self.current_candidates = []
+        self.migration = None
         self.current_fitnesses = []
         self.current_per_agent_metrics = []
         self.current_objective_vectors = []
         self.current_objective_directions = []
 
         # Hook draw
-        original_draw = self.game.on_draw
+        if game is not None:
+            original_draw = self.game.on_draw
 
-        def new_draw():
-            original_draw()
-            self.display_manager.draw()
+            def new_draw():
+                original_draw()
+                self.display_manager.draw()
 
-        self.game.on_draw = new_draw
+            self.game.on_draw = new_draw
 
         print("ES Training Script Initialized")
         print(f"  Population Size: {ESConfig.POPULATION_SIZE}")
@@ -224,7 +272,8 @@ class ESTrainingScript:
                         max_steps=ESConfig.MAX_STEPS,
                         frame_delay=ESConfig.FRAME_DELAY,
                         random_seed=seed,
-                        hidden_size=ESConfig.HIDDEN_LAYER_SIZE
+                        hidden_size=ESConfig.HIDDEN_LAYER_SIZE,
+                        action_repeat=ESConfig.ACTION_REPEAT
                     )
                 )
             per_agent_metrics[idx] = self._blend_metrics(
@@ -242,218 +291,296 @@ class ESTrainingScript:
         return fitnesses, per_agent_metrics, objective_vectors, objective_directions, order
 
     def update(self, delta_time):
+        import arcade
+
         try:
+            # Phase: Displaying (the next generation evaluates in the background)
+            if self.display_manager.showing_best_agent:
+                status = self.display_manager.update(delta_time)
+                if status == "done" and self.phase == "complete":
+                    arcade.close_window()
+                return
+
             if self.current_generation >= ESConfig.NUM_GENERATIONS:
-                if not self.display_manager.showing_best_agent:
+                if self.phase != "complete":
+                    self.phase = "complete"
                     print("Training Complete.")
                     print(f"All-time best fitness: {self.best_fitness:.2f} (Generation {self.best_generation})")
                     self._save()
                     if self.best_candidate is not None:
                         agent = NNAgent(self.best_candidate, self.state_encoder, self.action_interface)
                         self.display_manager.start_display(agent, self.best_fitness, self.best_fitness)
-                    return
-
-            # Phase: Displaying
-            if self.display_manager.showing_best_agent:
-                status = self.display_manager.update(delta_time)
-                if status == "done":
-                    if self.current_generation >= ESConfig.NUM_GENERATIONS:
-                        arcade.close_window()
                     else:
-                        self.phase = "updating"
+                        arcade.close_window()
                 return
 
-            # Phase: Sampling
-            if self.phase == "sampling":
-                print(f"\nGeneration {self.current_generation + 1}: Sampling...")
-                self.display_manager.update_info_text_training(
-                    self.current_generation + 1,
-                    ESConfig.NUM_GENERATIONS,
-                    self.max_workers,
-                    "Sampling perturbations..."
-                )
+            # Phase: Evaluating -> updating, then play back while N+1 evaluates
+            self.display_manager.update_info_text_training(
+                self.current_generation + 1,
+                ESConfig.NUM_GENERATIONS,
+                self.max_workers,
+                "Evaluating..."
+            )
+            current_best_candidate, current_best_fit = self._step_generation()
 
-                # Sample candidates from the distribution
-                self.current_candidates, _ = self.driver.sample_population()
-                self.phase = "evaluating"
-                return
+            # Start Display with best candidate
+            display_agent = NNAgent(current_best_candidate, self.state_encoder, self.action_interface)
+            self.display_manager.start_display(display_agent, current_best_fit, self.best_fitness)
 
-            # Phase: Evaluating
-            if self.phase == "evaluating":
-                print(f"Generation {self.current_generation + 1}: Evaluating {len(self.current_candidates)} candidates...")
-                self.display_manager.update_info_text_training(
-                    self.current_generation + 1,
-                    ESConfig.NUM_GENERATIONS,
-                    self.max_workers,
-                    "Evaluating..."
-                )
+        except Exception as e:
+            print(f"Error: {e}")
+            import traceback
+            traceback.print_exc()
+            self._save()
+            arcade.close_window()
 
-                eval_start = time.time()
-                fitnesses, generation_seed, gen_metrics, per_agent_metrics = evaluate_population_parallel(
-                    self.current_candidates,
-                    self.state_encoder,
-                    self.action_interface,
-                    max_steps=ESConfig.MAX_STEPS,
-                    max_workers=self.max_workers,
-                    seeds_per_agent=ESConfig.SEEDS_PER_AGENT,
-                    use_common_seeds=ESConfig.USE_COMMON_SEEDS
-                )
+    def run_headless(self):
+        """Run the full generation loop without a window or playback."""
+        try:
+            while self.current_generation < ESConfig.NUM_GENERATIONS:
+                self._step_generation()
+            print("Training Complete.")
+            print(f"All-time best fitness: {self.best_fitness:.2f} (Generation {self.best_generation})")
+        finally:
+            self.pipeline.shutdown()
+            self.checkpoint_writer.close()
+            self._save()
+            self.analytics.close_store()
 
-                # Pareto objectives for this generation
-                objective_vectors, objective_directions, _ = compute_objective_matrix(
-                    per_agent_metrics,
-                    self.pareto_config
-                )
-                fitnesses, per_agent_metrics, objective_vectors, objective_directions, order = self._apply_noise_handling(
-                    generation_seed,
-                    fitnesses,
-                    per_agent_metrics,
-                    objective_vectors,
-                    objective_directions
-                )
+    def _sample_generation(self):
+        print(f"\nGeneration {self.current_generation + 1}: Sampling...")
+        # Sample candidates from the distribution
+        self.current_candidates, _ = self.driver.sample_population()
 
-                self.current_fitnesses = fitnesses
-                self.current_per_agent_metrics = per_agent_metrics
-                self.current_objective_vectors = objective_vectors
-                self.current_objective_directions = objective_directions
-                best_idx = order[0] if order else 0
-                current_best_fit = fitnesses[best_idx]
-                current_best_candidate = self.current_candidates[best_idx]
-                prev_best = self.best_fitness
-                gen_best_fit = max(fitnesses) if fitnesses else float('-inf')
-                if gen_best_fit > prev_best:
-                    self.best_fitness = gen_best_fit
-                    self.best_generation = self.current_generation + 1
-                    self.fitness_stagnation = 0
-                else:
-                    self.fitness_stagnation += 1
-
-                if ESConfig.RESTART_ENABLED:
-                    if self.restart_cooldown > 0:
-                        self.restart_cooldown -= 1
-                    if (
-                        not self.restart_pending
-                        and self.restart_cooldown <= 0
-                        and (self.current_generation + 1) >= ESConfig.RESTART_MIN_GENERATIONS
-                        and self.fitness_stagnation >= ESConfig.RESTART_PATIENCE
-                    ):
-                        self.restart_pending = True
-
-                # Track normalized Pareto score across generations for "best of run"
-                if self.objective_maxima is None:
-                    self.objective_maxima = [0.0 for _ in objective_vectors[0]]
-                for vector in objective_vectors:
-                    for i, value in enumerate(vector):
-                        if value > self.objective_maxima[i]:
-                            self.objective_maxima[i] = value
-
-                def _pareto_score(vec):
-                    score = 0.0
-                    for i, value in enumerate(vec):
-                        denom = max(self.objective_maxima[i], 1e-9)
-                        score += value / denom
-                    return score
-
-                if objective_vectors:
-                    best_score = _pareto_score(objective_vectors[best_idx])
-                    if best_score > self.best_pareto_score:
-                        self.best_pareto_score = best_score
-                        self.best_candidate = current_best_candidate.copy()
-
-                # Record Analytics
-                timing_stats = {
-                    'evaluation_duration': time.time() - eval_start,
-                    'update_duration': self.driver.last_update_duration
-                }
-
-                # Merge ES-specific stats
-                es_stats = self.driver.last_update_stats.copy()
-
-                self.analytics.record_generation(
-                    generation=self.current_generation + 1,
-                    fitness_scores=fitnesses,
-                    behavioral_metrics=gen_metrics,
-                    timing_stats=timing_stats,
-                    operator_stats=es_stats
-                )
-                self.analytics.record_distributions(
-                    generation=self.current_generation + 1,
-                    fitness_values=fitnesses,
-                    per_agent_metrics=per_agent_metrics
-                )
+    def _step_generation(self):
+        """Collect generation N, update the distribution, submit N+1, then report N.
 
-                # Calculate stats for display
-                avg_fit = sum(fitnesses) / len(fitnesses)
-                min_fit = min(fitnesses)
-                std_fit = statistics.stdev(fitnesses) if len(fitnesses) > 1 else 0.0
-
-                print("\n" + "=" * 60)
-                print(f" GENERATION {self.current_generation + 1} SUMMARY (ES)")
-                print("=" * 60)
-                print(f" FITNESS")
-                print(f"  Best:  {current_best_fit:8.2f}  |  Avg: {avg_fit:8.2f}")
-                print(f"  Min:   {min_fit:8.2f}  |  Std: {std_fit:8.2f}")
-                print(f"  All-time Best: {self.best_fitness:.2f} (Gen {self.best_generation})")
-                print("-" * 60)
-                print(f" ES PARAMETERS")
-                sigma = es_stats.get('sigma', self.driver.sigma)
-                cov_mean = es_stats.get('cov_diag_mean', 0.0)
-                cov_min = es_stats.get('cov_diag_min', 0.0)
-                cov_max = es_stats.get('cov_diag_max', 0.0)
-                pareto_front0 = es_stats.get('pareto_front0_size', 0)
-                print(f"  Sigma: {sigma:.4f}")
-                print(f"  Cov Diag: mean={cov_mean:.4f} min={cov_min:.4f} max={cov_max:.4f}")
-                if pareto_front0:
-                    print(f"  Pareto Front0 Size: {pareto_front0}")
-                print("-" * 60)
-                print(f" BEHAVIOR (Avg)")
-                print(f"  Kills:    {gen_metrics.get('avg_kills', 0):6.1f}  |  Accuracy: {gen_metrics.get('avg_accuracy', 0) * 100:5.1f}%")
-                print(f"  Survival: {gen_metrics.get('avg_steps_survived', 0):6.0f}  |  Shots:    {gen_metrics.get('avg_shots_fired', 0):5.1f}")
-                print("=" * 60 + "\n")
-
-                # Start Display with best candidate
-                display_agent = NNAgent(current_best_candidate, self.state_encoder, self.action_interface)
-                self.display_manager.start_display(display_agent, current_best_fit, self.best_fitness)
-                self.phase = "displaying"
-                return
+        The CMA-ES update only needs this generation's ranking, so the next
+        sample starts evaluating before the summary, artifacts and playback.
 
-            # Phase: Updating
-            if self.phase == "updating":
-                print(f"Updating mean for generation {self.current_generation + 1}...")
-
-                if self.restart_pending:
-                    print("Restarting CMA-ES due to stagnation...")
-                    restart_sigma = ESConfig.CMAES_SIGMA if ESConfig.CMAES_SIGMA is not None else ESConfig.SIGMA
-                    restart_sigma = float(restart_sigma) * ESConfig.RESTART_SIGMA_MULTIPLIER
-                    restart_mean = None
-                    if ESConfig.RESTART_USE_BEST_CANDIDATE and self.best_candidate is not None:
-                        restart_mean = self.best_candidate
-                    self.driver.restart(mean=restart_mean, sigma=restart_sigma, reason="stagnation")
-                    self.restart_pending = False
-                    self.restart_cooldown = ESConfig.RESTART_COOLDOWN
-                    self.fitness_stagnation = 0
-                    self.current_generation += 1
-                    self.phase = "sampling"
-                    return
-
-                # Update the mean using fitness-weighted gradient
-                self.driver.update(
-                    self.current_fitnesses,
-                    self.current_per_agent_metrics,
-                    objective_vectors=self.current_objective_vectors,
-                    objective_directions=self.current_objective_directions
-                )
+        Returns:
+            (Pareto-best candidate of this generation, its fitness)
+        """
+        generation = self.current_generation + 1
+        if not self.pipeline.has_pending():
+            self._sample_generation()
+        print(f"Generation {generation}: Evaluating {len(self.current_candidates)} candidates...")
+        fitnesses, generation_seed, gen_metrics, per_agent_metrics = self.pipeline.collect(self.current_candidates)
 
-                self.current_generation += 1
-                self.phase = "sampling"
-                return
+        # Pareto objectives for this generation
+        objective_vectors, objective_directions, _ = compute_objective_matrix(
+            per_agent_metrics,
+            self.pareto_config
+        )
+        fitnesses, per_agent_metrics, objective_vectors, objective_directions, order = self._apply_noise_handling(
+            generation_seed,
+            fitnesses,
+            per_agent_metrics,
+            objective_vectors,
+            objective_directions
+        )
 
-        except Exception as e:
-            print(f"Error: {e}")
-            import traceback
-            traceback.print_exc()
-            self._save()
-            arcade.close_window()
+        self.current_fitnesses = fitnesses
+        self.current_per_agent_metrics = per_agent_metrics
+        self.current_objective_vectors = objective_vectors
+        self.current_objective_directions = objective_directions
+        best_idx = order[0] if order else 0
+        current_best_fit = fitnesses[best_idx]
+        current_best_candidate = self.current_candidates[best_idx]
+        prev_best = self.best_fitness
+        gen_best_fit = max(fitnesses) if fitnesses else float('-inf')
+        if gen_best_fit > prev_best:
+            self.best_fitness = gen_best_fit
+            self.best_generation = self.current_generation + 1
+            self.fitness_stagnation = 0
+        else:
+            self.fitness_stagnation += 1
+
+        if ESConfig.RESTART_ENABLED:
+            if self.restart_cooldown > 0:
+                self.restart_cooldown -= 1
+            if (
+                not self.restart_pending
+                and self.restart_cooldown <= 0
+                and (self.current_generation + 1) >= ESConfig.RESTART_MIN_GENERATIONS
+                and self.fitness_stagnation >= ESConfig.RESTART_PATIENCE
+            ):
+                self.restart_pending = True
+
+        # Track normalized Pareto score across generations for "best of run"
+        if self.objective_maxima is None:
+            self.objective_maxima = [0.0 for _ in objective_vectors[0]]
+        for vector in objective_vectors:
+            for i, value in enumerate(vector):
+                if value > self.objective_maxima[i]:
+                    self.objective_maxima[i] = value
+
+        def _pareto_score(vec):
+            score = 0.0
+            for i, value in enumerate(vec):
+                denom = max(self.objective_maxima[i], 1e-9)
+                score += value / denom
+            return score
+
+        improved = False
+        if objective_vectors:
+            best_score = _pareto_score(objective_vectors[best_idx])
+            if best_score > self.best_pareto_score:
+                self.best_pareto_score = best_score
+                self.best_candidate = current_best_candidate.copy()
+                improved = True
+
+        # Record Analytics
+        timing_stats = {
+            **self.pipeline.last_stats,
+            'update_duration': self.driver.last_update_duration
+        }
+
+        # Merge ES-specific stats
+        es_stats = self.driver.last_update_stats.copy()
+
+        # Island runs: publish this generation's best, take in neighbours'
+        migrants = []
+        if self.migration is not None and self.migration.due(generation):
+            migrants = self.migration.exchange(
+                generation, self.current_candidates, fitnesses, per_agent_metrics, encode=list
+            )
+            es_stats.update(self.migration.last_stats)
+
+        self.analytics.record_generation(
+            generation=self.current_generation + 1,
+            fitness_scores=fitnesses,
+            behavioral_metrics=gen_metrics,
+            timing_stats=timing_stats,
+            operator_stats=es_stats
+        )
+
+        sigma = es_stats.get('sigma', self.driver.sigma)
+        self._update_generation()
+        if migrants and migrants[0].fitness > gen_best_fit:
+            distance = self.driver.pull_mean(migrants[0].individual, IslandConfig.ES_IMMIGRANT_PULL)
+            print(f"Immigrant from island {migrants[0].source} pulled the mean {distance:.3f} toward it")
+        # Captured before N+1 is sampled and seeded; a resumed run replays both
+        next_rng_state = capture_rng_state()
+        if self.current_generation < ESConfig.NUM_GENERATIONS:
+            self._sample_generation()
+            self.pipeline.submit(self.current_candidates)
+
+        # Everything below overlaps with the next generation's evaluation
+        if improved:
+            save_best_weights(
+                self.best_weights_path,
+                self.best_candidate,
+                current_best_fit,
+                generation,
+                ESConfig.HIDDEN_LAYER_SIZE
+            )
+        self.analytics.record_distributions(
+            generation=generation,
+            fitness_values=fitnesses,
+            per_agent_metrics=per_agent_metrics
+        )
+        if AnalyticsConfig.LIVE_REPORT_EVERY and generation % AnalyticsConfig.LIVE_REPORT_EVERY == 0:
+            self.analytics.generate_live_report(self.live_report_path)
+
+        # Calculate stats for display
+        avg_fit = sum(fitnesses) / len(fitnesses)
+        min_fit = min(fitnesses)
+        std_fit = statistics.stdev(fitnesses) if len(fitnesses) > 1 else 0.0
+
+        print("\n" + "=" * 60)
+        print(f" GENERATION {generation} SUMMARY (ES)")
+        print("=" * 60)
+        print(f" FITNESS")
+        print(f"  Best:  {current_best_fit:8.2f}  |  Avg: {avg_fit:8.2f}")
+        print(f"  Min:   {min_fit:8.2f}  |  Std: {std_fit:8.2f}")
+        print(f"  All-time Best: {self.best_fitness:.2f} (Gen {self.best_generation})")
+        print("-" * 60)
+        print(f" ES PARAMETERS")
+        cov_mean = es_stats.get('cov_diag_mean', 0.0)
+        cov_min = es_stats.get('cov_diag_min', 0.0)
+        cov_max = es_stats.get('cov_diag_max', 0.0)
+        pareto_front0 = es_stats.get('pareto_front0_size', 0)
+        print(f"  Sigma: {sigma:.4f}")
+        print(f"  Cov Diag: mean={cov_mean:.4f} min={cov_min:.4f} max={cov_max:.4f}")
+        if pareto_front0:
+            print(f"  Pareto Front0 Size: {pareto_front0}")
+        print("-" * 60)
+        print(f" BEHAVIOR (Avg)")
+        print(f"  Kills:    {gen_metrics.get('avg_kills', 0):6.1f}  |  Accuracy: {gen_metrics.get('avg_accuracy', 0) * 100:5.1f}%")
+        print(f"  Survival: {gen_metrics.get('avg_steps_survived', 0):6.0f}  |  Shots:    {gen_metrics.get('avg_shots_fired', 0):5.1f}")
+        print("-" * 60)
+        print(self.pipeline.summary_line())
+        print("=" * 60 + "\n")
+
+        self._maybe_checkpoint(generation, next_rng_state)
+        return current_best_candidate, current_best_fit
+
+    def _update_generation(self):
+        print(f"Updating mean for generation {self.current_generation + 1}...")
+
+        if self.restart_pending:
+            print("Restarting CMA-ES due to stagnation...")
+            restart_sigma = ESConfig.CMAES_SIGMA if ESConfig.CMAES_SIGMA is not None else ESConfig.SIGMA
+            restart_sigma = float(restart_sigma) * ESConfig.RESTART_SIGMA_MULTIPLIER
+            restart_mean = None
+            if ESConfig.RESTART_USE_BEST_CANDIDATE and self.best_candidate is not None:
+                restart_mean = self.best_candidate
+            self.driver.restart(mean=restart_mean, sigma=restart_sigma, reason="stagnation")
+            self.restart_pending = False
+            self.restart_cooldown = ESConfig.RESTART_COOLDOWN
+            self.fitness_stagnation = 0
+            self.current_generation += 1
+            return
+
+        # Update the mean using fitness-weighted gradient
+        self.driver.update(
+            self.current_fitnesses,
+            self.current_per_agent_metrics,
+            objective_vectors=self.current_objective_vectors,
+            objective_directions=self.current_objective_directions
+        )
+
+        self.current_generation += 1
+
+    def _maybe_checkpoint(self, generation, rng_state):
+        if ESConfig.CHECKPOINT_EVERY and generation % ESConfig.CHECKPOINT_EVERY == 0:
+            self.checkpoint_writer.save({
+                "method": "es",
+                "current_generation": self.current_generation,
+                "best_fitness": self.best_fitness,
+                "best_candidate": self.best_candidate,
+                "best_generation": self.best_generation,
+                "best_pareto_score": self.best_pareto_score,
+                "objective_maxima": self.objective_maxima,
+                "fitness_stagnation": self.fitness_stagnation,
+                "restart_pending": self.restart_pending,
+                "restart_cooldown": self.restart_cooldown,
+                "driver": self.driver.state_dict(),
+                "analytics": self.analytics.state_dict(),
+                "rng": rng_state
+            })
+            print(f"Checkpoint after generation {generation} -> {self.checkpoint_writer.path}")
+
+    def resume(self, path=None):
+        """Restore a checkpoint; the next generation is resampled and continues the run bit-exactly."""
+        path = path or self.checkpoint_writer.path
+        state = load_checkpoint(path)
+        if state.get("method") != "es":
+            raise ValueError(f"{path} is a {state.get('method')} checkpoint, not es")
+        self.current_generation = state["current_generation"]
+        self.best_fitness = state["best_fitness"]
+        self.best_candidate = state["best_candidate"]
+        self.best_generation = state["best_generation"]
+        self.best_pareto_score = state["best_pareto_score"]
+        self.objective_maxima = state["objective_maxima"]
+        self.fitness_stagnation = state["fitness_stagnation"]
+        self.restart_pending = state["restart_pending"]
+        self.restart_cooldown = state["restart_cooldown"]
+        self.driver.load_state_dict(state["driver"])
+        self.analytics.load_state_dict(state["analytics"])
+        restore_rng_state(state["rng"])
+        print(f"Resumed ES run from {path} after generation {self.current_generation}")
 
     def _save(self):
         self.analytics.generate_markdown_report("training_summary_es.md")
@@ -462,16 +589,38 @@ class ESTrainingScript:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Evolution Strategies training for Asteroids AI")
+    parser.add_argument("--headless", action="store_true",
+                        help="Train without a window (view progress with view_best.py --method es)")
+    parser.add_argument("--resume", nargs="?", const="", default=None, metavar="CHECKPOINT",
+                        help="Continue from a checkpoint (default: training/es_artifacts/checkpoint.npz)")
+    args = parser.parse_args()
+
+    if args.headless:
+        trainer = ESTrainingScript()
+        if args.resume is not None:
+            trainer.resume(args.resume or None)
+        trainer.run_headless()
+        return
+
+    import arcade
+    from Asteroids import AsteroidsGame
+
     window = AsteroidsGame(globals.SCREEN_WIDTH, globals.SCREEN_HEIGHT, "Asteroids AI - Evolution Strategies Training")
     window.setup()
     trainer = ESTrainingScript(window)
+    if args.resume is not None:
+        trainer.resume(args.resume or None)
     arcade.schedule(trainer.update, ESConfig.FRAME_DELAY)
 
     try:
         arcade.run()
     finally:
         print("\nApplication exiting, saving training results...")
+        trainer.pipeline.shutdown()
+        trainer.checkpoint_writer.close()
         trainer._save()
+        trainer.analytics.close_store()
 
 
 if __name__ == "__main__":
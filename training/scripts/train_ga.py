@@ -2,13 +2,18 @@
 GA Training Entry Point
 
 Runs parallel Genetic Algorithm training for Asteroids AI.
+
+    python training/scripts/train_ga.py              # windowed, best-of-gen playback
+    python training/scripts/train_ga.py --headless   # no window; pair with view_best.py
+    python training/scripts/train_ga.py --headless --resume   # continue from the last checkpoint
+    python training/scripts/train_ga.py --steady-state         # asynchronous evolution (headless)
 """
 
+import argparse
 import sys
 import os
 import math
 import time
-import arcade
 import statistics
 
 # Add project root to path
@@ -17,26 +22,39 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from game import globals
-from Asteroids import AsteroidsGame
 from interfaces.encoders.HybridEncoder import HybridEncoder
 from interfaces.ActionInterface import ActionInterface
 from ai_agents.neuroevolution.nn_agent import NNAgent
 from training.config.genetic_algorithm import GAConfig
 from training.config.rewards import create_reward_calculator
-from training.core.episode_runner import EpisodeRunner
-from training.core.population_evaluator import evaluate_population_parallel
-from training.core.display_manager import DisplayManager
+from training.core.generation_pipeline import GenerationPipeline
+from training.core.remote_evaluation import create_remote_backend
+from training.core.steady_state import CompletionWindow, SteadyStateEvaluator, default_in_flight
+from training.core.islands import replace_members
+from training.core.best_artifacts import BEST_WEIGHTS_NAME, artifacts_dir, save_best_weights
+from training.core.checkpoints import CHECKPOINT_NAME, CheckpointWriter, capture_rng_state, load_checkpoint, restore_rng_state
 from training.methods.genetic_algorithm.driver import GADriver
 from training.analytics.analytics import TrainingAnalytics
+from training.config.analytics import AnalyticsConfig
 
 
 class GATrainingScript:
     """
     Main script for GA training. Orchestrates components.
+
+    Pass ``game=None`` to train headless: no episode runner or display is
+    created and ``run_headless()`` drives the generation loop directly.
+    ``run_steady_state()`` is the asynchronous alternative (no generations).
+
+    ``max_workers`` and ``artifacts_name`` let several trainers share a
+    machine (see train_islands.py); set ``migration`` to an
+    ``IslandMigration`` to exchange individuals with other islands.
     """
-    def __init__(self, game):
+    def __init__(self, game=None, steady_state=None, max_workers=None, artifacts_name="ga"):
         self.game = game
-        self.max_workers = os.cpu_count()
+        self.max_workers = max_workers or os.cpu_count()
+        self.steady_state = GAConfig.STEADY_STATE if steady_state is None else steady_state
+        self.steady_state_report_every = GAConfig.STEADY_STATE_REPORT_EVERY or GAConfig.POPULATION_SIZE
         
         # 1. Setup Infrastructure
         self.state_encoder = HybridEncoder(
@@ -51,12 +69,19 @@ class GATrainingScript:
             frame_delay=GAConfig.FRAME_DELAY
         )
         
-        self.episode_runner = EpisodeRunner(
-            game=game,
-            state_encoder=self.state_encoder,
-            action_interface=self.action_interface,
-            reward_calculator=self.reward_calculator
-        )
+        self.episode_runner = None
+        if game is not None:
+            # Windowed only, so headless and island processes never import arcade
+            from training.core.display_manager import DisplayManager
+            from training.core.episode_runner import EpisodeRunner
+
+            self.episode_runner = EpisodeRunner(
+                game=game,
+                state_encoder=self.state_encoder,
+                action_interface=self.action_interface,
+                reward_calculator=self.reward_calculator,
+                action_repeat=GAConfig.ACTION_REPEAT
+            )
         
         # 2. Setup Driver (GA Logic)
         input_size = self.state_encoder.get_state_size()
@@ -65,6 +90,21 @@ class GATrainingScript:
         param_size = NNAgent.get_parameter_count(input_size, hidden_size, output_size)
         
         self.driver = GADriver(param_size=param_size)
+        self.representation = {
+            "kind": "vector", "input_size": input_size, "hidden_size": hidden_size, "param_size": param_size
+        }
+        self.pipeline = GenerationPipeline(
+            max_workers=self.max_workers,
+            enabled=GAConfig.PIPELINE_GENERATIONS,
+            backend=create_remote_backend(),
+            schedule_by_cost=GAConfig.SCHEDULE_BY_COST,
+            state_encoder=self.state_encoder,
+            action_interface=self.action_interface,
+            max_steps=GAConfig.MAX_STEPS,
+            seeds_per_agent=GAConfig.SEEDS_PER_AGENT,
+            use_common_seeds=GAConfig.USE_COMMON_SEEDS,
+            action_repeat=GAConfig.ACTION_REPEAT
+        )
         
         # 3. Setup Analytics
         self.analytics = TrainingAnalytics()
@@ -73,10 +113,23 @@ class GATrainingScript:
             'num_generations': GAConfig.NUM_GENERATIONS,
             'mutation_probability': GAConfig.MUTATION_PROBABILITY,
             'max_workers': self.max_workers,
+            'pipeline_generations': GAConfig.PIPELINE_GENERATIONS,
+            'evolution_mode': 'steady_state' if self.steady_state else 'generational',
+            'steady_state_report_every': self.steady_state_report_every if self.steady_state else None,
         })
 
-        # 4. Setup Display
-        self.display_manager = DisplayManager(game, self.episode_runner, self.analytics)
+        # 4. Setup Display (windowed mode only)
+        self.display_manager = None
+        if game is not None:
+            self.display_manager = DisplayManager(game, self.episode_runner, self.analytics)
+
+        # Artifacts (tailed by training/scripts/view_best.py)
+        self.artifacts_dir = artifacts_dir(artifacts_name)
+        self.best_weights_path = os.path.join(self.artifacts_dir, BEST_WEIGHTS_NAME)
+        self.checkpoint_writer = CheckpointWriter(os.path.join(self.artifacts_dir, CHECKPOINT_NAME))
+        if AnalyticsConfig.STORE_ENABLED:
+            self.analytics.attach_store(os.path.join(self.artifacts_dir, AnalyticsConfig.STORE_FILENAME))
+        self.live_report_path = os.path.join(self.artifacts_dir, AnalyticsConfig.LIVE_REPORT_FILENAME)
         
         # State
         self.current_generation = 0
@@ -85,116 +138,48 @@ class GATrainingScript:
         self.phase = "evaluating"
         self.current_fitnesses = []
         self.current_per_agent_metrics = []
+        self.migration = None
         
         # Hook draw
-        original_draw = self.game.on_draw
-        def new_draw():
-            original_draw()
-            self.display_manager.draw()
-        self.game.on_draw = new_draw
+        if game is not None:
+            original_draw = self.game.on_draw
+            def new_draw():
+                original_draw()
+                self.display_manager.draw()
+            self.game.on_draw = new_draw
         
         print("GA Training Script Initialized.")
 
     def update(self, delta_time):
+        import arcade
+
         try:
+            # Phase: Displaying (the next generation evaluates in the background)
+            if self.display_manager.showing_best_agent:
+                status = self.display_manager.update(delta_time)
+                if status == "done" and self.phase == "complete":
+                    arcade.close_window()
+                return
+
             if self.current_generation >= GAConfig.NUM_GENERATIONS:
-                if not self.display_manager.showing_best_agent:
+                if self.phase != "complete":
+                    self.phase = "complete"
                     print("Training Complete.")
                     self._save()
                     if self.best_individual:
                         agent = NNAgent(self.best_individual, self.state_encoder, self.action_interface)
                         self.display_manager.start_display(agent, self.best_fitness, self.best_fitness)
-                    return
-            
-            # Phase: Displaying
-            if self.display_manager.showing_best_agent:
-                status = self.display_manager.update(delta_time)
-                if status == "done":
-                    if self.current_generation >= GAConfig.NUM_GENERATIONS:
-                        arcade.close_window()
                     else:
-                        self.phase = "evolving"
+                        arcade.close_window()
                 return
 
-            # Phase: Evaluating
-            if self.phase == "evaluating":
-                print(f"Generation {self.current_generation + 1}: Evaluating...")
-                self.display_manager.update_info_text_training(self.current_generation + 1, GAConfig.NUM_GENERATIONS, self.max_workers, "Evaluating...")
-                
-                eval_start = time.time()
-                fitnesses, _, gen_metrics, per_agent_metrics = evaluate_population_parallel(
-                    self.driver.population,
-                    self.state_encoder,
-                    self.action_interface,
-                    max_steps=GAConfig.MAX_STEPS,
-                    max_workers=self.max_workers,
-                    seeds_per_agent=GAConfig.SEEDS_PER_AGENT,
-                    use_common_seeds=GAConfig.USE_COMMON_SEEDS
-                )
-                self.current_fitnesses = fitnesses
-                self.current_per_agent_metrics = per_agent_metrics
-                
-                # Update best
-                best_idx = fitnesses.index(max(fitnesses))
-                current_best_fit = fitnesses[best_idx]
-                current_best_ind = self.driver.population[best_idx].copy()
-                
-                if current_best_fit > self.best_fitness:
-                    self.best_fitness = current_best_fit
-                    self.best_individual = current_best_ind
-                
-                # Record Analytics
-                timing_stats = {
-                    'evaluation_duration': time.time() - eval_start,
-                    'evolution_duration': self.driver.last_evolution_duration
-                }
-                self.analytics.record_generation(
-                    generation=self.current_generation + 1,
-                    fitness_scores=fitnesses,
-                    behavioral_metrics=gen_metrics,
-                    timing_stats=timing_stats,
-                    operator_stats=self.driver.last_evolution_stats
-                )
-                self.analytics.record_distributions(
-                    generation=self.current_generation + 1,
-                    fitness_values=fitnesses,
-                    per_agent_metrics=per_agent_metrics
-                )
-                
-                # Calculate basic stats for display
-                avg_fit = sum(fitnesses) / len(fitnesses)
-                min_fit = min(fitnesses)
-                std_fit = statistics.stdev(fitnesses) if len(fitnesses) > 1 else 0.0
-                
-                print("\n" + "="*50)
-                print(f" GENERATION {self.current_generation + 1} SUMMARY")
-                print("="*50)
-                print(f" FITNESS")
-                print(f"  Best: {current_best_fit:8.2f}  |  Avg: {avg_fit:8.2f}")
-                print(f"  Min:  {min_fit:8.2f}  |  Std: {std_fit:8.2f}")
-                print("-" * 50)
-                print(f" BEHAVIOR (Avg)")
-                print(f"  Kills:    {gen_metrics.get('avg_kills', 0):6.1f}  |  Accuracy: {gen_metrics.get('avg_accuracy', 0)*100:5.1f}%")
-                print(f"  Survival: {gen_metrics.get('avg_steps_survived', 0):6.0f}  |  Shots:    {gen_metrics.get('avg_shots_fired', 0):5.1f}")
-                print("="*50 + "\n")
-
-                # Start Display
-                display_agent = NNAgent(current_best_ind, self.state_encoder, self.action_interface)
-                self.display_manager.start_display(display_agent, current_best_fit, self.best_fitness)
-                self.phase = "displaying"
-                return
+            # Phase: Evaluating -> evolving, then play back while N+1 evaluates
+            self.display_manager.update_info_text_training(self.current_generation + 1, GAConfig.NUM_GENERATIONS, self.max_workers, "Evaluating...")
+            current_best_ind, current_best_fit = self._step_generation()
 
-            # Phase: Evolving
-            if self.phase == "evolving":
-                print(f"Evolving generation {self.current_generation + 1}...")
-                stagnation = 0
-                if self.analytics.generations_data:
-                    stagnation = self.analytics.generations_data[-1].get('generations_since_improvement', 0)
-                
-                self.driver.evolve(self.current_fitnesses, self.best_individual, stagnation, self.current_per_agent_metrics)
-                self.current_generation += 1
-                self.phase = "evaluating"
-                return
+            # Start Display
+            display_agent = NNAgent(current_best_ind, self.state_encoder, self.action_interface)
+            self.display_manager.start_display(display_agent, current_best_fit, self.best_fitness)
 
         except Exception as e:
             print(f"Error: {e}")
@@ -203,21 +188,292 @@ class GATrainingScript:
             self._save()
             arcade.close_window()
 
+    def run_headless(self):
+        """Run the full generation loop without a window or playback."""
+        try:
+            while self.current_generation < GAConfig.NUM_GENERATIONS:
+                self._step_generation()
+            print("Training Complete.")
+        finally:
+            self.pipeline.shutdown()
+            self.checkpoint_writer.close()
+            self._save()
+            self.analytics.close_store()
+
+    def run_steady_state(self):
+        """
+        Asynchronous evolution: breed an offspring whenever an evaluation ends.
+
+        Each completed evaluation replaces a population member at once, so
+        workers never idle behind a generation's longest episodes. Every
+        ``steady_state_report_every`` completions are recorded as one
+        analytics generation (and count toward NUM_GENERATIONS).
+        """
+        evaluator = SteadyStateEvaluator(
+            max_workers=self.max_workers,
+            state_encoder=self.state_encoder,
+            action_interface=self.action_interface,
+            max_steps=GAConfig.MAX_STEPS,
+            seeds_per_agent=GAConfig.SEEDS_PER_AGENT,
+            use_common_seeds=GAConfig.USE_COMMON_SEEDS,
+            common_seed_period=self.steady_state_report_every,
+            action_repeat=GAConfig.ACTION_REPEAT
+        )
+        in_flight = GAConfig.STEADY_STATE_IN_FLIGHT or default_in_flight(self.max_workers, GAConfig.SEEDS_PER_AGENT)
+        window = CompletionWindow(self.steady_state_report_every, self.max_workers)
+        if self.driver.fitnesses is None:
+            self.driver.start_steady_state()
+        try:
+            # Members without a fitness (a fresh run, or a resumed one) go first
+            for slot in self.driver.unevaluated_slots():
+                evaluator.submit(self.driver.population[slot].copy(), tag=slot)
+            while self.current_generation < GAConfig.NUM_GENERATIONS:
+                while evaluator.in_flight() < in_flight and self.driver.evaluated_count():
+                    evaluator.submit(self.driver.breed_offspring())
+                done = evaluator.next_completed()
+                if done.tag is not None:
+                    self.driver.record_evaluation(done.tag, done.fitness, done.metrics)
+                else:
+                    self.driver.insert_offspring(done.individual, done.fitness, done.metrics)
+                self._record_steady_state_best(done)
+                window.add(done)
+                if window.full():
+                    self._report_window(window)
+                    window.reset()
+            print("Training Complete.")
+        finally:
+            evaluator.shutdown()
+            self.pipeline.shutdown()
+            self.checkpoint_writer.close()
+            self._save()
+            self.analytics.close_store()
+
+    def _record_steady_state_best(self, done):
+        if done.fitness > self.best_fitness:
+            self.best_fitness = done.fitness
+            self.best_individual = list(map(float, done.individual))
+            save_best_weights(
+                self.best_weights_path,
+                self.best_individual,
+                self.best_fitness,
+                self.current_generation + 1,
+                GAConfig.HIDDEN_LAYER_SIZE
+            )
+
+    def _report_window(self, window):
+        """Record a window of completed evaluations as one generation."""
+        generation = self.current_generation + 1
+        fitnesses, gen_metrics, per_agent_metrics, timing_stats = window.summarize()
+
+        stagnation = 0
+        if self.analytics.generations_data:
+            stagnation = self.analytics.generations_data[-1].get('generations_since_improvement', 0)
+        self.driver.finish_window(stagnation)
+
+        self.analytics.record_generation(
+            generation=generation,
+            fitness_scores=fitnesses,
+            behavioral_metrics=gen_metrics,
+            timing_stats={**timing_stats, 'evolution_duration': self.driver.last_evolution_duration},
+            operator_stats=self.driver.last_evolution_stats
+        )
+        self.analytics.record_distributions(
+            generation=generation,
+            fitness_values=fitnesses,
+            per_agent_metrics=per_agent_metrics
+        )
+        if AnalyticsConfig.LIVE_REPORT_EVERY and generation % AnalyticsConfig.LIVE_REPORT_EVERY == 0:
+            self.analytics.generate_live_report(self.live_report_path)
+        self.current_generation += 1
+
+        print(
+            f"Window {generation}: {len(fitnesses)} evaluations | "
+            f"best {max(fitnesses):8.2f} | avg {sum(fitnesses) / len(fitnesses):8.2f} | "
+            f"all-time {self.best_fitness:8.2f} | "
+            f"workers busy {timing_stats['steady_state_busy_ratio'] * 100:.0f}% | "
+            f"{timing_stats['steady_state_evaluations_per_s']:.2f} evals/s"
+        )
+        self._maybe_checkpoint(generation, capture_rng_state())
+
+    def _step_generation(self):
+        """Collect generation N, evolve, submit N+1, then report N.
+
+        Evolution only needs fitnesses and the stagnation counter, so the next
+        generation starts evaluating before this one's summary, artifacts and
+        playback.
+
+        Returns:
+            (best individual of this generation, its fitness)
+        """
+        generation = self.current_generation + 1
+        print(f"Generation {generation}: Evaluating...")
+        fitnesses, _, gen_metrics, per_agent_metrics = self.pipeline.collect(
+            self.driver.get_population_as_lists(), parents=self.driver.parent_indices
+        )
+        self.current_fitnesses = fitnesses
+        self.current_per_agent_metrics = per_agent_metrics
+        
+        # Update best
+        best_idx = fitnesses.index(max(fitnesses))
+        current_best_fit = fitnesses[best_idx]
+        current_best_ind = self.driver.population[best_idx].tolist()
+        
+        improved = current_best_fit > self.best_fitness
+        if improved:
+            self.best_fitness = current_best_fit
+            self.best_individual = current_best_ind
+        
+        # Island runs: publish this generation's best, take in neighbours'
+        migrants = []
+        operator_stats = self.driver.last_evolution_stats
+        if self.migration is not None and self.migration.due(generation):
+            migrants = self.migration.exchange(
+                generation, self.driver.population, fitnesses, per_agent_metrics,
+                encode=lambda row: row.tolist()
+            )
+            operator_stats = {**operator_stats, **self.migration.last_stats}
+
+        # Record Analytics (stagnation counter feeds evolve)
+        timing_stats = {
+            **self.pipeline.last_stats,
+            'evolution_duration': self.driver.last_evolution_duration
+        }
+        self.analytics.record_generation(
+            generation=generation,
+            fitness_scores=fitnesses,
+            behavioral_metrics=gen_metrics,
+            timing_stats=timing_stats,
+            operator_stats=operator_stats
+        )
+
+        if migrants:
+            slots, self.current_fitnesses, self.current_per_agent_metrics = replace_members(
+                fitnesses, per_agent_metrics, migrants
+            )
+            self.driver.replace_members(slots, [migrant.individual for migrant in migrants])
+        self._evolve_generation()
+        # Captured before N+1 draws its evaluation seed; a resumed run replays it
+        next_rng_state = capture_rng_state()
+        if self.current_generation < GAConfig.NUM_GENERATIONS:
+            self.pipeline.submit(self.driver.get_population_as_lists(), parents=self.driver.parent_indices)
+
+        # Everything below overlaps with the next generation's evaluation
+        if improved:
+            save_best_weights(
+                self.best_weights_path,
+                self.best_individual,
+                self.best_fitness,
+                generation,
+                GAConfig.HIDDEN_LAYER_SIZE
+            )
+        self.analytics.record_distributions(
+            generation=generation,
+            fitness_values=fitnesses,
+            per_agent_metrics=per_agent_metrics
+        )
+        if AnalyticsConfig.LIVE_REPORT_EVERY and generation % AnalyticsConfig.LIVE_REPORT_EVERY == 0:
+            self.analytics.generate_live_report(self.live_report_path)
+        
+        # Calculate basic stats for display
+        avg_fit = sum(fitnesses) / len(fitnesses)
+        min_fit = min(fitnesses)
+        std_fit = statistics.stdev(fitnesses) if len(fitnesses) > 1 else 0.0
+        
+        print("\n" + "="*50)
+        print(f" GENERATION {generation} SUMMARY")
+        print("="*50)
+        print(f" FITNESS")
+        print(f"  Best: {current_best_fit:8.2f}  |  Avg: {avg_fit:8.2f}")
+        print(f"  Min:  {min_fit:8.2f}  |  Std: {std_fit:8.2f}")
+        print("-" * 50)
+        print(f" BEHAVIOR (Avg)")
+        print(f"  Kills:    {gen_metrics.get('avg_kills', 0):6.1f}  |  Accuracy: {gen_metrics.get('avg_accuracy', 0)*100:5.1f}%")
+        print(f"  Survival: {gen_metrics.get('avg_steps_survived', 0):6.0f}  |  Shots:    {gen_metrics.get('avg_shots_fired', 0):5.1f}")
+        print("-" * 50)
+        print(self.pipeline.summary_line())
+        print("="*50 + "\n")
+
+        self._maybe_checkpoint(generation, next_rng_state)
+        return current_best_ind, current_best_fit
+
+    def _evolve_generation(self):
+        print(f"Evolving generation {self.current_generation + 1}...")
+        stagnation = 0
+        if self.analytics.generations_data:
+            stagnation = self.analytics.generations_data[-1].get('generations_since_improvement', 0)
+        
+        self.driver.evolve(self.current_fitnesses, self.best_individual, stagnation, self.current_per_agent_metrics)
+        self.current_generation += 1
+
+    def _maybe_checkpoint(self, generation, rng_state):
+        if GAConfig.CHECKPOINT_EVERY and generation % GAConfig.CHECKPOINT_EVERY == 0:
+            self.checkpoint_writer.save({
+                "method": "ga",
+                "current_generation": self.current_generation,
+                "best_fitness": self.best_fitness,
+                "best_individual": self.best_individual,
+                "driver": self.driver.state_dict(),
+                "analytics": self.analytics.state_dict(),
+                "rng": rng_state
+            })
+            print(f"Checkpoint after generation {generation} -> {self.checkpoint_writer.path}")
+
+    def resume(self, path=None):
+        """Restore a checkpoint; the next generation continues the run bit-exactly."""
+        path = path or self.checkpoint_writer.path
+        state = load_checkpoint(path)
+        if state.get("method") != "ga":
+            raise ValueError(f"{path} is a {state.get('method')} checkpoint, not ga")
+        self.current_generation = state["current_generation"]
+        self.best_fitness = state["best_fitness"]
+        self.best_individual = state["best_individual"]
+        self.driver.load_state_dict(state["driver"])
+        self.analytics.load_state_dict(state["analytics"])
+        restore_rng_state(state["rng"])
+        print(f"Resumed GA run from {path} after generation {self.current_generation}")
+
     def _save(self):
         self.analytics.generate_markdown_report("training_summary.md")
         self.analytics.save_json("training_data.json")
 
 def main():
+    parser = argparse.ArgumentParser(description="GA training for Asteroids AI")
+    parser.add_argument("--headless", action="store_true",
+                        help="Train without a window (view progress with view_best.py --method ga)")
+    parser.add_argument("--resume", nargs="?", const="", default=None, metavar="CHECKPOINT",
+                        help="Continue from a checkpoint (default: training/ga_artifacts/checkpoint.npz)")
+    parser.add_argument("--steady-state", action="store_true", default=GAConfig.STEADY_STATE,
+                        help="Asynchronous steady-state evolution instead of generations (runs headless)")
+    args = parser.parse_args()
+
+    if args.headless or args.steady_state:
+        trainer = GATrainingScript(steady_state=args.steady_state)
+        if args.resume is not None:
+            trainer.resume(args.resume or None)
+        if args.steady_state:
+            trainer.run_steady_state()
+        else:
+            trainer.run_headless()
+        return
+
+    import arcade
+    from Asteroids import AsteroidsGame
+
     window = AsteroidsGame(globals.SCREEN_WIDTH, globals.SCREEN_HEIGHT, globals.SCREEN_TITLE)
     window.setup()
     trainer = GATrainingScript(window)
+    if args.resume is not None:
+        trainer.resume(args.resume or None)
     arcade.schedule(trainer.update, GAConfig.FRAME_DELAY)
     
     try:
         arcade.run()
     finally:
         print("\nApplication exiting, saving training results...")
+        trainer.pipeline.shutdown()
+        trainer.checkpoint_writer.close()
         trainer._save()
+        trainer.analytics.close_store()
 
 if __name__ == "__main__":
-    main()
+    main()
\ No newline at end of file
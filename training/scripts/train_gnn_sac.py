@@ -22,8 +22,10 @@ if project_root not in sys.path:
 
 from game import globals
 from game.headless_game import HeadlessAsteroidsGame
+from game.profiler import NULL_PROFILER, SpanProfiler
 from interfaces.encoders.GraphEncoder import GraphEncoder
 from training.config.sac import SACConfig
+from training.config.analytics import AnalyticsConfig
 from training.config.rewards import create_reward_calculator
 from training.analytics.analytics import TrainingAnalytics
 from training.methods.sac.replay_buffer import ReplayBuffer, Transition
@@ -94,6 +96,8 @@ class SACTrainingScript:
             "eval_every_episodes": SACConfig.EVAL_EVERY_EPISODES,
             "best_checkpoint_path": SACConfig.BEST_CHECKPOINT_PATH,
         })
+        if AnalyticsConfig.STORE_ENABLED:
+            self.analytics.attach_store("training_data_sac.jsonl")
 
         # Initialize collectors
         for idx in range(self.num_collectors):
@@ -126,6 +130,9 @@ class SACTrainingScript:
         self.last_eval_holdout_data: Dict[str, Any] = {}
         self.last_log_time = time.time()
 
+        # Collector/learner loop spans (per logging window)
+        self.profiler = SpanProfiler() if AnalyticsConfig.PROFILE_EPISODES else NULL_PROFILER
+
         # Probe metrics (policy/critic drift)
         self.probe_payloads = None
         self.probe_prev_actions = None
@@ -284,10 +291,14 @@ class SACTrainingScript:
         game = collector["game"]
         state_encoder = collector["state_encoder"]
         reward_calculator = collector["reward_calculator"]
+        profiler = self.profiler
+        mark = profiler.now()
 
         state = state_encoder.encode(game.tracker)
+        mark = profiler.lap("encode", mark)
         action = self._select_action(state)
         action, collector["prev_action"] = self._apply_action_smoothing(action, collector["prev_action"])
+        mark = profiler.lap("inference", mark)
 
         # Track action stats
         self.action_stats.append({
@@ -302,23 +313,20 @@ class SACTrainingScript:
         game.thrust_magnitude = float(action[1])
         game.shoot_requested = float(action[2]) > 0.5
 
-        # Step the game
-        game.on_update(SACConfig.FRAME_DELAY)
-        game.tracker.update(game)
-        game.metrics_tracker.update(game)
-
-        # Compute reward (scaled)
-        step_reward = reward_calculator.calculate_step_reward(
-            game.tracker,
-            game.metrics_tracker
+        # Step the game (ACTION_REPEAT physics frames per transition; reward
+        # summed over the frames, stops early on death or episode budget)
+        step_reward, frames, done = game.step_repeated(
+            SACConfig.FRAME_DELAY,
+            SACConfig.ACTION_REPEAT,
+            reward_calculator,
+            max_frames=SACConfig.MAX_EPISODE_STEPS - collector["episode_steps"]
         )
         step_reward *= SACConfig.REWARD_SCALE
+        mark = profiler.lap("env_step", mark)
 
         collector["episode_return"] += step_reward
-        collector["episode_steps"] += 1
+        collector["episode_steps"] += frames
         self.total_steps += 1
-
-        done = game.player not in game.player_list
         timeout = collector["episode_steps"] >= SACConfig.MAX_EPISODE_STEPS
 
         # Terminal reward
@@ -333,7 +341,9 @@ class SACTrainingScript:
         self.step_rewards_window.append(step_reward)
         self.window_steps += 1
 
+        mark = profiler.lap("metrics", mark)
         next_state = state_encoder.encode(game.tracker)
+        mark = profiler.lap("encode", mark)
         transition = Transition(
             obs=state,
             action=action,
@@ -342,14 +352,17 @@ class SACTrainingScript:
             done=done or timeout
         )
         self.replay_buffer.push(transition)
+        mark = profiler.lap("replay", mark)
 
         # Updates
         if self.total_steps >= SACConfig.LEARN_START_STEPS and len(self.replay_buffer) >= SACConfig.BATCH_SIZE:
             for _ in range(SACConfig.UPDATES_PER_STEP):
                 batch = self.replay_buffer.sample_batch(SACConfig.BATCH_SIZE, self.device)
+                mark = profiler.lap("replay", mark)
                 update_metrics = self.learner.update(batch)
                 self.update_metrics_window.append(update_metrics)
                 self.update_count += 1
+                mark = profiler.lap("update", mark)
 
         # Episode done handling
         if done or timeout:
@@ -396,6 +409,7 @@ class SACTrainingScript:
                 self._log_evaluation(eval_data, is_new_best, prev_best, holdout_data)
 
             self._reset_collector(collector)
+            profiler.lap("episode_end", mark)
 
         # Logging interval
         if self.total_steps % SACConfig.LOG_EVERY_STEPS == 0:
@@ -567,6 +581,9 @@ class SACTrainingScript:
             **learner_stats,
             **sac_metrics,
         }
+        if self.profiler.enabled:
+            behavioral_metrics["time_profile"] = self.profiler.snapshot()
+            self.profiler.reset()
 
         timing_stats = {
             "evaluation_duration": time.time() - self.last_log_time
@@ -744,15 +761,15 @@ class SACTrainingScript:
                 game.thrust_magnitude = float(action[1])
                 game.shoot_requested = float(action[2]) > 0.5
 
-                game.on_update(SACConfig.FRAME_DELAY)
-
-                step_reward = reward_calculator.calculate_step_reward(
-                    game.tracker,
-                    game.metrics_tracker
+                step_reward, frames, _ = game.step_repeated(
+                    SACConfig.FRAME_DELAY,
+                    SACConfig.ACTION_REPEAT,
+                    reward_calculator,
+                    max_frames=SACConfig.MAX_EPISODE_STEPS - steps
                 )
                 step_reward *= SACConfig.REWARD_SCALE
                 total_reward += step_reward
-                steps += 1
+                steps += frames
 
             total_reward += reward_calculator.calculate_episode_reward(game.metrics_tracker) * SACConfig.REWARD_SCALE
             eval_returns.append(total_reward)
@@ -816,7 +833,10 @@ class SACTrainingScript:
 
         finally:
             # Always save analytics on exit (normal or interrupted)
-            self._save_analytics()
+            try:
+                self._save_analytics()
+            finally:
+                self.analytics.close_store()
             print()
             print("=" * 75)
             print(f"[SAC] Training {'INTERRUPTED' if self.interrupted else 'COMPLETE'}")
@@ -827,6 +847,8 @@ class SACTrainingScript:
             print("-" * 75)
             print(f"  Reports saved:   training_summary_sac.md")
             print(f"                   training_data_sac.json")
+            if AnalyticsConfig.STORE_ENABLED:
+                print(f"                   training_data_sac.jsonl")
             print("=" * 75)
 
 
@@ -0,0 +1,207 @@
+"""
+Island Model Training Entry Point
+
+Runs several GA / ES / NEAT populations ("islands") as separate headless
+processes that periodically exchange their best individuals. Total population
+grows with the number of islands while each island's generation time stays
+that of a single run (see IslandConfig in training/config/islands.py).
+
+    python training/scripts/train_islands.py                   # IslandConfig.ISLANDS on this machine
+    python training/scripts/train_islands.py --island ga --island ga:MUTATION_PROBABILITY=0.3 --island es
+
+Across machines, share MIGRATION_DIR (file transport) or run a hub on one
+host and start each host's islands with ``--run``:
+
+    hostA$ python training/scripts/train_islands.py --transport socket --serve-hub 0.0.0.0:47310 --hub hostA:47310 --run 0 1
+    hostB$ python training/scripts/train_islands.py --transport socket --hub hostA:47310 --run 2 3
+
+Island ``i`` running method ``m`` writes its artifacts to
+training/island<i>_<m>_artifacts.
+"""
+
+import argparse
+import ast
+import importlib
+import multiprocessing
+import os
+import re
+import sys
+from typing import Any, Dict, List, Tuple
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from training.config.islands import IslandConfig
+from training.core.best_artifacts import artifacts_dir
+from training.core.islands import TOPOLOGIES, FileTransport, IslandMigration, MigrationHub, SocketTransport
+from training.core.wire_protocol import parse_address
+
+# method -> (trainer module, trainer class, config module, config class)
+METHODS = {
+    "ga": ("training.scripts.train_ga", "GATrainingScript", "training.config.genetic_algorithm", "GAConfig"),
+    "es": ("training.scripts.train_es", "ESTrainingScript", "training.config.evolution_strategies", "ESConfig"),
+    "neat": ("training.scripts.train_neat", "NEATTrainingScript", "training.config.neat", "NEATConfig"),
+}
+
+
+def parse_island_spec(spec: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Parse ``"method"`` or ``"method:KEY=VALUE,KEY=VALUE"``.
+
+    Values are Python literals (``0.3``, ``True``, ``[1, 2]``); anything that
+    is not a literal is kept as a string.
+    """
+    method, _, rest = spec.partition(":")
+    method = method.strip().lower()
+    if method not in METHODS:
+        raise ValueError(f"Unknown island method {method!r} in {spec!r}; expected one of {sorted(METHODS)}")
+    overrides = {}
+    # Split on commas that start a new KEY=, so list values may contain commas
+    for item in re.split(r",(?=\s*[A-Z_][A-Z0-9_]*\s*=)", rest) if rest.strip() else []:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Expected KEY=VALUE, got {item!r} in {spec!r}")
+        try:
+            overrides[key.strip()] = ast.literal_eval(value.strip())
+        except (ValueError, SyntaxError):
+            overrides[key.strip()] = value.strip()
+    return method, overrides
+
+
+def create_transport(settings: Dict[str, Any]):
+    if settings["transport"] == "socket":
+        return SocketTransport(settings["hub"])
+    if settings["transport"] == "file":
+        return FileTransport(settings["migration_dir"])
+    raise ValueError(f"Unknown transport {settings['transport']!r}; expected 'file' or 'socket'")
+
+
+def run_island(island_id: int, spec: str, num_islands: int, settings: Dict[str, Any]):
+    """
+    Train one island to completion (the body of each island process).
+
+    Returns:
+        The trainer, for inspection when called in-process
+    """
+    method, overrides = parse_island_spec(spec)
+    trainer_module, trainer_name, config_module, config_name = METHODS[method]
+    config = getattr(importlib.import_module(config_module), config_name)
+    for key, value in overrides.items():
+        if not hasattr(config, key):
+            raise ValueError(f"{config_name} has no setting {key!r}")
+        setattr(config, key, value)
+    if method == "ga" and getattr(config, "RNG_SEED", None) is not None and "RNG_SEED" not in overrides:
+        config.RNG_SEED += island_id  # A shared seed would make every GA island identical
+
+    trainer_cls = getattr(importlib.import_module(trainer_module), trainer_name)
+    trainer = trainer_cls(max_workers=settings["max_workers"], artifacts_name=f"island{island_id}_{method}")
+    trainer.migration = IslandMigration(
+        island_id,
+        num_islands,
+        create_transport(settings),
+        trainer.representation,
+        topology=settings["topology"],
+        interval=settings["interval"],
+        migrants=settings["migrants"],
+    )
+    print(f"Island {island_id}/{num_islands}: {method} {overrides or ''} -> {trainer.artifacts_dir}")
+
+    # Reports (training_summary.md, training_data.json) land next to the artifacts
+    previous_cwd = os.getcwd()
+    os.chdir(trainer.artifacts_dir)
+    try:
+        trainer.run_headless()
+    finally:
+        os.chdir(previous_cwd)
+        trainer.migration.close()
+        print(
+            f"Island {island_id} done: sent {trainer.migration.total_sent}, "
+            f"received {trainer.migration.total_received} migrants"
+        )
+    return trainer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Island-model training for Asteroids AI")
+    parser.add_argument("--island", action="append", default=None, metavar="SPEC",
+                        help="Island as METHOD[:KEY=VALUE,...]; repeat per island (default: IslandConfig.ISLANDS)")
+    parser.add_argument("--run", type=int, nargs="+", default=None, metavar="ID",
+                        help="Islands to run on this machine (default: all)")
+    parser.add_argument("--topology", choices=TOPOLOGIES, default=IslandConfig.TOPOLOGY)
+    parser.add_argument("--interval", type=int, default=IslandConfig.MIGRATION_INTERVAL,
+                        help="Generations between migrations (0 = never)")
+    parser.add_argument("--migrants", type=int, default=IslandConfig.MIGRANTS,
+                        help="Best individuals each island publishes per migration")
+    parser.add_argument("--transport", choices=("file", "socket"), default=IslandConfig.TRANSPORT)
+    parser.add_argument("--migration-dir", default=IslandConfig.MIGRATION_DIR,
+                        help="Directory of the file transport (share it between machines)")
+    parser.add_argument("--hub", default=IslandConfig.HUB_ADDRESS, metavar="HOST:PORT",
+                        help="Migration hub the socket transport connects to")
+    parser.add_argument("--serve-hub", nargs="?", const="", default=None, metavar="HOST:PORT",
+                        help="Run the migration hub in this process (default address: --hub)")
+    args = parser.parse_args()
+
+    specs = args.island or list(IslandConfig.ISLANDS)
+    for spec in specs:
+        parse_island_spec(spec)  # Fail before starting any process
+    local_ids = args.run if args.run is not None else list(range(len(specs)))
+    for island_id in local_ids:
+        if not 0 <= island_id < len(specs):
+            parser.error(f"--run {island_id}: only {len(specs)} islands are defined")
+
+    hub = None
+    if args.serve_hub is not None:
+        hub = MigrationHub(*parse_address(args.serve_hub or args.hub)).start()
+        print(f"Migration hub listening on {hub.address}")
+
+    settings = {
+        "topology": args.topology,
+        "interval": args.interval,
+        "migrants": args.migrants,
+        "transport": args.transport,
+        "migration_dir": args.migration_dir or os.path.join(artifacts_dir("islands"), "migration"),
+        # Islands started here reach a hub served here directly (it may listen on port 0)
+        "hub": hub.address.replace("0.0.0.0", "127.0.0.1") if hub is not None else args.hub,
+        # Islands on one machine split its cores
+        "max_workers": max(1, (os.cpu_count() or 1) // len(local_ids)),
+    }
+    transport = create_transport(settings)
+    for island_id in local_ids:
+        transport.clear(island_id)  # Payloads of a previous run must not migrate into this one
+    transport.close()
+
+    # Spawn: a fresh interpreter per island, so config overrides stay per island
+    context = multiprocessing.get_context("spawn")
+    processes: List[multiprocessing.Process] = []
+    for island_id in local_ids:
+        process = context.Process(
+            target=run_island,
+            args=(island_id, specs[island_id], len(specs), settings),
+            name=f"island-{island_id}",
+        )
+        process.start()
+        processes.append(process)
+
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        print("\nStopping islands...")
+        for process in processes:
+            process.terminate()
+            process.join()
+    finally:
+        if hub is not None:
+            hub.close()
+
+    failed = [p.name for p in processes if p.exitcode]
+    if failed:
+        print(f"Islands failed: {', '.join(failed)}")
+        sys.exit(1)
+    print("All islands complete.")
+
+
+if __name__ == "__main__":
+    main()
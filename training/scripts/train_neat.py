@@ -2,13 +2,17 @@
 NEAT Training Entry Point
 
 Runs parallel NEAT training for Asteroids AI.
+
+    python training/scripts/train_neat.py              # windowed, best-of-gen playback
+    python training/scripts/train_neat.py --headless   # no window; pair with view_best.py
+    python training/scripts/train_neat.py --headless --resume   # continue from the last checkpoint
+    python training/scripts/train_neat.py --steady-state         # asynchronous evolution (headless)
 """
 
-import json
+import argparse
 import os
 import sys
 import time
-import arcade
 import statistics
 
 # Add project root to path
@@ -17,26 +21,40 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from game import globals
-from Asteroids import AsteroidsGame
 from interfaces.encoders.HybridEncoder import HybridEncoder
 from interfaces.ActionInterface import ActionInterface
 from ai_agents.neuroevolution.neat.agent import NEATAgent
+from ai_agents.neuroevolution.neat.genome import Genome
 from training.config.neat import NEATConfig
 from training.config.rewards import create_reward_calculator
-from training.core.episode_runner import EpisodeRunner
-from training.core.population_evaluator import evaluate_population_parallel
-from training.core.display_manager import DisplayManager
+from training.core.generation_pipeline import GenerationPipeline
+from training.core.remote_evaluation import create_remote_backend
+from training.core.steady_state import CompletionWindow, SteadyStateEvaluator, default_in_flight
+from training.core.islands import replace_members
+from training.core.best_artifacts import artifacts_dir, atomic_write_text, save_genome_json
+from training.core.checkpoints import CHECKPOINT_NAME, CheckpointWriter, capture_rng_state, load_checkpoint, restore_rng_state
 from training.methods.neat.driver import NEATDriver
 from training.analytics.analytics import TrainingAnalytics
+from training.config.analytics import AnalyticsConfig
 
 
 class NEATTrainingScript:
     """
     Main script for NEAT training. Orchestrates components.
+
+    Pass ``game=None`` to train headless: no episode runner or display is
+    created and ``run_headless()`` drives the generation loop directly.
+    ``run_steady_state()`` is the asynchronous alternative (no generations).
+
+    ``max_workers`` and ``artifacts_name`` let several trainers share a
+    machine (see train_islands.py); set ``migration`` to an
+    ``IslandMigration`` to exchange genomes with other islands.
     """
-    def __init__(self, game):
+    def __init__(self, game=None, steady_state=None, max_workers=None, artifacts_name="neat"):
         self.game = game
-        self.max_workers = os.cpu_count()
+        self.max_workers = max_workers or os.cpu_count()
+        self.steady_state = NEATConfig.STEADY_STATE if steady_state is None else steady_state
+        self.steady_state_report_every = NEATConfig.STEADY_STATE_REPORT_EVERY or NEATConfig.POPULATION_SIZE
 
         # 1. Setup Infrastructure
         self.state_encoder = HybridEncoder(
@@ -53,17 +71,38 @@ class NEATTrainingScript:
             frame_delay=NEATConfig.FRAME_DELAY
         )
 
-        self.episode_runner = EpisodeRunner(
-            game=game,
-            state_encoder=self.state_encoder,
-            action_interface=self.action_interface,
-            reward_calculator=self.reward_calculator
-        )
+        self.episode_runner = None
+        if game is not None:
+            # Windowed only, so headless and island processes never import arcade
+            from training.core.display_manager import DisplayManager
+            from training.core.episode_runner import EpisodeRunner
+
+            self.episode_runner = EpisodeRunner(
+                game=game,
+                state_encoder=self.state_encoder,
+                action_interface=self.action_interface,
+                reward_calculator=self.reward_calculator,
+                action_repeat=NEATConfig.ACTION_REPEAT
+            )
 
         # 2. Setup Driver (NEAT Logic)
         input_size = self.state_encoder.get_state_size()
         output_size = NEATConfig.OUTPUT_SIZE
         self.driver = NEATDriver(input_size=input_size, output_size=output_size)
+        self.representation = {"kind": "neat", "inputs": input_size, "outputs": output_size}
+        self.pipeline = GenerationPipeline(
+            max_workers=self.max_workers,
+            enabled=NEATConfig.PIPELINE_GENERATIONS,
+            backend=create_remote_backend(),
+            schedule_by_cost=NEATConfig.SCHEDULE_BY_COST,
+            state_encoder=self.state_encoder,
+            action_interface=self.action_interface,
+            max_steps=NEATConfig.MAX_STEPS,
+            seeds_per_agent=NEATConfig.SEEDS_PER_AGENT,
+            use_common_seeds=NEATConfig.USE_COMMON_SEEDS,
+            agent_factory=self._agent_factory,
+            action_repeat=NEATConfig.ACTION_REPEAT
+        )
 
         # 3. Setup Analytics
         self.analytics = TrainingAnalytics()
@@ -90,16 +129,24 @@ class NEATTrainingScript:
             "novelty_enabled": NEATConfig.ENABLE_NOVELTY,
             "diversity_enabled": NEATConfig.ENABLE_DIVERSITY,
             "turn_deadzone": self.action_interface.turn_deadzone,
-            "max_workers": self.max_workers
+            "max_workers": self.max_workers,
+            "pipeline_generations": NEATConfig.PIPELINE_GENERATIONS,
+            "evolution_mode": "steady_state" if self.steady_state else "generational",
+            "steady_state_report_every": self.steady_state_report_every if self.steady_state else None
         })
 
-        # 4. Setup Display
-        self.display_manager = DisplayManager(game, self.episode_runner, self.analytics)
-        self.display_manager.best_agent_max_steps = NEATConfig.MAX_STEPS
+        # 4. Setup Display (windowed mode only)
+        self.display_manager = None
+        if game is not None:
+            self.display_manager = DisplayManager(game, self.episode_runner, self.analytics)
+            self.display_manager.best_agent_max_steps = NEATConfig.MAX_STEPS
 
-        # Artifacts
-        self.artifacts_dir = os.path.join(project_root, "training", "neat_artifacts")
-        os.makedirs(self.artifacts_dir, exist_ok=True)
+        # Artifacts (best_overall.json is tailed by training/scripts/view_best.py)
+        self.artifacts_dir = artifacts_dir(artifacts_name)
+        self.checkpoint_writer = CheckpointWriter(os.path.join(self.artifacts_dir, CHECKPOINT_NAME))
+        if AnalyticsConfig.STORE_ENABLED:
+            self.analytics.attach_store(os.path.join(self.artifacts_dir, AnalyticsConfig.STORE_FILENAME))
+        self.live_report_path = os.path.join(self.artifacts_dir, AnalyticsConfig.LIVE_REPORT_FILENAME)
 
         # State
         self.current_generation = 0
@@ -110,13 +157,15 @@ class NEATTrainingScript:
         self.current_fitnesses = []
         self.current_adjusted_fitnesses = []
         self.current_per_agent_metrics = []
+        self.migration = None
 
         # Hook draw
-        original_draw = self.game.on_draw
-        def new_draw():
-            original_draw()
-            self.display_manager.draw()
-        self.game.on_draw = new_draw
+        if game is not None:
+            original_draw = self.game.on_draw
+            def new_draw():
+                original_draw()
+                self.display_manager.draw()
+            self.game.on_draw = new_draw
 
         print("NEAT Training Script Initialized.")
 
@@ -129,8 +178,7 @@ class NEATTrainingScript:
         json_path = os.path.join(self.artifacts_dir, f"{label}.json")
         dot_path = os.path.join(self.artifacts_dir, f"{label}.dot")
 
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(genome.to_dict(), f, indent=2)
+        save_genome_json(json_path, genome.to_dict())
 
         lines = ["digraph NEAT {"]
         for node_id, node in genome.nodes.items():
@@ -140,135 +188,48 @@ class NEATTrainingScript:
                 continue
             lines.append(f'  {conn.in_node} -> {conn.out_node} [label="{conn.weight:.3f}"];')
         lines.append("}")
-        with open(dot_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        atomic_write_text(dot_path, "\n".join(lines))
 
     def update(self, delta_time):
+        import arcade
+
         try:
+            # Phase: Displaying (the next generation evaluates in the background)
+            if self.display_manager.showing_best_agent:
+                status = self.display_manager.update(delta_time)
+                if status == "done" and self.phase == "complete":
+                    arcade.close_window()
+                return
+
             if self.current_generation >= NEATConfig.NUM_GENERATIONS:
-                if not self.display_manager.showing_best_agent:
+                if self.phase != "complete":
+                    self.phase = "complete"
                     print("Training Complete.")
                     self._save()
                     if self.best_genome is not None:
                         agent = NEATAgent(self.best_genome)
                         self.display_manager.start_display(agent, self.best_fitness, self.best_fitness)
-                    return
-
-            # Phase: Displaying
-            if self.display_manager.showing_best_agent:
-                status = self.display_manager.update(delta_time)
-                if status == "done":
-                    if self.current_generation >= NEATConfig.NUM_GENERATIONS:
-                        arcade.close_window()
                     else:
-                        self.phase = "evolving"
+                        arcade.close_window()
                 return
 
-            # Phase: Evaluating
-            if self.phase == "evaluating":
-                print(f"Generation {self.current_generation + 1}: Evaluating...")
-                self.display_manager.update_info_text_training(
-                    self.current_generation + 1,
-                    NEATConfig.NUM_GENERATIONS,
-                    self.max_workers,
-                    "Evaluating..."
-                )
-
-                eval_start = time.time()
-                fitnesses, _, gen_metrics, per_agent_metrics = evaluate_population_parallel(
-                    self.driver.population,
-                    self.state_encoder,
-                    self.action_interface,
-                    max_steps=NEATConfig.MAX_STEPS,
-                    max_workers=self.max_workers,
-                    seeds_per_agent=NEATConfig.SEEDS_PER_AGENT,
-                    use_common_seeds=NEATConfig.USE_COMMON_SEEDS,
-                    agent_factory=self._agent_factory
-                )
-                self.current_fitnesses = fitnesses
-                self.current_per_agent_metrics = per_agent_metrics
-
-                # Calculate Reliability-Based Fitness (penalize std dev)
-                # This filters out "lucky" agents that only succeed on specific seeds
-                self.current_adjusted_fitnesses = []
-                for i, metrics in enumerate(per_agent_metrics):
-                    std_dev = metrics.get('fitness_std', 0.0)
-                    penalty = std_dev * NEATConfig.FITNESS_STD_PENALTY_RATIO
-                    adjusted_fit = fitnesses[i] - penalty
-                    self.current_adjusted_fitnesses.append(adjusted_fit)
-
-                # Use best fitness agent for both tracking and display
-                # (NEAT uses fitness-based selection, not Pareto)
-                best_idx = fitnesses.index(max(fitnesses)) if fitnesses else 0
-                current_best_fit = fitnesses[best_idx] if fitnesses else float("-inf")
-                current_best_genome = self.driver.population[best_idx].copy()
-                display_genome = current_best_genome
-
-                if current_best_fit > self.best_fitness:
-                    self.best_fitness = current_best_fit
-                    self.best_genome = current_best_genome.copy()
-                    self.last_improvement_gen = self.current_generation
-                    self._save_genome_artifacts(self.best_genome, "best_overall")
-
-                # Early Stopping Check
-                gens_since_improvement = self.current_generation - self.last_improvement_gen
-                if gens_since_improvement >= NEATConfig.EARLY_STOPPING_GENERATIONS:
-                    print(f"\nEarly Stopping triggered: No improvement for {gens_since_improvement} generations.")
-                    self._save()
-                    arcade.close_window()
-                    return
-
-                # Record Analytics
-                timing_stats = {
-                    "evaluation_duration": time.time() - eval_start,
-                    "evolution_duration": self.driver.last_evolution_duration
-                }
-                operator_stats = self.driver.last_evolution_stats.copy()
-
-                self.analytics.record_generation(
-                    generation=self.current_generation + 1,
-                    fitness_scores=fitnesses,
-                    behavioral_metrics=gen_metrics,
-                    timing_stats=timing_stats,
-                    operator_stats=operator_stats
-                )
-                self.analytics.record_distributions(
-                    generation=self.current_generation + 1,
-                    fitness_values=fitnesses,
-                    per_agent_metrics=per_agent_metrics
-                )
-
-                # Save artifacts for this generation
-                self._save_genome_artifacts(display_genome, f"gen_{self.current_generation + 1:04d}_best")
-
-                # Calculate stats for display
-                avg_fit = sum(fitnesses) / len(fitnesses) if fitnesses else 0.0
-                min_fit = min(fitnesses) if fitnesses else 0.0
-                std_fit = statistics.stdev(fitnesses) if len(fitnesses) > 1 else 0.0
-
-                print("\n" + "=" * 60)
-                print(f" GENERATION {self.current_generation + 1} SUMMARY (NEAT)")
-                print("=" * 60)
-                print(" FITNESS (Raw)")
-                print(f"  Best:  {current_best_fit:8.2f}  |  Avg: {avg_fit:8.2f}")
-                print(f"  Min:   {min_fit:8.2f}  |  Std: {std_fit:8.2f}")
-                print(f"  Last Impr: Gen {self.last_improvement_gen + 1} ({gens_since_improvement} ago)")
-                print("-" * 60)
-
-                # Start Display (showing best fitness agent)
-                display_agent = NEATAgent(display_genome)
-                self.display_manager.start_display(display_agent, current_best_fit, self.best_fitness)
-                self.phase = "displaying"
+            # Phase: Evaluating -> evolving, then play back while N+1 evaluates
+            self.display_manager.update_info_text_training(
+                self.current_generation + 1,
+                NEATConfig.NUM_GENERATIONS,
+                self.max_workers,
+                "Evaluating..."
+            )
+            result = self._step_generation()
+            if result is None:
+                self._save()
+                arcade.close_window()
                 return
+            display_genome, current_best_fit = result
 
-            # Phase: Evolving
-            if self.phase == "evolving":
-                print(f"Evolving generation {self.current_generation + 1}...")
-                # Pass adjusted fitnesses to driver to penalize luck
-                self.driver.evolve(self.current_adjusted_fitnesses, self.current_per_agent_metrics)
-                self.current_generation += 1
-                self.phase = "evaluating"
-                return
+            # Start Display (showing best fitness agent)
+            display_agent = NEATAgent(display_genome)
+            self.display_manager.start_display(display_agent, current_best_fit, self.best_fitness)
 
         except Exception as e:
             print(f"Error: {e}")
@@ -277,6 +238,269 @@ class NEATTrainingScript:
             self._save()
             arcade.close_window()
 
+    def run_headless(self):
+        """Run the full generation loop without a window or playback."""
+        try:
+            while self.current_generation < NEATConfig.NUM_GENERATIONS:
+                if self._step_generation() is None:
+                    return
+            print("Training Complete.")
+        finally:
+            self.pipeline.shutdown()
+            self.checkpoint_writer.close()
+            self._save()
+            self.analytics.close_store()
+
+    def run_steady_state(self):
+        """
+        Asynchronous (rtNEAT-style) evolution: breed whenever an evaluation ends.
+
+        Each completed offspring replaces the member with the lowest shared
+        fitness at once; every ``steady_state_report_every`` completions the
+        population is re-speciated and recorded as one analytics generation
+        (counting toward NUM_GENERATIONS and early stopping).
+        """
+        evaluator = SteadyStateEvaluator(
+            max_workers=self.max_workers,
+            state_encoder=self.state_encoder,
+            action_interface=self.action_interface,
+            max_steps=NEATConfig.MAX_STEPS,
+            seeds_per_agent=NEATConfig.SEEDS_PER_AGENT,
+            use_common_seeds=NEATConfig.USE_COMMON_SEEDS,
+            common_seed_period=self.steady_state_report_every,
+            agent_factory=self._agent_factory,
+            action_repeat=NEATConfig.ACTION_REPEAT
+        )
+        in_flight = NEATConfig.STEADY_STATE_IN_FLIGHT or default_in_flight(self.max_workers, NEATConfig.SEEDS_PER_AGENT)
+        window = CompletionWindow(self.steady_state_report_every, self.max_workers)
+        if self.driver.steady_fitness is None:
+            self.driver.start_steady_state()
+        try:
+            # Members without a fitness (a fresh run, or a resumed one) go first
+            for genome in self.driver.unevaluated():
+                evaluator.submit(genome, tag="member")
+            while self.current_generation < NEATConfig.NUM_GENERATIONS:
+                while evaluator.in_flight() < in_flight and self.driver.evaluated_count():
+                    evaluator.submit(self.driver.breed_offspring())
+                done = evaluator.next_completed()
+                # Reliability-based fitness for selection, as in generational training
+                adjusted_fit = done.fitness - done.metrics.get('fitness_std', 0.0) * NEATConfig.FITNESS_STD_PENALTY_RATIO
+                if done.tag == "member":
+                    self.driver.record_evaluation(done.individual, adjusted_fit, done.metrics)
+                else:
+                    self.driver.insert_offspring(done.individual, adjusted_fit, done.metrics)
+                if done.fitness > self.best_fitness:
+                    self.best_fitness = done.fitness
+                    self.best_genome = done.individual.copy()
+                    self.last_improvement_gen = self.current_generation
+                    self._save_genome_artifacts(self.best_genome, "best_overall")
+                window.add(done)
+                if window.full():
+                    if not self._report_window(window):
+                        return
+                    window.reset()
+            print("Training Complete.")
+        finally:
+            evaluator.shutdown()
+            self.pipeline.shutdown()
+            self.checkpoint_writer.close()
+            self._save()
+            self.analytics.close_store()
+
+    def _report_window(self, window):
+        """Record a window of completed evaluations as one generation.
+
+        Returns:
+            False when early stopping triggers.
+        """
+        generation = self.current_generation + 1
+        fitnesses, gen_metrics, per_agent_metrics, timing_stats = window.summarize()
+        gens_since_improvement = self.current_generation - self.last_improvement_gen
+        if gens_since_improvement >= NEATConfig.EARLY_STOPPING_GENERATIONS:
+            print(f"\nEarly Stopping triggered: No improvement for {gens_since_improvement} generations.")
+            return False
+
+        self.driver.finish_window()
+        self.analytics.record_generation(
+            generation=generation,
+            fitness_scores=fitnesses,
+            behavioral_metrics=gen_metrics,
+            timing_stats={**timing_stats, "evolution_duration": self.driver.last_evolution_duration},
+            operator_stats=self.driver.last_evolution_stats.copy()
+        )
+        self.analytics.record_distributions(
+            generation=generation,
+            fitness_values=fitnesses,
+            per_agent_metrics=per_agent_metrics
+        )
+        if AnalyticsConfig.LIVE_REPORT_EVERY and generation % AnalyticsConfig.LIVE_REPORT_EVERY == 0:
+            self.analytics.generate_live_report(self.live_report_path)
+        best = max(window.completions, key=lambda completion: completion.fitness)
+        self._save_genome_artifacts(best.individual, f"gen_{generation:04d}_best")
+        self.current_generation += 1
+
+        print(
+            f"Window {generation}: {len(fitnesses)} evaluations | "
+            f"best {best.fitness:8.2f} | avg {sum(fitnesses) / len(fitnesses):8.2f} | "
+            f"all-time {self.best_fitness:8.2f} | "
+            f"species {self.driver.last_evolution_stats['species_count']} | "
+            f"workers busy {timing_stats['steady_state_busy_ratio'] * 100:.0f}% | "
+            f"{timing_stats['steady_state_evaluations_per_s']:.2f} evals/s"
+        )
+        self._maybe_checkpoint(generation, capture_rng_state())
+        return True
+
+    def _step_generation(self):
+        """Collect generation N, evolve, submit N+1, then report N.
+
+        Returns:
+            (best genome of this generation, its fitness), or None when early
+            stopping triggers.
+        """
+        generation = self.current_generation + 1
+        print(f"Generation {generation}: Evaluating...")
+        fitnesses, _, gen_metrics, per_agent_metrics = self.pipeline.collect(
+            self.driver.population, parents=self.driver.parent_indices
+        )
+        self.current_fitnesses = fitnesses
+        self.current_per_agent_metrics = per_agent_metrics
+
+        # Calculate Reliability-Based Fitness (penalize std dev)
+        # This filters out "lucky" agents that only succeed on specific seeds
+        self.current_adjusted_fitnesses = []
+        for i, metrics in enumerate(per_agent_metrics):
+            std_dev = metrics.get('fitness_std', 0.0)
+            penalty = std_dev * NEATConfig.FITNESS_STD_PENALTY_RATIO
+            adjusted_fit = fitnesses[i] - penalty
+            self.current_adjusted_fitnesses.append(adjusted_fit)
+
+        # Use best fitness agent for both tracking and display
+        # (NEAT uses fitness-based selection, not Pareto)
+        best_idx = fitnesses.index(max(fitnesses)) if fitnesses else 0
+        current_best_fit = fitnesses[best_idx] if fitnesses else float("-inf")
+        current_best_genome = self.driver.population[best_idx].copy()
+        display_genome = current_best_genome
+
+        improved = current_best_fit > self.best_fitness
+        if improved:
+            self.best_fitness = current_best_fit
+            self.best_genome = current_best_genome.copy()
+            self.last_improvement_gen = self.current_generation
+
+        # Early Stopping Check
+        gens_since_improvement = self.current_generation - self.last_improvement_gen
+        if gens_since_improvement >= NEATConfig.EARLY_STOPPING_GENERATIONS:
+            print(f"\nEarly Stopping triggered: No improvement for {gens_since_improvement} generations.")
+            return None
+
+        # Island runs: publish this generation's best, take in neighbours'
+        migrants = []
+        operator_stats = self.driver.last_evolution_stats.copy()
+        if self.migration is not None and self.migration.due(generation):
+            migrants = self.migration.exchange(
+                generation, self.driver.population, self.current_adjusted_fitnesses, per_agent_metrics,
+                encode=lambda genome: genome.to_dict()
+            )
+            operator_stats.update(self.migration.last_stats)
+
+        # Record Analytics
+        timing_stats = {
+            **self.pipeline.last_stats,
+            "evolution_duration": self.driver.last_evolution_duration
+        }
+
+        self.analytics.record_generation(
+            generation=generation,
+            fitness_scores=fitnesses,
+            behavioral_metrics=gen_metrics,
+            timing_stats=timing_stats,
+            operator_stats=operator_stats
+        )
+
+        if migrants:
+            slots, self.current_adjusted_fitnesses, self.current_per_agent_metrics = replace_members(
+                self.current_adjusted_fitnesses, per_agent_metrics, migrants
+            )
+            self.driver.replace_members(
+                slots,
+                [migrant.individual for migrant in migrants],
+                sources=[migrant.source for migrant in migrants]
+            )
+        self._evolve_generation()
+        # Captured before N+1 draws its evaluation seed; a resumed run replays it
+        next_rng_state = capture_rng_state()
+        if self.current_generation < NEATConfig.NUM_GENERATIONS:
+            self.pipeline.submit(self.driver.population, parents=self.driver.parent_indices)
+
+        # Everything below overlaps with the next generation's evaluation
+        if improved:
+            self._save_genome_artifacts(self.best_genome, "best_overall")
+        self.analytics.record_distributions(
+            generation=generation,
+            fitness_values=fitnesses,
+            per_agent_metrics=per_agent_metrics
+        )
+        if AnalyticsConfig.LIVE_REPORT_EVERY and generation % AnalyticsConfig.LIVE_REPORT_EVERY == 0:
+            self.analytics.generate_live_report(self.live_report_path)
+
+        # Save artifacts for this generation
+        self._save_genome_artifacts(display_genome, f"gen_{generation:04d}_best")
+
+        # Calculate stats for display
+        avg_fit = sum(fitnesses) / len(fitnesses) if fitnesses else 0.0
+        min_fit = min(fitnesses) if fitnesses else 0.0
+        std_fit = statistics.stdev(fitnesses) if len(fitnesses) > 1 else 0.0
+
+        print("\n" + "=" * 60)
+        print(f" GENERATION {generation} SUMMARY (NEAT)")
+        print("=" * 60)
+        print(" FITNESS (Raw)")
+        print(f"  Best:  {current_best_fit:8.2f}  |  Avg: {avg_fit:8.2f}")
+        print(f"  Min:   {min_fit:8.2f}  |  Std: {std_fit:8.2f}")
+        print(f"  Last Impr: Gen {self.last_improvement_gen + 1} ({gens_since_improvement} ago)")
+        print("-" * 60)
+        print(self.pipeline.summary_line())
+        print("-" * 60)
+
+        self._maybe_checkpoint(generation, next_rng_state)
+        return display_genome, current_best_fit
+
+    def _evolve_generation(self):
+        print(f"Evolving generation {self.current_generation + 1}...")
+        # Pass adjusted fitnesses to driver to penalize luck
+        self.driver.evolve(self.current_adjusted_fitnesses, self.current_per_agent_metrics)
+        self.current_generation += 1
+
+    def _maybe_checkpoint(self, generation, rng_state):
+        if NEATConfig.CHECKPOINT_EVERY and generation % NEATConfig.CHECKPOINT_EVERY == 0:
+            self.checkpoint_writer.save({
+                "method": "neat",
+                "current_generation": self.current_generation,
+                "best_fitness": self.best_fitness,
+                "last_improvement_gen": self.last_improvement_gen,
+                "best_genome": self.best_genome.to_dict() if self.best_genome is not None else None,
+                "driver": self.driver.state_dict(),
+                "analytics": self.analytics.state_dict(),
+                "rng": rng_state
+            })
+            print(f"Checkpoint after generation {generation} -> {self.checkpoint_writer.path}")
+
+    def resume(self, path=None):
+        """Restore a checkpoint; the next generation continues the run bit-exactly."""
+        path = path or self.checkpoint_writer.path
+        state = load_checkpoint(path)
+        if state.get("method") != "neat":
+            raise ValueError(f"{path} is a {state.get('method')} checkpoint, not neat")
+        self.current_generation = state["current_generation"]
+        self.best_fitness = state["best_fitness"]
+        self.last_improvement_gen = state["last_improvement_gen"]
+        best_genome = state["best_genome"]
+        self.best_genome = Genome.from_dict(best_genome) if best_genome is not None else None
+        self.driver.load_state_dict(state["driver"])
+        self.analytics.load_state_dict(state["analytics"])
+        restore_rng_state(state["rng"])
+        print(f"Resumed NEAT run from {path} after generation {self.current_generation}")
+
     def _save(self):
         self.analytics.generate_markdown_report("training_summary_neat.md")
         self.analytics.save_json("training_data_neat.json")
@@ -284,16 +508,43 @@ class NEATTrainingScript:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="NEAT training for Asteroids AI")
+    parser.add_argument("--headless", action="store_true",
+                        help="Train without a window (view progress with view_best.py --method neat)")
+    parser.add_argument("--resume", nargs="?", const="", default=None, metavar="CHECKPOINT",
+                        help="Continue from a checkpoint (default: training/neat_artifacts/checkpoint.npz)")
+    parser.add_argument("--steady-state", action="store_true", default=NEATConfig.STEADY_STATE,
+                        help="Asynchronous steady-state evolution instead of generations (runs headless)")
+    args = parser.parse_args()
+
+    if args.headless or args.steady_state:
+        trainer = NEATTrainingScript(steady_state=args.steady_state)
+        if args.resume is not None:
+            trainer.resume(args.resume or None)
+        if args.steady_state:
+            trainer.run_steady_state()
+        else:
+            trainer.run_headless()
+        return
+
+    import arcade
+    from Asteroids import AsteroidsGame
+
     window = AsteroidsGame(globals.SCREEN_WIDTH, globals.SCREEN_HEIGHT, "Asteroids AI - NEAT Training")
     window.setup()
     trainer = NEATTrainingScript(window)
+    if args.resume is not None:
+        trainer.resume(args.resume or None)
     arcade.schedule(trainer.update, NEATConfig.FRAME_DELAY)
 
     try:
         arcade.run()
     finally:
         print("\nApplication exiting, saving training results...")
+        trainer.pipeline.shutdown()
+        trainer.checkpoint_writer.close()
         trainer._save()
+        trainer.analytics.close_store()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,191 @@
+"""
+GA / ES / NEAT Viewer (Best-So-Far Playback)
+
+Windowed playback for headless training runs. Tails the best-genome artifact
+written by ``train_ga.py``, ``train_es.py`` or ``train_neat.py`` and reloads it
+after each episode ends, so training itself never waits on rendering.
+
+    python training/scripts/train_es.py --headless &
+    python training/scripts/view_best.py --method es
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import arcade
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from game import globals
+from Asteroids import AsteroidsGame
+from interfaces.encoders.HybridEncoder import HybridEncoder
+from interfaces.encoders.TemporalStackEncoder import TemporalStackEncoder
+from interfaces.ActionInterface import ActionInterface
+from ai_agents.neuroevolution.nn_agent import NNAgent
+from ai_agents.neuroevolution.neat.agent import NEATAgent
+from ai_agents.neuroevolution.neat.genome import Genome
+from training.config.genetic_algorithm import GAConfig
+from training.config.evolution_strategies import ESConfig
+from training.config.neat import NEATConfig
+from training.config.rewards import create_reward_calculator
+from training.analytics.analytics import TrainingAnalytics
+from training.core.best_artifacts import (
+    BEST_GENOME_NAME,
+    BEST_WEIGHTS_NAME,
+    artifacts_dir,
+    load_best_weights,
+)
+from training.core.episode_runner import EpisodeRunner
+from training.core.display_manager import DisplayManager
+
+METHOD_CONFIGS = {
+    "ga": GAConfig,
+    "es": ESConfig,
+    "neat": NEATConfig,
+}
+
+
+def _build_state_encoder(method: str):
+    """Match the encoder each training script evaluates with."""
+    base_encoder = HybridEncoder(
+        screen_width=globals.SCREEN_WIDTH,
+        screen_height=globals.SCREEN_HEIGHT,
+        num_rays=16,
+        num_fovea_asteroids=3
+    )
+    if method == "es" and ESConfig.USE_TEMPORAL_STACK:
+        return TemporalStackEncoder(
+            base_encoder=base_encoder,
+            stack_size=ESConfig.TEMPORAL_STACK_SIZE,
+            include_deltas=ESConfig.TEMPORAL_INCLUDE_DELTAS
+        )
+    return base_encoder
+
+
+def _build_action_interface(method: str) -> ActionInterface:
+    if method == "neat":
+        return ActionInterface(action_space_type="boolean", turn_deadzone=0.03)
+    return ActionInterface(action_space_type="boolean")
+
+
+class BestGenomeViewer:
+    """Continuous playback of the best-so-far genome of a headless run."""
+    def __init__(self, game: AsteroidsGame, method: str, seed_start: int = 0):
+        self.game = game
+        self.method = method
+        self.config = METHOD_CONFIGS[method]
+
+        self.state_encoder = _build_state_encoder(method)
+        self.action_interface = _build_action_interface(method)
+        self.reward_calculator = create_reward_calculator(
+            max_steps=self.config.MAX_STEPS,
+            frame_delay=self.config.FRAME_DELAY
+        )
+        self.episode_runner = EpisodeRunner(
+            game=game,
+            state_encoder=self.state_encoder,
+            action_interface=self.action_interface,
+            reward_calculator=self.reward_calculator,
+            action_repeat=self.config.ACTION_REPEAT
+        )
+
+        self.analytics = TrainingAnalytics()
+        self.display_manager = DisplayManager(
+            game,
+            self.episode_runner,
+            self.analytics,
+            max_steps=self.config.MAX_STEPS
+        )
+
+        name = BEST_GENOME_NAME if method == "neat" else BEST_WEIGHTS_NAME
+        self.artifact_path = os.path.join(artifacts_dir(method), name)
+        self.artifact_mtime = None
+        self.agent = None
+        self.best_fitness = 0.0
+        self.seed_counter = seed_start
+
+        # Hook draw
+        original_draw = self.game.on_draw
+        def new_draw():
+            original_draw()
+            self.display_manager.draw()
+        self.game.on_draw = new_draw
+
+    def _load_artifact(self) -> bool:
+        """Reload the artifact if it changed since the last load."""
+        if not os.path.exists(self.artifact_path):
+            return False
+
+        mtime = os.path.getmtime(self.artifact_path)
+        if self.artifact_mtime is not None and mtime <= self.artifact_mtime:
+            return False
+        self.artifact_mtime = mtime
+
+        try:
+            if self.method == "neat":
+                with open(self.artifact_path, "r", encoding="utf-8") as f:
+                    genome = Genome.from_dict(json.load(f))
+                self.agent = NEATAgent(genome)
+            else:
+                artifact = load_best_weights(self.artifact_path)
+                self.agent = NNAgent(
+                    artifact["weights"],
+                    self.state_encoder,
+                    self.action_interface,
+                    hidden_size=artifact["hidden_size"]
+                )
+                self.best_fitness = artifact["fitness"]
+                print(f"[{self.method.upper()}] Loaded best genome from generation {artifact['generation']} "
+                      f"(fitness={self.best_fitness:.2f})")
+        except Exception as e:
+            print(f"[{self.method.upper()}] Failed to load {self.artifact_path}: {e}")
+            return False
+        return True
+
+    def _start_episode(self) -> None:
+        self.game.set_seed(self.seed_counter)
+        self.seed_counter += 1
+        self.display_manager.start_display(self.agent, self.best_fitness, self.best_fitness)
+
+    def update(self, delta_time: float) -> None:
+        if self.display_manager.showing_best_agent:
+            status = self.display_manager.update(delta_time)
+            if status == "done":
+                self._load_artifact()
+                if self.agent is not None:
+                    self._start_episode()
+            return
+
+        # Not currently displaying; attempt to load and start.
+        if self._load_artifact():
+            self._start_episode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Watch the best genome of a (headless) GA/ES/NEAT run")
+    parser.add_argument("--method", choices=sorted(METHOD_CONFIGS), required=True)
+    parser.add_argument("--seed", type=int, default=0, help="First playback seed (incremented per episode)")
+    args = parser.parse_args()
+
+    window = AsteroidsGame(
+        globals.SCREEN_WIDTH,
+        globals.SCREEN_HEIGHT,
+        f"AsteroidsAI - {args.method.upper()} Viewer"
+    )
+    window.setup()
+    viewer = BestGenomeViewer(window, args.method, seed_start=args.seed)
+    arcade.schedule(viewer.update, METHOD_CONFIGS[args.method].FRAME_DELAY)
+
+    try:
+        arcade.run()
+    finally:
+        print("Viewer exiting.")
+
+
+if __name__ == "__main__":
+    main()
@@ -51,7 +51,8 @@ class SACViewer:
             game=game,
             state_encoder=self.state_encoder,
             action_interface=self.action_interface,
-            reward_calculator=self.reward_calculator
+            reward_calculator=self.reward_calculator,
+            action_repeat=SACConfig.ACTION_REPEAT
         )
 
         self.analytics = TrainingAnalytics()